@@ -10,6 +10,7 @@ from app.academics.models.course import Course
 from app.academics.models.curriculum_course import CurriCrs
 from app.academics.models.prerequisite import Prerequisite
 from app.finance.models.invoice import Invoice
+from app.registry.effective_grades import recompute_effective_grades
 from app.registry.models.grade import Grade
 from app.registry.models.registration import Registration
 from app.timetable.models.section import Section
@@ -100,6 +101,8 @@ def merge_crss(target: Course, sources):
         cc.curriculum_id: cc
         for cc in CurriCrs.objects.filter(course=target).select_related("curriculum")
     }
+    # Grades under moved curriculum courses become attempts of the target course.
+    moved_cc_ids: list[int] = []
     for src in sources:
         if src.pk == target.pk:
             continue
@@ -134,6 +137,7 @@ def merge_crss(target: Course, sources):
             cc.save(update_fields=["course"])
             target_cc_map[curriculum_id] = cc
             summary["curriculum_courses_moved"] += 1
+            moved_cc_ids.append(cc.pk)
         prereq_summary = _merge_crs_prerequisites(target, src)
         summary["prerequisites_moved"] += prereq_summary["prerequisites_moved"]
         summary["prerequisites_skipped"] += prereq_summary["prerequisites_skipped"]
@@ -143,6 +147,15 @@ def merge_crss(target: Course, sources):
             summary["protected_deletes"] += 1
             continue
         summary["merged"] += 1
+    if moved_cc_ids:
+        recompute_effective_grades(
+            (int(student_id), int(target.pk))
+            for student_id in Grade.objects.filter(
+                section__curriculum_course_id__in=moved_cc_ids
+            )
+            .values_list("student_id", flat=True)
+            .distinct()
+        )
     return summary
 
 
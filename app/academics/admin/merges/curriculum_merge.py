@@ -15,6 +15,7 @@ from app.academics.models.prerequisite import Prerequisite
 from app.finance.models.invoice import Invoice
 from app.people.models.student import Student
 from app.people.models.student_curriculum_enrollment import StdCurriEnroll
+from app.registry.effective_grades import StdCrsPairT, recompute_effective_grades
 from app.registry.models.grade import Grade
 from app.registry.models.registration import Registration
 from app.timetable.models.section import Section
@@ -505,6 +506,9 @@ def reconcile_std_curri_records(
             _index_sec_merge_candidates(sections)
         )
 
+    course_by_cc_id = {cc.id: cc.course_id for cc in source_curriculum_courses}
+    # Effective flags are recomputed once after every grade has moved.
+    recompute_pairs: set[StdCrsPairT] = set()
     for source_section in source_sections:
         source_course_identity = source_course_identity_by_curriculum_course_id.get(
             source_section.curriculum_course_id
@@ -532,14 +536,21 @@ def reconcile_std_curri_records(
             )
             # If same-value grade already exists on target curriculum/course, drop duplicate.
             if source_grade.value_id in target_grade_values:
-                source_grade.delete()
+                source_grade.delete(recompute_effective=False)
+                recompute_pairs.add(
+                    (student.pk, course_by_cc_id[source_section.curriculum_course_id])
+                )
                 summary["grades_deduped"] += 1
             elif source_course_identity in target_has_grade_course_identities:
                 # Conflicting values are left untouched for manual resolution.
                 summary["grade_conflicts"] += 1
             elif target_section is not None:
                 source_grade.section = target_section
-                source_grade.save(update_fields=["section"])
+                source_grade.save(update_fields=["section"], recompute_effective=False)
+                recompute_pairs.add(
+                    (student.pk, course_by_cc_id[source_section.curriculum_course_id])
+                )
+                recompute_pairs.add((student.pk, target_cc.course_id))
                 target_grade_values_by_course_identity[source_course_identity].add(
                     source_grade.value_id
                 )
@@ -562,4 +573,6 @@ def reconcile_std_curri_records(
         source_registration.save(update_fields=["section"])
         target_registration_course_identities.add(source_course_identity)
         summary["registrations_moved"] += 1
+    if recompute_pairs:
+        recompute_effective_grades(recompute_pairs)
     return summary
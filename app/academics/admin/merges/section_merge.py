@@ -9,6 +9,7 @@ from django.db import models
 from django.db.models.deletion import ProtectedError
 
 from app.academics.models.curriculum_course import CurriCrs
+from app.registry.effective_grades import recompute_effective_grades
 from app.registry.models.grade import Grade
 from app.registry.models.registration import Registration
 from app.timetable.models.semester import Semester
@@ -44,6 +45,7 @@ def _merge_curri_crs_to_target(
         .select_related("semester__academic_year", "curriculum_course__course")
         .order_by("id")
     )
+    moved_section_ids: list[int] = []
     for section in source_sections:
         conflict = pick_candidate(target, section)
         if conflict is not None:
@@ -73,6 +75,15 @@ def _merge_curri_crs_to_target(
         section.curriculum_course = target
         section.save(update_fields=["curriculum_course"])
         summary["sections_moved"] += 1
+        moved_section_ids.append(section.pk)
+    if moved_section_ids:
+        # Moved grades may now compete with attempts of the target course.
+        recompute_effective_grades(
+            (int(student_id), int(target.course_id))
+            for student_id in Grade.objects.filter(section_id__in=moved_section_ids)
+            .values_list("student_id", flat=True)
+            .distinct()
+        )
     try:
         source.delete()
     except ProtectedError:
@@ -142,16 +153,11 @@ def _rebucket_sem0_conflicting_section(
         source_section.info = f"{source_section.info}\n{note}".strip()
         source_section.save(update_fields=["curriculum_course", "semester", "info"])
 
-        for student_id in affected_student_ids:
-            Grade.recompute_effective_for_student_course(
-                student_id=int(student_id),
-                course_id=target_course_id,
-            )
-            if source_course_id != target_course_id:
-                Grade.recompute_effective_for_student_course(
-                    student_id=int(student_id),
-                    course_id=source_course_id,
-                )
+        recompute_effective_grades(
+            (int(student_id), course_id)
+            for student_id in affected_student_ids
+            for course_id in {source_course_id, target_course_id}
+        )
         return True, False
 
     # No slot available in 1..3 for sem0 fallback.
@@ -345,11 +351,9 @@ def _merge_secs(target: Section, source: Section) -> SectionMergeResultT:
         # Defer effective recompute until all section-grade moves are done.
         grade.save(update_fields=["section"], recompute_effective=False)
         target_grade_values[grade.student_id] = grade.value_id
-    for student_id in affected_student_ids:
-        Grade.recompute_effective_for_student_course(
-            student_id=student_id,
-            course_id=target_course_id,
-        )
+    recompute_effective_grades(
+        (student_id, target_course_id) for student_id in affected_student_ids
+    )
 
     for registration in Registration.objects.filter(section=source):
         if Registration.objects.filter(
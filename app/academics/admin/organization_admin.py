@@ -27,6 +27,7 @@ from app.academics.models import (
 )
 from app.people.models.student import Student
 from app.people.models.student_curriculum_enrollment import StdCurriEnroll
+from app.registry.standing import count_stds_by_level
 from app.finance.models.invoice import Invoice
 from app.shared.admin.filters import BaseCollegeFlt
 from app.shared.admin.mixins import (
@@ -193,14 +194,14 @@ class CollegeAdmin(SimpleHistoryAdmin, ImportExportModelAdmin, GuardedModelAdmin
     def std_counts_by_level_link(self, obj: College):
         """Link to students filtered by college and computed level."""
         rows = []
-        students = list(
+        counts = count_stds_by_level(
             Student.objects.filter(
                 curriculum_enrollments__curriculum__college=obj,
                 curriculum_enrollments__is_primary=True,
-            ).distinct()
+            )
         )
         for level in ("Freshman", "Sophomore", "Junior", "Senior"):
-            count = sum(1 for s in students if getattr(s, "class_level", "") == level)
+            count = counts[level.lower()]
             url = reverse("admin:people_student_changelist") + (
                 f"?curricula__college__id__exact={obj.id}&class_level={level}"
             )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Tuple
+from typing import Optional, Tuple
 
 from app.academics.choices import COLLEGE_LONG_NAME
 from app.academics.models.college import College
@@ -13,25 +13,39 @@ from app.academics.models.department import Department
 from app.academics.utils import normalize_college_code, normalize_dpt_code
 from app.shared.course_wrangling import normalize_course_number
 from app.shared.models import CreditHour
-from app.shared.types import DeptCollegeMapT, DeptCrsMapT, StrIntMapT, TwoIntIntMapT
+from app.shared.identity_map import IdentityMap, identity_map
 from app.shared.utils import parse_str
 
-COLLEGE_CACHE: Dict[str, College] = {}
-DEPARTMENT_CACHE: Dict[Tuple[str, int], Department] = {}
-COURSE_CACHE: Dict[Tuple[int, str], Course] = {}
-CURRICULUM_CACHE: Dict[Tuple[str, Optional[int]], Curriculum] = {}
-CURRICULUM_COURSE_CACHE: Dict[Tuple[int, int], CurriCrs] = {}
-CREDIT_HOUR_CACHE: Dict[int, CreditHour] = {}
-
-COLLEGE_ID_CACHE: StrIntMapT = {}
-COLLEGE_BY_ID_CACHE: Dict[int, College] = {}
-DEPARTMENT_ID_CACHE: DeptCollegeMapT = {}
-DEPARTMENT_BY_ID_CACHE: Dict[int, Department] = {}
-COURSE_ID_CACHE: DeptCrsMapT = {}
-COURSE_BY_ID_CACHE: Dict[int, Course] = {}
-CURRICULUM_ID_CACHE: StrIntMapT = {}
-CURRICULUM_BY_ID_CACHE: Dict[int, Curriculum] = {}
-CURRICULUM_COURSE_ID_CACHE: TwoIntIntMapT = {}
+COLLEGE_CACHE: IdentityMap[str, College] = identity_map("academics.colleges")
+DEPARTMENT_CACHE: IdentityMap[Tuple[str, int], Department] = identity_map(
+    "academics.departments"
+)
+COURSE_CACHE: IdentityMap[Tuple[int, str], Course] = identity_map("academics.courses")
+CURRICULUM_CACHE: IdentityMap[Tuple[str, Optional[int]], Curriculum] = identity_map(
+    "academics.curricula"
+)
+CURRICULUM_COURSE_CACHE: IdentityMap[Tuple[int, int], CurriCrs] = identity_map(
+    "academics.curriculum_courses"
+)
+CREDIT_HOUR_CACHE: IdentityMap[int, CreditHour] = identity_map("academics.credit_hours")
+
+COLLEGE_ID_CACHE: IdentityMap[str, int] = identity_map("academics.college_ids")
+COLLEGE_BY_ID_CACHE: IdentityMap[int, College] = identity_map("academics.colleges_by_id")
+DEPARTMENT_ID_CACHE: IdentityMap[Tuple[str, int], int] = identity_map(
+    "academics.department_ids"
+)
+DEPARTMENT_BY_ID_CACHE: IdentityMap[int, Department] = identity_map(
+    "academics.departments_by_id"
+)
+COURSE_ID_CACHE: IdentityMap[Tuple[int, str], int] = identity_map("academics.course_ids")
+COURSE_BY_ID_CACHE: IdentityMap[int, Course] = identity_map("academics.courses_by_id")
+CURRICULUM_ID_CACHE: IdentityMap[str, int] = identity_map("academics.curriculum_ids")
+CURRICULUM_BY_ID_CACHE: IdentityMap[int, Curriculum] = identity_map(
+    "academics.curricula_by_id"
+)
+CURRICULUM_COURSE_ID_CACHE: IdentityMap[Tuple[int, int], int] = identity_map(
+    "academics.curriculum_course_ids"
+)
 
 
 def _normalize_crs_no(value: str) -> str:
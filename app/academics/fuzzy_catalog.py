@@ -0,0 +1,245 @@
+"""Scoped fuzzy index over course and curriculum match tokens.
+
+``CrsManager.find_fuzzy_match`` and ``CurriManager.find_fuzzy_match`` run
+inside ``get_or_create`` for every imported row allowing fuzzy reuse. Instead
+of loading and scoring the whole department (or every curriculum) per row,
+the managers keep one partition of match tokens per department / college in
+:data:`CATALOG_INDEX`, load it once and score a lookup in a single rapidfuzz
+call.
+
+Tokens are bucketed by length: Jaro-Winkler can only reach ``threshold``
+when the shorter token is at least :func:`min_length_ratio` times the longer
+one, so the other buckets are never scored. Scores use the same distance as
+``token_similarity``; the managers keep their historical tie-breaking.
+
+Partitions live in identity maps (:mod:`app.shared.identity_map`), so they
+last one request or import run, and a partition loaded or changed inside a
+rolled-back savepoint is dropped with it. Course and curriculum saves update
+the loaded partitions in place; department and college saves drop the
+partitions whose tokens or keys they change. Rows deleted behind the index's
+back are caught when the managers re-read the winning pk.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, TypeAlias
+
+from rapidfuzz import process
+from rapidfuzz.distance import JaroWinkler
+
+from app.shared.identity_map import IdentityMap, identity_map
+
+# (pk, match token, payload kept for tie-breaking)
+CatalogRowT: TypeAlias = tuple[int, str, Any]
+CatalogLoaderT: TypeAlias = Callable[[], Iterable[CatalogRowT]]
+
+
+@dataclass(frozen=True)
+class CatalogMatch:
+    """One indexed row scoring at or above the lookup threshold."""
+
+    order: int
+    pk: int
+    score: float
+    payload: Any = None
+
+
+def min_length_ratio(threshold: float) -> float:
+    """Return the smallest ``len(short) / len(long)`` able to reach ``threshold``.
+
+    Winkler's prefix bonus adds at most ``0.4 * (1 - jaro)`` and Jaro is at
+    most ``(2 + short / long) / 3``, so lower ratios score below ``threshold``.
+    """
+    return 5 * threshold - 4
+
+
+class TokenPartition:
+    """Match tokens of one partition, sorted by length for window lookups."""
+
+    def __init__(self, rows: Iterable[CatalogRowT]) -> None:
+        entries = sorted(
+            (len(token), order, pk, token, payload)
+            for order, (pk, token, payload) in enumerate(rows)
+            if token
+        )
+        self.keys = [(entry[0], entry[1]) for entry in entries]
+        self.tokens = [entry[3] for entry in entries]
+        self.rows = [(order, pk, payload) for _, order, pk, _, payload in entries]
+        self.orders = {pk: order for order, pk, _ in self.rows}
+        self.next_order = max(self.orders.values(), default=-1) + 1
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def pks(self) -> set[int]:
+        return set(self.orders)
+
+    def discard(self, pk: int) -> bool:
+        """Remove row ``pk``; return whether it was indexed."""
+        if pk not in self.orders:
+            return False
+        index = next(i for i, row in enumerate(self.rows) if row[1] == pk)
+        del self.keys[index], self.tokens[index], self.rows[index]
+        del self.orders[pk]
+        return True
+
+    def upsert(self, pk: int, token: str, payload: Any = None) -> None:
+        """Index row ``pk`` under ``token``, keeping its catalogue order."""
+        order = self.orders.get(pk)
+        self.discard(pk)
+        if not token:
+            return
+        if order is None:
+            order, self.next_order = self.next_order, self.next_order + 1
+        key = (len(token), order)
+        index = bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.tokens.insert(index, token)
+        self.rows.insert(index, (order, pk, payload))
+        self.orders[pk] = order
+
+    def matches(self, token: str, threshold: float) -> list[CatalogMatch]:
+        """Return rows whose token scores ``>= threshold`` against ``token``."""
+        if not token or not self.rows:
+            return []
+        low, high = 0, len(self.rows)
+        ratio = min_length_ratio(threshold)
+        if ratio > 0:
+            low = bisect_left(self.keys, (math.ceil(len(token) * ratio - 1e-9), -1))
+            high = bisect_right(
+                self.keys, (math.floor(len(token) / ratio + 1e-9), math.inf)
+            )
+        found = process.extract(
+            token,
+            self.tokens[low:high],
+            scorer=JaroWinkler.normalized_distance,
+            # Keep boundary pairs; the exact comparison below decides.
+            score_cutoff=1.0 - threshold + 1e-9,
+            limit=None,
+        )
+        matches: list[CatalogMatch] = []
+        for _, distance, index in found:
+            score = 1.0 - float(distance)
+            if score >= threshold and score > 0:
+                order, pk, payload = self.rows[low + index]
+                matches.append(CatalogMatch(order, pk, score, payload))
+        return matches
+
+
+COURSE_TOKENS: IdentityMap[int, TokenPartition] = identity_map("academics.course_tokens")
+CURRICULUM_TOKENS: IdentityMap[str, dict[str, TokenPartition]] = identity_map(
+    "academics.curriculum_tokens"
+)
+_ALL_CURRICULA = "all"
+
+
+class FuzzyCatalogIndex:
+    """Course (per department) and curriculum (per college) tokens of the scope.
+
+    Partitions are written back to their identity map after every change so
+    the change is journaled with the current savepoint.
+    """
+
+    def course_partition(
+        self, department_id: int, loader: CatalogLoaderT
+    ) -> TokenPartition:
+        """Return the course tokens of one department, loading them once."""
+        partition = COURSE_TOKENS.get(department_id)
+        if partition is None:
+            partition = TokenPartition(loader())
+            COURSE_TOKENS[department_id] = partition
+        return partition
+
+    def curriculum_partitions(self, loader: CatalogLoaderT) -> dict[str, TokenPartition]:
+        """Return curriculum tokens keyed by college code, loading them once.
+
+        ``loader`` payloads must start with the curriculum's college code.
+        """
+        partitions = CURRICULUM_TOKENS.get(_ALL_CURRICULA)
+        if partitions is None:
+            grouped: dict[str, list[CatalogRowT]] = {}
+            for row in loader():
+                grouped.setdefault(row[2][0], []).append(row)
+            partitions = {code: TokenPartition(rows) for code, rows in grouped.items()}
+            CURRICULUM_TOKENS[_ALL_CURRICULA] = partitions
+        return partitions
+
+    def has_curricula(self) -> bool:
+        """Return whether the curriculum partitions are loaded in this scope."""
+        return _ALL_CURRICULA in CURRICULUM_TOKENS
+
+    def upsert_course(
+        self, pk: int, department_id: int, token: Callable[[], str]
+    ) -> None:
+        """Re-index a saved course; a course moved between departments moves too.
+
+        ``token`` is only called when the course's department is loaded.
+        """
+        for key in list(COURSE_TOKENS):
+            partition = COURSE_TOKENS[key]
+            if key != department_id and partition.discard(pk):
+                COURSE_TOKENS[key] = partition
+        partition = COURSE_TOKENS.get(department_id)
+        if partition is not None:
+            partition.upsert(pk, token())
+            COURSE_TOKENS[department_id] = partition
+
+    def discard_course(self, pk: int, department_id: int) -> None:
+        """Forget a course deleted or rolled back since its partition loaded."""
+        partition = COURSE_TOKENS.get(department_id)
+        if partition is not None and partition.discard(pk):
+            COURSE_TOKENS[department_id] = partition
+
+    def upsert_curriculum(
+        self, pk: int, college_code: str, token: str, payload: Any
+    ) -> None:
+        """Re-index a saved curriculum under its college."""
+        partitions = CURRICULUM_TOKENS.get(_ALL_CURRICULA)
+        if partitions is None:
+            return
+        for partition in partitions.values():
+            partition.discard(pk)
+        partitions.setdefault(college_code, TokenPartition(())).upsert(pk, token, payload)
+        CURRICULUM_TOKENS[_ALL_CURRICULA] = partitions
+
+    def discard_curriculum(self, pk: int) -> None:
+        """Forget a curriculum deleted or rolled back since the partitions loaded."""
+        partitions = CURRICULUM_TOKENS.get(_ALL_CURRICULA)
+        if partitions is None:
+            return
+        for partition in partitions.values():
+            partition.discard(pk)
+        CURRICULUM_TOKENS[_ALL_CURRICULA] = partitions
+
+    def invalidate_department(self, department_id: int | None) -> None:
+        """Drop one department's course partition (its code is in the tokens)."""
+        if department_id is not None:
+            COURSE_TOKENS.pop(department_id, None)
+
+    def invalidate_curricula(self) -> None:
+        """Drop every curriculum partition."""
+        CURRICULUM_TOKENS.pop(_ALL_CURRICULA, None)
+
+    def clear(self) -> None:
+        """Forget everything; the next lookups reload from the database."""
+        COURSE_TOKENS.clear()
+        CURRICULUM_TOKENS.clear()
+
+
+CATALOG_INDEX = FuzzyCatalogIndex()
+
+
+__all__ = [
+    "CATALOG_INDEX",
+    "COURSE_TOKENS",
+    "CURRICULUM_TOKENS",
+    "CatalogMatch",
+    "FuzzyCatalogIndex",
+    "TokenPartition",
+    "min_length_ratio",
+]
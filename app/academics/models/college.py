@@ -7,6 +7,7 @@ from django.db import models
 from simple_history.models import HistoricalRecords
 
 from app.academics.choices import LEVEL_NUMBER, COLLEGE_LONG_NAME
+from app.academics.fuzzy_catalog import CATALOG_INDEX
 from app.shared.auth.perms import UserRole
 
 
@@ -50,6 +51,7 @@ class College(models.Model):
         """Ensure long_name matches the selected code before saving."""
         self._ensure_long_name()
         super().save(*args, **kwargs)
+        CATALOG_INDEX.invalidate_curricula()
 
     # ------------------------------------------------------------------
     # computed properties
@@ -58,23 +60,19 @@ class College(models.Model):
     @property
     def std_counts_by_level(self) -> str:
         """Return number of students grouped by class level."""
+        from app.registry.standing import count_stds_by_level
+
         Student = apps.get_model("people", "Student")
 
         counts = {lv.label: 0 for lv in LEVEL_NUMBER}
-        for stud in Student.objects.filter(
-            curriculum_enrollments__curriculum__college=self,
-            curriculum_enrollments__is_primary=True,
-        ).distinct():
-            _credits = stud.completed_credits
-            if _credits <= 36:
-                level = LEVEL_NUMBER.ONE.label
-            elif _credits <= 72:
-                level = LEVEL_NUMBER.TWO.label
-            elif _credits <= 108:
-                level = LEVEL_NUMBER.THREE.label
-            else:
-                level = LEVEL_NUMBER.FOUR.label
-            counts[level] += 1
+        counts.update(
+            count_stds_by_level(
+                Student.objects.filter(
+                    curriculum_enrollments__curriculum__college=self,
+                    curriculum_enrollments__is_primary=True,
+                )
+            )
+        )
         return ", ".join(f"{lvl}: {cnt}" for lvl, cnt in counts.items())
 
     @property
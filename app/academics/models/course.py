@@ -10,11 +10,11 @@ from django.db import models
 from simple_history.models import HistoricalRecords
 
 from app.academics.choices import LEVEL_NUMBER
+from app.academics.fuzzy_catalog import CATALOG_INDEX
 from app.academics.models.curriculum import Curriculum
 from app.academics.models.department import Department
 from app.academics.utils import make_crs_code
 from app.registry.models import CreditHour
-from app.shared.fuzzy_matching import token_similarity
 from app.shared.types import CrsQuery
 
 DEFAULT_COURSE_NO = count(start=1, step=1)
@@ -38,18 +38,33 @@ class CrsManager(models.Manager["Course"]):
         title: str | None = None,
         threshold: float = 0.9,
     ) -> Course | None:
-        """Return an existing course with a similar identifier/title."""
+        """Return an existing course with a similar identifier/title.
+
+        Candidates are the department's partition of the fuzzy catalog index;
+        among equal best scores the first course in catalogue order wins.
+        """
         token = self._token(department, number, title)
-        candidates = self.filter(department=department)
-        best: tuple[Course | None, float] = (None, 0.0)
-        # > We can factor this and the one in curriclum,
-        # > using a function to handle alternate case
-        for course in candidates:
-            other_token = self._token(course.department, course.number, course.title)
-            score, ok = token_similarity(token, other_token, threshold=threshold)
-            if ok and score > best[1]:
-                best = (course, score)
-        return best[0]
+        partition = CATALOG_INDEX.course_partition(
+            department.id,
+            lambda: (
+                (pk, self._token(department, course_no, course_title), None)
+                for pk, course_no, course_title in self.filter(
+                    department=department
+                ).values_list("pk", "number", "title")
+            ),
+        )
+        matches = partition.matches(token, threshold)
+        if not matches:
+            return None
+        best = min(matches, key=lambda match: (-match.score, match.order))
+        course = self.filter(pk=best.pk, department=department).first()
+        if course is None:
+            # Deleted or rolled back since the partition was loaded.
+            CATALOG_INDEX.discard_course(best.pk, department.id)
+            return self.find_fuzzy_match(
+                department=department, number=number, title=title, threshold=threshold
+            )
+        return course
 
     def get_or_create(
         self,
@@ -202,11 +217,49 @@ class Course(models.Model):
         return sep.join(curricula)
 
     # ---------- hooks ----------
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded codes and price key so saves can tell changes."""
+        instance = super().from_db(db, field_names, values)
+        instance._saved_codes = (
+            instance.__dict__.get("short_code"),
+            instance.__dict__.get("code"),
+        )
+        instance._saved_price_key = (
+            instance.__dict__.get("department_id"),
+            instance.__dict__.get("number"),
+        )
+        return instance
+
     def save(self, *args, **kwargs) -> None:
-        """Populate code from department shortname and number before saving."""
+        """Populate code from department shortname and number before saving.
+
+        Section sort codes are refreshed only when the course codes changed;
+        fee quotes (priced by department and number) only when those moved.
+        """
         self._ensure_dept()
         self._ensure_codes()
+        codes_changed = not self._state.adding and (
+            getattr(self, "_saved_codes", None) != (self.short_code, self.code)
+        )
+        price_changed = not self._state.adding and (
+            getattr(self, "_saved_price_key", None) != (self.department_id, self.number)
+        )
         super().save(*args, **kwargs)
+        self._saved_codes = (self.short_code, self.code)
+        self._saved_price_key = (self.department_id, self.number)
+        CATALOG_INDEX.upsert_course(
+            self.pk,
+            self.department_id,
+            lambda: Course.objects._token(self.department, self.number, self.title),
+        )
+        from app.finance.fee_quotes import invalidate_fee_quotes
+        from app.timetable.models.section import refresh_section_sort_codes
+
+        if price_changed:
+            invalidate_fee_quotes(course_ids=[self.pk])
+        if codes_changed:
+            refresh_section_sort_codes(course_ids=[self.pk])
 
     class Meta:
         constraints = [
@@ -12,8 +12,8 @@ from django.db import models
 from django.db.models import Count
 from simple_history.models import HistoricalRecords
 
+from app.academics.fuzzy_catalog import CATALOG_INDEX
 from app.academics.models.college import College
-from app.shared.fuzzy_matching import token_similarity
 from app.shared.mixins import SimpleTableMixin, StatusableMixin
 from app.shared.utils import as_title
 
@@ -51,53 +51,56 @@ class CurriManager(models.Manager["Curriculum"]):
         college: College,
         threshold: float = 0.9,
     ) -> tuple[Curriculum | None, float]:
-        """Do a fuzzy curriclum search."""
+        """Do a fuzzy curriclum search.
+
+        Curricula of another non-default college are never matched. Ties
+        prefer a curriculum with a long name, then a non-default college,
+        then the lower id.
+        """
         token = self._token(short_name, long_name)
         college_code_dft = College.get_dft().code
 
-        best: tuple[Curriculum | None, float] = (None, 0.0)
-        for cur in self.all():
-            # college rule: if both non-default and differ, skip
-            # we do not match if college differ and is set.
-            if (
-                cur.college.code != college_code_dft
-                and college.code != college_code_dft
-                and cur.college.code != college.code
-            ):
-                continue
-
-            other_token = self._token(cur.short_name, cur.long_name)
-            score, ok = token_similarity(token, other_token, threshold=threshold)
-
-            if not ok:
-                continue
-            choose = False
-            if score > best[1]:
-                choose = True
-            elif score == best[1] and best[0] is not None:
-                # tie-breaker: prefer one with long_name, else non-default college, else lower id
-                has_long = bool(cur.long_name and cur.long_name != cur.short_name)
-                best_long = bool(
-                    best[0].long_name and best[0].long_name != best[0].short_name
+        partitions = CATALOG_INDEX.curriculum_partitions(
+            lambda: (
+                (pk, self._token(short, long), (code, bool(long and long != short)))
+                for pk, short, long, code in self.values_list(
+                    "pk", "short_name", "long_name", "college__code"
                 )
-                if has_long and not best_long:
-                    choose = True
-                elif has_long == best_long:
-                    cur_default = (
-                        cur.college.code == college_code_dft if cur.college else True
-                    )
-                    best_default = (
-                        best[0].college.code == college_code_dft
-                        if best[0].college
-                        else True
-                    )
-                    if not cur_default and best_default:
-                        choose = True
-                    elif cur_default == best_default and cur.id and best[0].id:
-                        choose = cur.id < best[0].id
-            if choose:
-                best = (cur, score)
-        return best
+            )
+        )
+        if college.code == college_code_dft:
+            codes = list(partitions)
+        else:
+            codes = [college.code, college_code_dft]
+
+        matches = [
+            match
+            for code in codes
+            if code in partitions
+            for match in partitions[code].matches(token, threshold)
+        ]
+        if not matches:
+            return None, 0.0
+        best = max(
+            matches,
+            key=lambda match: (
+                match.score,
+                match.payload[1],
+                match.payload[0] != college_code_dft,
+                -match.pk,
+            ),
+        )
+        cur = self.filter(pk=best.pk).first()
+        if cur is None:
+            # Deleted or rolled back since the partitions were loaded.
+            CATALOG_INDEX.discard_curriculum(best.pk)
+            return self.find_fuzzy_match(
+                short_name=short_name,
+                long_name=long_name,
+                college=college,
+                threshold=threshold,
+            )
+        return cur, best.score
 
     def get_or_create(
         self,
@@ -283,6 +286,14 @@ class Curriculum(StatusableMixin, models.Model):
         self._ensure_activity()
         self._ensure_code()
         super().save(*args, **kwargs)
+        if CATALOG_INDEX.has_curricula():
+            long_name = self.long_name
+            CATALOG_INDEX.upsert_curriculum(
+                self.pk,
+                self.college.code,
+                Curriculum.objects._token(self.short_name, long_name),
+                (self.college.code, bool(long_name and long_name != self.short_name)),
+            )
 
     def clean(self) -> None:
         """Validate the curriculum and its current status."""
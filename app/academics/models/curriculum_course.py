@@ -67,6 +67,23 @@ LEVEL_NUMBER_CHOICES = tuple(
 )
 
 
+class CurriCrsQuerySet(models.QuerySet["CurriCrs"]):
+    """Curriculum course queries whose bulk course moves re-key sections."""
+
+    def update(self, **kwargs):
+        """Update rows, refreshing section sort codes when the course moves."""
+        if not {"course", "course_id"} & kwargs.keys():
+            return super().update(**kwargs)
+        from app.timetable.models.section import Section, refresh_section_sort_codes
+
+        pks = list(self.values_list("pk", flat=True))
+        updated = super().update(**kwargs)
+        refresh_section_sort_codes(
+            sections=Section.objects.filter(curriculum_course_id__in=pks)
+        )
+        return updated
+
+
 class CurriCrs(models.Model):
     """Map Curriculum instances to their constituent courses.
 
@@ -130,6 +147,8 @@ class CurriCrs(models.Model):
         help_text="Minimum validated credits required before taking this course",
     )
 
+    objects = CurriCrsQuerySet.as_manager()
+
     @classmethod
     def get_dft(cls, _course: Optional[Course] = None) -> Self:
         """Returns a default CurriCrs."""
@@ -209,17 +228,55 @@ class CurriCrs(models.Model):
         return course_tuition_amount(self, semester)
 
     def total_fee(self, semester) -> Decimal:
-        """Return tuition plus resolved additional fees for a semester."""
+        """Return tuition plus resolved additional fees for a semester.
+
+        Saved curriculum courses and semesters read the stored fee quote.
+        """
+        if self.pk and getattr(semester, "pk", None):
+            from app.finance.fee_quotes import fee_quote_for
+
+            quote = fee_quote_for(self, semester)
+            if quote is not None:
+                return quote.total_amount
         fee_map, _ = resolve_crs_fee_stack_map(self.course, semester)
         fee_total = sum(fee_map.values(), Decimal("0.00"))
         policy_extra = course_policy_extra_amount(self.course)
         return self.tuition_for(semester) + fee_total + policy_extra
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded course and credit hours to detect changes."""
+        instance = super().from_db(db, field_names, values)
+        instance._saved_course_id = instance.__dict__.get("course_id")
+        instance._saved_credit_hours_id = instance.__dict__.get("credit_hours_id")
+        return instance
+
     def save(self, *args, **kwargs):
-        """Make sure we set default before saving."""
+        """Make sure we set default before saving.
+
+        Moving the row to another course re-keys its sections' sort codes;
+        moving it or changing its credit hours drops its fee quotes.
+        """
         self._ensure_credit_hours()
         self._ensure_year_sem_from_level()
+        course_changed = not self._state.adding and (
+            getattr(self, "_saved_course_id", None) != self.course_id
+        )
+        credit_hours_changed = not self._state.adding and (
+            getattr(self, "_saved_credit_hours_id", None) != self.credit_hours_id
+        )
         super().save(*args, **kwargs)
+        self._saved_course_id = self.course_id
+        self._saved_credit_hours_id = self.credit_hours_id
+        from app.finance.fee_quotes import invalidate_fee_quotes
+        from app.timetable.models.section import Section, refresh_section_sort_codes
+
+        if course_changed or credit_hours_changed:
+            invalidate_fee_quotes(curriculum_course_ids=[self.pk])
+        if course_changed:
+            refresh_section_sort_codes(
+                sections=Section.objects.filter(curriculum_course_id=self.pk)
+            )
 
     class Meta:
         constraints = [
@@ -7,6 +7,7 @@ from typing import Self, cast
 from django.db import models
 from simple_history.models import HistoricalRecords
 
+from app.academics.fuzzy_catalog import CATALOG_INDEX
 from app.academics.models.college import College
 
 
@@ -57,12 +58,32 @@ class Department(models.Model):
         """Count the number of courses for this department."""
         return self.courses.count()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded code so saves can tell when it changed."""
+        instance = super().from_db(db, field_names, values)
+        instance._saved_code = instance.__dict__.get("code")
+        return instance
+
     def save(self, *args, **kwargs) -> None:
-        """Save the Department making sure the code is set."""
+        """Save the Department making sure the code is set.
+
+        Fee quotes price courses by department code, so a code change drops
+        the quotes of the department's courses.
+        """
         self._ensure_college()
         self._ensure_shortname()
         self._ensure_long_name()
+        code_changed = not self._state.adding and (
+            getattr(self, "_saved_code", None) != self.code
+        )
         super().save(*args, **kwargs)
+        self._saved_code = self.code
+        CATALOG_INDEX.invalidate_department(self.pk)
+        if code_changed:
+            from app.finance.fee_quotes import invalidate_fee_quotes
+
+            invalidate_fee_quotes(department_ids=[self.pk])
 
     @classmethod
     def get_dft(cls, code="DFT") -> Self:
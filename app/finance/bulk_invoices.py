@@ -0,0 +1,480 @@
+"""Set-based registration invoice materialization for large backfills.
+
+:func:`~app.finance.registration_invoices.materialize_registration_invoices`
+goes through one registration at a time. Each ``CrsInvoice.save`` refreshes
+its parent ``StdSemesterInvoice`` from scratch, which re-aggregates every
+sibling and re-writes their balances and registration statuses. That costs
+dozens of queries per row.
+
+:func:`bulk_materialize_registration_invoices` reaches the same end state
+with a fixed number of statements per batch:
+
+1. amounts come from the preloaded fee-quote map;
+2. missing parent and course invoices are inserted with ``bulk_create``;
+3. parent totals, deposits, balances and payers are recomputed from grouped
+   aggregates, and children and parents are written with ``bulk_update``;
+4. registration statuses are set with one grouped ``UPDATE`` per status.
+
+The per-row path refreshes a parent after every child it touches, so a
+registration can be marked cleared by an intermediate refresh and keep that
+status. :func:`_simulate_parent` replays those intermediate refreshes in
+memory so the bulk path yields the same rows.
+
+Example:
+    >>> summary = bulk_materialize_registration_invoices(registrations)
+    >>> summary["created"], summary["updated"]
+    (120, 4)
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from time import perf_counter
+from typing import TypeAlias, TypeVar
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Prefetch, Sum
+from simple_history.utils import bulk_create_with_history, bulk_update_with_history
+
+from app.finance.fee_quotes import prime_section_fee_quotes
+from app.finance.models.fee_stack import (
+    FeeStack,
+    FeeStackLine,
+    _resolve_line_payer,
+    _resolve_stack_fee_lines_for_sem,
+    _sem_start_date,
+)
+from app.finance.models.invoice import (
+    PAYER_MIXED_CODE,
+    PAYER_STUDENT_CODE,
+    REGIO_STATUS_FOR_INVOICE_STATUS,
+    CrsInvoice,
+    StdSemesterInvoice,
+    _allocate_child_balances,
+    _clamp_non_negative,
+    _crs_invoice_status_code,
+    _ensure_payer_dfts,
+    _quantize_money,
+)
+from app.finance.models.payment import Payment
+from app.finance.models.status_types_methods import InvoiceStatus
+from app.finance.registration_invoices import (
+    INVOICEABLE_REGISTRATION_STATUSES,
+    InvoiceMaterializationSummaryT,
+    RegistrationInvoiceKeyT,
+    _registration_invoice_key,
+    registration_invoice_amount,
+)
+from app.registry.models.registration import Registration
+from app.registry.models.status_types import RegistrationStatus
+
+ZERO = Decimal("0.00")
+BATCH_SIZE = 500
+
+ParentKeyT: TypeAlias = tuple[int, int]
+ProgressCallbackT: TypeAlias = Callable[[str, int, float], None]
+_T = TypeVar("_T")
+
+
+@dataclass
+class _ChildState:
+    """One course invoice as seen by its parent while replaying refreshes."""
+
+    key: RegistrationInvoiceKeyT
+    order: int
+    initial: Decimal
+    invoice: CrsInvoice | None = None
+    balance: Decimal = ZERO
+    status_id: str = "initial"
+
+
+@dataclass
+class _ParentPlan:
+    """Children and refresh events of one touched parent invoice."""
+
+    parent: StdSemesterInvoice
+    children: dict[RegistrationInvoiceKeyT, _ChildState] = field(default_factory=dict)
+    events: list[tuple[RegistrationInvoiceKeyT, Decimal | None]] = field(
+        default_factory=list
+    )
+    sticky_cleared: set[RegistrationInvoiceKeyT] = field(default_factory=set)
+
+
+def _chunks(items: Sequence[_T], size: int) -> Iterator[Sequence[_T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _parent_status(parent: StdSemesterInvoice) -> str:
+    """Mirror ``StdSemesterInvoice._update_status`` on already computed totals."""
+    balance = parent.balance
+    if balance == parent.initial_amount_due:
+        return "initial"
+    if balance == ZERO:
+        return "cleared"
+    if balance <= parent.clearance_balance():
+        return "settled"
+    return "updated"
+
+
+def _refresh_parent(
+    plan: _ParentPlan, fee_total: Decimal, payments_total: Decimal
+) -> list[_ChildState]:
+    """Apply ``refresh_totals_from_sources`` to the plan's current children."""
+    parent = plan.parent
+    children = sorted(plan.children.values(), key=lambda child: child.order)
+    course_total = sum((child.initial for child in children), ZERO)
+    parent.initial_amount_due = _quantize_money(course_total + fee_total)
+    parent.required_deposit_amount = parent.initial_required_deposit()
+    parent.balance = _clamp_non_negative(parent.initial_amount_due - payments_total)
+    parent.status_id = _parent_status(parent)
+    balances = _allocate_child_balances(
+        parent.balance,
+        parent.initial_amount_due,
+        course_total,
+        [child.initial for child in children],
+    )
+    for child, balance in zip(children, balances, strict=True):
+        child.balance = balance
+        child.status_id = _crs_invoice_status_code(balance, child.initial)
+    return children
+
+
+def _simulate_parent(
+    plan: _ParentPlan, fee_total: Decimal, payments_total: Decimal
+) -> None:
+    """Replay the per-row refresh after each event; keep the final state.
+
+    Children attached before the run start with their previous amounts;
+    each event then applies one registration's amount and refreshes. A
+    registration set to cleared by any intermediate refresh is never moved
+    back by later refreshes.
+    """
+    final = plan.children
+    evented = {key for key, _ in plan.events}
+    plan.children = {
+        key: _ChildState(key, child.order, child.initial, child.invoice)
+        for key, child in final.items()
+        if key not in evented
+    }
+    for key, previous_initial in plan.events:
+        if previous_initial is not None:
+            child = final[key]
+            plan.children[key] = _ChildState(key, child.order, previous_initial)
+    for key, _ in plan.events:
+        child = final[key]
+        plan.children[key] = _ChildState(key, child.order, child.initial, child.invoice)
+        for state in _refresh_parent(plan, fee_total, payments_total):
+            if state.status_id == "cleared":
+                plan.sticky_cleared.add(state.key)
+
+
+def _sem_fee_totals(
+    parents: Iterable[StdSemesterInvoice],
+) -> dict[int, tuple[Decimal, str | None]]:
+    """Return attached fee-stack total and resolved fee payer per parent."""
+    resolved: dict[int, tuple[Decimal, str | None]] = {}
+    for parent in parents:
+        semester_start = _sem_start_date(parent.semester)
+        total = ZERO
+        payers: set[str] = set()
+        for fee_stack in parent.fee_stacks.all():
+            lines = _resolve_stack_fee_lines_for_sem(fee_stack.fees.all(), semester_start)
+            total += sum((line.amount for line in lines), ZERO)
+            payers.update(
+                _resolve_line_payer(line, parent.fee_payer_id) for line in lines
+            )
+        if len(payers) > 1:
+            payer = PAYER_MIXED_CODE
+        elif len(payers) == 1:
+            payer = payers.pop()
+        else:
+            payer = parent.fee_payer_id or PAYER_STUDENT_CODE
+        resolved[parent.pk] = (total, payer)
+    return resolved
+
+
+def _load_parents(parent_ids: Sequence[int]) -> dict[int, StdSemesterInvoice]:
+    lines = FeeStackLine.objects.select_related(
+        "fee_type", "effective_from_semester", "fee_stack"
+    )
+    stacks = FeeStack.objects.prefetch_related(Prefetch("fees", queryset=lines))
+    parents: dict[int, StdSemesterInvoice] = {}
+    for chunk in _chunks(parent_ids, BATCH_SIZE):
+        parents.update(
+            StdSemesterInvoice.objects.filter(pk__in=chunk)
+            .select_related("semester")
+            .prefetch_related(Prefetch("fee_stacks", queryset=stacks))
+            .in_bulk()
+        )
+    return parents
+
+
+def _cleared_payment_totals(parent_ids: Sequence[int]) -> dict[int, Decimal]:
+    totals: dict[int, Decimal] = {}
+    for chunk in _chunks(parent_ids, BATCH_SIZE):
+        rows = (
+            Payment.objects.filter(
+                student_semester_invoice_id__in=chunk, status_id="cleared"
+            )
+            .values("student_semester_invoice_id")
+            .annotate(total=Sum("amount_paid"))
+            .values_list("student_semester_invoice_id", "total")
+        )
+        totals.update({parent_id: total or ZERO for parent_id, total in rows})
+    return totals
+
+
+def _existing_invoices(
+    keys: set[RegistrationInvoiceKeyT],
+) -> dict[RegistrationInvoiceKeyT, CrsInvoice]:
+    """Return stored course invoices for registration keys, batched by student."""
+    student_ids = sorted({student_id for student_id, _, _ in keys})
+    found: dict[RegistrationInvoiceKeyT, CrsInvoice] = {}
+    for chunk in _chunks(student_ids, BATCH_SIZE):
+        for invoice in CrsInvoice.objects.filter(student_id__in=chunk):
+            key = (invoice.student_id, invoice.curriculum_course_id, invoice.semester_id)
+            if key in keys:
+                found[key] = invoice
+    return found
+
+
+def _ensure_parents(
+    parent_keys: set[ParentKeyT],
+) -> dict[ParentKeyT, StdSemesterInvoice]:
+    """Return parents for (student, semester) keys, inserting missing ones."""
+    student_ids = sorted({student_id for student_id, _ in parent_keys})
+    parents: dict[ParentKeyT, StdSemesterInvoice] = {}
+    for chunk in _chunks(student_ids, BATCH_SIZE):
+        for parent in StdSemesterInvoice.objects.filter(student_id__in=chunk):
+            key = (parent.student_id, parent.semester_id)
+            if key in parent_keys:
+                parents[key] = parent
+    missing = sorted(parent_keys.difference(parents))
+    if missing:
+        _ensure_payer_dfts()
+        # Same defaults StdSemesterInvoice.save() fills on a bare insert.
+        created = bulk_create_with_history(
+            [
+                StdSemesterInvoice(
+                    student_id=student_id,
+                    semester_id=semester_id,
+                    initial_amount_due=ZERO,
+                    required_deposit_amount=ZERO,
+                    balance=ZERO,
+                    status_id="initial",
+                )
+                for student_id, semester_id in missing
+            ],
+            StdSemesterInvoice,
+            batch_size=BATCH_SIZE,
+        )
+        for parent in created:
+            key = (parent.student_id, parent.semester_id)
+            if key in parent_keys:
+                parents[key] = parent
+    return parents
+
+
+def _update_registration_statuses(plans: Iterable[_ParentPlan]) -> None:
+    """Write registration statuses with one grouped UPDATE per status."""
+    invoice_ids: dict[str, list[int]] = defaultdict(list)
+    for plan in plans:
+        for child in plan.children.values():
+            status = REGIO_STATUS_FOR_INVOICE_STATUS[child.status_id]
+            if child.key in plan.sticky_cleared:
+                status = "cleared"
+            invoice_ids[status].append(child.invoice.pk)
+    RegistrationStatus.ensure_codes(invoice_ids)
+    for status_code, ids in invoice_ids.items():
+        for chunk in _chunks(ids, BATCH_SIZE):
+            matching_invoice = CrsInvoice.objects.filter(
+                pk__in=chunk,
+                student_id=OuterRef("student_id"),
+                curriculum_course_id=OuterRef("section__curriculum_course_id"),
+                semester_id=OuterRef("section__semester_id"),
+            )
+            Registration.objects.filter(Exists(matching_invoice)).exclude(
+                status_id="cleared"
+            ).update(status_id=status_code)
+
+
+def bulk_materialize_registration_invoices(
+    registrations: Iterable[Registration],
+    *,
+    dry_run: bool = False,
+    progress: ProgressCallbackT | None = None,
+) -> InvoiceMaterializationSummaryT:
+    """Create or patch invoices for registrations with set-based statements.
+
+    Produces the same invoices, parent totals, registration statuses and
+    summary as ``materialize_registration_invoices`` for the same input.
+
+    Args:
+        registrations: Registrations in processing order (see
+            ``invoiceable_registration_qs``).
+        dry_run: Roll back every write before returning.
+        progress: Optional ``(phase, row count, seconds)`` callback invoked
+            as each phase finishes.
+    """
+    started = perf_counter()
+
+    def report(phase: str, count: int) -> None:
+        nonlocal started
+        if progress is not None:
+            progress(phase, count, perf_counter() - started)
+        started = perf_counter()
+
+    summary: InvoiceMaterializationSummaryT = {
+        "created": 0,
+        "updated": 0,
+        "existing": 0,
+        "skipped_status": 0,
+        "skipped_zero": 0,
+    }
+    registrations = list(registrations)
+    prime_section_fee_quotes(registration.section for registration in registrations)
+    targets: dict[RegistrationInvoiceKeyT, Decimal] = {}
+    for registration in registrations:
+        if registration.status_id not in INVOICEABLE_REGISTRATION_STATUSES:
+            summary["skipped_status"] += 1
+            continue
+        amount = registration_invoice_amount(registration)
+        if amount <= ZERO:
+            summary["skipped_zero"] += 1
+            continue
+        key = _registration_invoice_key(registration)
+        if key in targets:
+            summary["existing"] += 1  # patched by its first registration
+            continue
+        targets[key] = amount
+    report("quotes", len(registrations))
+
+    with transaction.atomic():
+        for status_lookup in (
+            InvoiceStatus.initial,
+            InvoiceStatus.updated,
+            InvoiceStatus.settled,
+            InvoiceStatus.cleared,
+        ):
+            status_lookup()  # status rows are referenced by raw ids below
+        existing = _existing_invoices(set(targets))
+        parent_keys = {
+            (key[0], key[2])
+            for key in targets
+            if key not in existing or existing[key].student_semester_invoice_id is None
+        }
+        parents_by_key = _ensure_parents(parent_keys)
+        report("parents", len(parents_by_key))
+
+        touched: dict[int, list[tuple[RegistrationInvoiceKeyT, Decimal | None]]] = {}
+        new_children: list[CrsInvoice] = []
+        patched_children: list[CrsInvoice] = []
+        for key, amount in targets.items():
+            student_id, curriculum_course_id, semester_id = key
+            invoice = existing.get(key)
+            previous_initial = None
+            if invoice is None:
+                parent = parents_by_key[(student_id, semester_id)]
+                invoice = CrsInvoice(
+                    student_id=student_id,
+                    curriculum_course_id=curriculum_course_id,
+                    semester_id=semester_id,
+                    student_semester_invoice_id=parent.pk,
+                    initial_amount_due=amount,
+                    balance=amount,
+                    status_id="initial",
+                )
+                new_children.append(invoice)
+                summary["created"] += 1
+            else:
+                parent_id = invoice.student_semester_invoice_id
+                changed = (
+                    invoice.initial_amount_due != amount
+                    or parent_id is None
+                    or (invoice.balance is None and parent_id not in touched)
+                )
+                if not changed:
+                    summary["existing"] += 1
+                    continue
+                if parent_id is not None:
+                    previous_initial = invoice.initial_amount_due
+                invoice.initial_amount_due = amount
+                if parent_id is None:
+                    parent_id = parents_by_key[(student_id, semester_id)].pk
+                    invoice.student_semester_invoice_id = parent_id
+                patched_children.append(invoice)
+                summary["updated"] += 1
+            touched.setdefault(invoice.student_semester_invoice_id, []).append(
+                (key, previous_initial)
+            )
+        bulk_create_with_history(new_children, CrsInvoice, batch_size=BATCH_SIZE)
+        CrsInvoice.objects.bulk_update(
+            patched_children,
+            ["initial_amount_due", "student_semester_invoice"],
+            batch_size=BATCH_SIZE,
+        )
+        report("course_invoices", len(new_children) + len(patched_children))
+
+        plans = _plan_parents(touched)
+        _write_refreshed_parents(plans)
+        report("parent_totals", len(plans))
+        _update_registration_statuses(plans.values())
+        report("registration_statuses", sum(len(p.children) for p in plans.values()))
+        if dry_run:
+            transaction.set_rollback(True)
+    return summary
+
+
+def _plan_parents(
+    touched: dict[int, list[tuple[RegistrationInvoiceKeyT, Decimal | None]]],
+) -> dict[int, _ParentPlan]:
+    """Build one refresh plan per touched parent from its stored children."""
+    parent_ids = sorted(touched)
+    parents = _load_parents(parent_ids)
+    plans = {
+        parent_id: _ParentPlan(parents[parent_id], events=touched[parent_id])
+        for parent_id in parent_ids
+    }
+    for chunk in _chunks(parent_ids, BATCH_SIZE):
+        for child in CrsInvoice.objects.filter(student_semester_invoice_id__in=chunk):
+            key = (child.student_id, child.curriculum_course_id, child.semester_id)
+            plans[child.student_semester_invoice_id].children[key] = _ChildState(
+                key, child.pk, child.initial_amount_due, child
+            )
+    return plans
+
+
+def _write_refreshed_parents(plans: dict[int, _ParentPlan]) -> None:
+    """Recompute touched parents and their children and write them in bulk."""
+    parent_ids = sorted(plans)
+    payments = _cleared_payment_totals(parent_ids)
+    fees = _sem_fee_totals(plan.parent for plan in plans.values())
+    children: list[CrsInvoice] = []
+    for parent_id, plan in plans.items():
+        fee_total, fee_payer = fees[parent_id]
+        _simulate_parent(plan, fee_total, payments.get(parent_id, ZERO))
+        plan.parent.fee_payer_id = fee_payer
+        for child in plan.children.values():
+            child.invoice.balance = child.balance
+            child.invoice.status_id = child.status_id
+            children.append(child.invoice)
+    CrsInvoice.objects.bulk_update(children, ["balance", "status"], batch_size=BATCH_SIZE)
+    bulk_update_with_history(
+        [plan.parent for plan in plans.values()],
+        StdSemesterInvoice,
+        [
+            "initial_amount_due",
+            "required_deposit_amount",
+            "balance",
+            "fee_payer",
+            "status",
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+__all__ = ["ProgressCallbackT", "bulk_materialize_registration_invoices"]
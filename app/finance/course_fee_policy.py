@@ -208,6 +208,32 @@ def load_tuition_rates(path: Path = DEFAULT_TUITION_RATES_PATH) -> TuitionRateMa
     return rates
 
 
+_POLICY_VERSION: list[str] = []
+
+
+def policy_version() -> str:
+    """Return a fingerprint of the policy TSVs, reloading them when it changes.
+
+    Stored fee quotes carry this value so edits to the override or tuition
+    tables make them stale without touching the database.
+    """
+    parts = []
+    for path in (DEFAULT_COURSE_FEE_OVERRIDES_PATH, DEFAULT_TUITION_RATES_PATH):
+        try:
+            stat = path.stat()
+        except OSError:
+            parts.append("-")
+            continue
+        parts.append(f"{stat.st_mtime_ns:x}.{stat.st_size:x}")
+    version = ":".join(parts)
+    if _POLICY_VERSION != [version]:
+        if _POLICY_VERSION:
+            load_course_fee_overrides.cache_clear()
+            load_tuition_rates.cache_clear()
+        _POLICY_VERSION[:] = [version]
+    return version
+
+
 def _credit_hours(curriculum_course: "CurriCrs") -> int:
     """Return credit hours as an integer, falling back to zero."""
     credit_hours = getattr(curriculum_course, "credit_hours", None)
@@ -260,6 +286,7 @@ __all__ = [
     "is_general_science_course",
     "load_course_fee_overrides",
     "load_tuition_rates",
+    "policy_version",
     "tuition_rate_for_semester",
     "unresolved_lab_fee_candidate_rows",
 ]
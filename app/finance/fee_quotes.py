@@ -0,0 +1,220 @@
+"""Build, read and invalidate the precomputed course fee quotes.
+
+A :class:`~app.finance.models.fee_quote.CrsFeeQuote` row stores what
+``CurriCrs.total_fee`` used to resolve on every call: billing-policy
+tuition, the fee-stack lines active in the semester and the policy extra.
+Readers ask for many quotes at once (:func:`fee_quotes_for`,
+:func:`prime_section_fee_quotes`); missing or stale rows are computed in one
+bulk pass that loads every fee stack with a single prefetch. Reads never
+write: rows are stored by :func:`rebuild_sem_fee_quotes` (when a semester
+opens for registration and from ``rebuild_fee_quotes``).
+
+Example:
+    >>> prime_section_fee_quotes(sections)
+    >>> [section.fee_total_amount() for section in sections]  # no queries
+    [Decimal('45.00'), Decimal('30.00')]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import TYPE_CHECKING, TypeAlias
+
+from django.db.models import Prefetch, Q
+
+from app.finance.course_fee_policy import course_fee_breakdown, policy_version
+from app.finance.models.fee_quote import CrsFeeQuote
+from app.finance.models.fee_stack import CrsFeeStack, resolve_crs_fee_stack_map
+
+if TYPE_CHECKING:
+    from app.academics.models.curriculum_course import CurriCrs
+    from app.timetable.models.section import Section
+    from app.timetable.models.semester import Semester
+
+QuoteKeyT: TypeAlias = tuple[int, int]
+QuoteMapT: TypeAlias = dict[QuoteKeyT, CrsFeeQuote]
+
+ZERO = Decimal("0.00")
+QUOTE_ATTR = "_fee_quote"
+_UPDATE_FIELDS = [
+    "credit_hours",
+    "tuition_rate",
+    "tuition_amount",
+    "tuition_reason",
+    "fee_lines",
+    "fee_amount",
+    "policy_extra_amount",
+    "total_amount",
+    "policy_version",
+    "computed_at",
+]
+
+
+def build_fee_quote(
+    curriculum_course: "CurriCrs", semester: "Semester", version: str = ""
+) -> CrsFeeQuote:
+    """Return an unsaved quote computed from fee stacks and policy tables."""
+    fee_map, label_map = resolve_crs_fee_stack_map(curriculum_course.course, semester)
+    breakdown = course_fee_breakdown(curriculum_course, semester)
+    fee_amount = sum(fee_map.values(), ZERO)
+    return CrsFeeQuote(
+        curriculum_course=curriculum_course,
+        semester=semester,
+        credit_hours=breakdown["credit_hours"],
+        tuition_rate=breakdown["tuition_rate"],
+        tuition_amount=breakdown["base_amount"],
+        tuition_reason=breakdown["reason"],
+        fee_lines={
+            code: {"label": label_map.get(code, code), "amount": str(amount)}
+            for code, amount in sorted(fee_map.items())
+        },
+        fee_amount=fee_amount,
+        policy_extra_amount=breakdown["extra_amount"],
+        total_amount=breakdown["base_amount"] + fee_amount + breakdown["extra_amount"],
+        policy_version=version,
+    )
+
+
+def _compute_quotes(keys: set[QuoteKeyT], version: str) -> list[CrsFeeQuote]:
+    """Compute quotes for ``keys`` with one load of courses, stacks and terms."""
+    from app.academics.models.curriculum_course import CurriCrs
+    from app.timetable.models.semester import Semester
+
+    stacks = CrsFeeStack.objects.select_related("fee_stack").prefetch_related(
+        "fee_stack__fees__fee_type", "fee_stack__fees__effective_from_semester"
+    )
+    curriculum_courses = {
+        cc.pk: cc
+        for cc in CurriCrs.objects.filter(pk__in={cc_id for cc_id, _ in keys})
+        .select_related("course__department", "credit_hours")
+        .prefetch_related(Prefetch("course__course_fee_stacks", queryset=stacks))
+    }
+    semesters = Semester.objects.select_related("academic_year").in_bulk(
+        {sem_id for _, sem_id in keys}
+    )
+    return [
+        build_fee_quote(curriculum_courses[cc_id], semesters[sem_id], version)
+        for cc_id, sem_id in sorted(keys)
+        if cc_id in curriculum_courses and sem_id in semesters
+    ]
+
+
+def _store_quotes(quotes: list[CrsFeeQuote]) -> None:
+    if quotes:
+        CrsFeeQuote.objects.bulk_create(
+            quotes,
+            update_conflicts=True,
+            unique_fields=["curriculum_course", "semester"],
+            update_fields=_UPDATE_FIELDS,
+        )
+
+
+def fee_quotes_for(keys: Iterable[QuoteKeyT]) -> QuoteMapT:
+    """Return current quotes for (curriculum course id, semester id) keys.
+
+    Stored rows built against the current policy tables are read in one
+    query; the rest are computed in bulk and returned unsaved.
+    """
+    wanted = {(int(cc_id), int(sem_id)) for cc_id, sem_id in keys if cc_id and sem_id}
+    if not wanted:
+        return {}
+    version = policy_version()
+    lookup = Q()
+    for sem_id in {sem_id for _, sem_id in wanted}:
+        cc_ids = [cc_id for cc_id, key_sem in wanted if key_sem == sem_id]
+        lookup |= Q(semester_id=sem_id, curriculum_course_id__in=cc_ids)
+    quotes: QuoteMapT = {
+        (quote.curriculum_course_id, quote.semester_id): quote
+        for quote in CrsFeeQuote.objects.filter(lookup, policy_version=version)
+    }
+    missing = wanted.difference(quotes)
+    if missing:
+        computed = _compute_quotes(missing, version)
+        quotes.update(
+            {(quote.curriculum_course_id, quote.semester_id): quote for quote in computed}
+        )
+    return quotes
+
+
+def fee_quote_for(
+    curriculum_course: "CurriCrs", semester: "Semester"
+) -> CrsFeeQuote | None:
+    """Return the quote of one curriculum course in one semester."""
+    return fee_quotes_for([(curriculum_course.pk, semester.pk)]).get(
+        (curriculum_course.pk, semester.pk)
+    )
+
+
+def prime_section_fee_quotes(sections: Iterable["Section"]) -> None:
+    """Attach quotes to sections so ``fee_total_amount`` runs no queries."""
+    section_list = [section for section in sections if section is not None]
+    quotes = fee_quotes_for(
+        (section.curriculum_course_id, section.semester_id) for section in section_list
+    )
+    for section in section_list:
+        setattr(
+            section,
+            QUOTE_ATTR,
+            quotes.get((section.curriculum_course_id, section.semester_id)),
+        )
+
+
+def rebuild_sem_fee_quotes(semester: "Semester") -> int:
+    """Recompute every quote of the curriculum courses offered in a semester."""
+    from app.timetable.models.section import Section
+
+    cc_ids = set(
+        Section.objects.filter(semester=semester).values_list(
+            "curriculum_course_id", flat=True
+        )
+    )
+    quotes = _compute_quotes({(cc_id, semester.pk) for cc_id in cc_ids}, policy_version())
+    CrsFeeQuote.objects.filter(semester=semester).exclude(
+        curriculum_course_id__in=cc_ids
+    ).delete()
+    _store_quotes(quotes)
+    return len(quotes)
+
+
+def invalidate_fee_quotes(
+    *,
+    course_ids: Iterable[int] = (),
+    curriculum_course_ids: Iterable[int] = (),
+    department_ids: Iterable[int] = (),
+    fee_stack_ids: Iterable[int] = (),
+    semester_ids: Iterable[int] = (),
+    academic_year_ids: Iterable[int] = (),
+) -> int:
+    """Delete the quotes affected by a fee, course, code or semester change."""
+    lookup = Q()
+    if course_ids := [pk for pk in course_ids if pk]:
+        lookup |= Q(curriculum_course__course_id__in=course_ids)
+    if department_ids := [pk for pk in department_ids if pk]:
+        lookup |= Q(curriculum_course__course__department_id__in=department_ids)
+    if curriculum_course_ids := [pk for pk in curriculum_course_ids if pk]:
+        lookup |= Q(curriculum_course_id__in=curriculum_course_ids)
+    if fee_stack_ids := [pk for pk in fee_stack_ids if pk]:
+        lookup |= Q(
+            curriculum_course__course__course_fee_stacks__fee_stack_id__in=fee_stack_ids
+        )
+    if semester_ids := [pk for pk in semester_ids if pk]:
+        lookup |= Q(semester_id__in=semester_ids)
+    if academic_year_ids := [pk for pk in academic_year_ids if pk]:
+        lookup |= Q(semester__academic_year_id__in=academic_year_ids)
+    if not lookup:
+        return 0
+    stale = list(CrsFeeQuote.objects.filter(lookup).values_list("pk", flat=True))
+    deleted, _ = CrsFeeQuote.objects.filter(pk__in=stale).delete()
+    return deleted
+
+
+__all__ = [
+    "QuoteKeyT",
+    "build_fee_quote",
+    "fee_quote_for",
+    "fee_quotes_for",
+    "invalidate_fee_quotes",
+    "prime_section_fee_quotes",
+    "rebuild_sem_fee_quotes",
+]
@@ -0,0 +1,235 @@
+"""Deferred, coalesced recomputation of parent invoice totals.
+
+``StdSemesterInvoice.refresh_totals_from_sources`` re-aggregates courses,
+fee stacks and payments and rewrites every child invoice. Callers that may
+touch many invoices at once (fee-stack edits, registration cancellation,
+payment imports) mark them dirty instead:
+
+* :func:`mark_invoices_dirty` upserts one :class:`DirtyInvoice` row per
+  invoice inside the caller's transaction, so marks are as durable as the
+  change that caused them and repeated marks collapse onto one row;
+* inside :func:`deferred_invoice_refresh` (opened per request by
+  :class:`InvoiceRefreshMiddleware`) marks are collected and, when there are
+  at most ``INVOICE_REFRESH_SYNC_LIMIT`` of them, refreshed when the scope
+  ends; outside a scope small marks are refreshed right away;
+* larger sets stay queued for ``manage.py drain_invoice_queue``.
+
+Example:
+    >>> with deferred_invoice_refresh():
+    ...     mark_invoices_dirty([12, 13], reason="fee_stack")
+    ...     mark_invoices_dirty([12], reason="fee_stack")  # coalesced
+    >>> invoice_queue_stats()["depth"]
+    0
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from time import perf_counter
+from typing import TypedDict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+
+from app.finance.models.invoice import StdSemesterInvoice
+from app.finance.models.invoice_queue import DirtyInvoice
+
+logger = logging.getLogger("app.finance.invoice_queue")
+
+SYNC_LIMIT = 50
+DRAIN_BATCH_SIZE = 100
+
+
+class InvoiceQueueStatsT(TypedDict):
+    """Depth and lag of the dirty-invoice queue."""
+
+    depth: int
+    oldest_marked_at: datetime | None
+    lag_seconds: float
+
+
+class InvoiceQueueDrainT(TypedDict):
+    """Counters for one drain of the dirty-invoice queue."""
+
+    refreshed: int
+    batches: int
+    seconds: float
+
+
+@dataclass
+class _RefreshScope:
+    """Invoices marked while one request or job runs."""
+
+    invoice_ids: set[int] = field(default_factory=set)
+
+
+_scope: ContextVar[_RefreshScope | None] = ContextVar(
+    "invoice_refresh_scope", default=None
+)
+
+
+def sync_limit() -> int:
+    """Return how many marked invoices may be refreshed synchronously."""
+    return int(getattr(settings, "INVOICE_REFRESH_SYNC_LIMIT", SYNC_LIMIT))
+
+
+def mark_invoices_dirty(invoice_ids: Iterable[int | None], *, reason: str = "") -> int:
+    """Queue parent invoices for a totals refresh; return how many were new.
+
+    Invoices already marked in the current scope are skipped; the rest are
+    upserted into the queue table.
+    """
+    ids = {int(pk) for pk in invoice_ids if pk}
+    scope = _scope.get()
+    if scope is not None:
+        ids.difference_update(scope.invoice_ids)
+        scope.invoice_ids.update(ids)
+    if not ids:
+        return 0
+    now = timezone.now()
+    DirtyInvoice.objects.bulk_create(
+        [
+            DirtyInvoice(
+                student_semester_invoice_id=pk,
+                reason=reason,
+                first_marked_at=now,
+                last_marked_at=now,
+            )
+            for pk in sorted(ids)
+        ],
+        update_conflicts=True,
+        unique_fields=["student_semester_invoice"],
+        update_fields=["reason", "last_marked_at"],
+    )
+    if scope is None and len(ids) <= sync_limit():
+        drain_dirty_invoices(invoice_ids=ids)
+    return len(ids)
+
+
+@contextmanager
+def deferred_invoice_refresh() -> Iterator[None]:
+    """Collect marks until the block ends, then refresh them if few.
+
+    Nested scopes join the outermost one. Marks are left queued when the
+    block raises or marked more than ``INVOICE_REFRESH_SYNC_LIMIT`` invoices.
+    """
+    if _scope.get() is not None:
+        yield
+        return
+    scope = _RefreshScope()
+    token = _scope.set(scope)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+    if scope.invoice_ids and len(scope.invoice_ids) <= sync_limit():
+        drain_dirty_invoices(invoice_ids=scope.invoice_ids)
+
+
+def _refresh_invoices(invoice_ids: list[int]) -> int:
+    """Refresh the given invoices and drop their queue rows."""
+    refreshed = 0
+    for invoice in StdSemesterInvoice.objects.filter(pk__in=invoice_ids).order_by("pk"):
+        invoice.refresh_totals_from_sources(save_model=True)
+        refreshed += 1
+    DirtyInvoice.objects.filter(student_semester_invoice_id__in=invoice_ids).delete()
+    return refreshed
+
+
+def drain_dirty_invoices(
+    *,
+    invoice_ids: Iterable[int] | None = None,
+    batch_size: int = DRAIN_BATCH_SIZE,
+    limit: int | None = None,
+    progress: Callable[[InvoiceQueueDrainT], None] | None = None,
+) -> InvoiceQueueDrainT:
+    """Refresh queued invoices oldest first, one transaction per batch.
+
+    Args:
+        invoice_ids: Only drain these invoices (queued or not).
+        batch_size: Invoices refreshed per transaction.
+        limit: Stop after about this many invoices.
+        progress: Optional callback receiving the running counters after
+            each batch.
+
+    Rows are locked with ``SKIP LOCKED`` where supported, so several workers
+    can drain concurrently.
+    """
+    started = perf_counter()
+    summary: InvoiceQueueDrainT = {"refreshed": 0, "batches": 0, "seconds": 0.0}
+    if invoice_ids is not None:
+        with transaction.atomic():
+            summary["refreshed"] = _refresh_invoices(sorted(set(invoice_ids)))
+        summary["batches"] = 1
+        summary["seconds"] = perf_counter() - started
+        return summary
+    while limit is None or summary["refreshed"] < limit:
+        size = batch_size
+        if limit is not None:
+            size = min(batch_size, limit - summary["refreshed"])
+        with transaction.atomic():
+            batch = list(
+                DirtyInvoice.objects.select_for_update(skip_locked=True)
+                .order_by("first_marked_at", "pk")
+                .values_list("student_semester_invoice_id", flat=True)[:size]
+            )
+            if not batch:
+                break
+            summary["refreshed"] += _refresh_invoices(batch)
+        summary["batches"] += 1
+        summary["seconds"] = perf_counter() - started
+        if progress is not None:
+            progress(summary)
+    summary["seconds"] = perf_counter() - started
+    stats = invoice_queue_stats()
+    logger.info(
+        json.dumps(
+            {
+                "event": "invoice_queue_drain",
+                **summary,
+                "depth": stats["depth"],
+                "lag_seconds": stats["lag_seconds"],
+            }
+        )
+    )
+    return summary
+
+
+def invoice_queue_stats() -> InvoiceQueueStatsT:
+    """Return the queue depth and the age of its oldest mark."""
+    row = DirtyInvoice.objects.aggregate(depth=Count("pk"), oldest=Min("first_marked_at"))
+    oldest = row["oldest"]
+    lag = (timezone.now() - oldest).total_seconds() if oldest else 0.0
+    return {"depth": row["depth"], "oldest_marked_at": oldest, "lag_seconds": lag}
+
+
+class InvoiceRefreshMiddleware:
+    """Refresh the invoices a request marked once its response is ready."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with deferred_invoice_refresh():
+            return self.get_response(request)
+
+
+__all__ = [
+    "InvoiceQueueDrainT",
+    "InvoiceQueueStatsT",
+    "InvoiceRefreshMiddleware",
+    "deferred_invoice_refresh",
+    "drain_dirty_invoices",
+    "invoice_queue_stats",
+    "mark_invoices_dirty",
+    "sync_limit",
+]
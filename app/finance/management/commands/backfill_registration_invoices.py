@@ -9,6 +9,7 @@ from typing import Iterable
 from django.core.management.base import BaseCommand, CommandError, CommandParser
 from django.db.models import Q
 
+from app.finance.bulk_invoices import bulk_materialize_registration_invoices
 from app.finance.course_fee_policy import unresolved_lab_fee_candidate_rows
 from app.finance.registration_invoices import (
     invoice_generation_registration_qs,
@@ -67,6 +68,11 @@ class Command(BaseCommand):
             action="store_true",
             help="Report what would be created without writing invoices.",
         )
+        parser.add_argument(
+            "--per-row",
+            action="store_true",
+            help="Save invoices one registration at a time instead of in bulk.",
+        )
 
     def handle(self, *args: object, **options: object) -> None:
         """Run the registration invoice backfill."""
@@ -94,7 +100,12 @@ class Command(BaseCommand):
         registration_count = registrations.count()
         if lab_report_path:
             _write_lab_report(Path(lab_report_path), registrations)
-        summary = materialize_registration_invoices(registrations, dry_run=dry_run)
+        if options.get("per_row"):
+            summary = materialize_registration_invoices(registrations, dry_run=dry_run)
+        else:
+            summary = bulk_materialize_registration_invoices(
+                registrations, dry_run=dry_run, progress=self._report_phase
+            )
         action = "would process" if dry_run else "processed"
         self.stdout.write(
             self.style.SUCCESS(
@@ -105,6 +116,10 @@ class Command(BaseCommand):
             )
         )
 
+    def _report_phase(self, phase: str, count: int, seconds: float) -> None:
+        """Print one bulk materialization phase with its row count and timing."""
+        self.stdout.write(f"  {phase}: {count} row(s) in {seconds:.2f}s")
+
 
 def _resolve_student_id(token: str) -> int:
     """Resolve a student selector to a database id."""
@@ -0,0 +1,91 @@
+"""Refresh parent invoices queued by fee-stack edits, imports and cancellations."""
+
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from app.finance.invoice_queue import (
+    DRAIN_BATCH_SIZE,
+    InvoiceQueueDrainT,
+    drain_dirty_invoices,
+    invoice_queue_stats,
+)
+
+
+class Command(BaseCommand):
+    """Drain the dirty-invoice queue in batches."""
+
+    help = "Recompute totals of queued StdSemesterInvoice rows, oldest first."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DRAIN_BATCH_SIZE,
+            help="Invoices refreshed per transaction.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Stop after about this many invoices (default: until empty).",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the queue instead of exiting when it is empty.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=5.0,
+            help="Seconds to wait between polls with --loop.",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Only print queue depth and lag.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Drain once, or keep draining with --loop."""
+        if options["stats"]:
+            self._write_stats()
+            return
+        while True:
+            summary = drain_dirty_invoices(
+                batch_size=options["batch_size"],
+                limit=options["limit"],
+                progress=self._write_progress,
+            )
+            if summary["refreshed"] or not options["loop"]:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Refreshed {summary['refreshed']} invoice(s) in "
+                        f"{summary['batches']} batch(es), {summary['seconds']:.2f}s."
+                    )
+                )
+            if not options["loop"]:
+                break
+            time.sleep(options["sleep"])
+        self._write_stats()
+
+    def _write_progress(self, summary: InvoiceQueueDrainT) -> None:
+        """Print running counters after each batch."""
+        self.stdout.write(
+            f"  batch {summary['batches']}: {summary['refreshed']} refreshed "
+            f"({summary['seconds']:.2f}s)"
+        )
+
+    def _write_stats(self) -> None:
+        """Print the queue depth and the age of the oldest mark."""
+        stats = invoice_queue_stats()
+        self.stdout.write(
+            f"Queue depth {stats['depth']}, lag {stats['lag_seconds']:.0f}s."
+        )
+
+
+__all__ = ["Command"]
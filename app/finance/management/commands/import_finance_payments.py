@@ -11,6 +11,7 @@ from typing import Mapping, TypeAlias
 from django.core.management.base import BaseCommand, CommandError, CommandParser
 from django.db import transaction
 
+from app.finance.invoice_queue import mark_invoices_dirty, sync_limit
 from app.finance.models.invoice import StdSemesterInvoice
 from app.finance.models.payment import Payment
 from app.finance.models.status_types_methods import Payer, PaymentMethod, PaymentStatus
@@ -113,8 +114,7 @@ class Command(BaseCommand):
                 _write_payment_errors(errors)
                 raise CommandError(f"Payment import failed with {len(errors)} errors.")
 
-            for invoice in StdSemesterInvoice.objects.filter(id__in=parent_invoice_ids):
-                invoice.refresh_totals_from_sources(save_model=True)
+            queued = mark_invoices_dirty(parent_invoice_ids, reason="payment_import")
 
             if dry_run:
                 transaction.set_rollback(True)
@@ -125,6 +125,10 @@ class Command(BaseCommand):
                 f"{created} payments created."
             )
         )
+        if queued > sync_limit():
+            self.stdout.write(
+                f"{queued} invoice refresh(es) queued; run drain_invoice_queue."
+            )
 
 
 def _payment_from_row(row: RowT) -> Payment:
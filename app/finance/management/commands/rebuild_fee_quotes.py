@@ -0,0 +1,42 @@
+"""Rebuild the stored course fee quotes of one or all semesters."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from app.finance.fee_quotes import rebuild_sem_fee_quotes
+from app.timetable.models.semester import Semester
+
+
+class Command(BaseCommand):
+    """Recompute CrsFeeQuote rows for every offered curriculum course."""
+
+    help = "Rebuild course fee quotes (tuition, fee-stack lines, policy extras)."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--semester-id",
+            type=int,
+            default=None,
+            help="Limit to one semester database id (default: all semesters).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Rebuild quotes semester by semester."""
+        semesters = Semester.objects.select_related("academic_year").order_by(
+            "start_date"
+        )
+        if options["semester_id"] is not None:
+            semesters = semesters.filter(pk=options["semester_id"])
+            if not semesters.exists():
+                raise CommandError(f"Semester {options['semester_id']} not found.")
+        total = 0
+        for semester in semesters:
+            count = rebuild_sem_fee_quotes(semester)
+            total += count
+            self.stdout.write(f"{semester}: {count} quotes")
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} fee quotes."))
+
+
+__all__ = ["Command"]
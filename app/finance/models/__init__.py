@@ -1,7 +1,9 @@
 """Convenience exports for finance app models."""
 
+from app.finance.models.fee_quote import CrsFeeQuote
 from app.finance.models.fee_stack import CrsFeeStack, FeeStack, FeeStackLine
 from app.finance.models.invoice import CrsInvoice, Invoice, StdSemesterInvoice
+from app.finance.models.invoice_queue import DirtyInvoice
 from app.finance.models.invoice_snapshot import InvoiceSnapshot
 from app.finance.models.payment import Payment
 from app.finance.models.scholarship import (
@@ -21,7 +23,9 @@ from app.finance.models.status_types_methods import (
 __all__ = [
     "AccountChartType",
     "AccountType",
+    "CrsFeeQuote",
     "CrsFeeStack",
+    "DirtyInvoice",
     "FeeStack",
     "FeeStackLine",
     "FeeType",
@@ -0,0 +1,59 @@
+"""Precomputed course fee quotes per curriculum course and semester."""
+
+from __future__ import annotations
+
+from django.db import models
+
+
+class CrsFeeQuote(models.Model):
+    """Resolved price of one curriculum course in one semester.
+
+    Holds the billing-policy tuition, the fee-stack lines active in the
+    semester and the policy extra so pages that print many prices read one
+    row per section instead of resolving fee stacks and policy tables.
+
+    Example:
+        >>> quote = CrsFeeQuote.objects.get(curriculum_course=cc, semester=sem)
+        >>> quote.total_amount, quote.fee_lines
+        (Decimal('45.00'), {'lab': {'label': 'Lab', 'amount': '15.00'}})
+
+    Side Effects:
+        Rows are built by :mod:`app.finance.fee_quotes`, deleted when fee
+        stacks, their lines, course attachments, the course or its credit
+        hours change, and ignored when ``policy_version`` no longer matches
+        the policy TSVs.
+    """
+
+    # ~~~~~~~~ Mandatory ~~~~~~~~
+    curriculum_course = models.ForeignKey(
+        "academics.CurriCrs", on_delete=models.CASCADE, related_name="fee_quotes"
+    )
+    semester = models.ForeignKey(
+        "timetable.Semester", on_delete=models.CASCADE, related_name="fee_quotes"
+    )
+
+    # ~~~~ Auto-filled ~~~~
+    credit_hours = models.PositiveSmallIntegerField(default=0)
+    tuition_rate = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    tuition_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    tuition_reason = models.CharField(max_length=64, blank=True, default="")
+    fee_lines = models.JSONField(default=dict, blank=True)
+    fee_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    policy_extra_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    total_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    policy_version = models.CharField(max_length=80, blank=True, default="")
+    computed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.curriculum_course_id}@{self.semester_id}: {self.total_amount}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["curriculum_course", "semester"],
+                name="uniq_fee_quote_per_curriculum_course_semester",
+            )
+        ]
+        indexes = [models.Index(fields=["semester", "curriculum_course"])]
+        verbose_name = "Course fee quote"
+        verbose_name_plural = "Course fee quotes"
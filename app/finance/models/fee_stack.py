@@ -115,16 +115,23 @@ def resolve_fee_stack_line_payers(
 
 
 def _refresh_parent_invoices_for_stack(stack_id: int | None) -> None:
-    """Refresh parent invoice totals affected by one fee-stack change."""
+    """Queue a totals refresh for parent invoices using one fee stack."""
     if stack_id is None:
         return
+    from app.finance.invoice_queue import mark_invoices_dirty
     from app.finance.models.invoice import StdSemesterInvoice
 
-    parent_invoices = StdSemesterInvoice.objects.filter(
-        fee_stacks__id=stack_id
-    ).distinct()
-    for parent_invoice in parent_invoices:
-        parent_invoice.refresh_totals_from_sources(save_model=True)
+    parent_ids = StdSemesterInvoice.objects.filter(fee_stacks__id=stack_id).values_list(
+        "id", flat=True
+    )
+    mark_invoices_dirty(list(parent_ids), reason="fee_stack")
+
+
+def _invalidate_fee_quotes(**scope) -> None:
+    """Drop stored fee quotes affected by a fee-stack change."""
+    from app.finance.fee_quotes import invalidate_fee_quotes
+
+    invalidate_fee_quotes(**scope)
 
 
 def resolve_crs_fee_stack_map(course, semester) -> tuple[FeeMapT, FeeLabelMapT]:
@@ -227,8 +234,14 @@ class FeeStack(models.Model):
         """Save the stack and refresh parent invoice aggregates."""
         save_result = super().save(*args, **kwargs)
         _refresh_parent_invoices_for_stack(self.pk)
+        _invalidate_fee_quotes(fee_stack_ids=[self.pk])
         return save_result
 
+    def delete(self, *args, **kwargs):
+        """Drop fee quotes of the attached courses before deleting the stack."""
+        _invalidate_fee_quotes(fee_stack_ids=[self.pk])
+        return super().delete(*args, **kwargs)
+
     def __str__(self) -> str:  # pragma: no cover
         return self.name
 
@@ -306,6 +319,7 @@ class FeeStackLine(models.Model):
         self.full_clean()
         save_result = super().save(*args, **kwargs)
         _refresh_parent_invoices_for_stack(self.fee_stack_id)
+        _invalidate_fee_quotes(fee_stack_ids=[self.fee_stack_id])
         return save_result
 
     def delete(self, *args, **kwargs):
@@ -313,6 +327,7 @@ class FeeStackLine(models.Model):
         stack_id = self.fee_stack_id
         delete_result = super().delete(*args, **kwargs)
         _refresh_parent_invoices_for_stack(stack_id)
+        _invalidate_fee_quotes(fee_stack_ids=[stack_id])
         return delete_result
 
     def __str__(self) -> str:  # pragma: no cover
@@ -379,7 +394,16 @@ class CrsFeeStack(models.Model):
         """Validate fee-type overlap rules before persisting the link."""
         # Keep this invariant at app level even when writes bypass ModelForms.
         self.full_clean()
-        return super().save(*args, **kwargs)
+        save_result = super().save(*args, **kwargs)
+        _invalidate_fee_quotes(course_ids=[self.course_id])
+        return save_result
+
+    def delete(self, *args, **kwargs):
+        """Drop the course fee quotes along with the stack attachment."""
+        course_id = self.course_id
+        delete_result = super().delete(*args, **kwargs)
+        _invalidate_fee_quotes(course_ids=[course_id])
+        return delete_result
 
     def __str__(self) -> str:  # pragma: no cover
         return f"{self.course} -> {self.fee_stack}"
@@ -5,7 +5,7 @@ from __future__ import annotations
 from decimal import Decimal, ROUND_HALF_UP
 
 from django.db import models
-from django.db.models import Sum
+from django.db.models import Case, CharField, Sum, Value, When
 from django.db.models.signals import m2m_changed
 from django.dispatch import receiver
 from simple_history.models import HistoricalRecords
@@ -18,6 +18,7 @@ from app.shared.mixins import StatusableMixin
 PAYER_STUDENT_CODE = "student"
 PAYER_GOV_CODE = "gov"
 PAYER_MIXED_CODE = "mixed"
+CRS_DEPOSIT_SHARE = Decimal("0.40")
 
 
 def _quantize_money(value: Decimal) -> Decimal:
@@ -37,6 +38,46 @@ def _ensure_payer_dfts() -> None:
     Payer._populate_attributes_and_db()
 
 
+def _crs_invoice_status_code(balance: Decimal, initial_amount_due: Decimal) -> str:
+    """Return the course invoice status code for a balance."""
+    if balance == initial_amount_due:
+        return "initial"
+    if balance == Decimal("0.00"):
+        return "cleared"
+    if balance <= initial_amount_due - initial_amount_due * CRS_DEPOSIT_SHARE:
+        return "settled"
+    return "updated"
+
+
+def _allocate_child_balances(
+    parent_balance: Decimal,
+    parent_initial: Decimal,
+    course_total: Decimal,
+    child_initials: list[Decimal],
+) -> list[Decimal]:
+    """Split the course share of a parent balance across its children.
+
+    Children are filled in order up to their initial amount; the last one
+    takes whatever remains.
+    """
+    if parent_initial <= Decimal("0.00") or course_total <= Decimal("0.00"):
+        course_balance_total = Decimal("0.00")
+    else:
+        course_balance_total = _quantize_money(
+            parent_balance * (course_total / parent_initial)
+        )
+    remaining_balance = _clamp_non_negative(course_balance_total)
+    balances: list[Decimal] = []
+    for index, child_initial in enumerate(child_initials):
+        if index == len(child_initials) - 1:
+            child_balance = _clamp_non_negative(remaining_balance)
+        else:
+            child_balance = min(child_initial, remaining_balance)
+        remaining_balance = _clamp_non_negative(remaining_balance - child_balance)
+        balances.append(child_balance)
+    return balances
+
+
 class StdSemesterInvoice(StatusableMixin, models.Model):
     """Parent invoice level for one student and one semester."""
 
@@ -142,30 +183,28 @@ class StdSemesterInvoice(StatusableMixin, models.Model):
         )
 
     def _refresh_crs_invoice_balances(self, course_total: Decimal) -> None:
-        """Propagate parent balance/status to child course invoices."""
-        child_invoices = list(self.course_invoices.all().select_related("status"))
+        """Propagate parent balance/status to child course invoices.
+
+        Balances are allocated in memory and written with one bulk UPDATE;
+        registrations follow with one more (see ``_update_regio_statuses``).
+        """
+        child_invoices = list(self.course_invoices.order_by("pk"))
         if not child_invoices:
             return
-        if self.initial_amount_due <= Decimal("0.00") or course_total <= Decimal("0.00"):
-            course_balance_total = Decimal("0.00")
-        else:
-            course_balance_total = _quantize_money(
-                self.get_balance() * (course_total / self.initial_amount_due)
-            )
-        remaining_balance = _clamp_non_negative(course_balance_total)
-        for index, child_invoice in enumerate(child_invoices):
-            if index == len(child_invoices) - 1:
-                child_balance = _clamp_non_negative(remaining_balance)
-            else:
-                child_balance = min(child_invoice.initial_amount_due, remaining_balance)
-            remaining_balance = _clamp_non_negative(remaining_balance - child_balance)
+        balances = _allocate_child_balances(
+            self.get_balance(),
+            self.initial_amount_due,
+            course_total,
+            [child_invoice.initial_amount_due for child_invoice in child_invoices],
+        )
+        for child_invoice, child_balance in zip(child_invoices, balances, strict=True):
             child_invoice.balance = child_balance
-            child_invoice._update_status()
-            CrsInvoice.objects.filter(pk=child_invoice.pk).update(
-                balance=child_invoice.balance,
-                status_id=child_invoice.status_id,
+            child_invoice.status_id = _crs_invoice_status_code(
+                child_balance, child_invoice.initial_amount_due
             )
-            _update_regio_status(child_invoice)
+        InvoiceStatus.ensure_codes(child.status_id for child in child_invoices)
+        CrsInvoice.objects.bulk_update(child_invoices, ["balance", "status"])
+        _update_regio_statuses(child_invoices)
 
     def refresh_totals_from_sources(self, save_model: bool = True) -> None:
         """Recompute totals from child invoices, fee stacks, and payments."""
@@ -273,15 +312,9 @@ class CrsInvoice(StatusableMixin, models.Model):
 
     def _update_status(self) -> None:
         """Update status from course invoice balance."""
-        balance = self.get_balance()
-        if balance == self.initial_amount_due:
-            self.status = InvoiceStatus.initial()
-        elif balance == Decimal("0.00"):
-            self.status = InvoiceStatus.cleared()
-        elif balance <= self.clearance_balance():
-            self.status = InvoiceStatus.settled()
-        else:
-            self.status = InvoiceStatus.updated()
+        self.status = InvoiceStatus.get_by_code(
+            _crs_invoice_status_code(self.get_balance(), self.initial_amount_due)
+        )
 
     def update_balance(self, amount_paid) -> None:
         """Update course-invoice balance and refresh parent totals."""
@@ -307,7 +340,7 @@ class CrsInvoice(StatusableMixin, models.Model):
             amount_due = self.balance
         if amount_due is None:
             return Decimal("0.00")
-        return amount_due * Decimal("0.40")
+        return amount_due * CRS_DEPOSIT_SHARE
 
     def _ensure_parent_invoice(self) -> None:
         """Attach a parent student-semester invoice when missing."""
@@ -365,26 +398,66 @@ def refresh_parent_invoice_after_fee_stack_change(
         instance.refresh_totals_from_sources(save_model=True)
 
 
+# Registration status code written for each course invoice status code.
+REGIO_STATUS_FOR_INVOICE_STATUS = {
+    "initial": "pending",
+    "updated": "pending",
+    "settled": "partialy_cleared",
+    "cleared": "cleared",
+}
+
+
 def _update_regio_status(invoice: "CrsInvoice") -> int:
     """Update registration status when the course-invoice status changes."""
     if not invoice:
         return 0
+    return _update_regio_statuses([invoice])
 
-    cleared_status = RegistrationStatus.cleared()
 
-    if invoice.status_id in {"initial", "updated"}:
-        reg_status = RegistrationStatus.pending()
-    if invoice.status_id == "settled":
-        reg_status = RegistrationStatus.partialy_cleared()
-    if invoice.status_id == "cleared":
-        reg_status = cleared_status
+def _update_regio_statuses(invoices: list["CrsInvoice"]) -> int:
+    """Sync the registrations behind course invoices with their statuses.
 
-    return (
+    Reads the matching non-cleared registrations once and writes them with a
+    single UPDATE (a CASE over primary keys when statuses differ).
+    """
+    code_by_key = {
+        (invoice.student_id, invoice.curriculum_course_id, invoice.semester_id): (
+            REGIO_STATUS_FOR_INVOICE_STATUS[invoice.status_id]
+        )
+        for invoice in invoices
+    }
+    if not code_by_key:
+        return 0
+    rows = (
         Registration.objects.filter(
-            student=invoice.student,
-            section__curriculum_course=invoice.curriculum_course,
-            section__semester=invoice.semester,
+            student_id__in={key[0] for key in code_by_key},
+            section__curriculum_course_id__in={key[1] for key in code_by_key},
+            section__semester_id__in={key[2] for key in code_by_key},
+        )
+        .exclude(status_id="cleared")
+        .values_list(
+            "pk",
+            "student_id",
+            "section__curriculum_course_id",
+            "section__semester_id",
+        )
+    )
+    ids_by_code: dict[str, list[int]] = {}
+    for pk, *key in rows:
+        code = code_by_key.get(tuple(key))
+        if code is not None:
+            ids_by_code.setdefault(code, []).append(pk)
+    if not ids_by_code:
+        return 0
+    RegistrationStatus.ensure_codes(ids_by_code)
+    registration_ids = [pk for ids in ids_by_code.values() for pk in ids]
+    if len(ids_by_code) == 1:
+        status_value = Value(next(iter(ids_by_code)))
+    else:
+        status_value = Case(
+            *[When(pk__in=ids, then=Value(code)) for code, ids in ids_by_code.items()],
+            output_field=CharField(),
         )
-        .exclude(status=cleared_status)
-        .update(status=reg_status)
+    return Registration.objects.filter(pk__in=registration_ids).update(
+        status_id=status_value
     )
@@ -0,0 +1,43 @@
+"""Durable queue of parent invoices waiting for a totals refresh."""
+
+from __future__ import annotations
+
+from django.db import models
+from django.utils import timezone
+
+
+class DirtyInvoice(models.Model):
+    """Parent invoice whose totals must be recomputed from their sources.
+
+    One row per invoice: marking an invoice that is already queued only bumps
+    ``last_marked_at``, so repeated edits cost one refresh.
+
+    Example:
+        >>> DirtyInvoice.objects.order_by("first_marked_at").first()
+        <DirtyInvoice: 42 (fee_stack)>
+
+    Side Effects:
+        Rows are written by :func:`app.finance.invoice_queue.mark_invoices_dirty`
+        and deleted once :func:`~app.finance.invoice_queue.drain_dirty_invoices`
+        has refreshed the invoice.
+    """
+
+    # ~~~~~~~~ Mandatory ~~~~~~~~
+    student_semester_invoice = models.OneToOneField(
+        "finance.StdSemesterInvoice",
+        on_delete=models.CASCADE,
+        related_name="dirty_mark",
+    )
+
+    # ~~~~ Auto-filled ~~~~
+    reason = models.CharField(max_length=40, blank=True, default="")
+    first_marked_at = models.DateTimeField(default=timezone.now)
+    last_marked_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.student_semester_invoice_id} ({self.reason})"
+
+    class Meta:
+        indexes = [models.Index(fields=["first_marked_at"])]
+        verbose_name = "Dirty invoice"
+        verbose_name_plural = "Dirty invoices"
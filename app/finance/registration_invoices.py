@@ -8,6 +8,7 @@ from typing import Iterable, TypeAlias, TypedDict
 from django.db import transaction
 from django.db.models import Exists, OuterRef, QuerySet
 
+from app.finance.fee_quotes import prime_section_fee_quotes
 from app.finance.models.invoice import CrsInvoice
 from app.registry.models.registration import Registration
 
@@ -120,10 +121,14 @@ def missing_registration_invoice_counts(
 ) -> MissingRegistrationInvoiceCountsT:
     """Return missing-invoice counters with one fee-resolution pass."""
     counts: MissingRegistrationInvoiceCountsT = {"billable": 0, "fee_setup": 0}
-    for registration in invoice_generation_registration_qs(
-        student_id=student_id,
-        semester_id=semester_id,
-    ).order_by():
+    registrations = list(
+        invoice_generation_registration_qs(
+            student_id=student_id,
+            semester_id=semester_id,
+        ).order_by()
+    )
+    prime_section_fee_quotes(registration.section for registration in registrations)
+    for registration in registrations:
         if registration_invoice_amount(registration) > Decimal("0.00"):
             counts["billable"] += 1
         else:
@@ -246,6 +251,8 @@ def materialize_registration_invoices(
         "skipped_status": 0,
         "skipped_zero": 0,
     }
+    registrations = list(registrations)
+    prime_section_fee_quotes(registration.section for registration in registrations)
     with transaction.atomic():
         for registration in registrations:
             if registration.status_id not in INVOICEABLE_REGISTRATION_STATUSES:
@@ -12,11 +12,13 @@ from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
 from django.core.exceptions import FieldDoesNotExist
 from django.db import transaction
 from django.db import models
+from django.db.models import Count
+from django.db.models.functions import Coalesce
 from django.template.response import TemplateResponse
 from django.urls import reverse
 from django.utils.html import format_html, format_html_join
 
-from app.shared.fuzzy_matching import name_similarity
+from app.people.duplicates import DUPLICATE_THRESHOLD, duplicate_edges
 from app.people.services.merge_people import merge_people
 
 ModelT: TypeAlias = models.Model
@@ -412,90 +414,53 @@ class MergeWizardMixin(dj_admin.ModelAdmin):
 
 
 class DuplicatePreviewMixin:
-    """Adds a computed column with potential duplicates."""
+    """Adds duplicate columns read from the persisted duplicate index.
 
-    duplicate_threshold = 0.9
+    Scores come from :class:`~app.people.models.duplicates.PersonDuplicate`
+    rows (see :mod:`app.people.duplicates`), so listing, ordering and the
+    ``dups_for`` filter are plain subqueries on that table.
+    """
+
+    duplicate_threshold = DUPLICATE_THRESHOLD
     duplicate_field_name = "possible_duplicates"
     duplicate_count_field_name = "duplicate_count_link"
 
     def get_queryset(self, request):
-        """Attach duplicate ordering and optional duplicate filters."""
+        """Attach duplicate score/count annotations and the dups_for filter."""
         # > Mypy: mixin expects ModelAdmin.get_queryset in the MRO.
         qs = super().get_queryset(request)  # type: ignore[misc]
-        # > Cache per-request duplicate metrics for list display and ordering.
-        self._duplicate_score_cache: dict[int, float] = {}
-        self._duplicate_count_cache: dict[int, int] = {}
         self._duplicate_matches_cache: DuplicateMatchesCacheT = {}
 
-        dup_target = request.GET.get("dups_for")
-        if dup_target:
-            target = qs.filter(pk=dup_target).first()
-            if target:
-                dup_ids = {target.pk}
-                dup_ids.update(
-                    other.pk for other, _ in self._duplicate_matches(target) if other.pk
-                )
-                qs = qs.filter(pk__in=dup_ids)
-
-        if self._should_order_by_duplicate_score(request):
-            score_map = self._duplicate_score_map(qs)
-            when_statements = [
-                models.When(pk=pk, then=models.Value(score))
-                for pk, score in score_map.items()
-            ]
-            qs = qs.annotate(
-                duplicate_score_sort=models.Case(
-                    *when_statements,
-                    default=models.Value(0.0),
-                    output_field=models.FloatField(),
-                )
-            )
-        if self._should_order_by_duplicate_count(request):
-            count_map = self._duplicate_count_map(qs)
-            when_statements = [
-                models.When(pk=pk, then=models.Value(count))
-                for pk, count in count_map.items()
-            ]
-            qs = qs.annotate(
-                duplicate_count_sort=models.Case(
-                    *when_statements,
-                    default=models.Value(0),
-                    output_field=models.IntegerField(),
-                )
+        dup_target = request.GET.get("dups_for", "")
+        if dup_target.isdigit():
+            others = self._duplicate_edges().filter(person_id=dup_target)
+            qs = qs.filter(
+                models.Q(pk=dup_target) | models.Q(pk__in=others.values("other_id"))
             )
-        return qs
 
-    def _get_long_name(self, obj):
-        """Get the long name of an object if it exists. or the staff_profile.long_name."""
-        return getattr(obj, "long_name", "") or getattr(
-            getattr(obj, "staff_profile", None), "long_name", ""
+        edges = self._duplicate_edges().filter(person_id=models.OuterRef("pk"))
+        best_score = edges.order_by("-score").values("score")[:1]
+        edge_count = (
+            edges.order_by()
+            .values("person_id")
+            .annotate(total=Count("pk"))
+            .values("total")
         )
-
-    def _get_candidates(self, obj, person_user):
-        """Get a queryset of user or staff with same last name as person_user."""
-        if hasattr(obj, "user"):
-            qs = obj.__class__.objects.exclude(pk=obj.pk).filter(
-                user__last_name__iexact=person_user.last_name
-            )
-        elif hasattr(obj, "staff_profile"):
-            qs = obj.__class__.objects.exclude(pk=obj.pk).filter(
-                staff_profile__user__last_name__iexact=person_user.last_name
-            )
-        else:
-            qs = obj.__class__.objects.none()
-        return qs
-
-    def _duplicate_candidates(self, obj) -> tuple[str, models.QuerySet]:
-        """Return base name and candidate queryset used for duplicate checks."""
-        base_name = self._get_long_name(obj)
-        # pick a comparable user and last name
-        person_user = getattr(obj, "user", None) or getattr(
-            getattr(obj, "staff_profile", None), "user", None
+        return qs.annotate(
+            duplicate_score_sort=Coalesce(
+                models.Subquery(best_score, output_field=models.FloatField()),
+                models.Value(0.0),
+            ),
+            duplicate_count_sort=Coalesce(
+                models.Subquery(edge_count, output_field=models.IntegerField()),
+                models.Value(0),
+            ),
         )
-        if not person_user:
-            return base_name, obj.__class__.objects.none()
-        qs = self._get_candidates(obj, person_user)
-        return base_name, qs
+
+    def _duplicate_edges(self) -> models.QuerySet:
+        """Return the duplicate edges of this admin's model above the threshold."""
+        admin_self = cast(dj_admin.ModelAdmin, self)
+        return duplicate_edges(admin_self.model, threshold=self.duplicate_threshold)
 
     def _duplicate_matches_cache_map(self) -> DuplicateMatchesCacheT:
         """Return the duplicate-match cache for the current admin request."""
@@ -506,109 +471,47 @@ class DuplicatePreviewMixin:
         return cast(DuplicateMatchesCacheT, cache)
 
     def _duplicate_matches(self, obj) -> DuplicateMatchesT:
-        """Return all matches meeting the similarity threshold."""
+        """Return indexed duplicates of ``obj``, best score first."""
         cache = self._duplicate_matches_cache_map()
-        if obj.pk and obj.pk in cache:
-            return cache[obj.pk]
-        base_name, qs = self._duplicate_candidates(obj)
-        if not base_name:
-            if obj.pk:
-                cache[obj.pk] = []
+        if not obj.pk:
             return []
-        matches: DuplicateMatchesT = []
-        for other in qs[:50]:
-            other_name = self._get_long_name(other)
-            score = name_similarity(base_name, other_name)
-            if score >= self.duplicate_threshold:
-                matches.append((other, score))
-        matches.sort(key=lambda item: item[1], reverse=True)
-        if obj.pk:
-            cache[obj.pk] = matches
+        if obj.pk in cache:
+            return cache[obj.pk]
+        edges = list(
+            self._duplicate_edges()
+            .filter(person_id=obj.pk)
+            .order_by("-score", "other_id")
+            .values_list("other_id", "score")
+        )
+        others = obj.__class__._default_manager.in_bulk(
+            [other_id for other_id, _ in edges]
+        )
+        matches: DuplicateMatchesT = [
+            (others[other_id], score) for other_id, score in edges if other_id in others
+        ]
+        cache[obj.pk] = matches
         return matches
 
     def _duplicate_score_value(self, obj) -> float:
         """Return the best match score for the object."""
-        cache = getattr(self, "_duplicate_score_cache", None)
-        if not isinstance(cache, dict):
-            cache = {}
-            self._duplicate_score_cache = cache
-        score_cache = cast(dict[int, float], cache)
-        if obj.pk in score_cache:
-            return score_cache[obj.pk]
+        score = getattr(obj, "duplicate_score_sort", None)
+        if score is not None:
+            return float(score)
         matches = self._duplicate_matches(obj)
-        score = matches[0][1] if matches else 0.0
-        if obj.pk:
-            score_cache[obj.pk] = score
-        return score
+        return matches[0][1] if matches else 0.0
 
     def _duplicate_count_value(self, obj) -> int:
         """Return the number of potential duplicates for the object."""
-        cache = getattr(self, "_duplicate_count_cache", None)
-        if not isinstance(cache, dict):
-            cache = {}
-            self._duplicate_count_cache = cache
-        count_cache = cast(dict[int, int], cache)
-        if obj.pk in count_cache:
-            return count_cache[obj.pk]
-        count = len(self._duplicate_matches(obj))
-        if obj.pk:
-            count_cache[obj.pk] = count
-        return count
-
-    def _duplicate_score_map(self, queryset: models.QuerySet) -> dict[int, float]:
-        """Build a map of PKs to best duplicate score."""
-        score_map: dict[int, float] = {}
-        for obj in queryset:
-            if not obj.pk:
-                continue
-            score_map[obj.pk] = self._duplicate_score_value(obj)
-        self._duplicate_score_cache = score_map
-        return score_map
-
-    def _duplicate_count_map(self, queryset: models.QuerySet) -> dict[int, int]:
-        """Build a map of PKs to duplicate counts."""
-        count_map: dict[int, int] = {}
-        for obj in queryset:
-            if not obj.pk:
-                continue
-            count_map[obj.pk] = self._duplicate_count_value(obj)
-        self._duplicate_count_cache = count_map
-        return count_map
-
-    def _should_order_by_duplicate_score(self, request) -> bool:
-        """Return True when ordering by the duplicate score column."""
-        ordering = request.GET.get("o", "")
-        if not ordering:
-            return False
-        admin_self = cast(dj_admin.ModelAdmin, self)
-        list_display = list(admin_self.get_list_display(request))
-        if self.duplicate_field_name not in list_display:
-            return False
-        duplicate_index = list_display.index(self.duplicate_field_name) + 1
-        order_fields = [
-            part.lstrip("-") for part in ordering.split(",") if part.lstrip("-").isdigit()
-        ]
-        return str(duplicate_index) in order_fields
-
-    def _should_order_by_duplicate_count(self, request) -> bool:
-        """Return True when ordering by the duplicate count column."""
-        ordering = request.GET.get("o", "")
-        if not ordering:
-            return False
-        admin_self = cast(dj_admin.ModelAdmin, self)
-        list_display = list(admin_self.get_list_display(request))
-        if self.duplicate_count_field_name not in list_display:
-            return False
-        duplicate_index = list_display.index(self.duplicate_count_field_name) + 1
-        order_fields = [
-            part.lstrip("-") for part in ordering.split(",") if part.lstrip("-").isdigit()
-        ]
-        return str(duplicate_index) in order_fields
+        count = getattr(obj, "duplicate_count_sort", None)
+        if count is not None:
+            return int(count)
+        return len(self._duplicate_matches(obj))
 
     def possible_duplicates(self, obj):
         """Return a list of links to possible duplicates based on name similarity."""
         # > What is missing here is to take in account ambiguous duplicates
-
+        if not self._duplicate_count_value(obj):
+            return ""
         matches = self._duplicate_matches(obj)[:3]
         if not matches:
             return ""
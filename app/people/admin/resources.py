@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import re
+from typing import cast
 
 from import_export import fields, resources
 from import_export.widgets import DateWidget, Widget
@@ -166,6 +167,7 @@ class StdResource(resources.ModelResource):
     def before_import(self, dataset):
         headers = dataset.headers or []
         dataset.headers = [STUDENT_HEADER_MAP.get(h, h) for h in headers]
+        cast(UserStdWgt, self.fields["user"].widget).prefetch_usernames(dataset.dict)
 
     def before_import_row(self, row, **kwargs):
         """Inject derived columns to capture StudentInfo data."""
@@ -147,21 +147,6 @@ class MergeableUserAdmin(MergeWizardMixin, DuplicatePreviewMixin, dj_admin.Model
         field = UserFullNameChoiceField(queryset=User.objects.none())
         return field.label_from_instance(cast(UserModel, obj))
 
-    def _get_long_name(self, obj: UserModel) -> str:
-        """Return the full name (or username) for duplicate checks."""
-        full_name = obj.get_full_name()
-        return full_name or obj.username
-
-    def _duplicate_candidates(self, obj: UserModel) -> tuple[str, models.QuerySet]:
-        """Return base name and candidate queryset for user duplicates."""
-        base_name = self._get_long_name(obj)
-        if not obj.last_name:
-            return base_name, obj.__class__.objects.none()
-        qs = obj.__class__.objects.exclude(pk=obj.pk).filter(
-            last_name__iexact=obj.last_name
-        )
-        return base_name, qs
-
     def merge_records(self, target: ModelT, sources: Iterable[ModelT]) -> None:
         """Merge selected users into the chosen target user."""
         target_user = cast(UserModel, target)
@@ -171,6 +156,8 @@ class MergeableUserAdmin(MergeWizardMixin, DuplicatePreviewMixin, dj_admin.Model
     def possible_duplicates(self, obj):
         """Reuse the duplicate preview logic at the user level."""
         # We are missing the middle name here.
+        if not self._duplicate_count_value(obj):
+            return ""
         matches = self._duplicate_matches(obj)[:3]
         if not matches:
             return ""
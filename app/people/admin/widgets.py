@@ -25,18 +25,23 @@ from app.people.models.staffs import Staff
 from app.people.models.student import Student
 from app.people.models.student_curriculum_enrollment import set_primary_std_curri_enroll
 from app.people.utils import (
+    NameParts,
     cached_entity,
     create_person_factory,
     name_parts_from_row,
     mk_password,
     mk_username,
 )
+from app.people.usernames import UsernameAllocator
+from app.shared.identity_map import IdentityMap, identity_map
 from app.shared.utils import get_in_row, parse_str
 
 
 class StaffProfileWgt(widgets.ForeignKeyWidget):
     def __init__(self):
-        self._cache_staff: dict[Hashable, Staff] = {}
+        self._cache_staff: IdentityMap[Hashable, Staff] = identity_map(
+            "people.widgets.staff"
+        )
         super().__init__(Staff)
 
     def clean(self, value, row=None, *args, **kwargs) -> Optional[Staff]:
@@ -70,7 +75,7 @@ class StaffProfileWgt(widgets.ForeignKeyWidget):
 
     def after_import(self, dataset, result, **kwargs):
         """Remove any cache which may be present after import."""
-        self.cache_staff = dict()
+        self._cache_staff.clear()
 
 
 class UserWgt(widgets.ForeignKeyWidget):
@@ -79,7 +84,9 @@ class UserWgt(widgets.ForeignKeyWidget):
     def __init__(self, model: type[AbstractPerson] = Staff):
         super().__init__(User)
         self.model = model
-        self._cache_user: dict[Hashable, User] = {}
+        self._cache_user: IdentityMap[Hashable, User] = identity_map(
+            "people.widgets.users"
+        )
 
     def clean(self, value, row=None, *args, **kwargs) -> Optional[User]:
         """Return or create a User from username or name."""
@@ -111,7 +118,7 @@ class UserWgt(widgets.ForeignKeyWidget):
 
     def after_import(self, dataset, result, **kwargs):
         """Remove any cache which may be present after import."""
-        self.cache_user = dict()
+        self._cache_user.clear()
 
 
 class FacultyUsernameWgt(widgets.ForeignKeyWidget):
@@ -164,7 +171,9 @@ class StdUserWgt(widgets.ForeignKeyWidget):
 
     def __init__(self):
         # field is "id" by default
-        self._cache_student: dict[Hashable, Student] = {}
+        self._cache_student: IdentityMap[Hashable, Student] = identity_map(
+            "people.widgets.students"
+        )
         super().__init__(Student)
 
     def clean(self, value: str, row=None, *args, **kwargs) -> Student | None:
@@ -207,7 +216,7 @@ class StdUserWgt(widgets.ForeignKeyWidget):
 
     def after_import(self, dataset, result, **kwargs):
         """Remove any cache which may be present after import."""
-        self.cache_student = dict()
+        self._cache_student.clear()
 
 
 class StdGradeWgt(widgets.ForeignKeyWidget):
@@ -215,8 +224,11 @@ class StdGradeWgt(widgets.ForeignKeyWidget):
 
     def __init__(self):
         super().__init__(Student, field="student_id")
-        self._cache_student: dict[Hashable, Student] = {}
+        self._cache_student: IdentityMap[Hashable, Student] = identity_map(
+            "people.widgets.grade_students"
+        )
         self.curriculum_w = CurriWgt()
+        self.usernames = UsernameAllocator()
 
     def clean(self, value, row=None, *args, **kwargs) -> Student:
         """Return the Student tied to the identifier, creating it if needed."""
@@ -247,13 +259,11 @@ class StdGradeWgt(widgets.ForeignKeyWidget):
             row, raw_name=raw_name, fallback_first="Student", fallback_last=student_id
         )
 
-        username = Student.mk_username(_n.first, _n.last)
-        password = mk_password(_n.first, _n.last)
-        user = User.objects.create_user(
-            username=username,
+        user = self.usernames.create_user(
+            Student.mk_username(_n.first, _n.last, unique=False),
             first_name=_n.first,
             last_name=_n.last,
-            password=password,
+            password=mk_password(_n.first, _n.last),
         )
 
         student = Student(user=user, student_id=student_id)
@@ -275,7 +285,9 @@ class UserDonorWgt(widgets.ForeignKeyWidget):
 
     def __init__(self):
         super().__init__(User)
-        self._cache_user: dict[Hashable, User] = {}
+        self._cache_user: IdentityMap[Hashable, User] = identity_map(
+            "people.widgets.donor_users"
+        )
 
     def clean(self, value, row=None, *args, **kwargs) -> User:
         """Return or create a User from the donor name."""
@@ -300,17 +312,32 @@ class UserStdWgt(widgets.ForeignKeyWidget):
     def __init__(self):
         # field is "id" by default
         super().__init__(User)
-        self._cache_user: dict[Hashable, User] = dict()
+        self._cache_user: IdentityMap[Hashable, User] = identity_map(
+            "people.widgets.student_users"
+        )
+        self.usernames = UsernameAllocator()
+
+    @staticmethod
+    def _row_name(row) -> NameParts:
+        return name_parts_from_row(row, fullname_key="long_name", fallback_last="Student")
+
+    def prefetch_usernames(self, rows) -> None:
+        """Index taken usernames for every generated name in one batch.
+
+        Resets the allocator so each import starts from fresh database state.
+        """
+        self.usernames = UsernameAllocator()
+        self.usernames.prefetch(
+            Student.mk_username(*self._row_name(row).parts(), unique=False)
+            for row in rows
+            if not parse_str(get_in_row("username", row))
+        )
 
     def clean(self, value: str, row=None, *args, **kwargs) -> User | None:
         """From the student id, name or username look up or create a Student object."""
         username = parse_str(value)
         student_id = get_in_row("student_id", row)
-        _n = name_parts_from_row(
-            row,
-            fullname_key="long_name",
-            fallback_last="Student",
-        )
+        _n = self._row_name(row)
 
         if not username and not student_id and not _n.last:
             return None
@@ -323,7 +350,9 @@ class UserStdWgt(widgets.ForeignKeyWidget):
             return cached
 
         if not username:
-            username = Student.mk_username(*_n.parts())
+            username = self.usernames.allocate(
+                Student.mk_username(*_n.parts(), unique=False)
+            )
 
         dfts = _n.to_dict(full=False)
 
@@ -337,4 +366,4 @@ class UserStdWgt(widgets.ForeignKeyWidget):
 
     def after_import(self, dataset, result, **kwargs):
         """Remove any cache which may be present after import."""
-        self.cache_user = dict()
+        self._cache_user.clear()
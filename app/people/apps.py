@@ -2,8 +2,30 @@
 
 # app/people/apps.py
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def _prepare_student_search(sender, using: str = "default", **kwargs) -> None:
+    """Create the search indexes and backfill missing search documents."""
+    from app.people.student_search import (
+        ensure_search_indexes,
+        rebuild_student_search_docs,
+    )
+
+    ensure_search_indexes(using)
+    rebuild_student_search_docs(missing_only=True)
 
 
 class PeopleConfig(AppConfig):
     name = "app.people"
     verbose_name = "People"
+
+    def ready(self):
+        """Prepare student search documents after each migrate.
+
+        Also drops duplicate-index edges whenever a person row is deleted.
+        """
+        from app.people.duplicates import connect_duplicate_signals
+
+        post_migrate.connect(_prepare_student_search, sender=self)
+        connect_duplicate_signals()
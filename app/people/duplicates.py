@@ -0,0 +1,327 @@
+"""Build and refresh the persisted person-duplicate index.
+
+Possible duplicates are rows of the same model whose surnames match
+(case-insensitive) and whose display names score at least
+:data:`DUPLICATE_THRESHOLD` with :func:`name_similarity`. The admin reads the
+resulting :class:`PersonDuplicate` rows instead of scoring candidates for
+every changelist row.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, TypeAlias
+
+from django.contrib.auth.models import User
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from app.people.models.duplicates import PersonDuplicate
+from app.people.models.faculty import Faculty
+from app.people.models.staffs import Staff
+from app.people.models.student import Student
+from app.shared.fuzzy_matching import name_similarity
+
+DUPLICATE_THRESHOLD = 0.9
+DUPLICATE_METHOD = "surname_name_sim"
+
+# (pk, lowercased surname, display name)
+NameRowT: TypeAlias = tuple[int, str, str]
+
+# Instance attribute holding the matched column values last read or written.
+_MATCH_SNAPSHOT = "_dup_match_values"
+# User columns the person and user names are built from.
+_USER_NAME_FIELDS = ("first_name", "last_name", "username")
+
+
+@dataclass(frozen=True)
+class DupSource:
+    """Where to read the surname and display name of one model's rows."""
+
+    model: type[models.Model]
+    surname_path: str
+    name_paths: tuple[str, ...]
+    fallback_path: str | None = None
+    # Local fields every matched path derives from; saves that leave them
+    # unchanged keep the row's edges.
+    match_fields: tuple[str, ...] = ()
+
+    @property
+    def label(self) -> str:
+        """Return the model label stored on duplicate rows."""
+        return self.model._meta.label_lower
+
+    def name_rows(self, queryset: models.QuerySet | None = None) -> list[NameRowT]:
+        """Return ``(pk, surname, name)`` for the queryset in one query."""
+        queryset = self.model._default_manager.all() if queryset is None else queryset
+        paths = [self.surname_path, *self.name_paths]
+        if self.fallback_path:
+            paths.append(self.fallback_path)
+        rows: list[NameRowT] = []
+        for pk, surname, *parts in queryset.values_list("pk", *paths):
+            names = parts[: len(self.name_paths)]
+            name = " ".join(str(part) for part in names if part).strip()
+            if not name and self.fallback_path:
+                name = str(parts[-1] or "")
+            rows.append((int(pk), str(surname or "").lower(), name))
+        return rows
+
+
+DUPLICATE_SOURCES: dict[str, DupSource] = {
+    source.label: source
+    for source in (
+        DupSource(
+            Student, "user__last_name", ("long_name",), match_fields=("user", "long_name")
+        ),
+        DupSource(
+            Staff, "user__last_name", ("long_name",), match_fields=("user", "long_name")
+        ),
+        DupSource(
+            Faculty,
+            "staff_profile__user__last_name",
+            ("staff_profile__long_name",),
+            match_fields=("staff_profile",),
+        ),
+        DupSource(User, "last_name", ("first_name", "last_name"), "username"),
+    )
+}
+
+
+def duplicate_source(model: type[models.Model]) -> DupSource | None:
+    """Return the duplicate source registered for ``model``, if any."""
+    return DUPLICATE_SOURCES.get(model._meta.label_lower)
+
+
+def _match_values(instance: models.Model, source: DupSource) -> tuple[object, ...] | None:
+    """Return the instance's matched column values, ``None`` if any is deferred."""
+    values = []
+    for name in source.match_fields:
+        attname = instance._meta.get_field(name).attname
+        if attname not in instance.__dict__:
+            return None
+        values.append(instance.__dict__[attname])
+    return tuple(values)
+
+
+def remember_match_fields(instance: models.Model) -> None:
+    """Snapshot the matched columns of a row loaded from or written to the DB."""
+    source = duplicate_source(type(instance))
+    if source is not None:
+        setattr(instance, _MATCH_SNAPSHOT, _match_values(instance, source))
+
+
+def match_fields_changed(
+    instance: models.Model, update_fields: Iterable[str] | None = None
+) -> bool:
+    """Return whether saving ``instance`` can change its duplicate edges.
+
+    Args:
+        instance: Row about to be (or just) saved.
+        update_fields: The ``update_fields`` of that save, if any.
+    """
+    source = duplicate_source(type(instance))
+    if source is None:
+        return False
+    if update_fields is not None and not set(update_fields) & {
+        *source.match_fields,
+        *(instance._meta.get_field(name).attname for name in source.match_fields),
+    }:
+        return False
+    loaded = getattr(instance, _MATCH_SNAPSHOT, None)
+    return loaded is None or loaded != _match_values(instance, source)
+
+
+def _pair_rows(
+    label: str,
+    person: NameRowT,
+    others: Iterable[NameRowT],
+    threshold: float,
+) -> list[PersonDuplicate]:
+    """Score ``person`` against ``others`` and return both edge directions."""
+    pk, _surname, name = person
+    edges: list[PersonDuplicate] = []
+    if not name:
+        return edges
+    for other_pk, _other_surname, other_name in others:
+        if other_pk == pk or not other_name:
+            continue
+        forward = name_similarity(name, other_name)
+        backward = name_similarity(other_name, name)
+        if forward >= threshold:
+            edges.append(
+                PersonDuplicate(
+                    model_label=label,
+                    person_id=pk,
+                    other_id=other_pk,
+                    score=forward,
+                    method=DUPLICATE_METHOD,
+                )
+            )
+        if backward >= threshold:
+            edges.append(
+                PersonDuplicate(
+                    model_label=label,
+                    person_id=other_pk,
+                    other_id=pk,
+                    score=backward,
+                    method=DUPLICATE_METHOD,
+                )
+            )
+    return edges
+
+
+def rebuild_person_duplicates(
+    model: type[models.Model],
+    *,
+    threshold: float = DUPLICATE_THRESHOLD,
+    batch_size: int = 1000,
+) -> int:
+    """Recompute every duplicate pair for ``model`` and return the row count.
+
+    Rows are grouped by surname in memory, so the whole model is read once
+    and each surname block is compared pairwise.
+    """
+    source = DUPLICATE_SOURCES[model._meta.label_lower]
+    blocks: dict[str, list[NameRowT]] = defaultdict(list)
+    for row in source.name_rows():
+        if row[1]:
+            blocks[row[1]].append(row)
+    edges: list[PersonDuplicate] = []
+    for block in blocks.values():
+        for index, row in enumerate(block):
+            edges.extend(_pair_rows(source.label, row, block[index + 1 :], threshold))
+    with transaction.atomic():
+        PersonDuplicate.objects.filter(model_label=source.label).delete()
+        PersonDuplicate.objects.bulk_create(edges, batch_size=batch_size)
+    return len(edges)
+
+
+def refresh_person_duplicates(
+    model: type[models.Model],
+    pk: int,
+    *,
+    threshold: float = DUPLICATE_THRESHOLD,
+) -> None:
+    """Recompute the duplicate edges touching one row."""
+    source = DUPLICATE_SOURCES.get(model._meta.label_lower)
+    if source is None:
+        return
+    manager = model._default_manager
+    person = next(iter(source.name_rows(manager.filter(pk=pk))), None)
+    edges: list[PersonDuplicate] = []
+    if person is not None and person[1]:
+        candidates = manager.filter(**{f"{source.surname_path}__iexact": person[1]})
+        edges = _pair_rows(source.label, person, source.name_rows(candidates), threshold)
+    with transaction.atomic():
+        purge_person_duplicates(model, pk)
+        if edges:
+            PersonDuplicate.objects.bulk_create(edges)
+
+
+def purge_person_duplicates(model: type[models.Model], pk: int) -> None:
+    """Remove every duplicate edge touching one row."""
+    PersonDuplicate.objects.filter(
+        Q(person_id=pk) | Q(other_id=pk), model_label=model._meta.label_lower
+    ).delete()
+
+
+def _purge_deleted(sender: type[models.Model], instance: models.Model, **kwargs) -> None:
+    purge_person_duplicates(sender, instance.pk)
+
+
+def _user_names_changed(user: User, update_fields: Iterable[str] | None) -> bool:
+    """Compare a user's name columns with its stored row."""
+    if update_fields is not None and not set(update_fields) & set(_USER_NAME_FIELDS):
+        return False
+    if user._state.adding or user.pk is None:
+        return True
+    stored = User.objects.filter(pk=user.pk).values_list(*_USER_NAME_FIELDS).first()
+    return stored != tuple(getattr(user, name) for name in _USER_NAME_FIELDS)
+
+
+def _user_pre_save(sender, instance: User, raw: bool = False, **kwargs) -> None:
+    if not raw:
+        instance._dup_names_changed = _user_names_changed(  # type: ignore[attr-defined]
+            instance, kwargs.get("update_fields")
+        )
+
+
+def _user_post_save(
+    sender, instance: User, created: bool, raw: bool = False, **kwargs
+) -> None:
+    """Refresh the edges of a renamed user and of the profiles built on it."""
+    if raw or not instance.__dict__.pop("_dup_names_changed", False):
+        return
+    refresh_person_duplicates(User, instance.pk)
+    if created:
+        return
+    for model, user_path in (
+        (Student, "user_id"),
+        (Staff, "user_id"),
+        (Faculty, "staff_profile__user_id"),
+    ):
+        for pk in model._default_manager.filter(**{user_path: instance.pk}).values_list(
+            "pk", flat=True
+        ):
+            refresh_person_duplicates(model, pk)
+
+
+def connect_duplicate_signals() -> None:
+    """Keep the index in sync with user renames and every kind of delete.
+
+    ``post_delete`` also fires for cascades and ``QuerySet.delete()``, so no
+    edge outlives its row.
+    """
+    for source in DUPLICATE_SOURCES.values():
+        post_delete.connect(
+            _purge_deleted,
+            sender=source.model,
+            dispatch_uid=f"person_duplicates_{source.label}",
+        )
+    pre_save.connect(_user_pre_save, sender=User, dispatch_uid="person_duplicates_user")
+    post_save.connect(_user_post_save, sender=User, dispatch_uid="person_duplicates_user")
+
+
+def refresh_duplicates_for(person: models.Model) -> None:
+    """Refresh the index for a saved person, its user and its faculty row."""
+    refresh_person_duplicates(type(person), person.pk)
+    user_id = getattr(person, "user_id", None)
+    if user_id:
+        refresh_person_duplicates(User, user_id)
+    if isinstance(person, Staff):
+        faculty_id = (
+            Faculty.objects.filter(staff_profile_id=person.pk)
+            .values_list("pk", flat=True)
+            .first()
+        )
+        if faculty_id:
+            refresh_person_duplicates(Faculty, faculty_id)
+
+
+def duplicate_edges(
+    model: type[models.Model],
+    *,
+    threshold: float = DUPLICATE_THRESHOLD,
+) -> models.QuerySet[PersonDuplicate]:
+    """Return the duplicate edges of ``model`` at or above ``threshold``."""
+    return PersonDuplicate.objects.filter(
+        model_label=model._meta.label_lower, score__gte=threshold
+    )
+
+
+__all__ = [
+    "DUPLICATE_SOURCES",
+    "DUPLICATE_THRESHOLD",
+    "DupSource",
+    "connect_duplicate_signals",
+    "duplicate_edges",
+    "duplicate_source",
+    "match_fields_changed",
+    "purge_person_duplicates",
+    "rebuild_person_duplicates",
+    "refresh_duplicates_for",
+    "refresh_person_duplicates",
+    "remember_match_fields",
+]
@@ -5,10 +5,11 @@ from typing import Any, Dict, Mapping, Type, cast
 from app.people import ensures as student_ensures
 from app.people.models.faculty import Faculty
 from app.people.models.staffs import Staff
+from app.shared.identity_map import IdentityMap, identity_map
 from app.shared.types import AbstractPersonT
 from app.people.utils import NameParts
 
-FACULTY_CACHE: Dict[str, Faculty] = {}
+FACULTY_CACHE: IdentityMap[str, Faculty] = identity_map("people.faculty")
 STUDENT_ID_CACHE = student_ensures.STUDENT_ID_CACHE
 
 
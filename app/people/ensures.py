@@ -9,12 +9,12 @@ from app.people.models.student_curriculum_enrollment import (
     set_primary_std_curri_enroll,
     sync_primary_std_curri_enroll,
 )
-from app.shared.types import StrIntMapT
+from app.shared.identity_map import IdentityMap, identity_map
 from app.shared.utils import parse_str
 
 StdIdT: TypeAlias = str
 
-STUDENT_ID_CACHE: StrIntMapT = {}
+STUDENT_ID_CACHE: IdentityMap[str, int] = identity_map("people.student_ids")
 
 
 def _prime_std_id_cache() -> None:
@@ -0,0 +1,115 @@
+"""Counter-backed allocation of person IDs (``TU-STD00042`` and friends).
+
+Each person model with an ``ID_FIELD`` owns one :class:`PersonIdCounter`
+row. Allocation locks that row, bumps it and formats the reserved numbers,
+so inserts no longer scan every existing ID and concurrent creates cannot
+hand out the same value. The counter is seeded from existing IDs the
+first time a model allocates, or explicitly with ``seed_person_ids``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+
+from app.people.models.id_counter import PersonIdCounter
+from app.people.utils import extract_id_num
+
+if TYPE_CHECKING:
+    from app.people.models.core import AbstractPerson
+
+ID_NUM_WIDTH = 5
+
+
+def format_person_id(model_cls: type[AbstractPerson], number: int) -> str:
+    """Return the display ID for ``number`` using the model prefix."""
+    return f"{model_cls.ID_PREFIX}{number:0{ID_NUM_WIDTH}}"
+
+
+def _counter_label(model_cls: type[AbstractPerson]) -> str:
+    return model_cls._meta.label_lower
+
+
+def _max_existing_num(model_cls: type[AbstractPerson]) -> int:
+    existing = model_cls.get_existing_id()
+    return max(existing) if existing else 0
+
+
+def _locked_counter(model_cls: type[AbstractPerson]) -> PersonIdCounter:
+    """Return the model counter row locked for update, seeding it if missing.
+
+    Must run inside ``transaction.atomic()``.
+    """
+    label = _counter_label(model_cls)
+    counter = (
+        PersonIdCounter.objects.select_for_update().filter(model_label=label).first()
+    )
+    if counter is not None:
+        return counter
+    try:
+        with transaction.atomic():
+            PersonIdCounter.objects.create(
+                model_label=label, last_value=_max_existing_num(model_cls)
+            )
+    except IntegrityError:
+        # Another writer seeded the row first; lock theirs below.
+        pass
+    return PersonIdCounter.objects.select_for_update().get(model_label=label)
+
+
+def reserve_ids(model_cls: type[AbstractPerson], n: int) -> list[str]:
+    """Reserve ``n`` consecutive IDs for ``model_cls``.
+
+    Args:
+        model_cls: Person model declaring ``ID_FIELD`` and ``ID_PREFIX``.
+        n: Number of IDs to hand out.
+
+    Returns:
+        Formatted IDs in allocation order. Unused IDs are simply skipped;
+        the counter never moves backwards.
+    """
+    if n < 1:
+        return []
+    with transaction.atomic():
+        counter = _locked_counter(model_cls)
+        start = counter.last_value + 1
+        counter.last_value += n
+        counter.save(update_fields=["last_value"])
+    return [format_person_id(model_cls, number) for number in range(start, start + n)]
+
+
+def note_explicit_id(model_cls: type[AbstractPerson], id_value: str) -> None:
+    """Advance the counter past an ID that was assigned by hand.
+
+    Imports and defaults may set ``ID_FIELD`` themselves; bumping the counter
+    keeps later allocations from colliding with them. Values without digits
+    are ignored, and a missing counter row is left for lazy seeding.
+    """
+    try:
+        number = extract_id_num(id_value)
+    except ValidationError:
+        return
+    PersonIdCounter.objects.filter(
+        model_label=_counter_label(model_cls), last_value__lt=number
+    ).update(last_value=number)
+
+
+def seed_id_counter(model_cls: type[AbstractPerson]) -> int:
+    """Set the counter to at least the highest existing ID and return it."""
+    with transaction.atomic():
+        counter = _locked_counter(model_cls)
+        highest = _max_existing_num(model_cls)
+        if highest > counter.last_value:
+            counter.last_value = highest
+            counter.save(update_fields=["last_value"])
+    return int(counter.last_value)
+
+
+__all__ = [
+    "format_person_id",
+    "note_explicit_id",
+    "reserve_ids",
+    "seed_id_counter",
+]
@@ -13,6 +13,7 @@ from tablib import Dataset
 from app.people.admin.resources import StdResource
 from app.people.admin.resources_mapping import STUDENT_HEADER_MAP
 from app.shared.file_utils import read_text_file
+from app.shared.identity_map import identity_map_scope
 from app.shared.management.commands.import_resources import _load_dataset
 
 ErrorRowT: TypeAlias = Mapping[str, str]
@@ -49,6 +50,11 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options) -> None:
+        """Run the import with lookup caches scoped to this run."""
+        with identity_map_scope():
+            self._import(options)
+
+    def _import(self, options) -> None:
         dry_run: bool = bool(options.get("dry_run"))
         path: Path = Path(options["file"])
         if not path.exists():
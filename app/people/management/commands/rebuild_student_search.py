@@ -0,0 +1,42 @@
+"""Rebuild the student search documents used by the portal lookups."""
+
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from app.people.student_search import ensure_search_indexes, rebuild_student_search_docs
+
+
+class Command(BaseCommand):
+    """Recompute the per-student search documents."""
+
+    help = (
+        "Rebuild the student search documents behind the enrollment directory, "
+        "finance lookup and registrar autocomplete. Run after bulk imports or "
+        "curriculum / college renames."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Only build documents for students that have none.",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Rebuild the documents and make sure the search indexes exist."""
+        started = time.perf_counter()
+        ensure_search_indexes()
+        written = rebuild_student_search_docs(missing_only=bool(options["missing_only"]))
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {written} student search document(s) in {elapsed:.1f}s."
+            )
+        )
+
+
+__all__ = ["Command"]
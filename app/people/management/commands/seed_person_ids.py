@@ -0,0 +1,42 @@
+"""Seed person ID counters from the IDs already stored in the database."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from app.people.id_allocator import seed_id_counter
+from app.people.models.donor import Donor
+from app.people.models.staffs import Staff
+from app.people.models.student import Student
+
+PERSON_MODELS = {"student": Student, "staff": Staff, "donor": Donor}
+
+
+class Command(BaseCommand):
+    """Align each person ID counter with the highest existing ID."""
+
+    help = (
+        "Seed the Student/Staff/Donor ID counters from existing IDs. Run once "
+        "after deploying the counter table or after loading IDs by hand."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--model",
+            choices=sorted(PERSON_MODELS),
+            action="append",
+            default=[],
+            help="Person model to seed (repeatable). Defaults to all.",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Seed the selected counters."""
+        names = list(options["model"] or []) or sorted(PERSON_MODELS)  # type: ignore[call-overload]
+        for name in names:
+            last_value = seed_id_counter(PERSON_MODELS[name])
+            self.stdout.write(f"{name}: next id after {last_value}")
+        self.stdout.write(self.style.SUCCESS(f"Seeded {len(names)} ID counter(s)."))
+
+
+__all__ = ["Command"]
@@ -5,6 +5,9 @@ from app.people.models.student import Student
 from app.people.models.student_curriculum_enrollment import StdCurriEnroll
 from app.people.models.staffs import Staff
 from app.people.models.faculty import Faculty, FacultyManager, FacultyWorkloadSnapshot
+from app.people.models.duplicates import PersonDuplicate
+from app.people.models.id_counter import PersonIdCounter
+from app.people.models.search_doc import StudentSearchDoc
 from app.people.models.object_manager import PersonManager
 from .role_assignment import RoleAssignment
 
@@ -13,9 +16,12 @@ __all__ = [
     "Faculty",
     "FacultyManager",
     "FacultyWorkloadSnapshot",
+    "PersonDuplicate",
+    "PersonIdCounter",
     "PersonManager",
     "RoleAssignment",
     "Staff",
     "Student",
     "StdCurriEnroll",
+    "StudentSearchDoc",
 ]
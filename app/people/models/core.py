@@ -11,7 +11,9 @@ from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from phonenumber_field.modelfields import PhoneNumberField
 
+from app.people import id_allocator
 from app.people.models.object_manager import PersonManager
+from app.people.usernames import UsernameAllocator
 from app.people.utils import NameParts, extract_id_num, mk_username, photo_upload_to
 
 from typing import Mapping, Type, TypeVar, cast
@@ -151,13 +153,8 @@ class AbstractPerson(models.Model):
             unique=False,
         )
         username = desired_username
-        counter = 1
-        while (
-            username
-            and User.objects.filter(username=username).exclude(pk=self.user.pk).exists()
-        ):
-            counter += 1
-            username = f"{desired_username}{counter}"
+        if username and (not current_username or self.user.pk is None):
+            username = UsernameAllocator().allocate(desired_username)
 
         if username and username != current_username:
             self.user.username = username
@@ -191,12 +188,13 @@ class AbstractPerson(models.Model):
         return slugify(username, allow_unicode=False).replace("-", "") + self.EMAIL_SUFFIX
 
     def _mk_id(self) -> str:
-        """Build an ID incrementing the user_id depending on its class."""
-        existing_ids = self.get_existing_id()
+        """Build the next ID for this class from its counter row."""
+        return self.reserve_ids(1)[0]
 
-        next_num = max(existing_ids) + 1 if existing_ids else 1
-
-        return f"{self.ID_PREFIX}{next_num:05}"
+    @classmethod
+    def reserve_ids(cls, n: int) -> list[str]:
+        """Reserve ``n`` consecutive IDs, e.g. for bulk imports."""
+        return id_allocator.reserve_ids(cls, n)
 
     def _is_id_field(self) -> None:
         """Raise an exception if ID_PREFIX is not set."""
@@ -217,16 +215,39 @@ class AbstractPerson(models.Model):
         names = self.user.groups.values_list("name", flat=True)
         return ", ".join(names) if names else ""
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded name columns to skip needless duplicate refreshes."""
+        from app.people.duplicates import remember_match_fields
+
+        instance = super().from_db(db, field_names, values)
+        remember_match_fields(instance)
+        return instance
+
     def save(self, *args, **kwargs):
-        """Create an ID and saves it for each model using _mk_id and ID_FIELD."""
+        """Create an ID and saves it for each model using _mk_id and ID_FIELD.
+
+        The duplicate index is refreshed only when the name columns it matches
+        on changed. Pass ``refresh_duplicates=False`` to skip it (bulk imports
+        rebuild it with ``rebuild_person_duplicates``).
+        """
+        from app.people.duplicates import match_fields_changed, remember_match_fields
+
+        refresh_duplicates = bool(kwargs.pop("refresh_duplicates", True))
         if not self.obj_id:
             new_id = self._mk_id()
             object.__setattr__(self, self.ID_FIELD, new_id)  # type: ignore[arg-type]
+        elif self._state.adding:
+            id_allocator.note_explicit_id(type(self), self.obj_id)
 
         self._ensure_long_name()
         self._ensure_email()
         self._ensure_username()
+        update_fields = kwargs.get("update_fields")
+        names_changed = match_fields_changed(self, update_fields)
         super().save(*args, **kwargs)
+        if names_changed or update_fields is None:
+            remember_match_fields(self)
 
         # handling groups
         if self.user_id:
@@ -238,6 +259,11 @@ class AbstractPerson(models.Model):
                 self.user.is_staff = self.STAFF_STATUS
                 self.user.save(update_fields=["is_staff"])
 
+        if refresh_duplicates and names_changed:
+            from app.people.duplicates import refresh_duplicates_for
+
+            refresh_duplicates_for(self)
+
     @classmethod
     def mk_username(
         cls, first, last, middle="", unique=True, exclude=None, prefix_len=None, sep=None
@@ -255,7 +281,10 @@ class AbstractPerson(models.Model):
 
     @classmethod
     def get_existing_id(cls) -> list[int]:
-        """Returns the list of all existing number in the (class) ids field."""
+        """Returns the list of all existing number in the (class) ids field.
+
+        Only used to seed the ID counter; see :mod:`app.people.id_allocator`.
+        """
         user_ids_raw = cls.objects.values_list(
             "pk",
             cls.ID_FIELD or "",
@@ -0,0 +1,47 @@
+"""Persisted person-duplicate pairs backing the admin duplicate columns."""
+
+from __future__ import annotations
+
+from django.db import models
+
+
+class PersonDuplicate(models.Model):
+    """One directed "possible duplicate" edge between two rows of a model.
+
+    Each pair is stored in both directions so a row's duplicates are a plain
+    ``person_id`` lookup. ``model_label`` is the Django label of the compared
+    model (``people.student``, ``auth.user``...).
+
+    Example:
+        >>> PersonDuplicate.objects.filter(
+        ...     model_label="people.student", person_id=student.pk
+        ... ).order_by("-score")
+
+    Side Effects:
+        Rows are rebuilt by ``rebuild_person_duplicates`` and refreshed on
+        person saves through :mod:`app.people.duplicates`.
+    """
+
+    # ~~~~~~~~ Mandatory ~~~~~~~~
+    model_label = models.CharField(max_length=100)
+    person_id = models.PositiveBigIntegerField()
+    other_id = models.PositiveBigIntegerField()
+    score = models.FloatField()
+    method = models.CharField(max_length=30)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["model_label", "person_id", "other_id"],
+                name="uniq_person_duplicate_pair",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["model_label", "person_id", "score"],
+                name="person_dup_lookup_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.model_label} {self.person_id} ~ {self.other_id} ({self.score:.2f})"
@@ -173,14 +173,34 @@ class Faculty(models.Model):
         if not self.college_id:
             self.college = College.get_dft()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded staff profile to skip needless duplicate refreshes."""
+        from app.people.duplicates import remember_match_fields
+
+        instance = super().from_db(db, field_names, values)
+        remember_match_fields(instance)
+        return instance
+
     def save(self, *args, **kwargs):
         """Check that we have a college for the staff before save."""
+        from app.people.duplicates import (
+            match_fields_changed,
+            refresh_person_duplicates,
+            remember_match_fields,
+        )
+
         if self.staff_profile is None:
             raise ValidationError("Staff profile must be save before the Faculty.")
 
         self._ensure_college()
+        profile_changed = match_fields_changed(self, kwargs.get("update_fields"))
         super().save(*args, **kwargs)
 
+        if profile_changed:
+            remember_match_fields(self)
+            refresh_person_duplicates(Faculty, self.pk)
+
     def _delegate_user(self):
         """Return the User instance we should forward to."""
         return self.staff_profile.user
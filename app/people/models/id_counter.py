@@ -0,0 +1,25 @@
+"""Per-model counters backing person ID allocation."""
+
+from __future__ import annotations
+
+from django.db import models
+
+
+class PersonIdCounter(models.Model):
+    """Last numeric ID handed out for one person model.
+
+    Example:
+        >>> PersonIdCounter.objects.get(model_label="people.student").last_value
+        1523
+
+    Side Effects:
+        Rows are seeded lazily from existing IDs by
+        :func:`app.people.id_allocator.reserve_ids`.
+    """
+
+    # ~~~~~~~~ Mandatory ~~~~~~~~
+    model_label = models.CharField(max_length=100, unique=True)
+    last_value = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.model_label}: {self.last_value}"
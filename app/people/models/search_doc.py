@@ -0,0 +1,40 @@
+"""Denormalized student search documents backing the portal lookups."""
+
+from __future__ import annotations
+
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+
+class StudentSearchDoc(models.Model):
+    """Lowercased search text of one student (ids, names, programs, terms).
+
+    The enrollment directory, the finance student lookup and the registrar
+    autocomplete all filter on ``document``. On PostgreSQL ``document`` has a
+    ``pg_trgm`` GIN index for substring lookups and ``vector`` holds its
+    ``tsvector`` for ranking; both indexes are created after ``migrate``.
+
+    Example:
+        >>> StudentSearchDoc.objects.get(student=student).document
+        'tu-std-0001 john kollie jkollie ... bsc agri cafs ... 2024-2025 1'
+
+    Side Effects:
+        Rows are refreshed on student and enrollment saves through
+        :mod:`app.people.student_search` and rebuilt by
+        ``rebuild_student_search``.
+    """
+
+    # ~~~~~~~~ Mandatory ~~~~~~~~
+    student = models.OneToOneField(
+        "people.Student",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_doc",
+    )
+    document = models.TextField(blank=True, default="")
+
+    # ~~~~ Auto-filled ~~~~
+    vector = SearchVectorField(null=True, editable=False)
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.student_id}: {self.document[:60]}"
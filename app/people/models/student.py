@@ -8,10 +8,8 @@ from typing import cast
 
 from django.contrib.auth.models import User
 from django.db import models
-from django.db.models import Sum
 from simple_history.models import HistoricalRecords
 
-from app.academics.choices import LEVEL_NUMBER
 from app.academics.constants import MAX_STUDENT_CREDITS
 from app.academics.models.course import Course
 
@@ -119,35 +117,24 @@ class Student(AbstractPerson):
 
     def passed_crss(self) -> CrsQuery:
         """Return courses the student completed with an effective passing grade."""
-        return Course.objects.filter(
-            in_curriculum_courses__sections__grade__student=self,
-            in_curriculum_courses__sections__grade__value__number__gte=1,
-            in_curriculum_courses__sections__grade__is_effective=True,
-        ).distinct()
+        from app.registry.standing import get_std_standing
+
+        standing = get_std_standing(self.id)
+        return Course.objects.filter(id__in=standing.passed_course_ids)
 
     @property
     def completed_credits(self) -> int:
-        """Return completed credits from effective passing grade rows."""
-        from app.registry.models.grade import Grade
+        """Return completed credits from the materialized standing row."""
+        from app.registry.standing import get_std_standing
 
-        aggregate = Grade.objects.filter(
-            student=self,
-            value__number__gte=1,
-            is_effective=True,
-        ).aggregate(total=Sum("section__curriculum_course__credit_hours__code"))
-        return int(aggregate.get("total") or 0)
+        return int(get_std_standing(self.id).earned_credits)
 
     @property
     def class_level(self) -> str:
         """Return student level computed from completed credits."""
-        credits = self.completed_credits
-        if credits <= 36:
-            return LEVEL_NUMBER.ONE.label
-        if credits <= 72:
-            return LEVEL_NUMBER.TWO.label
-        if credits <= 108:
-            return LEVEL_NUMBER.THREE.label
-        return LEVEL_NUMBER.FOUR.label
+        from app.registry.standing import class_level_for_credits
+
+        return class_level_for_credits(self.completed_credits)
 
     def allowed_crss(self) -> CrsQuery:
         """Return courses available for registration based on prerequisites."""
@@ -196,9 +183,17 @@ class Student(AbstractPerson):
         When a student's enrollment is confirmed for the first time
         (i.e., ``last_enrolled_semester`` is set) and the
         ``entry_semester`` is empty, record today's date.
+
+        Pass ``refresh_search=False`` to skip the search-document refresh
+        (bulk imports rebuild it with ``rebuild_student_search``).
         """
+        refresh_search = bool(kwargs.pop("refresh_search", True))
         super().save(*args, **kwargs)
         self._ensure_primary_curri_enrollment()
+        if refresh_search:
+            from app.people.student_search import refresh_student_search_docs
+
+            refresh_student_search_docs([self.pk])
 
     def _ensure_primary_curri_enrollment(self) -> None:
         """Keep enrollment rows canonical after student save."""
@@ -55,6 +55,20 @@ class StdCurriEnroll(models.Model):
         """Return a compact label for admin displays."""
         return f"{self.student} -> {self.curriculum}"
 
+    def save(self, *args, **kwargs) -> None:
+        """Save the enrollment and refresh the student's search document."""
+        update_fields = kwargs.get("update_fields")
+        super().save(*args, **kwargs)
+        if update_fields is None or {"student", "curriculum"} & set(update_fields):
+            _refresh_search_doc(self.student_id)
+
+    def delete(self, *args, **kwargs):
+        """Delete the enrollment and refresh the student's search document."""
+        student_id = self.student_id
+        result = super().delete(*args, **kwargs)
+        _refresh_search_doc(student_id)
+        return result
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
@@ -69,6 +83,13 @@ class StdCurriEnroll(models.Model):
         ]
 
 
+def _refresh_search_doc(student_id: int | None) -> None:
+    """Refresh one student's search document (programs are part of it)."""
+    from app.people.student_search import refresh_student_search_docs
+
+    refresh_student_search_docs([student_id] if student_id else [])
+
+
 def _std_curri_enroll_qs(student: "Student") -> models.QuerySet[StdCurriEnroll]:
     """Return enrollment rows ordered by stable priority."""
     return StdCurriEnroll.objects.filter(student=student).select_related("curriculum")
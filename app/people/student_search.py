@@ -0,0 +1,235 @@
+"""Build, refresh and query the per-student search documents.
+
+Each student gets one :class:`StudentSearchDoc` row holding the lowercased
+text the portals search: student id, names, username, programs and their
+colleges, and the entry / last enrolled terms. Every query term must appear
+in the document. On PostgreSQL this is a ``LIKE`` served by a ``pg_trgm``
+GIN index and results are ranked with ``ts_rank`` over the stored
+``tsvector``. Other backends (SQLite test runs) use the same filter and rank
+in SQL on whole-word, prefix and substring hits. Students whose document is
+missing (not backfilled yet) still match on their id, name and username.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import DatabaseError, connections, transaction
+from django.db.models import Case, CharField, F, FloatField, Q, QuerySet, Value, When
+from django.db.models.functions import Coalesce, Concat
+
+from app.people.models.search_doc import StudentSearchDoc
+from app.people.models.student import Student
+from app.people.models.student_curriculum_enrollment import StdCurriEnroll
+
+logger = logging.getLogger(__name__)
+
+SEARCH_LIMIT = 15
+EXACT_ID_BOOST = 1.0
+
+_SEMESTER_FIELDS = (
+    "academic_year__code",
+    "academic_year__long_name",
+    "number",
+)
+_STUDENT_FIELDS = (
+    "pk",
+    "student_id",
+    "long_name",
+    "user__username",
+    "user__first_name",
+    "user__last_name",
+    *(f"entry_semester__{field}" for field in _SEMESTER_FIELDS),
+    *(f"last_enrolled_semester__{field}" for field in _SEMESTER_FIELDS),
+)
+_PROGRAM_FIELDS = (
+    "student_id",
+    "curriculum__short_name",
+    "curriculum__long_name",
+    "curriculum__college__code",
+    "curriculum__college__long_name",
+)
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# Student columns searched when the student has no document row.
+_MISSING_DOC_FIELDS = ("student_id", "long_name", "user__username")
+
+
+def search_document(parts: Iterable[object]) -> str:
+    """Join non-empty parts into one lowercased, space-normalized document."""
+    text = " ".join(str(part) for part in parts if part not in (None, ""))
+    return " ".join(text.lower().split())
+
+
+def search_terms(query: str | None) -> list[str]:
+    """Return the lowercased whitespace-separated terms of a query."""
+    return str(query or "").lower().split()
+
+
+def _uses_postgres(queryset: QuerySet) -> bool:
+    return connections[queryset.db].vendor == "postgresql"
+
+
+def refresh_student_search_docs(student_ids: Iterable[int]) -> int:
+    """Rebuild the search documents of the given students; return the count."""
+    ids = sorted({int(pk) for pk in student_ids if pk})
+    if not ids:
+        return 0
+    programs: dict[int, list[object]] = defaultdict(list)
+    for student_id, *parts in StdCurriEnroll.objects.filter(
+        student_id__in=ids
+    ).values_list(*_PROGRAM_FIELDS):
+        programs[student_id].extend(parts)
+    docs = [
+        StudentSearchDoc(student_id=pk, document=search_document([*parts, *programs[pk]]))
+        for pk, *parts in Student.objects.filter(pk__in=ids).values_list(*_STUDENT_FIELDS)
+    ]
+    with transaction.atomic():
+        StudentSearchDoc.objects.filter(student_id__in=ids).delete()
+        StudentSearchDoc.objects.bulk_create(docs)
+        if docs and _uses_postgres(StudentSearchDoc.objects.all()):
+            StudentSearchDoc.objects.filter(student_id__in=ids).update(
+                vector=SearchVector("document", config="simple")
+            )
+    return len(docs)
+
+
+def rebuild_student_search_docs(
+    *, missing_only: bool = False, batch_size: int = 1000
+) -> int:
+    """Rebuild every (or only the missing) student search document."""
+    students = Student.objects.order_by("pk")
+    if missing_only:
+        students = students.filter(search_doc__isnull=True)
+    ids = list(students.values_list("pk", flat=True))
+    return sum(
+        refresh_student_search_docs(ids[start : start + batch_size])
+        for start in range(0, len(ids), batch_size)
+    )
+
+
+def _rank_in_sql(queryset: QuerySet[Student], terms: Sequence[str]) -> QuerySet[Student]:
+    """Alias ``search_word_rank``: whole words beat prefixes beat substrings."""
+    queryset = queryset.alias(
+        search_padded=Concat(
+            Value(" "),
+            Coalesce(F("search_doc__document"), Value("")),
+            Value(" "),
+            output_field=CharField(),
+        )
+    )
+    scores = [
+        Case(
+            When(search_padded__contains=f" {term} ", then=Value(0.1)),
+            When(search_padded__contains=f" {term}", then=Value(0.05)),
+            default=Value(0.01),
+            output_field=FloatField(),
+        )
+        for term in terms
+    ]
+    total = scores[0]
+    for score in scores[1:]:
+        total = total + score
+    return queryset.alias(search_word_rank=total / Value(float(len(terms))))
+
+
+def _prefix_tsquery(terms: Sequence[str]) -> str:
+    """Return a raw ``simple`` tsquery requiring a prefix match of each word."""
+    words = [word for term in terms for word in _WORD_RE.findall(term)]
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def search_students(queryset: QuerySet[Student], query: str | None) -> QuerySet[Student]:
+    """Filter ``queryset`` on the search documents and annotate ``search_rank``.
+
+    Without query terms the queryset is returned with a zero rank, so callers
+    can always order by ``-search_rank``. An exact student-id hit ranks first.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+    no_doc = Q(search_doc__isnull=True)
+    for term in terms:
+        fallback = Q()
+        for field in _MISSING_DOC_FIELDS:
+            fallback |= Q(**{f"{field}__icontains": term})
+        queryset = queryset.filter(
+            Q(search_doc__document__contains=term) | (no_doc & fallback)
+        )
+    exact = Case(
+        When(student_id__iexact=" ".join(terms), then=Value(EXACT_ID_BOOST)),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+    if _uses_postgres(queryset):
+        tsquery = _prefix_tsquery(terms)
+        rank = (
+            SearchRank(
+                F("search_doc__vector"),
+                SearchQuery(tsquery, config="simple", search_type="raw"),
+            )
+            if tsquery
+            else Value(0.0, output_field=FloatField())
+        )
+        # Students without a document have no vector to rank.
+        rank = Coalesce(rank, Value(0.0), output_field=FloatField())
+        return queryset.annotate(search_rank=rank + exact)
+    queryset = _rank_in_sql(queryset, terms)
+    return queryset.annotate(search_rank=F("search_word_rank") + exact)
+
+
+def top_students(
+    query: str | None,
+    queryset: QuerySet[Student] | None = None,
+    *,
+    limit: int = SEARCH_LIMIT,
+    order_by: Sequence[str] = ("long_name", "student_id"),
+) -> list[Student]:
+    """Return the ``limit`` best-ranked students for ``query``."""
+    if not search_terms(query):
+        return []
+    queryset = Student.objects.select_related("user") if queryset is None else queryset
+    ranked = search_students(queryset, query).order_by("-search_rank", *order_by)
+    return list(ranked[:limit])
+
+
+def ensure_search_indexes(using: str = "default") -> None:
+    """Create the PostgreSQL tsvector and trigram indexes when missing.
+
+    The trigram index needs the ``pg_trgm`` extension; when the server does
+    not ship it (or the role may not create it) substring lookups fall back
+    to sequential scans and a warning is logged.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return
+    table = connection.ops.quote_name(StudentSearchDoc._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS people_std_search_vector_idx "
+            f"ON {table} USING gin (vector)"
+        )
+        try:
+            with transaction.atomic(using=using):
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS people_std_search_trgm_idx "
+                    f"ON {table} USING gin (document gin_trgm_ops)"
+                )
+        except DatabaseError as exc:
+            logger.warning("Student search trigram index not created: %s", exc)
+
+
+__all__ = [
+    "SEARCH_LIMIT",
+    "ensure_search_indexes",
+    "rebuild_student_search_docs",
+    "refresh_student_search_docs",
+    "search_document",
+    "search_students",
+    "search_terms",
+    "top_students",
+]
@@ -0,0 +1,112 @@
+"""Batch allocation of unique usernames.
+
+``mk_username`` builds a base username such as ``es.thot`` and suffixes a
+counter (``es.thot2``, ``es.thot3``...) until the name is free. Instead of
+probing ``auth_user`` once per counter value, :class:`UsernameAllocator`
+loads every taken ``<base><digits>`` name for many bases in one query and
+hands out the suffixes from memory.
+
+The cache can go stale when another process creates users at the same
+time; :meth:`UsernameAllocator.create_user` relies on the unique constraint
+on ``auth_user.username`` and retries with a refreshed cache on conflict.
+"""
+
+from __future__ import annotations
+
+from functools import reduce
+from operator import or_
+from typing import Any, Iterable
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractBaseUser
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
+User = get_user_model()
+
+PREFETCH_CHUNK = 200
+CREATE_RETRIES = 5
+
+
+def _candidate_bases(username: str, bases: set[str]) -> list[str]:
+    """Return the bases ``username`` is an instance of (``base`` or ``base<n>``)."""
+    digits_from = len(username.rstrip("0123456789"))
+    return [
+        username[:end]
+        for end in range(len(username), digits_from - 1, -1)
+        if username[:end] in bases
+    ]
+
+
+class UsernameAllocator:
+    """Hand out unique usernames from an in-memory index of taken names.
+
+    Example:
+        >>> allocator = UsernameAllocator()
+        >>> allocator.prefetch(["es.thot", "ad.love"])  # one query
+        >>> allocator.allocate("es.thot")
+        'es.thot2'
+    """
+
+    def __init__(self, exclude: Iterable[str] | None = None) -> None:
+        self._exclude = set(exclude or ())
+        self._taken: dict[str, set[str]] = {}
+        self._next_counter: dict[str, int] = {}
+
+    def prefetch(self, bases: Iterable[str]) -> None:
+        """Load taken usernames for every base not indexed yet."""
+        missing = sorted({base for base in bases if base and base not in self._taken})
+        for start in range(0, len(missing), PREFETCH_CHUNK):
+            chunk = missing[start : start + PREFETCH_CHUNK]
+            chunk_set = set(chunk)
+            for base in chunk:
+                self._taken[base] = set()
+            query = reduce(or_, (Q(username__startswith=base) for base in chunk))
+            names = User.objects.filter(query).values_list("username", flat=True)
+            for name in names:
+                for base in _candidate_bases(name, chunk_set):
+                    self._taken[base].add(name)
+
+    def allocate(self, base: str) -> str:
+        """Return the first free ``base``/``base<n>`` name and mark it taken."""
+        self.prefetch([base])
+        taken = self._taken.setdefault(base, set())
+        counter = self._next_counter.get(base, 1)
+        username = base if counter == 1 else f"{base}{counter}"
+        while username in taken or username in self._exclude:
+            counter += 1
+            username = f"{base}{counter}"
+        taken.add(username)
+        self._next_counter[base] = counter
+        return username
+
+    def allocate_many(self, bases: Iterable[str]) -> list[str]:
+        """Allocate one username per base, prefetching all bases at once."""
+        bases = list(bases)
+        self.prefetch(bases)
+        return [self.allocate(base) for base in bases]
+
+    def forget(self, base: str) -> None:
+        """Drop the cached names for ``base`` so the next allocation reloads."""
+        self._taken.pop(base, None)
+
+    def create_user(self, base: str, **fields: Any) -> AbstractBaseUser:
+        """Create a user under the next free username for ``base``.
+
+        Raises:
+            IntegrityError: Every retry collided with a concurrent writer.
+        """
+        attempts = 0
+        while True:
+            username = self.allocate(base)
+            try:
+                with transaction.atomic():
+                    return User.objects.create_user(username=username, **fields)
+            except IntegrityError:
+                attempts += 1
+                if attempts >= CREATE_RETRIES:
+                    raise
+                self.forget(base)
+
+
+__all__ = ["UsernameAllocator"]
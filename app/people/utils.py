@@ -24,6 +24,7 @@ from typing import (
     Dict,
     Hashable,
     Mapping,
+    MutableMapping,
     Optional,
     Sequence,
     Tuple,
@@ -31,6 +32,7 @@ from typing import (
 )
 
 from app.people.constants import USER_KWARGS
+from app.people.usernames import UsernameAllocator
 from app.shared.types import _T, ModelT
 
 from django.contrib.auth import get_user_model
@@ -145,7 +147,7 @@ class NameParts:
 
 
 def cached_entity(
-    cache: Dict[Hashable, _T],
+    cache: MutableMapping[Hashable, _T],
     key: Hashable,
     factory: Callable[[], _T],
 ) -> _T:
@@ -159,9 +161,10 @@ def cached_entity(
     Returns:
         Cached or newly created entity.
     """
-    if key not in cache:
-        cache[key] = factory()
-    return cache[key]
+    if key in cache:
+        return cache[key]
+    entity = cache[key] = factory()
+    return entity
 
 
 def extract_suffix(raw_name: str) -> tuple[str, str]:
@@ -350,7 +353,8 @@ def mk_fullusername(
 
     Args:
         fullname: Full name to parse into components.
-        unique: When set, ensure the username is not already used by checking users.
+        unique: When set, ensure the username is not already used by checking users
+            (one query through :class:`UsernameAllocator`).
         exclude: Usernames to avoid when checking uniqueness.
         prefix_len: Limit for the first-name portion of the username.
         sep: Requested separator between name parts; this helper always uses ".".
@@ -388,7 +392,8 @@ def mk_username(
         first: First name used for the username prefix.
         last: Last name used for the username suffix.
         middle: Middle name used to derive the middle initial.
-        unique: When set, ensure the username is not already used by checking users.
+        unique: When set, ensure the username is not already used by checking users
+            (one query through :class:`UsernameAllocator`).
         exclude: Usernames to avoid when checking uniqueness.
         prefix_len: Limit for the first-name portion of the username.
         sep: Separator inserted between name parts.
@@ -411,11 +416,8 @@ def mk_username(
     ).lower()
     username = baseusername
     if unique:
-        counter = 1
-        while User.objects.filter(username=username).exists():
-            counter += 1
-            username = f"{baseusername}{counter}"
-    if exclude:
+        username = UsernameAllocator(exclude=exclude).allocate(baseusername)
+    elif exclude:
         counter = 1
         while len({username} - exclude) == 0:
             counter += 1
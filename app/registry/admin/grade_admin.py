@@ -5,8 +5,7 @@ from typing import Optional, TypeAlias, cast
 from django import forms
 from django.contrib import admin
 from django.contrib.auth.models import User
-from django.db.models import Case, CharField, Count, F, QuerySet, Value, When
-from django.db.models.functions import Cast, Concat
+from django.db.models import Count, QuerySet
 from django.http import HttpRequest
 from django.urls import path, reverse
 from django.utils.html import format_html
@@ -34,6 +33,7 @@ from app.timetable.models.section import Section
 from simple_history.admin import SimpleHistoryAdmin
 from guardian.admin import GuardedModelAdmin
 from app.shared.admin.mixins import ScopedAutocompleteAdminMixin
+from app.shared.admin.pagination import EstimatedCountPaginator
 from app.shared.auth.perms import UserRole
 
 SectionQueryT: TypeAlias = QuerySet[Section]
@@ -85,10 +85,13 @@ class GradeAdmin(
     """Admin interface for :class:~app.registry.models.Grade.
 
     Shows student, section and grade fields in the list view with autocomplete
-    lookups for student and section.
+    lookups for student and section. The section column sorts on the indexed
+    ``Section.sort_code``; unfiltered lists use the table's row estimate.
     """
 
     resource_class = GradeResource
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     date_hierarchy = "graded_on"
     list_display = (
         "student",
@@ -136,34 +139,14 @@ class GradeAdmin(
         return custom + urls
 
     def get_queryset(self, request):
-        """Annotate a sortable section short code for changelist ordering."""
+        """Limit faculty users to grades from their own sections."""
         qs = super().get_queryset(request)
-        section_code = Case(
-            When(
-                section__curriculum_course__course__short_code__isnull=True,
-                then=F("section__curriculum_course__course__code"),
-            ),
-            When(
-                section__curriculum_course__course__short_code="",
-                then=F("section__curriculum_course__course__code"),
-            ),
-            default=F("section__curriculum_course__course__short_code"),
-            output_field=CharField(),
-        )
-        # Keep a DB-level key so sorting is alphabetical on section short code.
-        scoped_qs = qs.annotate(
-            section_sort_code=Concat(
-                section_code,
-                Value(":s"),
-                Cast(F("section__number"), CharField()),
-            )
-        )
         if _can_view_all_grades(request):
-            return scoped_qs
+            return qs
         faculty = _grade_admin_faculty(request)
         if faculty is None:
-            return scoped_qs.none()
-        return scoped_qs.filter(section__faculty=faculty)
+            return qs.none()
+        return qs.filter(section__faculty=faculty)
 
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         """Scope grade admin foreign-key choices for faculty users."""
@@ -230,7 +213,7 @@ class GradeAdmin(
             obj,
         ) and self._scope_allows_grade(request, obj)
 
-    @admin.display(description="Section", ordering="section_sort_code")
+    @admin.display(description="Section", ordering="section__sort_code")
     def sec_short_code(self, obj):
         """Display the section short code and keep links in the FK field view."""
         section = cast(Section | None, getattr(obj, "section", None))
@@ -32,3 +32,6 @@ GRADES_DESCRIPTION = {
 
 # Grade codes that should not count toward GPA calculations.
 GPA_EXCLUDED_CODES = {"dr", "ip", "ip_upd", "ng", "w", "i", "ab"}
+
+# Registration statuses that no longer occupy a section seat.
+SEAT_RELEASING_REGIO_STATUSES = frozenset({"canceled", "removed"})
@@ -0,0 +1,113 @@
+"""Set-based recomputation of ``Grade.is_effective``.
+
+Each (student, course) pair keeps a single effective grade: its most recent
+attempt by :data:`EFFECTIVE_GRADE_ORDERING`. :func:`recompute_effective_grades`
+ranks every attempt of a chunk of students with ``ROW_NUMBER()`` and flips
+the rows whose flag disagrees with their rank in one ``UPDATE`` per chunk.
+
+``Grade.save()``/``delete()`` use it for the pair they touch. Importers and
+merges that write grades in bulk (``bulk_create``, ``recompute_effective=False``)
+call it once with every pair they touched, or run ``recompute_effective_grades``.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Iterable, TypeAlias
+
+from django.db import connection
+from django.db.models import F, QuerySet, Window
+from django.db.models.functions import RowNumber
+
+from app.registry.models.grade import Grade
+
+StdCrsPairT: TypeAlias = tuple[int, int]
+
+# Most recent attempt first; the first row of each (student, course) wins.
+EFFECTIVE_GRADE_ORDERING: tuple[str, ...] = (
+    "-section__semester__start_date",
+    "-section__semester_id",
+    "-section_id",
+    "-graded_on",
+    "-id",
+)
+
+
+def recompute_effective_grades(
+    pairs: Iterable[StdCrsPairT] | None = None,
+    *,
+    chunk_size: int = 500,
+    refresh_standing: bool = True,
+) -> int:
+    """Recompute effective grades; return the number of grade rows changed.
+
+    Args:
+        pairs: ``(student_id, course_id)`` pairs to rank. ``None`` ranks
+            every grade.
+        chunk_size: Students ranked per ``UPDATE``.
+        refresh_standing: Rebuild standing rows of the ranked students.
+    """
+    from app.registry.standing import rebuild_std_standings
+
+    courses_by_std: dict[int, set[int]] | None = None
+    if pairs is None:
+        student_ids = list(
+            Grade.objects.order_by("student_id")
+            .values_list("student_id", flat=True)
+            .distinct()
+        )
+    else:
+        courses_by_std = defaultdict(set)
+        for student_id, course_id in pairs:
+            courses_by_std[int(student_id)].add(int(course_id))
+        student_ids = sorted(courses_by_std)
+
+    chunk_size = max(int(chunk_size), 1)
+    changed = 0
+    for start in range(0, len(student_ids), chunk_size):
+        chunk = student_ids[start : start + chunk_size]
+        grades = Grade.objects.filter(student_id__in=chunk)
+        if courses_by_std is not None:
+            # Ranking extra pairs of the same students is harmless: the
+            # result is idempotent and only disagreeing rows are written.
+            course_ids = set().union(*(courses_by_std[std_id] for std_id in chunk))
+            grades = grades.filter(
+                section__curriculum_course__course_id__in=sorted(course_ids)
+            )
+        changed += _flip_mis_ranked(grades)
+
+    if refresh_standing and student_ids:
+        rebuild_std_standings(
+            None if pairs is None else student_ids, chunk_size=chunk_size
+        )
+    return changed
+
+
+def _flip_mis_ranked(grades: QuerySet[Grade]) -> int:
+    """Rank ``grades`` per student/course and flip every disagreeing flag."""
+    ranked = grades.annotate(
+        effective_rank=Window(
+            RowNumber(),
+            partition_by=[F("student_id"), F("section__curriculum_course__course_id")],
+            order_by=list(EFFECTIVE_GRADE_ORDERING),
+        )
+    ).values("id", "is_effective", "effective_rank")
+    ranked_sql, params = ranked.query.sql_with_params()
+    qn = connection.ops.quote_name
+    table = qn(Grade._meta.db_table)
+    sql = (
+        f"UPDATE {table} SET {qn('is_effective')} = NOT {qn('is_effective')} "
+        f"WHERE {qn('id')} IN ("
+        f"SELECT ranked.{qn('id')} FROM ({ranked_sql}) ranked "
+        f"WHERE ranked.{qn('is_effective')} <> (ranked.{qn('effective_rank')} = 1))"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return max(cursor.rowcount, 0)
+
+
+__all__ = [
+    "EFFECTIVE_GRADE_ORDERING",
+    "StdCrsPairT",
+    "recompute_effective_grades",
+]
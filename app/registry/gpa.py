@@ -150,23 +150,42 @@ def _compute_gpa_from_grades(grades: Iterable[Grade]) -> GpaResultT:
     }
 
 
-def get_gpa(semester: Semester, student: Student, curriculum: Curriculum) -> GpaResultT:
+def get_gpa(
+    semester: Semester,
+    student: Student,
+    curriculum: Curriculum | None = None,
+) -> GpaResultT:
     """Return GPA data for a student in a single semester/curriculum.
 
     Args:
         semester: Target semester.
         student: Student to evaluate.
-        curriculum: Curriculum used for credit hour lookup.
+        curriculum: Curriculum used for credit hour lookup. ``None`` reads the
+            all-curricula value from the materialized standing rows.
 
     Returns:
         GPA summary for the semester.
     """
+    if curriculum is None:
+        from app.registry.standing import standing_gpa_result
+
+        return standing_gpa_result(student.id, semester_id=semester.id)
     grades = build_gpa_queryset(student=student, curriculum=curriculum, semester=semester)
     return _compute_gpa_from_grades(grades)
 
 
-def get_cumulative_gpa(student: Student, curriculum: Curriculum) -> GpaResultT:
-    """Return cumulative GPA data across all semesters in a curriculum."""
+def get_cumulative_gpa(
+    student: Student,
+    curriculum: Curriculum | None = None,
+) -> GpaResultT:
+    """Return cumulative GPA data across all semesters in a curriculum.
+
+    Without a curriculum the all-curricula GPA is read from ``StdStanding``.
+    """
+    if curriculum is None:
+        from app.registry.standing import standing_gpa_result
+
+        return standing_gpa_result(student.id)
     grades = build_gpa_queryset(student=student, curriculum=curriculum, semester=None)
     return _compute_gpa_from_grades(grades)
 
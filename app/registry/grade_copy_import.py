@@ -0,0 +1,445 @@
+"""PostgreSQL ``COPY`` fast path for ``import_grades``.
+
+The row-by-row importer loads every existing (student, section) grade pair
+into Python and resolves each row through the ``ensure_*`` helpers. On
+PostgreSQL, :func:`copy_import_grades` instead:
+
+1. streams the TSV with ``COPY`` into a temporary staging table (temporary
+   tables are unlogged and private to the session);
+2. resolves foreign keys set-wise: grade codes join ``GradeValue``, student
+   ids join ``Student``, and each *distinct* section key (semester, college,
+   department, course, curriculum, credit hours, section number) goes once
+   through :func:`grade_section_id`, the helper the row-by-row path uses;
+3. inserts the new pairs with ``INSERT ... SELECT ... ON CONFLICT DO NOTHING``
+   (the first row of a duplicated pair wins, as in the row-by-row path), then
+   joins them to ``Section``/``CurriCrs`` to recompute effective grades.
+
+Rows that do not resolve are written to the grade import error log
+(:func:`write_grade_error_log`), the same file the row-by-row path writes.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import IO, Iterator, Mapping, Sequence, TypeAlias
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.backends.utils import CursorWrapper
+
+from app.academics.ensures import (
+    ensure_college_id,
+    ensure_crs_id,
+    ensure_curri_crs_id,
+    ensure_curri_id,
+    ensure_dpt_id,
+)
+from app.academics.models.curriculum_course import CurriCrs
+from app.people.ensures import ensure_std_sid
+from app.people.models.student import Student
+from app.registry.effective_grades import recompute_effective_grades
+from app.registry.grade_import_errors import write_grade_error_log
+from app.registry.grade_registration_reconciliation import (
+    GradeRegistrationSummary,
+    ensure_grade_registration_pairs,
+)
+from app.registry.models.grade import Grade, GradeValue
+from app.shared.utils import get_in_row, to_int
+from app.timetable.ensures import ensure_sec_id, ensure_sem_id
+from app.timetable.models.section import Section
+
+RowT: TypeAlias = Mapping[str, str]
+
+UNKNOWN_GRADE_CODE = "unknown grade code"
+COPY_CHUNK_BYTES = 1 << 20
+
+# Staged columns, cleaned like ``get_in_row``; missing headers read as "".
+SECTION_KEY_COLUMNS = (
+    "academic_year",
+    "semester_no",
+    "college_code",
+    "course_dept",
+    "course_no",
+    "course_title",
+    "curriculum",
+    "credit_hours",
+    "section_no",
+)
+REJECT_COLUMNS = (
+    "student_id",
+    "academic_year",
+    "semester_no",
+    "course_dept",
+    "course_no",
+    "section_no",
+    "grade_code",
+)
+
+_STAGE = "grade_import_stage"
+_STUDENT_KEYS = "grade_import_students"
+_SECTION_KEYS = "grade_import_sections"
+_NEW_PAIRS = "grade_import_new_pairs"
+
+
+class GradeCopyImportError(ValueError):
+    """Raised when a TSV cannot be staged for the COPY import."""
+
+
+@dataclass
+class CopyGradeImportSummary:
+    """Counters for one COPY grade import run."""
+
+    rows: int = 0
+    created: int = 0
+    skipped: int = 0
+    errors: int = 0
+    effective_changed: int = 0
+    registrations: GradeRegistrationSummary = field(
+        default_factory=GradeRegistrationSummary
+    )
+    error_log: Path | None = None
+
+
+def copy_import_supported(using: str = DEFAULT_DB_ALIAS) -> bool:
+    """Return True when the database can run :func:`copy_import_grades`."""
+    return connections[using].vendor == "postgresql"
+
+
+def grade_section_id(row: RowT, *, default_faculty_id: int) -> int:
+    """Resolve (creating when missing) the Section of one normalized grade row."""
+    semester_no = get_in_row("semester_no", row) or get_in_row("semester", row)
+    sem_pk = ensure_sem_id(get_in_row("academic_year", row), semester_no)
+    college_pk = ensure_college_id(get_in_row("college_code", row))
+    dept_pk = ensure_dpt_id(get_in_row("course_dept", row), college_pk)
+    course_pk = ensure_crs_id(
+        dept_pk,
+        get_in_row("course_no", row),
+        get_in_row("course_title", row),
+    )
+    curriculum_pk = ensure_curri_id(
+        get_in_row("curriculum", row), college_pk, fuzzy_threshold=1.0
+    )
+    credit_code = to_int(get_in_row("credit_hours", row), default=3)
+    curr_course_pk = ensure_curri_crs_id(curriculum_pk, course_pk, credit_code)
+    sec_no = to_int(get_in_row("section_no", row))
+    return ensure_sec_id(sem_pk, curr_course_pk, sec_no, default_faculty_id)
+
+
+def copy_import_grades(
+    path: Path,
+    *,
+    default_faculty_id: int,
+    batch_size: int = 5000,
+    reconstruct_registrations: bool = True,
+    dry_run: bool = False,
+    using: str = DEFAULT_DB_ALIAS,
+) -> CopyGradeImportSummary:
+    """Import a grade TSV through a COPY staging table.
+
+    When any row fails to resolve, ``summary.errors`` is non-zero, the
+    whole import is rolled back and the failed rows are written to the grade
+    import error log (``summary.error_log``). Unknown grade codes are
+    skipped, not errors.
+
+    Raises:
+        GradeCopyImportError: The TSV header is empty or repeats a column.
+    """
+    headers = _read_headers(path)
+    summary = CopyGradeImportSummary()
+    connection = connections[using]
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        summary.rows = _stage_tsv(cursor, path, headers)
+        _resolve_students(cursor, headers)
+        _resolve_sections(cursor, headers, default_faculty_id)
+        _resolve_grade_values(cursor, headers)
+        rejects = _fetch_rejects(cursor, headers)
+        summary.skipped = sum(reject[1] == UNKNOWN_GRADE_CODE for reject in rejects)
+        summary.errors = len(rejects) - summary.skipped
+        if not summary.errors:
+            summary.created = _insert_new_grades(cursor)
+            if reconstruct_registrations:
+                for pairs in _fetchmany(cursor, _resolved_pairs_sql(), batch_size):
+                    summary.registrations.add(
+                        ensure_grade_registration_pairs(
+                            pairs, batch_size=batch_size, dry_run=dry_run
+                        )
+                    )
+            cursor.execute(_new_std_crs_pairs_sql(cursor))
+            summary.effective_changed = recompute_effective_grades(
+                cursor.fetchall(), chunk_size=batch_size, refresh_standing=True
+            )
+        if summary.errors or dry_run:
+            transaction.set_rollback(True, using=using)
+    if summary.errors:
+        summary.error_log = write_grade_error_log(
+            [
+                (line_no, reason, dict(zip(REJECT_COLUMNS, cells, strict=True)))
+                for line_no, reason, *cells in rejects
+                if reason != UNKNOWN_GRADE_CODE
+            ]
+        )
+    return summary
+
+
+def _read_headers(path: Path) -> tuple[str, ...]:
+    """Return the TSV header, as ``csv.DictReader`` would read it."""
+    with path.open(newline="", encoding="utf-8-sig") as handle:
+        headers = tuple(next(csv.reader(handle, delimiter="\t"), ()))
+    if not headers:
+        raise GradeCopyImportError(f"Empty grade file: {path}")
+    if len(set(headers)) != len(headers):
+        raise GradeCopyImportError(f"Repeated column in grade file header: {path}")
+    return headers
+
+
+def _qn(cursor: CursorWrapper, name: str) -> str:
+    """Quote ``name`` for the connection the cursor belongs to."""
+    return cursor.db.ops.quote_name(name)
+
+
+def _cell(
+    cursor: CursorWrapper, headers: Sequence[str], name: str, table: str = _STAGE
+) -> str:
+    """Return SQL for a staged cell stripped like ``get_in_row``; "" when absent."""
+    if name not in headers:
+        return "''"
+    column = _qn(cursor, name)
+    return f"btrim(coalesce({table}.{column}, ''), E' \\t\\r\\n\\f\\x0b')"
+
+
+def _semester_cell(cursor: CursorWrapper, headers: Sequence[str]) -> str:
+    """Return SQL for ``semester_no``, falling back to ``semester``."""
+    return (
+        f"coalesce(nullif({_cell(cursor, headers, 'semester_no')}, ''), "
+        f"{_cell(cursor, headers, 'semester')})"
+    )
+
+
+def _key_cells(
+    cursor: CursorWrapper, headers: Sequence[str], names: Sequence[str]
+) -> list[str]:
+    """Return SQL for the staged cells of ``names``."""
+    return [
+        _semester_cell(cursor, headers)
+        if name == "semester_no"
+        else _cell(cursor, headers, name)
+        for name in names
+    ]
+
+
+def _stage_tsv(cursor: CursorWrapper, path: Path, headers: Sequence[str]) -> int:
+    """COPY the TSV body into the staging table; return the staged row count."""
+    columns = ", ".join(_qn(cursor, name) for name in headers)
+    cursor.execute(
+        f"CREATE TEMP TABLE {_STAGE} ("
+        "line_no bigserial PRIMARY KEY, "
+        f"{', '.join(f'{_qn(cursor, name)} text' for name in headers)}, "
+        "student_pk bigint, section_pk bigint, value_pk bigint, reject_reason text"
+        ") ON COMMIT DROP"
+    )
+    with path.open("rb") as handle:
+        handle.readline()
+        _copy_in(
+            cursor,
+            f"COPY {_STAGE} ({columns}) FROM STDIN "
+            "WITH (FORMAT csv, DELIMITER E'\\t', ENCODING 'UTF8')",
+            handle,
+        )
+    cursor.execute(f"SELECT count(*) FROM {_STAGE}")
+    return int(cursor.fetchone()[0])
+
+
+def _resolve_students(cursor: CursorWrapper, headers: Sequence[str]) -> None:
+    """Join staged student ids to Student; ensure the remaining ids once each."""
+    student_id = _cell(cursor, headers, "student_id")
+    student_table = _qn(cursor, Student._meta.db_table)
+    sid_column = _qn(cursor, Student._meta.get_field("student_id").column)
+    cursor.execute(
+        f"UPDATE {_STAGE} SET student_pk = std.id "
+        f"FROM {student_table} AS std "
+        f"WHERE {student_id} <> '' AND std.{sid_column} = {student_id}"
+    )
+    cursor.execute(
+        f"SELECT {student_id}, min(line_no) FROM {_STAGE} "
+        "WHERE student_pk IS NULL GROUP BY 1 ORDER BY 2"
+    )
+    resolved = [
+        (sid, *_try_resolve(partial(ensure_std_sid, sid)))
+        for sid, _first_line in cursor.fetchall()
+    ]
+    cursor.execute(
+        f"CREATE TEMP TABLE {_STUDENT_KEYS} "
+        "(sid text, student_pk bigint, error text) ON COMMIT DROP"
+    )
+    _copy_rows(cursor, _STUDENT_KEYS, resolved)
+    cursor.execute(
+        f"UPDATE {_STAGE} SET student_pk = k.student_pk, "
+        "reject_reason = k.error "
+        f"FROM {_STUDENT_KEYS} AS k "
+        f"WHERE {_STAGE}.student_pk IS NULL AND k.sid = {student_id}"
+    )
+
+
+def _resolve_sections(
+    cursor: CursorWrapper, headers: Sequence[str], default_faculty_id: int
+) -> None:
+    """Resolve each distinct section key once and join the ids back."""
+    cells = _key_cells(cursor, headers, SECTION_KEY_COLUMNS)
+    positions = ", ".join(str(index) for index in range(1, len(cells) + 1))
+    cursor.execute(
+        f"SELECT {', '.join(cells)}, min(line_no) FROM {_STAGE} "
+        f"WHERE reject_reason IS NULL GROUP BY {positions} "
+        f"ORDER BY {len(cells) + 1}"
+    )
+    resolved = []
+    for *key, _first_line in cursor.fetchall():
+        row = dict(zip(SECTION_KEY_COLUMNS, key, strict=True))
+        resolved.append(
+            (
+                *key,
+                *_try_resolve(
+                    partial(grade_section_id, row, default_faculty_id=default_faculty_id)
+                ),
+            )
+        )
+    key_columns = ", ".join(f"{name} text" for name in SECTION_KEY_COLUMNS)
+    cursor.execute(
+        f"CREATE TEMP TABLE {_SECTION_KEYS} "
+        f"({key_columns}, section_pk bigint, error text) ON COMMIT DROP"
+    )
+    _copy_rows(cursor, _SECTION_KEYS, resolved)
+    matches = " AND ".join(
+        f"k.{name} = {cell}"
+        for name, cell in zip(SECTION_KEY_COLUMNS, cells, strict=True)
+    )
+    cursor.execute(
+        f"UPDATE {_STAGE} SET section_pk = k.section_pk, "
+        "reject_reason = k.error "
+        f"FROM {_SECTION_KEYS} AS k "
+        f"WHERE {_STAGE}.reject_reason IS NULL AND {matches}"
+    )
+
+
+def _resolve_grade_values(cursor: CursorWrapper, headers: Sequence[str]) -> None:
+    """Join staged grade codes to GradeValue; flag the unknown ones."""
+    grade_code = f"lower({_cell(cursor, headers, 'grade_code')})"
+    value_table = _qn(cursor, GradeValue._meta.db_table)
+    cursor.execute(
+        f"UPDATE {_STAGE} SET value_pk = gv.id "
+        f"FROM {value_table} AS gv "
+        f"WHERE {_STAGE}.reject_reason IS NULL AND lower(gv.code) = {grade_code}"
+    )
+    cursor.execute(
+        f"UPDATE {_STAGE} SET reject_reason = %s "
+        "WHERE reject_reason IS NULL AND value_pk IS NULL",
+        [UNKNOWN_GRADE_CODE],
+    )
+
+
+def _fetch_rejects(
+    cursor: CursorWrapper, headers: Sequence[str]
+) -> list[tuple[object, ...]]:
+    """Return ``(line_no, reason, *REJECT_COLUMNS)`` for every rejected row."""
+    cells = _key_cells(cursor, headers, REJECT_COLUMNS)
+    cursor.execute(
+        f"SELECT line_no, reject_reason, {', '.join(cells)} FROM {_STAGE} "
+        "WHERE reject_reason IS NOT NULL ORDER BY line_no"
+    )
+    return cursor.fetchall()
+
+
+def _insert_new_grades(cursor: CursorWrapper) -> int:
+    """Insert the first row of every new pair; return the number inserted."""
+    grade_table = _qn(cursor, Grade._meta.db_table)
+    cursor.execute(
+        f"CREATE TEMP TABLE {_NEW_PAIRS} "
+        "(student_id bigint, section_id bigint) ON COMMIT DROP"
+    )
+    cursor.execute(
+        "WITH inserted AS ("
+        f"INSERT INTO {grade_table} "
+        "(student_id, section_id, value_id, is_effective, info, graded_on) "
+        "SELECT DISTINCT ON (student_pk, section_pk) "
+        "student_pk, section_pk, value_pk, TRUE, '', CURRENT_DATE "
+        f"FROM {_STAGE} WHERE reject_reason IS NULL "
+        "ORDER BY student_pk, section_pk, line_no "
+        "ON CONFLICT (student_id, section_id) DO NOTHING "
+        "RETURNING student_id, section_id) "
+        f"INSERT INTO {_NEW_PAIRS} SELECT student_id, section_id FROM inserted"
+    )
+    return max(cursor.rowcount, 0)
+
+
+def _resolved_pairs_sql() -> str:
+    return (
+        f"SELECT DISTINCT student_pk, section_pk FROM {_STAGE} "
+        "WHERE reject_reason IS NULL ORDER BY student_pk, section_pk"
+    )
+
+
+def _new_std_crs_pairs_sql(cursor: CursorWrapper) -> str:
+    section_table = _qn(cursor, Section._meta.db_table)
+    cc_table = _qn(cursor, CurriCrs._meta.db_table)
+    return (
+        "SELECT DISTINCT np.student_id, cc.course_id "
+        f"FROM {_NEW_PAIRS} AS np "
+        f"JOIN {section_table} AS sec ON sec.id = np.section_id "
+        f"JOIN {cc_table} AS cc ON cc.id = sec.curriculum_course_id"
+    )
+
+
+def _try_resolve(resolve) -> tuple[int | None, str | None]:
+    """Return ``(id, None)`` or ``(None, error)`` like the row-by-row path logs."""
+    try:
+        return resolve(), None
+    except Exception as exc:
+        return None, str(exc) or type(exc).__name__
+
+
+def _copy_rows(
+    cursor: CursorWrapper,
+    table: str,
+    rows: Sequence[Sequence[object]],
+) -> None:
+    """COPY Python rows into ``table`` (NULL for None)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for row in rows:
+        writer.writerow(["\\N" if value is None else value for value in row])
+    _copy_in(
+        cursor,
+        f"COPY {table} FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+        io.BytesIO(buffer.getvalue().encode("utf-8")),
+    )
+
+
+def _copy_in(cursor: CursorWrapper, sql: str, stream: IO[bytes]) -> None:
+    """Run ``COPY ... FROM STDIN`` with psycopg2 or psycopg 3."""
+    raw = cursor.cursor
+    if hasattr(raw, "copy_expert"):
+        raw.copy_expert(sql, stream, size=COPY_CHUNK_BYTES)
+        return
+    with raw.copy(sql) as copy:
+        while chunk := stream.read(COPY_CHUNK_BYTES):
+            copy.write(chunk)
+
+
+def _fetchmany(
+    cursor: CursorWrapper, sql: str, size: int
+) -> Iterator[list[tuple[int, int]]]:
+    """Yield the rows of ``sql`` in lists of at most ``size``."""
+    cursor.execute(sql)
+    while rows := cursor.fetchmany(size):
+        yield [(int(first), int(second)) for first, second in rows]
+
+
+__all__ = [
+    "CopyGradeImportSummary",
+    "GradeCopyImportError",
+    "copy_import_grades",
+    "copy_import_supported",
+    "grade_section_id",
+]
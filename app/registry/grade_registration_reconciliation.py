@@ -9,6 +9,7 @@ from app.registry.gpa import effective_transcript_grades
 from app.registry.models.grade import Grade
 from app.registry.models.registration import Registration
 from app.registry.models.status_types import RegistrationStatus
+from app.registry.seats import reconcile_section_seats
 from app.timetable.models.section import Section
 
 GradeRegistrationPairT: TypeAlias = tuple[int, int]
@@ -85,6 +86,8 @@ def ensure_grade_registration_pairs(
         ignore_conflicts=True,
         batch_size=batch_size,
     )
+    # bulk_create skips Registration.save(), so recount the touched sections.
+    reconcile_section_seats({section_id for _student_id, section_id in missing_pairs})
     summary.created = len(registrations)
     return summary
 
@@ -10,15 +10,15 @@ from typing import Mapping, TypeAlias
 from django.core.management.base import BaseCommand, CommandError, CommandParser
 from django.db import transaction
 
-from app.academics.ensures import (
-    ensure_college_id,
-    ensure_crs_id,
-    ensure_curri_crs_id,
-    ensure_curri_id,
-    ensure_dpt_id,
-)
 from app.people.ensures import ensure_std_sid
 from app.people.models.faculty import Faculty
+from app.registry.effective_grades import StdCrsPairT, recompute_effective_grades
+from app.registry.grade_copy_import import (
+    GradeCopyImportError,
+    copy_import_grades,
+    copy_import_supported,
+    grade_section_id,
+)
 from app.registry.grade_import_errors import write_grade_error_log
 from app.registry.grade_registration_reconciliation import (
     GradeRegistrationPairT,
@@ -26,9 +26,14 @@ from app.registry.grade_registration_reconciliation import (
     ensure_grade_registration_pairs,
 )
 from app.registry.models.grade import Grade, GradeValue
+from app.shared.identity_map import (
+    format_identity_map_stats,
+    identity_map_scope,
+    identity_map_stats,
+)
 from app.shared.types import StrIntMapT
-from app.shared.utils import get_in_row, to_int
-from app.timetable.ensures import ensure_sec_id, ensure_sem_id
+from app.shared.utils import get_in_row
+from app.timetable.models.section import Section
 
 RowT: TypeAlias = Mapping[str, str]
 
@@ -67,8 +72,25 @@ class Command(BaseCommand):
             action="store_true",
             help="Do not create missing cleared registrations from grade rows.",
         )
+        parser.add_argument(
+            "--method",
+            choices=["auto", "copy", "rows"],
+            default="rows",
+            help=(
+                "rows (default): row-by-row import; copy: PostgreSQL COPY "
+                "staging import; auto: copy on PostgreSQL, rows elsewhere."
+            ),
+        )
 
     def handle(self, *args, **options):
+        # Lookup caches live for this run only and drop rolled-back rows.
+        with identity_map_scope():
+            self._import(options)
+            if int(options.get("verbosity") or 1) >= 2:
+                for line in format_identity_map_stats(identity_map_stats()):
+                    self.stdout.write(f"Cache {line}")
+
+    def _import(self, options) -> None:
         path = Path(options["file"])
         if not path.exists():
             raise CommandError(f"Missing file: {path}")
@@ -78,6 +100,13 @@ class Command(BaseCommand):
         max_errors = int(options.get("max_errors") or 25)
         reconstruct_registrations = not bool(options.get("no_reconstruct_registrations"))
 
+        method = str(options.get("method") or "rows")
+        if method == "auto":
+            method = "copy" if copy_import_supported() else "rows"
+        if method == "copy":
+            self._handle_copy(path, batch_size, dry_run, reconstruct_registrations)
+            return
+
         # Caches are preloaded on-demand inside ensure_* helpers.
         grade_values: StrIntMapT = {
             code.lower(): pk for code, pk in GradeValue.objects.values_list("code", "id")
@@ -98,6 +127,7 @@ class Command(BaseCommand):
             pass
 
         rows_to_create: list[Grade] = []
+        created_pairs: list[tuple[int, int]] = []
         registration_pairs_to_ensure: list[GradeRegistrationPairT] = []
         registration_pairs_seen: set[GradeRegistrationPairT] = set()
         registration_summary = GradeRegistrationSummary()
@@ -143,6 +173,7 @@ class Command(BaseCommand):
                         rows_processed += 1
                         continue
                     existing_pairs.add(pair)
+                    created_pairs.append(pair)
                     rows_to_create.append(grade)
 
                     if len(rows_to_create) >= batch_size:
@@ -182,6 +213,14 @@ class Command(BaseCommand):
                 )
             )
 
+            # bulk_create skips Grade.save(); rank the new attempts and
+            # rebuild the standings of their students in bulk.
+            effective_changed = recompute_effective_grades(
+                _std_crs_pairs(created_pairs),
+                chunk_size=batch_size,
+                refresh_standing=True,
+            )
+
             if error_rows:
                 write_grade_error_log(error_rows)
                 raise CommandError(
@@ -198,7 +237,53 @@ class Command(BaseCommand):
                 "(missing grade_value or invalid). "
                 f"Grade-backed registrations: {registration_summary.created} created, "
                 f"{registration_summary.would_create} would-create, "
-                f"{registration_summary.existing} existing."
+                f"{registration_summary.existing} existing. "
+                f"Effective grades: {effective_changed} row(s) updated. "
+                f"Row import: {rows_processed} rows in "
+                f"{time.time() - start_time:.1f}s."
+            )
+        )
+
+    def _handle_copy(
+        self,
+        path: Path,
+        batch_size: int,
+        dry_run: bool,
+        reconstruct_registrations: bool,
+    ) -> None:
+        """Import through the PostgreSQL COPY staging table."""
+        if not copy_import_supported():
+            raise CommandError("--method copy needs a PostgreSQL database.")
+        start_time = time.perf_counter()
+        try:
+            summary = copy_import_grades(
+                path,
+                default_faculty_id=Faculty.get_dft().id,
+                batch_size=batch_size,
+                reconstruct_registrations=reconstruct_registrations,
+                dry_run=dry_run,
+            )
+        except GradeCopyImportError as exc:
+            raise CommandError(str(exc)) from exc
+        if summary.errors:
+            raise CommandError(
+                f"Grade import failed with {summary.errors} row errors; see "
+                f"{summary.error_log}."
+            )
+        elapsed = time.perf_counter() - start_time
+        rate = summary.rows / elapsed if elapsed else 0
+        registrations = summary.registrations
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Grade import complete{' (dry-run)' if dry_run else ''}: "
+                f"{summary.created} grades created, {summary.skipped} skipped "
+                "(unknown grade code). "
+                f"Grade-backed registrations: {registrations.created} created, "
+                f"{registrations.would_create} would-create, "
+                f"{registrations.existing} existing. "
+                f"Effective grades: {summary.effective_changed} row(s) updated. "
+                f"COPY import: {summary.rows} rows in {elapsed:.1f}s "
+                f"({rate:.0f} rows/s)."
             )
         )
 
@@ -213,22 +298,7 @@ def _grade_from_row(
     """Build a Grade object from one normalized import row."""
     # > this ensure_student should student manager to find existing student with sid
     student_pk = ensure_std_sid(get_in_row("student_id", row))
-    semester_no = get_in_row("semester_no", row) or get_in_row("semester", row)
-    sem_pk = ensure_sem_id(get_in_row("academic_year", row), semester_no)
-    college_pk = ensure_college_id(get_in_row("college_code", row))
-    dept_pk = ensure_dpt_id(get_in_row("course_dept", row), college_pk)
-    course_pk = ensure_crs_id(
-        dept_pk,
-        get_in_row("course_no", row),
-        get_in_row("course_title", row),
-    )
-    curriculum_pk = ensure_curri_id(
-        get_in_row("curriculum", row), college_pk, fuzzy_threshold=1.0
-    )
-    credit_code = to_int(get_in_row("credit_hours", row), default=3)
-    curr_course_pk = ensure_curri_crs_id(curriculum_pk, course_pk, credit_code)
-    sec_no = to_int(get_in_row("section_no", row))
-    section_pk = ensure_sec_id(sem_pk, curr_course_pk, sec_no, default_faculty_id)
+    section_pk = grade_section_id(row, default_faculty_id=default_faculty_id)
 
     grade_code = get_in_row("grade_code", row).lower()
     grade_value_id = grade_values.get(grade_code)
@@ -251,6 +321,19 @@ def _queue_registration_pair(
     pairs_to_ensure.append(pair)
 
 
+def _std_crs_pairs(std_sec_pairs: list[tuple[int, int]]) -> set[StdCrsPairT]:
+    """Map created (student, section) pairs to their (student, course) pairs."""
+    course_by_section = dict(
+        Section.objects.filter(
+            id__in={section_id for _student_id, section_id in std_sec_pairs}
+        ).values_list("id", "curriculum_course__course_id")
+    )
+    return {
+        (student_id, course_by_section[section_id])
+        for student_id, section_id in std_sec_pairs
+    }
+
+
 def _flush_registration_pairs(
     pairs_to_ensure: list[GradeRegistrationPairT],
     *,
@@ -0,0 +1,56 @@
+"""Rebuild materialized student standing rows from effective grades."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db.models import Q
+
+from app.people.models.student import Student
+from app.registry.standing import rebuild_std_standings
+
+
+class Command(BaseCommand):
+    """Recompute StdStanding/StdSemStanding rows in bulk."""
+
+    help = (
+        "Rebuild cumulative and per-semester student standing (GPA, credits, "
+        "passed courses). Run after imports that bypass Grade.save()."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--student",
+            default="",
+            help="Optional student username, student_id, or database id.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Students loaded and written per batch.",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Run the standing rebuild."""
+        student_token = str(options["student"]).strip()
+        student_ids = [_resolve_student_id(student_token)] if student_token else None
+        batch_size = max(int(str(options.get("batch_size") or 500)), 1)
+        processed = rebuild_std_standings(student_ids, chunk_size=batch_size)
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt standing for {processed} student(s).")
+        )
+
+
+def _resolve_student_id(token: str) -> int:
+    """Resolve a student selector to a database id."""
+    query = Q(user__username=token) | Q(username=token) | Q(student_id=token)
+    if token.isdigit():
+        query |= Q(id=int(token))
+    student = Student.objects.filter(query).order_by("id").first()
+    if student is None:
+        raise CommandError(f"Student not found: {token}")
+    return int(student.id)
+
+
+__all__ = ["Command"]
@@ -0,0 +1,80 @@
+"""Recompute ``Grade.is_effective`` in bulk with a window-function ranking."""
+
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from app.registry.effective_grades import recompute_effective_grades
+from app.registry.management.commands.rebuild_std_standing import _resolve_student_id
+from app.registry.models.grade import Grade
+
+
+class Command(BaseCommand):
+    """Keep one effective grade per student/course, most recent attempt first."""
+
+    help = (
+        "Recompute the effective grade of every (student, course) pair, or of one "
+        "student's pairs, with the same ordering as Grade.save(). Run after "
+        "imports that bypass Grade.save(); replaces "
+        "scripts/backfill_grade_is_effective.sql."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--student",
+            default="",
+            help="Optional student username, student_id, or database id.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Students ranked per UPDATE.",
+        )
+        parser.add_argument(
+            "--no-standing",
+            action="store_true",
+            help="Do not rebuild standing rows of the ranked students.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the rows that would change without keeping them.",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Run the effective-grade recompute."""
+        student_token = str(options["student"]).strip()
+        pairs = None
+        if student_token:
+            student_id = _resolve_student_id(student_token)
+            pairs = {
+                (student_id, int(course_id))
+                for course_id in Grade.objects.filter(student_id=student_id)
+                .values_list("section__curriculum_course__course_id", flat=True)
+                .distinct()
+            }
+        batch_size = max(int(str(options.get("batch_size") or 500)), 1)
+        dry_run = bool(options.get("dry_run"))
+        started = time.perf_counter()
+        with transaction.atomic():
+            changed = recompute_effective_grades(
+                pairs,
+                chunk_size=batch_size,
+                refresh_standing=not (options.get("no_standing") or dry_run),
+            )
+            if dry_run:
+                transaction.set_rollback(True)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Effective grades{' (dry-run)' if dry_run else ''}: "
+                f"{changed} row(s) updated in {time.perf_counter() - started:.1f}s."
+            )
+        )
+
+
+__all__ = ["Command"]
@@ -0,0 +1,49 @@
+"""Repair drift in ``Section.current_registrations`` seat counters."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from app.registry.seats import reconcile_section_seats
+
+
+class Command(BaseCommand):
+    """Recount seat-holding registrations and fix stored section counters."""
+
+    help = (
+        "Recount seat-holding registrations per section and repair "
+        "current_registrations. Use --dry-run to only report drift."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--section",
+            type=int,
+            action="append",
+            default=[],
+            help="Section database id to check (repeatable). Defaults to all.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drift without writing.",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Run the seat reconciliation."""
+        section_ids = list(options["section"] or []) or None  # type: ignore[call-overload]
+        dry_run = bool(options["dry_run"])
+        drifts = reconcile_section_seats(section_ids, dry_run=dry_run)
+        for drift in drifts:
+            self.stdout.write(
+                f"section {drift.section_id}: stored {drift.stored}, "
+                f"actual {drift.actual}"
+            )
+        mode = "Dry-run" if dry_run else "Applied"
+        self.stdout.write(
+            self.style.SUCCESS(f"{mode} seat reconciliation: {len(drifts)} section(s).")
+        )
+
+
+__all__ = ["Command"]
@@ -13,6 +13,7 @@ from .status_types import (
 )
 from .grade import Grade, GradeValue
 from .registration import Registration
+from .standing import StdSemStanding, StdStanding
 from .transcript import TranscriptRequest
 from .credit_hours import CreditHour
 
@@ -25,6 +26,8 @@ __all__ = [
     "DocStd",
     "Registration",
     "RegistrationStatus",
+    "StdSemStanding",
+    "StdStanding",
     "Grade",
     "GradeValue",
     "TranscriptRequest",
@@ -115,36 +115,26 @@ class Grade(models.Model):
 
     @classmethod
     def recompute_effective_for_student_course(
-        cls, *, student_id: int, course_id: int
+        cls, *, student_id: int, course_id: int, refresh_standing: bool = True
     ) -> None:
-        """Set a single effective grade per student/course using recency."""
-        effective_id = (
-            cls.objects.filter(
-                student_id=student_id,
-                section__curriculum_course__course_id=course_id,
-            )
-            .order_by(
-                "-section__semester__start_date",
-                "-section__semester_id",
-                "-section_id",
-                "-graded_on",
-                "-id",
-            )
-            .values_list(
-                "id",
-                flat=True,
-            )
-            .first()
-        )
-        if effective_id is None:
-            return
-        cls.objects.filter(
-            student_id=student_id,
-            section__curriculum_course__course_id=course_id,
-        ).exclude(id=effective_id).filter(is_effective=True).update(is_effective=False)
-        cls.objects.filter(id=effective_id).exclude(is_effective=True).update(
-            is_effective=True
-        )
+        """Set a single effective grade per student/course using recency.
+
+        See :func:`app.registry.effective_grades.recompute_effective_grades`
+        for the ordering and for recomputing many pairs at once.
+        """
+        from app.registry.effective_grades import recompute_effective_grades
+
+        recompute_effective_grades([(student_id, course_id)], refresh_standing=False)
+        if refresh_standing:
+            cls._refresh_standings([student_id])
+
+    @staticmethod
+    def _refresh_standings(student_ids) -> None:
+        """Refresh materialized standing rows for the touched students."""
+        from app.registry.standing import refresh_std_standing
+
+        for student_id in sorted({int(student_id) for student_id in student_ids}):
+            refresh_std_standing(student_id)
 
     def __str__(self) -> str:  # pragma: no cover
         """Human readable representation used in admin lists."""
@@ -176,6 +166,7 @@ class Grade(models.Model):
 
         super().save(*args, **kwargs)
         if not recompute_effective:
+            self._refresh_standings([self.student_id])
             return
 
         recompute_pairs: set[tuple[int, int]] = set()
@@ -193,11 +184,16 @@ class Grade(models.Model):
             self.recompute_effective_for_student_course(
                 student_id=student_id,
                 course_id=course_id,
+                refresh_standing=False,
             )
+        self._refresh_standings(
+            [self.student_id, *(student_id for student_id, _course_id in recompute_pairs)]
+        )
 
     def delete(self, *args, **kwargs):
         """Delete a grade and refresh effective status for the same course."""
         recompute_effective = bool(kwargs.pop("recompute_effective", True))
+        student_id = self.student_id
         old_pair = None
         if recompute_effective:
             old_pair = (
@@ -214,4 +210,6 @@ class Grade(models.Model):
                 student_id=int(old_pair[0]),
                 course_id=int(old_pair[1]),
             )
+        else:
+            self._refresh_standings([student_id])
         return deleted
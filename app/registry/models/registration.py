@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Self, cast
 
-from django.db import models
+from django.db import models, transaction
 from simple_history.models import HistoricalRecords
 
 from app.registry.models.status_types import RegistrationStatus
@@ -52,9 +52,47 @@ class Registration(StatusableMixin, models.Model):
             self.status = RegistrationStatus.get_dft()
 
     def save(self, *args, **kwargs):
-        """Check model before save."""
+        """Check model before save and keep the section seat counter in sync.
+
+        Pass ``enforce_seat_limit=True`` to reject taking a seat in a full
+        section (``SectionFullError``); imports and staff edits keep counting
+        past ``max_seats``.
+        """
+        from app.registry.seats import holds_seat, release_seat, reserve_seat
+
+        enforce_seat_limit = bool(kwargs.pop("enforce_seat_limit", False))
         self._ensure_regio_status()
-        return super().save(*args, **kwargs)
+        old_row = None
+        if self.pk:
+            old_row = (
+                self.__class__.objects.filter(pk=self.pk)
+                .values_list("section_id", "status_id")
+                .first()
+            )
+        old_seat = old_row[0] if old_row and holds_seat(old_row[1]) else None
+        new_seat = self.section_id if holds_seat(self.status_id) else None
+        with transaction.atomic():
+            if new_seat is not None and new_seat != old_seat:
+                reserve_seat(new_seat, enforce_limit=enforce_seat_limit)
+            result = super().save(*args, **kwargs)
+            if old_seat is not None and old_seat != new_seat:
+                release_seat(old_seat)
+        return result
+
+    def delete(self, *args, **kwargs):
+        """Delete the registration and give its seat back."""
+        from app.registry.seats import holds_seat, release_seat
+
+        old_row = (
+            self.__class__.objects.filter(pk=self.pk)
+            .values_list("section_id", "status_id")
+            .first()
+        )
+        with transaction.atomic():
+            deleted = super().delete(*args, **kwargs)
+            if old_row is not None and holds_seat(old_row[1]):
+                release_seat(old_row[0])
+        return deleted
 
     class Meta:
         constraints = [
@@ -0,0 +1,68 @@
+"""Materialized academic standing rows for students."""
+
+from __future__ import annotations
+
+from django.db import models
+
+
+class StdStanding(models.Model):
+    """Cumulative academic standing for one student.
+
+    Rows are rebuilt from effective grades by ``app.registry.standing`` on
+    every grade save/delete, so reads are one indexed lookup instead of a
+    Grade → Section → CurriCrs → CreditHour aggregate.
+    """
+
+    # ~~~~~~~~ Mandatory ~~~~~~~~
+    student = models.OneToOneField(
+        "people.Student",
+        on_delete=models.CASCADE,
+        related_name="standing",
+    )
+
+    # ~~~~ Auto-filled ~~~~
+    gpa = models.FloatField(null=True, blank=True)
+    quality_points = models.FloatField(default=0.0)
+    # Credits counted in the GPA denominator (GPA-excluded codes removed).
+    gpa_credits = models.PositiveIntegerField(default=0)
+    attempted_credits = models.PositiveIntegerField(default=0)
+    earned_credits = models.PositiveIntegerField(default=0)
+    passed_course_ids = models.JSONField(default=list, blank=True)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.student_id}: {self.earned_credits} cr, GPA {self.gpa}"
+
+
+class StdSemStanding(models.Model):
+    """Academic standing of one student for a single semester."""
+
+    # ~~~~~~~~ Mandatory ~~~~~~~~
+    student = models.ForeignKey(
+        "people.Student",
+        on_delete=models.CASCADE,
+        related_name="sem_standings",
+    )
+    semester = models.ForeignKey(
+        "timetable.Semester",
+        on_delete=models.CASCADE,
+        related_name="std_standings",
+    )
+
+    # ~~~~ Auto-filled ~~~~
+    gpa = models.FloatField(null=True, blank=True)
+    quality_points = models.FloatField(default=0.0)
+    gpa_credits = models.PositiveIntegerField(default=0)
+    attempted_credits = models.PositiveIntegerField(default=0)
+    earned_credits = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.student_id} @ {self.semester_id}: GPA {self.gpa}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["student", "semester"],
+                name="uniq_std_sem_standing",
+            )
+        ]
@@ -0,0 +1,181 @@
+"""Seat accounting for ``Section.current_registrations``.
+
+Every registration whose status holds a seat counts once against its
+section. ``Registration.save()``/``delete()`` keep the counter in sync;
+bulk writes (``bulk_create``, ``QuerySet.update``/``delete``) must call
+:func:`reconcile_section_seats` or run ``reconcile_section_seats``.
+
+Reservations use a conditional ``UPDATE ... WHERE current_registrations <
+max_seats`` so concurrent registrations cannot oversubscribe a section:
+the database serializes writers on the section row and re-checks the
+predicate for each of them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q
+
+from app.registry.constants import SEAT_RELEASING_REGIO_STATUSES
+from app.registry.models.registration import Registration
+from app.registry.models.status_types import RegistrationStatus
+from app.timetable.models.section import Section
+
+
+class SectionFullError(ValueError):
+    """Raised when a seat is requested in a section with no seat left."""
+
+    def __init__(self, section_id: int) -> None:
+        super().__init__(f"Section {section_id} has no available seat.")
+        self.section_id = section_id
+
+
+@dataclass(frozen=True)
+class SectionSeatDrift:
+    """Stored seat counter that disagrees with registration rows."""
+
+    section_id: int
+    stored: int
+    actual: int
+
+
+def holds_seat(status_id: str | None) -> bool:
+    """Return True when a registration status occupies a section seat."""
+    return (status_id or "") not in SEAT_RELEASING_REGIO_STATUSES
+
+
+def reserve_seat(section_id: int, *, enforce_limit: bool = True) -> None:
+    """Take one seat in a section.
+
+    Args:
+        section_id: Section to update.
+        enforce_limit: When False the counter is incremented even past
+            ``max_seats`` (historical imports, staff overrides).
+
+    Raises:
+        SectionFullError: The section has no seat left and the limit applies.
+    """
+    sections = Section.objects.filter(pk=section_id)
+    if enforce_limit:
+        sections = sections.filter(current_registrations__lt=F("max_seats"))
+    updated = sections.update(current_registrations=F("current_registrations") + 1)
+    if not updated and enforce_limit:
+        raise SectionFullError(section_id)
+
+
+def release_seat(section_id: int) -> None:
+    """Give back one seat, never letting the counter go below zero."""
+    Section.objects.filter(pk=section_id, current_registrations__gt=0).update(
+        current_registrations=F("current_registrations") - 1
+    )
+
+
+def register_with_seat(
+    *,
+    student_id: int,
+    section_id: int,
+    status: RegistrationStatus,
+) -> tuple[Registration, bool]:
+    """Create or revive a registration while enforcing the seat limit.
+
+    Returns:
+        ``(registration, changed)`` where ``changed`` is True when a seat was
+        taken by this call (new row or canceled/removed row revived).
+
+    Raises:
+        SectionFullError: The section is full; nothing is written.
+    """
+    with transaction.atomic():
+        registration = (
+            Registration.objects.select_for_update()
+            .filter(student_id=student_id, section_id=section_id)
+            .first()
+        )
+        if registration is not None:
+            if holds_seat(registration.status_id):
+                return registration, False
+            registration.status = status
+            registration.save(update_fields=["status"], enforce_seat_limit=True)
+            return registration, True
+        registration = Registration(
+            student_id=student_id,
+            section_id=section_id,
+            status=status,
+        )
+        try:
+            with transaction.atomic():
+                registration.save(enforce_seat_limit=True)
+        except IntegrityError:
+            # A parallel request created the same row first.
+            existing = Registration.objects.get(
+                student_id=student_id, section_id=section_id
+            )
+            return existing, False
+        return registration, True
+
+
+def _seats_taken_qs(section_ids: Iterable[int] | None = None):
+    """Return sections annotated with their seat-holding registration count."""
+    sections = Section.objects.all()
+    if section_ids is not None:
+        sections = sections.filter(pk__in=list(section_ids))
+    return sections.annotate(
+        seats_taken=Count(
+            "section_registrations",
+            filter=~Q(section_registrations__status_id__in=SEAT_RELEASING_REGIO_STATUSES),
+        )
+    )
+
+
+def section_seat_counts(section_ids: Iterable[int] | None = None) -> dict[int, int]:
+    """Return seat-holding registration counts keyed by section id."""
+    rows = _seats_taken_qs(section_ids).values_list("pk", "seats_taken")
+    return {int(pk): int(taken) for pk, taken in rows}
+
+
+def reconcile_section_seats(
+    section_ids: Iterable[int] | None = None,
+    *,
+    dry_run: bool = False,
+) -> list[SectionSeatDrift]:
+    """Repair ``current_registrations`` drift from actual registration rows.
+
+    Args:
+        section_ids: Sections to check. ``None`` checks every section.
+        dry_run: Report drift without writing.
+
+    Returns:
+        One entry per section whose stored counter differed.
+    """
+    rows = (
+        _seats_taken_qs(section_ids)
+        .exclude(current_registrations=F("seats_taken"))
+        .values_list("pk", "current_registrations", "seats_taken")
+        .order_by("pk")
+    )
+    drifts = [
+        SectionSeatDrift(int(pk), int(stored), int(actual)) for pk, stored, actual in rows
+    ]
+    if dry_run or not drifts:
+        return drifts
+    with transaction.atomic():
+        for drift in drifts:
+            Section.objects.filter(pk=drift.section_id).update(
+                current_registrations=drift.actual
+            )
+    return drifts
+
+
+__all__ = [
+    "SectionFullError",
+    "SectionSeatDrift",
+    "holds_seat",
+    "reconcile_section_seats",
+    "register_with_seat",
+    "release_seat",
+    "reserve_seat",
+    "section_seat_counts",
+]
@@ -0,0 +1,283 @@
+"""Maintain materialized student standing (GPA, credits, passed courses).
+
+``StdStanding``/``StdSemStanding`` rows are derived from effective grades.
+Grade writes refresh the touched student; ``rebuild_std_standings`` repairs
+rows in bulk after imports that bypass ``Grade.save()``.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Iterable, TypeAlias, TypedDict
+
+from django.db import transaction
+from django.db.models import Case, CharField, Count, Q, QuerySet, Value, When
+
+from app.academics.choices import LEVEL_NUMBER
+from app.registry.gpa import (
+    GpaResultT,
+    effective_transcript_grades,
+    get_grade_points_and_credits,
+)
+from app.registry.models.grade import Grade
+from app.registry.models.standing import StdSemStanding, StdStanding
+
+STANDING_FIELDS = [
+    "gpa",
+    "quality_points",
+    "gpa_credits",
+    "attempted_credits",
+    "earned_credits",
+]
+
+
+class StandingTotalsT(TypedDict):
+    """Aggregated standing numbers for one student or student/semester."""
+
+    gpa: float | None
+    quality_points: float
+    gpa_credits: int
+    attempted_credits: int
+    earned_credits: int
+
+
+StdTotalsT: TypeAlias = tuple[StandingTotalsT, list[int], dict[int, StandingTotalsT]]
+
+
+def _empty_totals() -> StandingTotalsT:
+    return {
+        "gpa": None,
+        "quality_points": 0.0,
+        "gpa_credits": 0,
+        "attempted_credits": 0,
+        "earned_credits": 0,
+    }
+
+
+def _finish_gpa(totals: StandingTotalsT) -> StandingTotalsT:
+    credits_total = totals["gpa_credits"]
+    totals["gpa"] = totals["quality_points"] / credits_total if credits_total else None
+    return totals
+
+
+# Upper completed-credit bound per class level; the last level is open-ended.
+CLASS_LEVEL_CREDIT_BOUNDS: list[tuple[str, int | None]] = [
+    (LEVEL_NUMBER.ONE.label, 36),
+    (LEVEL_NUMBER.TWO.label, 72),
+    (LEVEL_NUMBER.THREE.label, 108),
+    (LEVEL_NUMBER.FOUR.label, None),
+]
+
+
+def class_level_for_credits(credits: int) -> str:
+    """Return the class-level label matching a completed-credit total."""
+    for label, upper in CLASS_LEVEL_CREDIT_BOUNDS:
+        if upper is None or credits <= upper:
+            return label
+    return LEVEL_NUMBER.FOUR.label
+
+
+def class_level_q(level: str, prefix: str = "standing__") -> Q:
+    """Return a Student filter matching a class level through ``StdStanding``.
+
+    Students without a standing row have no effective grades yet (or predate
+    ``rebuild_std_standing``) and count as first level.
+    """
+    lower = 0
+    for label, upper in CLASS_LEVEL_CREDIT_BOUNDS:
+        if label == level:
+            query = Q(**{f"{prefix}earned_credits__gt": lower}) if lower else Q()
+            if upper is not None:
+                query &= Q(**{f"{prefix}earned_credits__lte": upper})
+            if not lower:
+                query |= Q(**{f"{prefix}isnull": True})
+            return query
+        lower = upper or lower
+    return Q(pk__in=[])
+
+
+def count_stds_by_level(students: QuerySet) -> dict[str, int]:
+    """Return distinct student counts per class level, grouped in SQL.
+
+    ``students`` may span multi-valued joins (e.g. curriculum enrollments);
+    each student is counted once.
+    """
+    level = Case(
+        *[
+            When(class_level_q(label), then=Value(label))
+            for label, _upper in CLASS_LEVEL_CREDIT_BOUNDS
+        ],
+        default=Value(LEVEL_NUMBER.FOUR.label),
+        output_field=CharField(),
+    )
+    counts = {label: 0 for label, _upper in CLASS_LEVEL_CREDIT_BOUNDS}
+    rows = (
+        students.order_by()
+        .annotate(class_level=level)
+        .values("class_level")
+        .annotate(total=Count("pk", distinct=True))
+    )
+    for row in rows:
+        counts[row["class_level"]] += row["total"]
+    return counts
+
+
+def standing_grades_qs(student_ids: Iterable[int]) -> QuerySet[Grade]:
+    """Return effective grades with the joins standing computation needs."""
+    return (
+        Grade.objects.filter(student_id__in=list(student_ids), is_effective=True)
+        .select_related(
+            "value",
+            "section__semester__academic_year",
+            "section__curriculum_course__credit_hours",
+            "section__curriculum_course__course__department",
+        )
+        .order_by("student_id", "id")
+    )
+
+
+def compute_std_totals(grades: Iterable[Grade]) -> StdTotalsT:
+    """Return cumulative totals, passed course ids and per-semester totals.
+
+    Earned/attempted credits and passed courses follow ``Student.completed_credits``
+    (every effective grade). GPA follows the transcript rules and collapses
+    approved course aliases first, exactly like ``registry.gpa``.
+    """
+    grade_list = list(grades)
+    cumulative = _empty_totals()
+    by_semester: dict[int, StandingTotalsT] = defaultdict(_empty_totals)
+    passed_ids: set[int] = set()
+
+    for grade in grade_list:
+        value = grade.value
+        if value is None or value.number is None:
+            continue
+        curri_crs = grade.section.curriculum_course
+        credits = int(getattr(curri_crs.credit_hours, "code", 0) or 0)
+        sem_totals = by_semester[int(grade.section.semester_id)]
+        cumulative["attempted_credits"] += credits
+        sem_totals["attempted_credits"] += credits
+        if value.number >= 1:
+            cumulative["earned_credits"] += credits
+            sem_totals["earned_credits"] += credits
+            passed_ids.add(int(curri_crs.course_id))
+
+    for grade in effective_transcript_grades(grade_list):
+        result = get_grade_points_and_credits(grade)
+        if result is None:
+            continue
+        points, credits = result
+        sem_totals = by_semester[int(grade.section.semester_id)]
+        cumulative["quality_points"] += points
+        cumulative["gpa_credits"] += credits
+        sem_totals["quality_points"] += points
+        sem_totals["gpa_credits"] += credits
+
+    for sem_totals in by_semester.values():
+        _finish_gpa(sem_totals)
+    return _finish_gpa(cumulative), sorted(passed_ids), dict(by_semester)
+
+
+def _write_standings(totals_by_std: dict[int, StdTotalsT]) -> None:
+    """Upsert cumulative rows and replace semester rows for the given students."""
+    if not totals_by_std:
+        return
+    standings = [
+        StdStanding(student_id=student_id, passed_course_ids=passed_ids, **cumulative)
+        for student_id, (cumulative, passed_ids, _sems) in totals_by_std.items()
+    ]
+    sem_standings = [
+        StdSemStanding(student_id=student_id, semester_id=semester_id, **sem_totals)
+        for student_id, (_cumulative, _passed, sems) in totals_by_std.items()
+        for semester_id, sem_totals in sems.items()
+    ]
+    with transaction.atomic():
+        StdStanding.objects.bulk_create(
+            standings,
+            update_conflicts=True,
+            unique_fields=["student"],
+            update_fields=[*STANDING_FIELDS, "passed_course_ids", "refreshed_at"],
+        )
+        StdSemStanding.objects.filter(student_id__in=list(totals_by_std)).delete()
+        StdSemStanding.objects.bulk_create(sem_standings)
+
+
+def refresh_std_standing(student_id: int) -> None:
+    """Recompute standing rows for one student from effective grades."""
+    grades = standing_grades_qs([student_id])
+    _write_standings({int(student_id): compute_std_totals(grades)})
+
+
+def rebuild_std_standings(
+    student_ids: Iterable[int] | None = None,
+    *,
+    chunk_size: int = 500,
+) -> int:
+    """Rebuild standing rows in chunks; return the number of students processed.
+
+    Args:
+        student_ids: Students to rebuild. ``None`` rebuilds every student.
+        chunk_size: Students loaded and written per batch.
+    """
+    from app.people.models.student import Student
+
+    if student_ids is None:
+        ids = list(Student.objects.order_by("id").values_list("id", flat=True))
+    else:
+        ids = sorted({int(student_id) for student_id in student_ids})
+    chunk_size = max(int(chunk_size), 1)
+    for start in range(0, len(ids), chunk_size):
+        chunk = ids[start : start + chunk_size]
+        grades_by_std: dict[int, list[Grade]] = {student_id: [] for student_id in chunk}
+        for grade in standing_grades_qs(chunk):
+            grades_by_std[int(grade.student_id)].append(grade)
+        _write_standings(
+            {
+                student_id: compute_std_totals(grades)
+                for student_id, grades in grades_by_std.items()
+            }
+        )
+    return len(ids)
+
+
+def get_std_standing(student_id: int) -> StdStanding:
+    """Return the student's standing row, materializing it on first read."""
+    standing = StdStanding.objects.filter(student_id=student_id).first()
+    if standing is None:
+        refresh_std_standing(student_id)
+        standing = StdStanding.objects.get(student_id=student_id)
+    return standing
+
+
+def standing_gpa_result(student_id: int, semester_id: int | None = None) -> GpaResultT:
+    """Return a ``GpaResultT`` read from materialized standing rows."""
+    row: StdStanding | StdSemStanding | None
+    if semester_id is None:
+        row = get_std_standing(student_id)
+    else:
+        get_std_standing(student_id)
+        row = StdSemStanding.objects.filter(
+            student_id=student_id, semester_id=semester_id
+        ).first()
+    if row is None:
+        return {"gpa": None, "credits_total": 0, "quality_points": 0.0}
+    return {
+        "gpa": row.gpa,
+        "credits_total": int(row.gpa_credits),
+        "quality_points": float(row.quality_points),
+    }
+
+
+__all__ = [
+    "CLASS_LEVEL_CREDIT_BOUNDS",
+    "StandingTotalsT",
+    "class_level_for_credits",
+    "class_level_q",
+    "compute_std_totals",
+    "count_stds_by_level",
+    "get_std_standing",
+    "rebuild_std_standings",
+    "refresh_std_standing",
+    "standing_gpa_result",
+    "standing_grades_qs",
+]
@@ -70,6 +70,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # outermost so query counts and Server-Timing cover the whole request
+    "app.shared.perf.PerfMiddleware",
     "simple_history.middleware.HistoryRequestMiddleware",
     # standard
     "django.middleware.security.SecurityMiddleware",
@@ -77,6 +79,10 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # per-request lookup caches, dropped with the request or a rollback
+    "app.shared.identity_map.IdentityMapMiddleware",
+    # refresh invoices marked dirty during the request once it is handled
+    "app.finance.invoice_queue.InvoiceRefreshMiddleware",
     "impersonate.middleware.ImpersonateMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -223,6 +229,19 @@ LOGGING = {
     },
 }
 
+# Cache staff role/group snapshots across requests (0 = per request only).
+USER_ACCESS_CACHE_SECONDS = int(os.getenv("USER_ACCESS_CACHE_SECONDS", "0"))
+
+# Requests slower than this are logged at INFO on the "app.perf" logger.
+PERF_SLOW_REQUEST_MS = float(os.getenv("PERF_SLOW_REQUEST_MS", "500"))
+
+# Requests and jobs refresh at most this many dirty invoices inline; larger
+# sets are left for `manage.py drain_invoice_queue`.
+INVOICE_REFRESH_SYNC_LIMIT = int(os.getenv("INVOICE_REFRESH_SYNC_LIMIT", "50"))
+
+# Entries kept per import lookup cache before least recently used ones go.
+IDENTITY_MAP_MAXSIZE = int(os.getenv("IDENTITY_MAP_MAXSIZE", "100000"))
+
 LOGIN_REDIRECT_URL = "/portal/"
 LOGIN_URL = "/auth/login/"
 LOGOUT_REDIRECT_URL = "/auth/login/"
@@ -151,15 +151,12 @@ class StdLevelFlt(admin.SimpleListFilter):
 
     def queryset(self, request, qs):
         """Describe how to filter the student qs."""
+        from app.registry.standing import class_level_q
+
         level = self.value()
         if not level:
             return qs
-        # Compute levels in Python; limited to current queryset ids.
-        ids: list[int] = []
-        for student in qs:
-            if student.class_level == level:
-                ids.append(student.id)
-        return qs.filter(id__in=ids)
+        return qs.filter(class_level_q(level))
 
 
 class ScopedAutocompleteFilter(AutocompleteFilter):
@@ -0,0 +1,61 @@
+"""Changelist paginators that avoid full-table counts on large tables."""
+
+from __future__ import annotations
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+ESTIMATED_COUNT_MIN_ROWS = 100_000
+
+
+def estimated_table_count(queryset: QuerySet) -> int | None:
+    """Return the planner's row estimate for an unfiltered queryset.
+
+    Only PostgreSQL keeps a cheap estimate (``pg_class.reltuples``). Filtered
+    or distinct querysets, other backends and never-analysed tables return
+    None.
+    """
+    query = queryset.query
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql" or query.where or query.distinct:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+            [connection.ops.quote_name(queryset.model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that trusts the table estimate for large unfiltered lists.
+
+    Below :data:`ESTIMATED_COUNT_MIN_ROWS`, or whenever a filter, search or
+    scope narrows the queryset, the count is exact.
+
+    Example:
+        >>> class GradeAdmin(admin.ModelAdmin):
+        ...     paginator = EstimatedCountPaginator
+        ...     show_full_result_count = False
+    """
+
+    @cached_property
+    def count(self) -> int:
+        """Return the estimated or exact number of objects."""
+        if isinstance(self.object_list, QuerySet):
+            estimate = estimated_table_count(self.object_list)
+            if estimate is not None and estimate >= ESTIMATED_COUNT_MIN_ROWS:
+                return estimate
+        return super().count
+
+
+__all__ = [
+    "ESTIMATED_COUNT_MIN_ROWS",
+    "EstimatedCountPaginator",
+    "estimated_table_count",
+]
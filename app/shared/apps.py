@@ -7,3 +7,9 @@ from django.apps import AppConfig
 class SharedConfig(AppConfig):
     name = "app.shared"
     verbose_name = "Shared"
+
+    def ready(self):
+        """Time template rendering for the request instrumentation."""
+        from app.shared.perf import install_template_timer
+
+        install_template_timer()
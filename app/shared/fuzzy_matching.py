@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Any, Callable, Iterable, List, Sequence, Tuple, TypeAlias, TypeVar
 
 from rapidfuzz.distance import JaroWinkler
@@ -71,6 +72,38 @@ def normalize_name_tokens(name: str) -> NameTokensT:
     return surn, givens
 
 
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def soundex(token: str) -> str:
+    """Return the American Soundex code of a name token ("" when empty).
+
+    Examples:
+        "Kollie" and "Kolie" both yield "K400".
+    """
+    letters = _clean_name_token(token)
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if char not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
 def sim_name_token(x: str, y: str) -> float:
     """Similarity between two given-name tokens, handling initials."""
     if not x or not y:
@@ -95,36 +128,68 @@ def name_similarity(
 
     Surnames dominate; given names allow initials/full swaps.
     """
+    return name_tokens_similarity(
+        normalize_name_tokens(name_a),
+        normalize_name_tokens(name_b),
+        sim_threshold=sim_threshold,
+        weight_surname=weight_surname,
+        length_penalty=length_penalty,
+    )
+
+
+def name_tokens_similarity(
+    tokens_a: NameTokensT,
+    tokens_b: NameTokensT,
+    sim_threshold: float = 0.8,
+    weight_surname: float = 0.6,
+    length_penalty: float = 0.07,
+    *,
+    surname_score: float | None = None,
+) -> float:
+    """Same as :func:`name_similarity` for pre-normalized name tokens.
 
-    surn_a, givens_a = normalize_name_tokens(name_a)
-    surn_b, givens_b = normalize_name_tokens(name_b)
+    Batch matchers normalize each name once and call this per pair; those
+    that already scored the two surnames pass it as ``surname_score``.
+    """
+    surn_a, givens_a = tokens_a
+    surn_b, givens_b = tokens_b
 
-    sim_surname = jarowinkler_similarity(surn_a, surn_b)
+    if surname_score is None:
+        sim_surname = jarowinkler_similarity(surn_a, surn_b)
+    else:
+        sim_surname = surname_score
 
     # > Why do we reduce the case of low sim_threshold ?
     # > to make it more apparant that there is not similarity ?
     if sim_surname < sim_threshold:
         return sim_surname * 0.2
 
-    if not givens_a and not givens_b:
-        sim_given = 1.0
-    else:
-        scores_a = [
-            max((sim_name_token(x, y) for y in givens_b), default=0.0) for x in givens_a
-        ]
-        scores_b = [
-            max((sim_name_token(y, x) for x in givens_a), default=0.0) for y in givens_b
-        ]
-        avg_a = sum(scores_a) / len(scores_a) if scores_a else 0.0
-        avg_b = sum(scores_b) / len(scores_b) if scores_b else 0.0
-        sim_given_raw = (avg_a + avg_b) / 2
-        penalty = length_penalty * abs(len(givens_a) - len(givens_b))
-        sim_given = max(0.0, sim_given_raw - penalty)
+    sim_given = _given_similarity(tuple(givens_a), tuple(givens_b), length_penalty)
 
     sim = weight_surname * sim_surname + (1 - weight_surname) * sim_given
     return max(0.0, min(1.0, sim))
 
 
+@lru_cache(maxsize=65536)
+def _given_similarity(
+    givens_a: tuple[str, ...], givens_b: tuple[str, ...], length_penalty: float
+) -> float:
+    """Greedy given-name similarity; cached since given names repeat a lot."""
+    if not givens_a and not givens_b:
+        return 1.0
+    scores_a = [
+        max((sim_name_token(x, y) for y in givens_b), default=0.0) for x in givens_a
+    ]
+    scores_b = [
+        max((sim_name_token(y, x) for x in givens_a), default=0.0) for y in givens_b
+    ]
+    avg_a = sum(scores_a) / len(scores_a) if scores_a else 0.0
+    avg_b = sum(scores_b) / len(scores_b) if scores_b else 0.0
+    sim_given_raw = (avg_a + avg_b) / 2
+    penalty = length_penalty * abs(len(givens_a) - len(givens_b))
+    return max(0.0, sim_given_raw - penalty)
+
+
 def top_name_matches(
     base: str,
     candidates: Iterable[CandidateT],
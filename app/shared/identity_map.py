@@ -0,0 +1,346 @@
+"""Scoped, rollback-aware identity maps for import lookups.
+
+The ``ensure_*`` helpers and import widgets remember the rows they resolved
+or created (``COURSE_ID_CACHE``, ``SECTION_ID_CACHE``, ...). Each of those
+caches is an :class:`IdentityMap` registered here by name:
+
+* entries live in the current *scope*. :func:`identity_map_scope` (opened per
+  request by :class:`IdentityMapMiddleware` and per run by the import
+  commands) starts every map empty and drops it when the block ends. Outside
+  a scope each thread keeps one default scope;
+* entries written inside a transaction are journaled per savepoint with a
+  ``transaction.on_commit`` hook. When the savepoint or the transaction rolls
+  back (``--dry-run``, failed imports), the hook is discarded and the entries
+  are evicted on the next access, so a cache never hands out an id that no
+  longer exists;
+* each map is bounded (``IDENTITY_MAP_MAXSIZE``) and evicts least recently
+  used entries first. The journal only tracks entries still cached, so it
+  is bounded too;
+* :func:`identity_map_stats` reports hits, misses, evictions and rollbacks.
+
+Example:
+    >>> COURSE_ID_CACHE: IdentityMap[tuple[int, str], int] = identity_map(
+    ...     "academics.course_ids"
+    ... )
+    >>> with identity_map_scope():
+    ...     COURSE_ID_CACHE[(3, "101")] = 42
+    ...     COURSE_ID_CACHE.get((3, "101"))
+    42
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Generic, TypedDict, TypeVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.http import HttpRequest, HttpResponse
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+DEFAULT_MAXSIZE = 100_000
+
+
+class IdentityMapStatsT(TypedDict):
+    """Usage counters of one identity map in the current scope."""
+
+    name: str
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+    rollbacks: int
+
+
+@dataclass
+class _MapState:
+    """Entries and counters of one map inside one scope."""
+
+    entries: OrderedDict[Hashable, object] = field(default_factory=OrderedDict)
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    rollbacks: int = 0
+
+
+EntryKeyT = tuple[str, Hashable]
+
+
+@dataclass(eq=False)
+class _PendingWrites:
+    """Keys written while one savepoint stack was active and not yet committed."""
+
+    savepoint_ids: tuple[str | None, ...]
+    keys: set[EntryKeyT] = field(default_factory=set)
+
+
+@dataclass
+class _Scope:
+    """Every map's state for one request, import run or thread."""
+
+    states: dict[str, _MapState] = field(default_factory=dict)
+    # Uncommitted writes by ``id()`` of the on_commit hook that confirms them.
+    pending: dict[int, _PendingWrites] = field(default_factory=dict)
+    # Hook id of the group each journaled, still cached entry belongs to.
+    journaled: dict[EntryKeyT, int] = field(default_factory=dict)
+    last_hook_id: int | None = None
+    # The connection's ``run_on_commit`` list when hooks were last checked.
+    # Django swaps in a new list whenever it discards hooks, so the list
+    # identity tells whether a rollback happened since.
+    seen_hooks: list[object] | None = None
+
+    def state(self, name: str) -> _MapState:
+        if name not in self.states:
+            self.states[name] = _MapState()
+        return self.states[name]
+
+    def journal(self, name: str, key: Hashable) -> None:
+        """Remember a write made inside a transaction until it commits."""
+        connection = connections[DEFAULT_DB_ALIAS]
+        if not connection.in_atomic_block:
+            return
+        savepoint_ids = tuple(connection.savepoint_ids)
+        group = self.pending.get(self.last_hook_id)  # type: ignore[arg-type]
+        if group is None or group.savepoint_ids != savepoint_ids:
+            group = _PendingWrites(savepoint_ids)
+            hook = self._commit_hook()
+            self.pending[id(hook)] = group
+            self.last_hook_id = id(hook)
+            transaction.on_commit(hook)
+        entry = (name, key)
+        if self.journaled.get(entry) == self.last_hook_id:
+            return
+        # A rewrite belongs to the innermost savepoint that made it.
+        self.forget(name, key)
+        group.keys.add(entry)
+        self.journaled[entry] = self.last_hook_id  # type: ignore[assignment]
+
+    def forget(self, name: str, key: Hashable) -> None:
+        """Stop tracking an entry that left its map (evicted or deleted)."""
+        hook_id = self.journaled.pop((name, key), None)
+        if hook_id is None:
+            return
+        group = self.pending[hook_id]
+        group.keys.discard((name, key))
+        if not group.keys:
+            del self.pending[hook_id]
+
+    def forget_map(self, name: str) -> None:
+        """Stop tracking every entry of one map."""
+        for entry_name, key in [entry for entry in self.journaled if entry[0] == name]:
+            self.forget(entry_name, key)
+
+    def sync(self) -> None:
+        """Evict writes whose savepoint or transaction has rolled back."""
+        if not self.pending:
+            return
+        run_on_commit = connections[DEFAULT_DB_ALIAS].run_on_commit
+        if run_on_commit is self.seen_hooks:
+            return
+        self.seen_hooks = run_on_commit
+        live = {id(hook) for _sids, hook, _robust in run_on_commit}
+        for hook_id in [hook_id for hook_id in self.pending if hook_id not in live]:
+            for name, key in self.pending.pop(hook_id).keys:
+                del self.journaled[(name, key)]
+                state = self.state(name)
+                if state.entries.pop(key, _MISSING) is not _MISSING:
+                    state.rollbacks += 1
+
+    def reset(self) -> None:
+        self.states.clear()
+        self.pending.clear()
+        self.journaled.clear()
+        self.last_hook_id = None
+        self.seen_hooks = None
+
+    def _commit_hook(self) -> Callable[[], None]:
+        def confirm() -> None:
+            group = self.pending.pop(id(confirm), None)
+            for entry in group.keys if group is not None else ():
+                del self.journaled[entry]
+
+        return confirm
+
+
+_MISSING = object()
+_scope: ContextVar[_Scope | None] = ContextVar("identity_map_scope", default=None)
+_thread_scope = threading.local()
+_REGISTRY: dict[str, IdentityMap[Hashable, object]] = {}
+
+
+def _current_scope() -> _Scope:
+    """Return the active scope, or this thread's default scope."""
+    scope = _scope.get()
+    if scope is not None:
+        return scope
+    if not hasattr(_thread_scope, "scope"):
+        _thread_scope.scope = _Scope()
+    return _thread_scope.scope
+
+
+def default_maxsize() -> int:
+    """Return the entry limit applied to maps registered without one."""
+    return int(getattr(settings, "IDENTITY_MAP_MAXSIZE", DEFAULT_MAXSIZE))
+
+
+class IdentityMap(MutableMapping[KeyT, ValueT], Generic[KeyT, ValueT]):
+    """A named, bounded cache whose entries belong to the current scope.
+
+    Reads count as hits or misses and refresh the entry's LRU position.
+    Membership tests (``key in cache``) are not counted.
+    """
+
+    def __init__(self, name: str, maxsize: int | None = None) -> None:
+        self.name = name
+        self._maxsize = maxsize
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize if self._maxsize is not None else default_maxsize()
+
+    def _state(self) -> _MapState:
+        scope = _current_scope()
+        scope.sync()
+        return scope.state(self.name)
+
+    def __getitem__(self, key: KeyT) -> ValueT:
+        state = self._state()
+        try:
+            value = state.entries[key]
+        except KeyError:
+            state.misses += 1
+            raise
+        state.hits += 1
+        state.entries.move_to_end(key)
+        return value  # type: ignore[return-value]
+
+    def __setitem__(self, key: KeyT, value: ValueT) -> None:
+        scope = _current_scope()
+        scope.sync()
+        state = scope.state(self.name)
+        state.entries[key] = value
+        state.entries.move_to_end(key)
+        scope.journal(self.name, key)
+        while len(state.entries) > self.maxsize:
+            evicted, _value = state.entries.popitem(last=False)
+            state.evictions += 1
+            scope.forget(self.name, evicted)
+
+    def __delitem__(self, key: KeyT) -> None:
+        scope = _current_scope()
+        scope.sync()
+        del scope.state(self.name).entries[key]
+        scope.forget(self.name, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._state().entries
+
+    def __iter__(self) -> Iterator[KeyT]:
+        return iter(list(self._state().entries))  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self._state().entries)
+
+    def clear(self) -> None:
+        """Drop every entry of this map in the current scope."""
+        scope = _current_scope()
+        scope.sync()
+        scope.state(self.name).entries.clear()
+        scope.forget_map(self.name)
+
+    def stats(self) -> IdentityMapStatsT:
+        """Return this map's counters in the current scope."""
+        state = self._state()
+        return {
+            "name": self.name,
+            "size": len(state.entries),
+            "maxsize": self.maxsize,
+            "hits": state.hits,
+            "misses": state.misses,
+            "evictions": state.evictions,
+            "rollbacks": state.rollbacks,
+        }
+
+
+def identity_map(name: str, *, maxsize: int | None = None) -> IdentityMap:
+    """Register (or return) the identity map called ``name``.
+
+    Args:
+        name: Registry key, ``<app>.<what>`` by convention.
+        maxsize: Entry limit; defaults to ``IDENTITY_MAP_MAXSIZE``.
+    """
+    if name not in _REGISTRY:
+        _REGISTRY[name] = IdentityMap(name, maxsize)
+    return _REGISTRY[name]
+
+
+@contextmanager
+def identity_map_scope() -> Iterator[None]:
+    """Give the block its own, initially empty, identity maps.
+
+    Nested scopes join the outermost one. Everything cached in the block is
+    dropped when it ends.
+    """
+    if _scope.get() is not None:
+        yield
+        return
+    token = _scope.set(_Scope())
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def clear_identity_maps() -> None:
+    """Drop every entry and counter of the current scope."""
+    _current_scope().reset()
+
+
+def identity_map_stats() -> list[IdentityMapStatsT]:
+    """Return the counters of every map used in the current scope."""
+    used = _current_scope().states
+    return [_REGISTRY[name].stats() for name in sorted(used) if name in _REGISTRY]
+
+
+def format_identity_map_stats(stats: list[IdentityMapStatsT]) -> list[str]:
+    """Return one ``name: size, hits/misses`` line per map that was read."""
+    return [
+        f"{row['name']}: {row['size']} entries, {row['hits']} hits, "
+        f"{row['misses']} misses, {row['evictions']} evicted, "
+        f"{row['rollbacks']} rolled back"
+        for row in stats
+        if row["hits"] or row["misses"] or row["size"]
+    ]
+
+
+class IdentityMapMiddleware:
+    """Give each request its own identity maps."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with identity_map_scope():
+            return self.get_response(request)
+
+
+__all__ = [
+    "DEFAULT_MAXSIZE",
+    "IdentityMap",
+    "IdentityMapMiddleware",
+    "IdentityMapStatsT",
+    "clear_identity_maps",
+    "default_maxsize",
+    "format_identity_map_stats",
+    "identity_map",
+    "identity_map_scope",
+    "identity_map_stats",
+]
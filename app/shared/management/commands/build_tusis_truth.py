@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import cast
 
@@ -12,6 +13,7 @@ from app.shared.source_truth.builder import (
     build_tusis_truth,
     default_output_dir,
 )
+from app.shared.source_truth.stage_cache import cache_summary
 
 
 class Command(BaseCommand):
@@ -56,10 +58,42 @@ class Command(BaseCommand):
             default="data/course_aliases/approved_course_aliases.tsv",
             help="Approved course alias TSV applied to import-ready outputs.",
         )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help="Worker processes for independent loading stages (0: one per CPU).",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Print stage timings and write cProfile stats to <output>/profile.",
+        )
+        parser.add_argument(
+            "--cache-dir",
+            default="logs/tusis_truth/cache",
+            help="Stage cache reused by later builds with unchanged inputs.",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Do not read or write the stage cache.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recompute every stage and refresh the stage cache.",
+        )
+        parser.add_argument(
+            "--source-cache-dir",
+            default="logs/tusis_truth/sources",
+            help="Converted source tables written by convert_sources.",
+        )
 
     def handle(self, *args: object, **options: object) -> None:
         """Run the read-only source-truth build."""
         output_option = cast(str | None, options.get("output_dir"))
+        cache_option = options["cache_dir"]
         config = TruthBuildConfigT(
             smartschool_dir=Path(cast(str, options["smartschool_dir"])),
             fundamentals_dir=Path(cast(str, options["smartschool_fallback_dir"])),
@@ -68,8 +102,25 @@ class Command(BaseCommand):
             tucurricula_import_dir=Path(cast(str, options["tucurricula_import_dir"])),
             output_dir=Path(output_option) if output_option else default_output_dir(),
             approved_course_aliases_path=Path(cast(str, options["course_aliases"])),
+            jobs=cast(int, options["jobs"]) or os.cpu_count() or 1,
+            profile=bool(options["profile"]),
+            cache_dir=None if options["no_cache"] else Path(cast(str, cache_option)),
+            force=bool(options["force"]),
+            source_cache_dir=Path(cast(str, options["source_cache_dir"])),
         )
         result = build_tusis_truth(config)
+        if config.cache_dir:
+            self.stdout.write(
+                cache_summary(
+                    {metric.stage: metric.cache for metric in result.stage_metrics}
+                )
+            )
+        if config.profile:
+            for metric in result.stage_metrics:
+                self.stdout.write(
+                    f"  {metric.stage}: {metric.rows} row(s) in {metric.seconds:.2f}s, "
+                    f"peak RSS {metric.peak_rss_mb:.0f} MiB"
+                )
         self.stdout.write(
             self.style.SUCCESS(f"Wrote source-truth bundle: {result.output_dir}")
         )
@@ -0,0 +1,83 @@
+"""Convert verified SmartSchool and GraPro exports into the columnar source cache."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import cast
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from app.shared.source_truth.builder import source_table_paths
+from app.shared.source_truth.inventory import (
+    build_smartschool_integrity,
+    ok_smartschool_tables,
+    smartschool_csv_name,
+)
+from app.shared.source_truth.scope import SMARTSCHOOL_IMPORT_TABLES
+from app.shared.source_truth.source_cache import SourceCache
+from app.shared.source_truth.tables import parse_source_table
+
+
+class Command(BaseCommand):
+    """Write one memory-mappable columnar table per verified source export."""
+
+    help = (
+        "Convert SmartSchool exports that pass the manifest integrity check and "
+        "the GraPro CSVs into the converted source cache read by build_tusis_truth. "
+        "Unchanged files are skipped; changed files are converted again."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register source and cache path options."""
+        parser.add_argument(
+            "--smartschool-dir",
+            default="Seed_data/SmartSchoolDB_20260609",
+            help="Latest SmartSchool CSV export directory.",
+        )
+        parser.add_argument(
+            "--grapro-csv-dir",
+            default="Seed_data/Archives/DBs/GP_DB250717",
+            help="GradPro legacy CSV export directory.",
+        )
+        parser.add_argument(
+            "--source-cache-dir",
+            default="logs/tusis_truth/sources",
+            help="Converted source cache directory.",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Convert every verified export that is not already cached."""
+        smartschool_dir = Path(cast(str, options["smartschool_dir"]))
+        grapro_csv_dir = Path(cast(str, options["grapro_csv_dir"]))
+        cache = SourceCache(Path(cast(str, options["source_cache_dir"])))
+        integrity = build_smartschool_integrity(
+            smartschool_dir, set(SMARTSCHOOL_IMPORT_TABLES)
+        )
+        unverified = {
+            smartschool_dir / smartschool_csv_name(table)
+            for table in SMARTSCHOOL_IMPORT_TABLES - ok_smartschool_tables(integrity)
+        }
+        converted = skipped = 0
+        for path in source_table_paths(smartschool_dir, grapro_csv_dir):
+            if path in unverified or not path.exists() or not path.stat().st_size:
+                continue
+            if cache.current_sha256(path) is not None:
+                skipped += 1
+                continue
+            started = time.perf_counter()
+            table = parse_source_table(path)
+            target = cache.store(table)
+            converted += 1
+            self.stdout.write(
+                f"  {path.name}: {len(table)} row(s) -> {target.name} "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Converted {converted} source table(s); {skipped} already current."
+            )
+        )
+
+
+__all__ = ["Command"]
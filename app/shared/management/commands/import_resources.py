@@ -34,6 +34,11 @@ from app.registry.admin import (
 )
 from app.shared.auth.helpers import ensure_superuser  # noqa: F401
 from app.shared.file_utils import guess_tabular_format, read_text_file
+from app.shared.identity_map import (
+    format_identity_map_stats,
+    identity_map_scope,
+    identity_map_stats,
+)
 from app.shared.importing import get_import_logger
 from app.shared.management.resources import (
     DIRECTORY_RESOURCE_ENTRIES,
@@ -114,18 +119,20 @@ class Command(BaseCommand):
         if not file_path.exists():
             raise FileNotFoundError(str(file_path))
 
-        if file_path.is_dir():
-            _import_from_directory(self, file_path, selected_rsc, dry_run)
-            return
-
-        file_contents = read_text_file(file_path)
-        dataset = _load_dataset(file_contents)
-
-        for key in selected_rsc:
-            ResourceClass = RESOURCE_REGISTRY.get(key)
-            if ResourceClass is None:
-                raise CommandError(f"Unknown resource: {key}")
-            _run_import(self, dataset, key, ResourceClass, file_path, dry_run)
+        # One set of lookup caches per run; rolled-back rows leave them too.
+        with identity_map_scope():
+            if file_path.is_dir():
+                _import_from_directory(self, file_path, selected_rsc, dry_run)
+            else:
+                dataset = _load_dataset(read_text_file(file_path))
+                for key in selected_rsc:
+                    ResourceClass = RESOURCE_REGISTRY.get(key)
+                    if ResourceClass is None:
+                        raise CommandError(f"Unknown resource: {key}")
+                    _run_import(self, dataset, key, ResourceClass, file_path, dry_run)
+            if int(opts.get("verbosity") or 1) >= 2:
+                for line in format_identity_map_stats(identity_map_stats()):
+                    self.stdout.write(f"Cache {line}")
 
 
 # ------------------------------------------------------------------ helpers
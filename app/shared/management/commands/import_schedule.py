@@ -38,6 +38,7 @@ from app.people.models.faculty import Faculty
 from app.people.models.staffs import Staff
 from app.people.utils import name_parts_from_row
 from app.registry.models import CreditHour
+from app.shared.identity_map import identity_map_scope
 from app.shared.utils import get_in_row, parse_str, to_int
 from app.spaces.models.core import Room, Space
 from app.timetable.ensures import ensure_sem
@@ -105,6 +106,11 @@ class Command(BaseCommand):
 
     # ------------------------------------------------------------------ CLI
     def handle(self, *args, **options) -> None:
+        """Run the import with lookup caches scoped to this run."""
+        with identity_map_scope():
+            self._import(options)
+
+    def _import(self, options) -> None:
         source = Path(options["source"])
         dry_run: bool = options["dry_run"]
         start_row: int = options["start_row"]
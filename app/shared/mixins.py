@@ -65,6 +65,14 @@ class SimpleTableMixin(models.Model):
         obj, _ = cls.objects.get_or_create(code=code)
         return cast(Self, obj)
 
+    @classmethod
+    def ensure_codes(cls, codes: Iterable[str]) -> None:
+        """Create the rows missing among ``codes`` with one read when all exist."""
+        wanted = set(codes)
+        existing = set(cls.objects.filter(code__in=wanted).values_list("code", flat=True))
+        for code in sorted(wanted - existing):
+            cls.get_by_code(code)
+
     def __str__(self) -> str:
         """Return human readable label."""
         return self.label
@@ -0,0 +1,244 @@
+"""Per-request query, DB, template and Python timings for the portals.
+
+:class:`PerfMiddleware` counts every query run while a request is handled
+(through ``connection.execute_wrapper``), times template rendering and the
+named service blocks wrapped in :func:`timed_block`, then:
+
+* adds a ``Server-Timing`` header (staff users and ``DEBUG`` only);
+* logs one JSON line on the ``app.perf`` logger, at INFO when the request is
+  slower than ``PERF_SLOW_REQUEST_MS`` and at DEBUG otherwise;
+* leaves the :class:`RequestTimings` on ``response.perf`` so tests can
+  assert query budgets on whole pages.
+
+Example:
+    >>> @timed_block("finance_console")
+    ... def build_finance_console_context(request): ...
+    >>> with timed_block("staff.links"):
+    ...     links = build_links(user)
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import re
+from contextlib import ContextDecorator, ExitStack
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger("app.perf")
+
+SLOW_REQUEST_MS = 500.0
+_METRIC_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+_current: ContextVar[RequestTimings | None] = ContextVar("perf_timings", default=None)
+
+
+@dataclass
+class BlockTimings:
+    """Accumulated cost of one named service block within a request."""
+
+    calls: int = 0
+    queries: int = 0
+    db_time: float = 0.0
+    wall_time: float = 0.0
+
+
+@dataclass
+class RequestTimings:
+    """Query count and timings (seconds) collected for one request."""
+
+    queries: int = 0
+    db_time: float = 0.0
+    template_time: float = 0.0
+    template_db_time: float = 0.0
+    total_time: float = 0.0
+    blocks: dict[str, BlockTimings] = field(default_factory=dict)
+    _template_depth: int = 0
+
+    @property
+    def python_time(self) -> float:
+        """Return time spent outside queries and template rendering."""
+        template_only = self.template_time - self.template_db_time
+        return max(0.0, self.total_time - self.db_time - template_only)
+
+    def record_query(self, elapsed: float) -> None:
+        """Account for one executed query."""
+        self.queries += 1
+        self.db_time += elapsed
+
+    def server_timing(self) -> str:
+        """Return the ``Server-Timing`` header value (durations in ms)."""
+        metrics = [
+            f"total;dur={self.total_time * 1000:.1f}",
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"',
+            f"tpl;dur={self.template_time * 1000:.1f}",
+            f"py;dur={self.python_time * 1000:.1f}",
+        ]
+        for name, block in self.blocks.items():
+            metric = _METRIC_NAME_RE.sub("-", name)
+            metrics.append(
+                f"blk.{metric};dur={block.wall_time * 1000:.1f};"
+                f'desc="{block.queries} queries"'
+            )
+        return ", ".join(metrics)
+
+    def as_log_dict(self) -> dict[str, Any]:
+        """Return the timings as a JSON-ready dict (durations in ms)."""
+        return {
+            "queries": self.queries,
+            "db_ms": round(self.db_time * 1000, 1),
+            "template_ms": round(self.template_time * 1000, 1),
+            "python_ms": round(self.python_time * 1000, 1),
+            "total_ms": round(self.total_time * 1000, 1),
+            "blocks": {
+                name: {
+                    "calls": block.calls,
+                    "queries": block.queries,
+                    "db_ms": round(block.db_time * 1000, 1),
+                    "wall_ms": round(block.wall_time * 1000, 1),
+                }
+                for name, block in self.blocks.items()
+            },
+        }
+
+
+def current_timings() -> RequestTimings | None:
+    """Return the timings of the request being handled, if any."""
+    return _current.get()
+
+
+class timed_block(ContextDecorator):  # noqa: N801 - used like a function
+    """Time a named service block; usable as decorator or context manager.
+
+    Outside an instrumented request (commands, shell) it does nothing.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._start: tuple[RequestTimings, int, float, float] | None = None
+
+    def _recreate_cm(self) -> timed_block:
+        # Each decorated call gets its own instance (thread and reentrancy safe).
+        return type(self)(self.name)
+
+    def __enter__(self) -> timed_block:
+        timings = _current.get()
+        if timings is not None:
+            self._start = (timings, timings.queries, timings.db_time, perf_counter())
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._start is None:
+            return
+        timings, queries, db_time, started = self._start
+        self._start = None
+        block = timings.blocks.setdefault(self.name, BlockTimings())
+        block.calls += 1
+        block.queries += timings.queries - queries
+        block.db_time += timings.db_time - db_time
+        block.wall_time += perf_counter() - started
+
+
+def _query_recorder(timings: RequestTimings) -> Callable[..., Any]:
+    """Return an ``execute_wrapper`` adding each query to ``timings``."""
+
+    def _record(execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            timings.record_query(perf_counter() - started)
+
+    return _record
+
+
+def install_template_timer() -> None:
+    """Wrap ``Template.render`` so outermost renders add to the request timings."""
+    from django.template.base import Template
+
+    if getattr(Template.render, "perf_timed", False):
+        return
+    original = Template.render
+
+    @functools.wraps(original)
+    def render(self, context):
+        timings = _current.get()
+        if timings is None or timings._template_depth:
+            return original(self, context)
+        timings._template_depth += 1
+        started, db_time = perf_counter(), timings.db_time
+        try:
+            return original(self, context)
+        finally:
+            timings._template_depth -= 1
+            timings.template_time += perf_counter() - started
+            timings.template_db_time += timings.db_time - db_time
+
+    render.perf_timed = True  # type: ignore[attr-defined]
+    Template.render = render  # type: ignore[method-assign]
+
+
+def _shows_server_timing(request: HttpRequest) -> bool:
+    user = getattr(request, "user", None)
+    return bool(settings.DEBUG or getattr(user, "is_staff", False))
+
+
+class PerfMiddleware:
+    """Collect :class:`RequestTimings` for each request (see module doc)."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        self.slow_ms = float(getattr(settings, "PERF_SLOW_REQUEST_MS", SLOW_REQUEST_MS))
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        timings = RequestTimings()
+        token = _current.set(timings)
+        started = perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(_query_recorder(timings))
+                    )
+                response = self.get_response(request)
+        finally:
+            timings.total_time = perf_counter() - started
+            _current.reset(token)
+        response.perf = timings  # type: ignore[attr-defined]
+        if _shows_server_timing(request):
+            response["Server-Timing"] = timings.server_timing()
+        self._log(request, response, timings)
+        return response
+
+    def _log(
+        self, request: HttpRequest, response: HttpResponse, timings: RequestTimings
+    ) -> None:
+        match = getattr(request, "resolver_match", None)
+        payload = {
+            "event": "request_timing",
+            "method": request.method,
+            "path": request.path,
+            "view": match.view_name if match else "",
+            "status": response.status_code,
+            **timings.as_log_dict(),
+        }
+        slow = timings.total_time * 1000 >= self.slow_ms
+        logger.log(logging.INFO if slow else logging.DEBUG, json.dumps(payload))
+
+
+__all__ = [
+    "BlockTimings",
+    "PerfMiddleware",
+    "RequestTimings",
+    "current_timings",
+    "install_template_timer",
+    "timed_block",
+]
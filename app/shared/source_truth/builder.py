@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import sqlite3
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
 from typing import TypeAlias
 
 from app.shared.source_truth.curriculum_match import (
+    CurriculumMatchMapT,
     apply_curriculum_matches_to_students,
     build_curriculum_match_map,
 )
 from app.shared.source_truth.conflicts import build_conflicts
 from app.shared.source_truth.course_aliases import (
     DEFAULT_APPROVED_ALIAS_PATH,
+    CourseAliasMapT,
     apply_course_aliases,
     collapse_aliased_duplicates,
     grade_collision_key,
@@ -49,8 +54,14 @@ from app.shared.source_truth.inventory import (
     build_smartschool_integrity,
     list_mdb_tables,
     ok_smartschool_tables,
+    smartschool_csv_name,
 )
 from app.shared.source_truth.io import RowT, write_tsv
+from app.shared.source_truth.metrics import (
+    STAGE_METRIC_HEADERS,
+    StageMeter,
+    StageMetricT,
+)
 from app.shared.source_truth.records import (
     load_grapro_import_students,
     load_fundamental_students,
@@ -70,6 +81,7 @@ from app.shared.source_truth.smartschool_operational import (
 )
 from app.shared.source_truth.reports import report_specs, summary_text
 from app.shared.source_truth.runbook import write_import_runbook
+from app.shared.source_truth.scheduler import StageT, run_stages
 from app.shared.source_truth.scope import (
     FUNDAMENTAL_IMPORT_FILES,
     GRAPRO_IMPORT_FILES,
@@ -82,15 +94,54 @@ from app.shared.source_truth.smartschool_catalog import (
     load_smartschool_curriculum_courses,
 )
 from app.shared.source_truth.smartschool_students import load_smartschool_students
+from app.shared.source_truth.source_cache import SourceCache
+from app.shared.source_truth.stage_cache import StageCache
 from app.shared.source_truth.staging import (
+    begin_stage_load,
+    finish_stage_load,
     open_stage,
     stage_output_count,
+    spill_rows,
     stage_report_rows,
     stage_truth_witnesses,
 )
+from app.shared.source_truth.tables import SourceTables, use_source_tables
 
 RowsT: TypeAlias = list[RowT]
 CountsT: TypeAlias = dict[str, int]
+ApprovedAliasesT: TypeAlias = tuple[CourseAliasMapT, RowsT]
+
+STAGE_METRICS_FILENAME = "stage_metrics.tsv"
+PROFILE_DIRNAME = "profile"
+SPILLED_STAGES = frozenset(
+    {"grades", "registrations", "semester_enrollments", "payments"}
+)
+SINK_INPUTS = frozenset(
+    {
+        "smartschool_integrity",
+        "inventory",
+        "mdb_tables",
+        "invalid_course_identities",
+        "repaired_course_identities",
+        "approved_course_aliases",
+        "tuc_courses",
+        "courses",
+        "tuc_curricula",
+        "curricula",
+        "tuc_curri_courses",
+        "tuc_requirements",
+        "curriculum_courses",
+        "gp_students",
+        "gp_grade_skipped",
+        "students",
+        "grades",
+        "registrations",
+        "semester_enrollments",
+        "payments",
+        "canonical",
+        "conflicts",
+    }
+)
 
 
 @dataclass(frozen=True)
@@ -104,6 +155,11 @@ class TruthBuildConfigT:
     tucurricula_import_dir: Path
     output_dir: Path
     approved_course_aliases_path: Path = DEFAULT_APPROVED_ALIAS_PATH
+    jobs: int = 1
+    profile: bool = False
+    cache_dir: Path | None = None
+    force: bool = False
+    source_cache_dir: Path | None = None
 
 
 @dataclass(frozen=True)
@@ -112,6 +168,7 @@ class TruthBuildResultT:
 
     output_dir: Path
     counts: CountsT
+    stage_metrics: tuple[StageMetricT, ...] = ()
 
 
 def default_output_dir() -> Path:
@@ -121,202 +178,549 @@ def default_output_dir() -> Path:
 
 
 def build_tusis_truth(config: TruthBuildConfigT) -> TruthBuildResultT:
-    """Build the source-truth SQLite database and reviewable TSV reports."""
+    """Build the source-truth SQLite database and reviewable TSV reports.
+
+    Source loading and matching run as the stage graph from
+    :func:`truth_stages`, on ``config.jobs`` worker processes. Once grades,
+    registrations, semester enrollments and payments land they are spilled
+    to the stage database, so the build holds few large datasets at once.
+    Reports, witnesses and import-ready files are then written here, in one
+    SQLite transaction indexed at the end. Every stage's rows, wall time,
+    throughput and peak memory go to ``stage_metrics.tsv``. Outputs do not
+    depend on ``jobs``.
+
+    In-scope SmartSchool and GraPro exports are parsed once and shared by
+    every stage (see :func:`shared_source_tables`), or loaded from the
+    ``convert_sources`` cache in ``config.source_cache_dir`` when unchanged;
+    ``SUMMARY.txt`` lists the parses and bytes read per file.
+
+    With ``config.cache_dir`` set, graph stages whose inputs and code are
+    unchanged are reused from the stage cache; ``config.force`` recomputes
+    and re-stores all of them.
+    """
     config.output_dir.mkdir(parents=True, exist_ok=True)
     sqlite_path = config.output_dir / "truth.sqlite"
     _reset_sqlite_outputs(sqlite_path)
     conn = open_stage(sqlite_path)
+    begin_stage_load(conn)
     counts: CountsT = {}
+    profile_dir = config.output_dir / PROFILE_DIRNAME if config.profile else None
+    meter = StageMeter(profile_dir=profile_dir)
 
-    smartschool_integrity = build_smartschool_integrity(
-        config.smartschool_dir, set(SMARTSCHOOL_IMPORT_TABLES)
-    )
-    ok_tables = ok_smartschool_tables(smartschool_integrity)
-    inventory = build_configured_inventory(
+    cache = StageCache(config.cache_dir, force=config.force) if config.cache_dir else None
+
+    def spill(name: str, value: object) -> object:
+        if name in SPILLED_STAGES:
+            return _spill_stage_result(conn, name, value)
+        return value
+
+    with use_source_tables(shared_source_tables(config)) as tables:
+        results, graph_metrics = run_stages(
+            truth_stages(),
+            config,
+            jobs=config.jobs,
+            keep=SINK_INPUTS,
+            on_result=spill,
+            profile_dir=profile_dir,
+            cache=cache,
+            on_done=tables.stage_done,
+        )
+    smartschool_integrity = results["smartschool_integrity"]
+    _, approved_course_aliases = results["approved_course_aliases"]
+    tuc_courses = results["tuc_courses"]
+    historical_courses_raw, course_aliases, _ = results["courses"]
+    tuc_curricula = results["tuc_curricula"]
+    historical_curricula, _, curriculum_aliases = results["curricula"]
+    tuc_curri_courses = results["tuc_curri_courses"]
+    tuc_requirements = results["tuc_requirements"]
+    historical_curri_courses_raw, _ = results["curriculum_courses"]
+    gp_students = results["gp_students"]
+    (
+        students,
+        grapro_student_supplements,
+        student_curriculum_matches,
+        student_matches,
+    ) = results["students"]
+    grades, grapro_grade_supplements, grade_alias_collisions = results["grades"]
+    registrations, registration_alias_collisions = results["registrations"]
+    semester_enrollments = results["semester_enrollments"]
+    payments = results["payments"]
+    canonical_courses, canonical_curricula, canonical_curri_courses = results["canonical"]
+
+    with meter.stage("reports") as stage:
+        reports = report_specs(
+            inventory=results["inventory"],
+            smartschool_integrity=smartschool_integrity,
+            mdb_tables=results["mdb_tables"],
+            course_witnesses=[*tuc_courses, *historical_courses_raw],
+            course_aliases=course_aliases,
+            approved_course_aliases=approved_course_aliases,
+            course_alias_collisions=[
+                *grade_alias_collisions,
+                *registration_alias_collisions,
+            ],
+            invalid_course_identities=results["invalid_course_identities"],
+            repaired_course_identities=results["repaired_course_identities"],
+            curriculum_aliases=curriculum_aliases,
+            student_matches=student_matches,
+            student_curriculum_matches=student_curriculum_matches,
+            grapro_student_supplements=grapro_student_supplements,
+            grapro_grade_supplements=grapro_grade_supplements,
+            grapro_grade_skipped=results["gp_grade_skipped"],
+            canonical_courses=canonical_courses,
+            canonical_curricula=canonical_curricula,
+            canonical_curri_courses=canonical_curri_courses,
+            conflicts=results["conflicts"],
+        )
+        for filename, headers, rows in reports:
+            counts[filename] = write_tsv(config.output_dir / filename, headers, rows)
+            stage_report_rows(conn, filename, rows)
+            stage_output_count(conn, filename, counts[filename])
+            stage.rows += counts[filename]
+
+    with meter.stage("witnesses") as stage:
+        stage.rows = stage_truth_witnesses(
+            conn,
+            courses=chain(tuc_courses, historical_courses_raw),
+            curricula=chain(tuc_curricula, historical_curricula),
+            curriculum_courses=chain(tuc_curri_courses, historical_curri_courses_raw),
+            requirements=tuc_requirements,
+            students=chain(students, gp_students),
+            grades=grades,
+            registrations=registrations,
+            semester_enrollments=semester_enrollments,
+            payments=payments,
+        )
+
+    with meter.stage("import_ready") as stage:
+        import_counts = write_import_ready_bundle(
+            config.output_dir,
+            courses=canonical_courses,
+            curricula=canonical_curricula,
+            curriculum_courses=canonical_curri_courses,
+            requirements=tuc_requirements,
+            students=students,
+            grades=grades,
+            registrations=registrations,
+            semester_enrollments=semester_enrollments,
+            payments=payments,
+        )
+        for filename, row_count in import_counts.items():
+            counts[filename] = row_count
+            stage_output_count(conn, filename, row_count)
+            stage.rows += row_count
+
+    with meter.stage("stage_indexes"):
+        finish_stage_load(conn)
+
+    counts["IMPORT_RUNBOOK.org"] = write_import_runbook(
+        config.output_dir,
         smartschool_dir=config.smartschool_dir,
-        fundamentals_dir=config.fundamentals_dir,
-        grapro_csv_dir=config.grapro_csv_dir,
-        tucurricula_import_dir=config.tucurricula_import_dir,
-        grapro_mdb=config.grapro_mdb,
-        smartschool_tables=SMARTSCHOOL_IMPORT_TABLES,
+    )
+    stage_metrics = (*graph_metrics, *meter.metrics)
+    counts[STAGE_METRICS_FILENAME] = write_tsv(
+        config.output_dir / STAGE_METRICS_FILENAME,
+        STAGE_METRIC_HEADERS,
+        (metric.as_row() for metric in stage_metrics),
+    )
+    stage_output_count(conn, STAGE_METRICS_FILENAME, counts[STAGE_METRICS_FILENAME])
+    conn.commit()
+    (config.output_dir / "SUMMARY.txt").write_text(
+        summary_text(
+            config.output_dir, counts, smartschool_integrity, stage_metrics=stage_metrics
+        ),
+        encoding="utf-8",
+    )
+    conn.close()
+    return TruthBuildResultT(
+        output_dir=config.output_dir, counts=counts, stage_metrics=stage_metrics
+    )
+
+
+def shared_source_tables(config: TruthBuildConfigT) -> SourceTables:
+    """Return the parse-once registry of in-scope SmartSchool and GraPro exports."""
+    paths = source_table_paths(config.smartschool_dir, config.grapro_csv_dir)
+    return SourceTables(
+        paths,
+        cache=SourceCache(config.source_cache_dir) if config.source_cache_dir else None,
+        readers=table_readers(paths, truth_stages(), config),
+    )
+
+
+def table_readers(
+    paths: Iterable[Path], stages: Iterable[StageT], config: object
+) -> dict[Path, set[str]]:
+    """Map each source path to the stages that may read it.
+
+    A stage may read a file when one of its path parameters is that file or
+    a directory containing it.
+    """
+    stage_roots = [
+        (stage.name, [getattr(config, param) for param in stage.params])
+        for stage in stages
+    ]
+    return {
+        path: {
+            name
+            for name, roots in stage_roots
+            if any(isinstance(root, Path) and path.is_relative_to(root) for root in roots)
+        }
+        for path in paths
+    }
+
+
+def source_table_paths(smartschool_dir: Path, grapro_csv_dir: Path) -> list[Path]:
+    """Return the in-scope SmartSchool and GraPro export paths."""
+    return [
+        *(
+            smartschool_dir / smartschool_csv_name(table)
+            for table in sorted(SMARTSCHOOL_IMPORT_TABLES)
+        ),
+        *(grapro_csv_dir / filename for filename in GRAPRO_IMPORT_FILES),
+    ]
+
+
+def truth_stages() -> tuple[StageT, ...]:
+    """Return the source-loading and matching stages of a truth build."""
+    ss_dir = ("smartschool_dir",)
+    fund_dir = ("fundamentals_dir",)
+    gp_dir = ("grapro_csv_dir",)
+    tuc_dir = ("tucurricula_import_dir",)
+    ok_tables = ("ok_tables",)
+    aliases = ("approved_course_aliases",)
+    return (
+        StageT("smartschool_integrity", _smartschool_integrity, params=ss_dir),
+        StageT("ok_tables", ok_smartschool_tables, inputs=("smartschool_integrity",)),
+        StageT(
+            "inventory",
+            _configured_inventory,
+            params=(*ss_dir, *fund_dir, *gp_dir, *tuc_dir, "grapro_mdb"),
+        ),
+        StageT("mdb_tables", list_mdb_tables, params=("grapro_mdb",)),
+        StageT(
+            "invalid_course_identities",
+            load_invalid_smartschool_course_identities,
+            inputs=ok_tables,
+            params=ss_dir,
+        ),
+        StageT(
+            "repaired_course_identities",
+            load_repaired_smartschool_course_identities,
+            inputs=ok_tables,
+            params=ss_dir,
+        ),
+        StageT(
+            "approved_course_aliases",
+            load_approved_course_aliases,
+            params=("approved_course_aliases_path",),
+        ),
+        StageT("tuc_courses", load_tucurricula_courses, params=tuc_dir),
+        StageT("ss_courses", load_smartschool_courses, inputs=ok_tables, params=ss_dir),
+        StageT("fund_courses", load_fundamental_courses, params=fund_dir),
+        StageT("gp_courses", load_grapro_courses, params=gp_dir),
+        StageT(
+            "courses",
+            _courses,
+            inputs=("tuc_courses", "ss_courses", "fund_courses", "gp_courses", *aliases),
+        ),
+        StageT("tuc_curricula", load_tucurricula_curricula, params=tuc_dir),
+        StageT(
+            "ss_curricula", load_smartschool_curricula, inputs=ok_tables, params=ss_dir
+        ),
+        StageT("fund_curricula", load_fundamental_curricula, params=fund_dir),
+        StageT(
+            "curricula",
+            _curricula,
+            inputs=("tuc_curricula", "ss_curricula", "fund_curricula"),
+        ),
+        StageT("tuc_curri_courses", load_tucurricula_curriculum_courses, params=tuc_dir),
+        StageT("tuc_requirements", load_tucurricula_requirements, params=tuc_dir),
+        StageT(
+            "ss_curri_courses",
+            load_smartschool_curriculum_courses,
+            inputs=ok_tables,
+            params=ss_dir,
+        ),
+        StageT(
+            "fund_curri_courses", load_fundamental_curriculum_courses, params=fund_dir
+        ),
+        StageT(
+            "curriculum_courses",
+            _curriculum_courses,
+            inputs=("ss_curri_courses", "fund_curri_courses", *aliases),
+        ),
+        StageT("gp_students", load_grapro_students, params=gp_dir),
+        StageT("gp_import_students", load_grapro_import_students, params=gp_dir),
+        StageT("grapro_grades", load_grapro_grades, params=gp_dir),
+        StageT("gp_grades", _grapro_grades, inputs=("grapro_grades", *aliases)),
+        StageT("gp_grade_skipped", _grapro_grade_skipped, inputs=("grapro_grades",)),
+        StageT(
+            "source_students",
+            _source_students,
+            inputs=ok_tables,
+            params=(*ss_dir, *fund_dir),
+        ),
+        StageT(
+            "students",
+            _students,
+            inputs=(
+                "source_students",
+                "gp_import_students",
+                "gp_grades",
+                "curricula",
+                "gp_students",
+            ),
+        ),
+        StageT(
+            "source_grades",
+            _source_grades,
+            inputs=(*ok_tables, *aliases),
+            params=(*ss_dir, *fund_dir),
+        ),
+        StageT("grades", _grades, inputs=("source_grades", "gp_grades")),
+        StageT(
+            "registrations",
+            _registrations,
+            inputs=(*ok_tables, *aliases),
+            params=ss_dir,
+        ),
+        StageT(
+            "semester_enrollments",
+            _semester_enrollments,
+            inputs=ok_tables,
+            params=(*ss_dir, *fund_dir),
+        ),
+        StageT("payments", _payments, inputs=ok_tables, params=(*ss_dir, *fund_dir)),
+        StageT(
+            "canonical",
+            _canonical,
+            inputs=(
+                "tuc_courses",
+                "courses",
+                "tuc_curricula",
+                "curricula",
+                "tuc_curri_courses",
+                "curriculum_courses",
+            ),
+        ),
+        StageT(
+            "conflicts",
+            _conflicts,
+            inputs=("smartschool_integrity", "courses", "invalid_course_identities"),
+        ),
+    )
+
+
+def _smartschool_integrity(smartschool_dir: Path) -> RowsT:
+    """Compare the in-scope SmartSchool manifest counts to the exports."""
+    return build_smartschool_integrity(smartschool_dir, set(SMARTSCHOOL_IMPORT_TABLES))
+
+
+def _configured_inventory(
+    smartschool_dir: Path,
+    fundamentals_dir: Path,
+    grapro_csv_dir: Path,
+    tucurricula_import_dir: Path,
+    grapro_mdb: Path,
+) -> RowsT:
+    """Profile every in-scope source file."""
+    return build_configured_inventory(
+        smartschool_dir=smartschool_dir,
+        fundamentals_dir=fundamentals_dir,
+        grapro_csv_dir=grapro_csv_dir,
+        tucurricula_import_dir=tucurricula_import_dir,
+        grapro_mdb=grapro_mdb,
+        smartschool_tables=tuple(sorted(SMARTSCHOOL_IMPORT_TABLES)),
         fundamental_files=FUNDAMENTAL_IMPORT_FILES,
         grapro_files=GRAPRO_IMPORT_FILES,
         tucurricula_files=TUCURRICULA_IMPORT_FILES,
     )
-    mdb_tables = list_mdb_tables(config.grapro_mdb)
-    invalid_course_identities = load_invalid_smartschool_course_identities(
-        config.smartschool_dir, ok_tables
-    )
-    repaired_course_identities = load_repaired_smartschool_course_identities(
-        config.smartschool_dir, ok_tables
-    )
 
-    tuc_courses = load_tucurricula_courses(config.tucurricula_import_dir)
-    ss_courses = load_smartschool_courses(config.smartschool_dir, ok_tables)
-    fund_courses = load_fundamental_courses(config.fundamentals_dir)
-    gp_courses = load_grapro_courses(config.grapro_csv_dir)
+
+def _courses(
+    tuc_courses: RowsT,
+    ss_courses: RowsT,
+    fund_courses: RowsT,
+    gp_courses: RowsT,
+    approved_course_aliases: ApprovedAliasesT,
+) -> tuple[RowsT, RowsT, RowsT]:
+    """Return raw historical courses, alias candidates and aliased courses."""
     historical_courses_raw = [*ss_courses, *fund_courses, *gp_courses]
     course_aliases = build_course_alias_candidates(historical_courses_raw, tuc_courses)
-    approved_alias_map, approved_course_aliases = load_approved_course_aliases(
-        config.approved_course_aliases_path
+    historical_courses = apply_course_aliases(
+        historical_courses_raw, approved_course_aliases[0]
     )
-    historical_courses = apply_course_aliases(historical_courses_raw, approved_alias_map)
+    return historical_courses_raw, course_aliases, historical_courses
+
 
-    tuc_curricula = load_tucurricula_curricula(config.tucurricula_import_dir)
-    ss_curricula = load_smartschool_curricula(config.smartschool_dir, ok_tables)
-    fund_curricula = load_fundamental_curricula(config.fundamentals_dir)
+def _curricula(
+    tuc_curricula: RowsT, ss_curricula: RowsT, fund_curricula: RowsT
+) -> tuple[RowsT, CurriculumMatchMapT, RowsT]:
+    """Return historical curricula, their matches and the alias report."""
     historical_curricula = [*ss_curricula, *fund_curricula]
     curriculum_matches, curriculum_aliases = build_curriculum_match_map(
         historical_curricula, tuc_curricula
     )
+    return historical_curricula, curriculum_matches, curriculum_aliases
 
-    tuc_curri_courses = load_tucurricula_curriculum_courses(config.tucurricula_import_dir)
-    tuc_requirements = load_tucurricula_requirements(config.tucurricula_import_dir)
-    ss_curri_courses = load_smartschool_curriculum_courses(
-        config.smartschool_dir, ok_tables
-    )
-    fund_curri_courses = load_fundamental_curriculum_courses(config.fundamentals_dir)
+
+def _curriculum_courses(
+    ss_curri_courses: RowsT,
+    fund_curri_courses: RowsT,
+    approved_course_aliases: ApprovedAliasesT,
+) -> tuple[RowsT, RowsT]:
+    """Return raw and aliased historical curriculum courses."""
     historical_curri_courses_raw = [*ss_curri_courses, *fund_curri_courses]
     historical_curri_courses = apply_course_aliases(
-        historical_curri_courses_raw, approved_alias_map
+        historical_curri_courses_raw, approved_course_aliases[0]
     )
+    return historical_curri_courses_raw, historical_curri_courses
+
+
+def _grapro_grades(
+    grapro_grades: tuple[RowsT, RowsT], approved_course_aliases: ApprovedAliasesT
+) -> RowsT:
+    """Return GradPro grades with approved course aliases applied."""
+    return apply_course_aliases(grapro_grades[0], approved_course_aliases[0])
+
+
+def _grapro_grade_skipped(grapro_grades: tuple[RowsT, RowsT]) -> RowsT:
+    """Return the GradPro grade rows skipped while loading."""
+    return grapro_grades[1]
 
-    gp_students = load_grapro_students(config.grapro_csv_dir)
-    gp_import_students = load_grapro_import_students(config.grapro_csv_dir)
-    gp_grades_raw, gp_grade_skipped = load_grapro_grades(config.grapro_csv_dir)
-    gp_grades = apply_course_aliases(gp_grades_raw, approved_alias_map)
 
-    students = load_smartschool_students(config.smartschool_dir, ok_tables)
-    if not students:
-        students = load_fundamental_students(config.fundamentals_dir)
+def _source_students(
+    smartschool_dir: Path, fundamentals_dir: Path, ok_tables: set[str]
+) -> RowsT:
+    """Return SmartSchool students, or the fundamentals export without them."""
+    students = load_smartschool_students(smartschool_dir, ok_tables)
+    return students or load_fundamental_students(fundamentals_dir)
+
+
+def _students(
+    source_students: RowsT,
+    gp_import_students: RowsT,
+    gp_grades: RowsT,
+    curricula: tuple[RowsT, CurriculumMatchMapT, RowsT],
+    gp_students: RowsT,
+) -> tuple[RowsT, RowsT, RowsT, RowsT]:
+    """Return students plus GradPro supplement, curriculum and identity reports."""
     students, grapro_student_supplements = merge_missing_grapro_students(
-        students,
+        source_students,
         gp_import_students,
         {row.get("student_id", "") for row in gp_grades},
     )
     students, student_curriculum_matches = apply_curriculum_matches_to_students(
-        students, curriculum_matches
+        students, curricula[1]
     )
     student_matches = build_student_identity_candidates(students, gp_students)
+    return (
+        students,
+        grapro_student_supplements,
+        student_curriculum_matches,
+        student_matches,
+    )
 
-    grades_raw = load_smartschool_grades(config.smartschool_dir, ok_tables)
-    grades = apply_course_aliases(grades_raw, approved_alias_map)
+
+def _source_grades(
+    smartschool_dir: Path,
+    fundamentals_dir: Path,
+    ok_tables: set[str],
+    approved_course_aliases: ApprovedAliasesT,
+) -> RowsT:
+    """Return aliased SmartSchool grades, or the fundamentals export without them."""
+    grades = load_smartschool_grades(smartschool_dir, ok_tables)
     if not grades:
         grades = load_passthrough_rows(
-            config.fundamentals_dir / "full_grades.tsv", "fundamentals_smartschool"
+            fundamentals_dir / "full_grades.tsv", "fundamentals_smartschool"
         )
-        grades = apply_course_aliases(grades, approved_alias_map)
-    grades, grapro_grade_supplements = merge_missing_grades(grades, gp_grades)
+    return apply_course_aliases(grades, approved_course_aliases[0])
+
+
+def _grades(source_grades: RowsT, gp_grades: RowsT) -> tuple[RowsT, RowsT, RowsT]:
+    """Return merged grades, GradPro supplements and alias collisions."""
+    grades, grapro_grade_supplements = merge_missing_grades(source_grades, gp_grades)
     grades, grade_alias_collisions = collapse_aliased_duplicates(
         grades,
         domain="grade",
         key_fn=grade_collision_key,
         signature_fn=grade_collision_signature,
     )
-    registrations_raw = load_smartschool_course_registrations(
-        config.smartschool_dir, ok_tables
+    return grades, grapro_grade_supplements, grade_alias_collisions
+
+
+def _registrations(
+    smartschool_dir: Path,
+    ok_tables: set[str],
+    approved_course_aliases: ApprovedAliasesT,
+) -> tuple[RowsT, RowsT]:
+    """Return aliased course registrations and their alias collisions."""
+    registrations = apply_course_aliases(
+        load_smartschool_course_registrations(smartschool_dir, ok_tables),
+        approved_course_aliases[0],
     )
-    registrations = apply_course_aliases(registrations_raw, approved_alias_map)
-    registrations, registration_alias_collisions = collapse_aliased_duplicates(
+    return collapse_aliased_duplicates(
         registrations,
         domain="registration",
         key_fn=registration_collision_key,
         signature_fn=registration_collision_signature,
     )
-    semester_enrollments = load_smartschool_semester_enrollments(
-        config.smartschool_dir, ok_tables
-    )
-    if not semester_enrollments:
-        semester_enrollments = load_passthrough_rows(
-            config.fundamentals_dir / "registry_registration.csv",
-            "fundamentals_smartschool",
-        )
-    payments = load_smartschool_payments(config.smartschool_dir, ok_tables)
-    if not payments:
-        payments = load_passthrough_rows(
-            config.fundamentals_dir / "finance_payments.csv",
-            "fundamentals_smartschool",
-        )
 
-    canonical_courses = build_canonical_courses(tuc_courses, historical_courses)
-    canonical_curricula = build_canonical_curricula(tuc_curricula, historical_curricula)
-    canonical_curri_courses = build_canonical_curriculum_courses(
-        tuc_curri_courses, historical_curri_courses
-    )
-    conflicts = build_conflicts(
-        smartschool_integrity,
-        historical_courses_raw,
-        course_aliases,
-        invalid_course_identities,
-    )
 
-    reports = report_specs(
-        inventory=inventory,
-        smartschool_integrity=smartschool_integrity,
-        mdb_tables=mdb_tables,
-        course_witnesses=[*tuc_courses, *historical_courses_raw],
-        course_aliases=course_aliases,
-        approved_course_aliases=approved_course_aliases,
-        course_alias_collisions=[
-            *grade_alias_collisions,
-            *registration_alias_collisions,
-        ],
-        invalid_course_identities=invalid_course_identities,
-        repaired_course_identities=repaired_course_identities,
-        curriculum_aliases=curriculum_aliases,
-        student_matches=student_matches,
-        student_curriculum_matches=student_curriculum_matches,
-        grapro_student_supplements=grapro_student_supplements,
-        grapro_grade_supplements=grapro_grade_supplements,
-        grapro_grade_skipped=gp_grade_skipped,
-        canonical_courses=canonical_courses,
-        canonical_curricula=canonical_curricula,
-        canonical_curri_courses=canonical_curri_courses,
-        conflicts=conflicts,
+def _semester_enrollments(
+    smartschool_dir: Path, fundamentals_dir: Path, ok_tables: set[str]
+) -> RowsT:
+    """Return semester enrollments, falling back to the fundamentals export."""
+    semester_enrollments = load_smartschool_semester_enrollments(
+        smartschool_dir, ok_tables
     )
-    for filename, headers, rows in reports:
-        counts[filename] = write_tsv(config.output_dir / filename, headers, rows)
-        stage_report_rows(conn, filename, rows)
-        stage_output_count(conn, filename, counts[filename])
-
-    stage_truth_witnesses(
-        conn,
-        courses=[*tuc_courses, *historical_courses_raw],
-        curricula=[*tuc_curricula, *historical_curricula],
-        curriculum_courses=[*tuc_curri_courses, *historical_curri_courses_raw],
-        requirements=tuc_requirements,
-        students=[*students, *gp_students],
-        grades=grades,
-        registrations=registrations,
-        semester_enrollments=semester_enrollments,
-        payments=payments,
+    return semester_enrollments or load_passthrough_rows(
+        fundamentals_dir / "registry_registration.csv", "fundamentals_smartschool"
     )
-    import_counts = write_import_ready_bundle(
-        config.output_dir,
-        courses=canonical_courses,
-        curricula=canonical_curricula,
-        curriculum_courses=canonical_curri_courses,
-        requirements=tuc_requirements,
-        students=students,
-        grades=grades,
-        registrations=registrations,
-        semester_enrollments=semester_enrollments,
-        payments=payments,
+
+
+def _payments(
+    smartschool_dir: Path, fundamentals_dir: Path, ok_tables: set[str]
+) -> RowsT:
+    """Return payments, falling back to the fundamentals export."""
+    payments = load_smartschool_payments(smartschool_dir, ok_tables)
+    return payments or load_passthrough_rows(
+        fundamentals_dir / "finance_payments.csv", "fundamentals_smartschool"
     )
-    for filename, row_count in import_counts.items():
-        counts[filename] = row_count
-        stage_output_count(conn, filename, row_count)
 
-    counts["IMPORT_RUNBOOK.org"] = write_import_runbook(
-        config.output_dir,
-        smartschool_dir=config.smartschool_dir,
+
+def _canonical(
+    tuc_courses: RowsT,
+    courses: tuple[RowsT, RowsT, RowsT],
+    tuc_curricula: RowsT,
+    curricula: tuple[RowsT, CurriculumMatchMapT, RowsT],
+    tuc_curri_courses: RowsT,
+    curriculum_courses: tuple[RowsT, RowsT],
+) -> tuple[RowsT, RowsT, RowsT]:
+    """Return canonical courses, curricula and curriculum courses."""
+    return (
+        build_canonical_courses(tuc_courses, courses[2]),
+        build_canonical_curricula(tuc_curricula, curricula[0]),
+        build_canonical_curriculum_courses(tuc_curri_courses, curriculum_courses[1]),
     )
-    (config.output_dir / "SUMMARY.txt").write_text(
-        summary_text(config.output_dir, counts, smartschool_integrity),
-        encoding="utf-8",
+
+
+def _conflicts(
+    smartschool_integrity: RowsT,
+    courses: tuple[RowsT, RowsT, RowsT],
+    invalid_course_identities: RowsT,
+) -> RowsT:
+    """Return cross-source conflicts for review."""
+    return build_conflicts(
+        smartschool_integrity, courses[0], courses[1], invalid_course_identities
     )
-    conn.close()
-    return TruthBuildResultT(output_dir=config.output_dir, counts=counts)
+
+
+def _spill_stage_result(conn: sqlite3.Connection, name: str, value: object) -> object:
+    """Replace the row list of a large stage result with its spilled view."""
+    if isinstance(value, tuple):
+        return (spill_rows(conn, name, value[0]), *value[1:])
+    return spill_rows(conn, name, value)
 
 
 def _reset_sqlite_outputs(sqlite_path: Path) -> None:
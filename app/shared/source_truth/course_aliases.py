@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import TypeAlias
 
 from app.shared.course_wrangling import course_key, split_course_code
-from app.shared.source_truth.io import RowT, read_rows
+from app.shared.source_truth.io import RowT, iter_rows
 from app.timetable.utils import normalize_academic_year
 
 RowsT: TypeAlias = list[RowT]
@@ -24,7 +24,7 @@ def load_approved_course_aliases(
     """Load approved source->target course aliases from a TSV/CSV file."""
     alias_map: CourseAliasMapT = {}
     report_rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         source_key = course_key(
             row.get("source_course_dept"), row.get("source_course_no")
         )
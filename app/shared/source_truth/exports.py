@@ -105,12 +105,12 @@ def write_import_ready_bundle(
     courses: RowsT,
     curricula: RowsT,
     curriculum_courses: RowsT,
-    requirements: RowsT,
-    students: RowsT,
-    grades: RowsT,
-    registrations: RowsT,
-    semester_enrollments: RowsT,
-    payments: RowsT,
+    requirements: Iterable[RowT],
+    students: Iterable[RowT],
+    grades: Iterable[RowT],
+    registrations: Iterable[RowT],
+    semester_enrollments: Iterable[RowT],
+    payments: Iterable[RowT],
 ) -> OutputCountsT:
     """Write Django-import-compatible TSV files."""
     import_dir = output_dir / "import_ready"
@@ -197,25 +197,26 @@ def _curriculum_course_output(row: RowT, status: str) -> RowT:
     }
 
 
-def _write_passthrough(path: Path, rows: RowsT) -> int:
-    """Write rows using their own columns minus provenance extras."""
-    rows = [canonicalize_college_fields(row) for row in rows]
+def _write_passthrough(path: Path, rows: Iterable[RowT]) -> int:
+    """Write rows using their own columns minus provenance extras.
+
+    ``rows`` is iterated twice (headers, then data) and never copied, so
+    spilled datasets stream straight from the stage database.
+    """
     headers = _passthrough_headers(rows)
     if not headers:
-        headers = ("empty",)
-        rows = []
-    return write_tsv(path, headers, rows)
+        return write_tsv(path, ("empty",), [])
+    return write_tsv(path, headers, (canonicalize_college_fields(row) for row in rows))
 
 
-def _passthrough_headers(rows: RowsT) -> tuple[str, ...]:
+def _passthrough_headers(rows: Iterable[RowT]) -> tuple[str, ...]:
     """Return stable headers for passthrough source rows."""
     blocked = {"source_name", "source_path"}
-    seen: list[str] = []
+    seen: dict[str, None] = {}
     for row in rows:
         for key in row:
-            if key in blocked or key in seen:
-                continue
-            seen.append(key)
+            if key not in blocked:
+                seen.setdefault(key)
     return tuple(seen)
 
 
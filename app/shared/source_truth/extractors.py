@@ -10,7 +10,8 @@ from app.shared.source_truth.college_codes import (
     canonicalize_college_fields,
 )
 from app.shared.source_truth.fuzzy import course_key, split_course_code
-from app.shared.source_truth.io import RowT, read_rows
+from app.shared.source_truth.io import RowT
+from app.shared.source_truth.tables import iter_rows
 
 RowsT: TypeAlias = list[RowT]
 
@@ -19,7 +20,7 @@ def load_tucurricula_courses(import_dir: Path) -> RowsT:
     """Load revised curriculum course catalog witnesses."""
     path = import_dir / "academic_course.tsv"
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         rows.append(
             _course_row(
                 source_name="tucurricula",
@@ -39,7 +40,7 @@ def load_tucurricula_curricula(import_dir: Path) -> RowsT:
     """Load revised curriculum witnesses."""
     path = import_dir / "academic_curriculum.tsv"
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         curriculum = _first(row, "curriculum")
         rows.append(
             {
@@ -62,7 +63,7 @@ def load_tucurricula_curriculum_courses(import_dir: Path) -> RowsT:
     """Load revised curriculum-course witnesses."""
     path = import_dir / "academic_curriculum_course.tsv"
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         rows.append(
             {
                 "source_name": "tucurricula",
@@ -88,7 +89,7 @@ def load_tucurricula_requirements(import_dir: Path) -> RowsT:
     """Load revised curriculum prerequisite/corequisite import rows."""
     path = import_dir / "academic_curriculum_requirement.tsv"
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         out = canonicalize_college_fields(row)
         out["source_name"] = "tucurricula"
         out["source_path"] = str(path)
@@ -100,7 +101,7 @@ def load_fundamental_courses(fundamentals_dir: Path) -> RowsT:
     """Load import-ready historical SmartSchool course witnesses."""
     path = fundamentals_dir / "academic_course.csv"
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         rows.append(
             _course_row(
                 source_name="fundamentals_smartschool",
@@ -119,7 +120,7 @@ def load_fundamental_curricula(fundamentals_dir: Path) -> RowsT:
     """Load historical SmartSchool curriculum labels."""
     path = fundamentals_dir / "academics_curriculums.csv"
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         curriculum = _first(row, "EnrollmentType", "curriculum")
         rows.append(
             {
@@ -139,7 +140,7 @@ def load_fundamental_curriculum_courses(fundamentals_dir: Path) -> RowsT:
     """Load historical SmartSchool curriculum-course witnesses."""
     path = fundamentals_dir / "academic_curriculum_course.csv"
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         rows.append(
             {
                 "source_name": "fundamentals_smartschool",
@@ -165,7 +166,7 @@ def load_grapro_courses(grapro_dir: Path) -> RowsT:
     """Load GradPro course catalog witnesses."""
     path = grapro_dir / "Courses.csv"
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         dept, number = split_course_code(_first(row, "CourseID", "ItemID"))
         rows.append(
             _course_row(
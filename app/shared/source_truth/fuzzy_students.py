@@ -6,11 +6,28 @@ from collections import defaultdict
 from collections.abc import Iterable
 from typing import TypeAlias
 
-from app.shared.fuzzy_matching import name_similarity, normalize_name_tokens
+from rapidfuzz import process
+from rapidfuzz.distance import JaroWinkler
+
+from app.shared.fuzzy_matching import (
+    NameTokensT,
+    name_similarity,
+    name_tokens_similarity,
+    normalize_name_tokens,
+    soundex,
+)
 from app.shared.source_truth.io import RowT
 
 RowsT: TypeAlias = list[RowT]
-CandidateIndexT: TypeAlias = dict[str, list[RowT]]
+# Blocking key -> distinct normalized surnames carrying it.
+BlockIndexT: TypeAlias = dict[str, list[str]]
+# Normalized surname -> (row position, row, name tokens) in input order.
+SurnameRowsT: TypeAlias = dict[str, list[tuple[int, RowT, NameTokensT]]]
+# Source surname -> {close target surname: Jaro-Winkler surname score}.
+CloseSurnamesT: TypeAlias = dict[str, dict[str, float]]
+
+SURNAME_GATE = 0.8
+"""``name_similarity`` caps pairs whose surnames score below this at 0.2."""
 
 
 def build_student_identity_candidates(
@@ -20,27 +37,46 @@ def build_student_identity_candidates(
     threshold: float = 0.84,
     limit: int = 3,
 ) -> RowsT:
-    """Return identity candidates using exact id and shared name similarity."""
+    """Return identity candidates using exact id and shared name similarity.
+
+    Rows without an exact student-id match are blocked on surname keys
+    (Soundex code and single-deletion variants, see
+    :func:`surname_block_keys`). Each distinct source surname is scored
+    once against the union of its blocks with rapidfuzz, and only target
+    rows whose surname passes the ``name_similarity`` surname gate get a
+    full name score.
+    """
     candidates = list(grapro_students)
     by_id = {
         row.get("student_id", ""): row for row in candidates if row.get("student_id")
     }
-    by_surname = _index_students_by_surname(candidates)
+    sources = [
+        (source, source.get("student_name", ""), by_id.get(source.get("student_id", "")))
+        for source in source_students
+    ]
+    source_tokens = {
+        source_name: normalize_name_tokens(source_name)
+        for _, source_name, exact in sources
+        if exact is None
+    }
+    rows_by_surname = _index_students_by_surname(candidates)
+    close_surnames = _close_surnames(
+        {tokens[0] for tokens in source_tokens.values() if tokens[0]},
+        rows_by_surname,
+        min_score=min(SURNAME_GATE, threshold),
+    )
     rows: RowsT = []
-    for source in source_students:
-        source_id = source.get("student_id", "")
-        exact = by_id.get(source_id)
+    for source, source_name, exact in sources:
         if exact is not None:
-            score = name_similarity(
-                source.get("student_name", ""), exact.get("student_name", "")
-            )
+            score = name_similarity(source_name, exact.get("student_name", ""))
             rows.append(
                 _student_match_row(source, exact, score or 1.0, "exact_student_id")
             )
             continue
-        surname, _ = normalize_name_tokens(source.get("student_name", ""))
-        pool = by_surname.get(surname, candidates if surname else [])
-        scored = _score_student_candidates(source, pool, threshold)
+        tokens = source_tokens[source_name]
+        scored = _score_student_candidates(
+            tokens, close_surnames.get(tokens[0], {}), rows_by_surname, threshold
+        )
         for target, score in scored[:limit]:
             rows.append(
                 _student_match_row(source, target, score, _student_recommendation(score))
@@ -48,30 +84,94 @@ def build_student_identity_candidates(
     return rows
 
 
-def _index_students_by_surname(rows: Iterable[RowT]) -> CandidateIndexT:
-    """Index student candidates by normalized surname."""
-    index: CandidateIndexT = defaultdict(list)
-    for row in rows:
-        surname, _ = normalize_name_tokens(row.get("student_name", ""))
-        if surname:
-            index[surname].append(row)
+def surname_block_keys(surname: str) -> set[str]:
+    """Return the blocking keys of one normalized surname.
+
+    The Soundex code groups phonetic variants; the surname itself and every
+    single-character deletion of it make any one-letter drop, insertion or
+    doubling land in a shared block.
+
+    Examples:
+        "kollie" and "kolie" share ``"sdx:K400"`` and ``"del:kolie"``.
+    """
+    if not surname:
+        return set()
+    keys = {f"sdx:{soundex(surname)}", f"del:{surname}"}
+    keys.update(
+        f"del:{surname[:index]}{surname[index + 1 :]}" for index in range(len(surname))
+    )
+    return keys
+
+
+def _index_students_by_surname(rows: Iterable[RowT]) -> SurnameRowsT:
+    """Index student candidates by normalized surname, keeping input order."""
+    index: SurnameRowsT = defaultdict(list)
+    for position, row in enumerate(rows):
+        tokens = normalize_name_tokens(row.get("student_name", ""))
+        if tokens[0]:
+            index[tokens[0]].append((position, row, tokens))
     return dict(index)
 
 
+def _block_index(surnames: Iterable[str]) -> BlockIndexT:
+    """Map each blocking key to the surnames that carry it."""
+    index: dict[str, list[str]] = defaultdict(list)
+    for surname in surnames:
+        for key in surname_block_keys(surname):
+            index[key].append(surname)
+    return dict(index)
+
+
+def _close_surnames(
+    source_surnames: Iterable[str],
+    rows_by_surname: SurnameRowsT,
+    *,
+    min_score: float,
+) -> CloseSurnamesT:
+    """Return, per source surname, target surnames scoring >= ``min_score``.
+
+    Each source surname is compared once with the distinct target surnames
+    of all its blocks in a single rapidfuzz ``extract`` call. Scores use the
+    same Jaro-Winkler distance as ``jarowinkler_similarity``, so they can be
+    fed back into ``name_tokens_similarity`` unchanged.
+    """
+    target_blocks = _block_index(rows_by_surname)
+    close: CloseSurnamesT = {}
+    for surname in source_surnames:
+        choices: set[str] = set()
+        for key in surname_block_keys(surname):
+            choices.update(target_blocks.get(key, ()))
+        if not choices:
+            continue
+        matches = process.extract(
+            surname,
+            list(choices),
+            scorer=JaroWinkler.normalized_distance,
+            # Keep boundary pairs; name_tokens_similarity applies the exact gate.
+            score_cutoff=1.0 - min_score + 1e-9,
+            limit=None,
+        )
+        close[surname] = {choice: 1.0 - float(dist) for choice, dist, _ in matches}
+    return close
+
+
 def _score_student_candidates(
-    source: RowT, candidates: Iterable[RowT], threshold: float
+    source_tokens: NameTokensT,
+    surname_scores: dict[str, float],
+    rows_by_surname: SurnameRowsT,
+    threshold: float,
 ) -> list[tuple[RowT, float]]:
-    """Return name-similarity candidates above threshold."""
-    scored: list[tuple[RowT, float]] = []
-    source_name = source.get("student_name", "")
-    if not source_name:
-        return scored
-    for target in candidates:
-        score = name_similarity(source_name, target.get("student_name", ""))
-        if score >= threshold:
-            scored.append((target, score))
-    scored.sort(key=lambda item: item[1], reverse=True)
-    return scored
+    """Return name-similarity candidates above threshold, best first."""
+    scored: list[tuple[int, RowT, float]] = []
+    for surname, surname_score in surname_scores.items():
+        for position, target, target_tokens in rows_by_surname[surname]:
+            score = name_tokens_similarity(
+                source_tokens, target_tokens, surname_score=surname_score
+            )
+            if score >= threshold:
+                scored.append((position, target, score))
+    scored.sort(key=lambda item: (-item[2], item[0]))
+    return [(target, score) for _, target, score in scored]
 
 
 def _student_recommendation(score: float) -> str:
@@ -8,12 +8,13 @@ from typing import TypeAlias
 from app.registry.constants import GRADES_NUM
 from app.shared.source_truth.fuzzy import course_key, split_course_code
 from app.shared.source_truth.grapro_normalize import gradpro_term_parts
-from app.shared.source_truth.io import RowT, read_rows
+from app.shared.source_truth.io import RowT
 from app.shared.source_truth.smartschool_normalize import (
     clean_student_id,
     first_value,
     int_text,
 )
+from app.shared.source_truth.tables import iter_rows
 
 RowsT: TypeAlias = list[RowT]
 GradeLoadResultT: TypeAlias = tuple[RowsT, RowsT]
@@ -28,7 +29,7 @@ def load_grapro_grades(grapro_dir: Path) -> GradeLoadResultT:
     course_lookup = _course_lookup(grapro_dir)
     rows: RowsT = []
     skipped: RowsT = []
-    for row_number, row in enumerate(read_rows(path), start=1):
+    for row_number, row in enumerate(iter_rows(path), start=1):
         parsed = _grade_row(path, row_number, row, course_lookup)
         if parsed.get("reason"):
             skipped.append(parsed)
@@ -81,7 +82,7 @@ def _grade_row(
 def _course_lookup(grapro_dir: Path) -> dict[str, RowT]:
     """Return GradPro course metadata keyed by normalized course identity."""
     rows: dict[str, RowT] = {}
-    for row in read_rows(grapro_dir / "Courses.csv"):
+    for row in iter_rows(grapro_dir / "Courses.csv"):
         dept, number = split_course_code(first_value(row, "CourseID", "ItemID"))
         key = course_key(dept, number)
         if not key:
@@ -9,7 +9,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TypeAlias
 
-from app.shared.source_truth.io import RowT, profile_file, read_rows
+from app.shared.source_truth.io import RowT
+from app.shared.source_truth.tables import iter_rows, profile_file
 
 InventoryRowsT: TypeAlias = list[RowT]
 VerifiedRowsT: TypeAlias = dict[str, int]
@@ -58,7 +59,7 @@ def build_smartschool_integrity(
     rows: InventoryRowsT = []
     if not manifest_path.exists():
         return rows
-    for manifest in read_rows(manifest_path):
+    for manifest in iter_rows(manifest_path):
         table_name = manifest.get("table_name", "")
         if not table_name:
             continue
@@ -263,7 +264,7 @@ def _load_verified_reexport_rows(smartschool_dir: Path) -> VerifiedRowsT:
     if not path.exists():
         return {}
     verified: VerifiedRowsT = {}
-    for row in read_rows(path):
+    for row in iter_rows(path):
         if row.get("status") != "OK":
             continue
         table_name = row.get("table", "")
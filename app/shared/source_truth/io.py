@@ -1,20 +1,40 @@
-"""Small tabular IO helpers for source-truth reports."""
+"""Small tabular IO helpers for source-truth reports.
+
+Legacy exports run to several gigabytes, so rows are streamed: the encoding is
+detected from the first chunk, headers are normalized once per header line
+and :func:`iter_rows` yields one dictionary at a time. :func:`read_rows` is
+the list-returning convenience for small files.
+
+Every pass over a source file is reported to active
+:func:`track_source_reads` blocks, so builds can show how often each table
+was parsed and how many bytes were read.
+"""
 
 from __future__ import annotations
 
+import codecs
 import csv
 import hashlib
+import io
 import sys
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import TypeAlias
+from typing import TYPE_CHECKING, TextIO, TypeAlias
 
-from app.shared.file_utils import read_text_file
+if TYPE_CHECKING:
+    from hashlib import _Hash
 
 RowT: TypeAlias = dict[str, str]
 RowsT: TypeAlias = Iterable[RowT]
 HeadersT: TypeAlias = Sequence[str]
+HeaderSlotsT: TypeAlias = tuple[tuple[int, str], ...]
+
+ENCODING_SNIFF_BYTES = 64 * 1024
+READ_CHUNK_BYTES = 1024 * 1024
 
 
 @dataclass(frozen=True)
@@ -28,6 +48,18 @@ class FileProfileT:
     size_bytes: int
 
 
+@dataclass(frozen=True)
+class SourceReadT:
+    """Parses of one source file and the bytes they read."""
+
+    path: str
+    parses: int
+    bytes_read: int
+
+
+_READ_TRACKERS: list[list[SourceReadT]] = []
+
+
 def safe_cell(value: object) -> str:
     """Return a stable string cell for TSV/SQLite payloads."""
     if value is None:
@@ -54,53 +86,156 @@ def detect_delimiter(text: str) -> str:
     return "\t" if "\t" in header else ","
 
 
-def read_rows(path: Path, *, delimiter: str | None = None) -> list[RowT]:
-    """Read a CSV/TSV file into dictionaries with normalized headers."""
-    ensure_csv_field_limit()
-    if not path.exists() or path.stat().st_size == 0:
-        return []
-    text = read_text_file(path)
-    if not text.strip():
-        return []
-    lines = text.splitlines()
-    reader = csv.DictReader(lines, delimiter=delimiter or detect_delimiter(text))
-    headers = [normalize_header(header) for header in (reader.fieldnames or [])]
-    if not any(headers):
-        return []
-    normalized_keys: dict[str, str] = {}
-    for key in reader.fieldnames or []:
+def detect_encoding(head: bytes) -> str:
+    """Return the codec for a file from its first bytes.
+
+    Matches :func:`app.shared.file_utils.read_text_file`: UTF-8 with an
+    optional BOM, otherwise UTF-16. A multi-byte sequence cut at the end of
+    ``head`` is not treated as a decoding error.
+    """
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    try:
+        codecs.getincrementaldecoder("utf-8-sig")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return "utf-16"
+    return "utf-8-sig"
+
+
+class _MeteredReader(io.RawIOBase):
+    """Raw reader that counts, and optionally hashes, the bytes it returns."""
+
+    def __init__(self, raw: io.BufferedReader, digest: _Hash | None) -> None:
+        super().__init__()
+        self._raw = raw
+        self.digest = digest
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        count = self._raw.readinto(buffer)
+        if count:
+            self.bytes_read += count
+            if self.digest is not None:
+                self.digest.update(memoryview(buffer)[:count])
+        return count
+
+    def drain(self) -> None:
+        """Read to the end of the file so the digest covers every byte."""
+        for _ in iter(lambda: self.read(READ_CHUNK_BYTES), b""):
+            pass
+
+
+@contextmanager
+def open_text(path: Path, *, digest: _Hash | None = None) -> Iterator[TextIO]:
+    """Open a source file as text, detecting its encoding from the first chunk.
+
+    With ``digest``, every byte of the file is fed to it, including any the
+    caller did not read. The pass is reported to :func:`track_source_reads`.
+    """
+    with path.open("rb") as raw:
+        encoding = detect_encoding(raw.read(ENCODING_SNIFF_BYTES))
+        raw.seek(0)
+        metered = _MeteredReader(raw, digest)
+        buffered = io.BufferedReader(metered, READ_CHUNK_BYTES)
+        try:
+            with io.TextIOWrapper(buffered, encoding=encoding, newline="") as handle:
+                yield handle
+                if digest is not None:
+                    metered.drain()
+        finally:
+            record_source_read(SourceReadT(str(path), 1, metered.bytes_read))
+
+
+def record_source_read(read: SourceReadT) -> None:
+    """Report one pass over a source file to active trackers."""
+    for reads in _READ_TRACKERS:
+        reads.append(read)
+
+
+@contextmanager
+def track_source_reads() -> Iterator[list[SourceReadT]]:
+    """Collect the source file passes made inside the block."""
+    reads: list[SourceReadT] = []
+    _READ_TRACKERS.append(reads)
+    try:
+        yield reads
+    finally:
+        # By identity: nested trackers that collected the same reads are equal.
+        _READ_TRACKERS[:] = [other for other in _READ_TRACKERS if other is not reads]
+
+
+@lru_cache(maxsize=512)
+def _header_slots(fieldnames: tuple[str, ...]) -> HeaderSlotsT:
+    """Return ``(column index, normalized header)`` pairs for a raw header line."""
+    slots: list[tuple[int, str]] = []
+    for index, key in enumerate(fieldnames):
         normalized_key = normalize_header(key)
         if normalized_key:
-            normalized_keys[key] = normalized_key
-    rows: list[RowT] = []
-    for raw in reader:
-        row: RowT = {}
-        for key, value in raw.items():
-            normalized_key = normalized_keys.get(key, "")
-            if normalized_key:
-                row[normalized_key] = safe_cell(value)
-        rows.append(row)
-    return rows
+            slots.append((index, normalized_key))
+    return tuple(slots)
+
+
+def read_header(
+    handle: TextIO, delimiter: str | None = None
+) -> tuple[HeaderSlotsT, int, Iterator[list[str]]]:
+    """Read the header line of an open source file.
+
+    Returns:
+        The normalized header slots, the raw header width and a CSV reader
+        over the remaining records.
+    """
+    first_line = handle.readline()
+    reader = csv.reader(
+        chain([first_line], handle),
+        delimiter=delimiter or detect_delimiter(first_line),
+    )
+    fieldnames = tuple(next(reader, []))
+    return _header_slots(fieldnames), len(fieldnames), reader
+
+
+def iter_rows(path: Path, *, delimiter: str | None = None) -> Iterator[RowT]:
+    """Yield CSV/TSV rows as dictionaries with normalized headers.
+
+    The file is decoded incrementally, so memory stays flat regardless of
+    its size. Blank lines are skipped, short rows are padded with empty
+    cells and cells beyond the header are dropped.
+    """
+    ensure_csv_field_limit()
+    if not path.exists() or path.stat().st_size == 0:
+        return
+    with open_text(path) as handle:
+        slots, width, reader = read_header(handle, delimiter)
+        if not slots:
+            return
+        for raw in reader:
+            if not raw:
+                continue
+            if len(raw) < width:
+                raw.extend([""] * (width - len(raw)))
+            yield {key: safe_cell(raw[index]) for index, key in slots}
+
+
+def read_rows(path: Path, *, delimiter: str | None = None) -> list[RowT]:
+    """Read a CSV/TSV file into dictionaries with normalized headers."""
+    return list(iter_rows(path, delimiter=delimiter))
 
 
 def profile_file(path: Path) -> FileProfileT:
-    """Return file shape and hash without retaining row data."""
+    """Return file shape and hash in one pass, without retaining row data."""
     ensure_csv_field_limit()
-    raw = path.read_bytes() if path.exists() else b""
-    sha256 = hashlib.sha256(raw).hexdigest() if raw else ""
-    if not path.exists() or not raw.strip():
-        return FileProfileT(path, 0, (), sha256, len(raw))
-    text = read_text_file(path)
-    if not text.strip():
-        return FileProfileT(path, 0, (), sha256, len(raw))
-    reader = csv.reader(text.splitlines(), delimiter=detect_delimiter(text))
-    headers = tuple(
-        header
-        for header in (normalize_header(cell) for cell in next(reader, []))
-        if header
-    )
-    row_count = sum(1 for _ in reader) if headers else 0
-    return FileProfileT(path, row_count, headers, sha256, len(raw))
+    if not path.exists():
+        return FileProfileT(path, 0, (), "", 0)
+    size_bytes = path.stat().st_size
+    digest = hashlib.sha256()
+    with open_text(path, digest=digest) as handle:
+        slots, _, reader = read_header(handle)
+        row_count = sum(1 for _ in reader) if slots else 0
+    sha256 = digest.hexdigest() if size_bytes else ""
+    headers = tuple(key for _, key in slots)
+    return FileProfileT(path, row_count, headers, sha256, size_bytes)
 
 
 def write_tsv(path: Path, headers: HeadersT, rows: RowsT) -> int:
@@ -0,0 +1,141 @@
+"""Per-stage throughput, memory and source-read figures for source-truth builds."""
+
+from __future__ import annotations
+
+import cProfile
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+
+from app.shared.source_truth.io import RowT, SourceReadT, track_source_reads
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+STAGE_METRIC_HEADERS = (
+    "stage",
+    "rows",
+    "seconds",
+    "rows_per_second",
+    "peak_rss_mb",
+    "peak_rss_growth_mb",
+    "cache",
+)
+
+
+@dataclass(frozen=True)
+class StageMetricT:
+    """Rows handled, wall time, peak memory and source reads of one build stage."""
+
+    stage: str
+    rows: int
+    seconds: float
+    peak_rss_mb: float
+    peak_rss_growth_mb: float
+    cache: str = ""
+    source_reads: tuple[SourceReadT, ...] = ()
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the stage throughput."""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def as_row(self) -> RowT:
+        """Return the metric as a report row."""
+        return {
+            "stage": self.stage,
+            "rows": str(self.rows),
+            "seconds": f"{self.seconds:.3f}",
+            "rows_per_second": f"{self.rows_per_second:.0f}",
+            "peak_rss_mb": f"{self.peak_rss_mb:.1f}",
+            "peak_rss_growth_mb": f"{self.peak_rss_growth_mb:.1f}",
+            "cache": self.cache,
+        }
+
+
+@dataclass
+class _StageRun:
+    """Mutable row counter handed to the body of a measured stage."""
+
+    rows: int = 0
+
+
+@dataclass
+class StageMeter:
+    """Collect :class:`StageMetricT` rows while a build runs.
+
+    With ``profile_dir`` set, each stage also runs under :mod:`cProfile` and
+    writes ``<stage>.pstats`` there.
+
+    Example:
+        >>> meter = StageMeter()
+        >>> with meter.stage("grades") as stage:
+        ...     stage.rows = len(grades)
+        >>> meter.metrics[0].stage
+        'grades'
+    """
+
+    metrics: list[StageMetricT] = field(default_factory=list)
+    profile_dir: Path | None = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[_StageRun]:
+        """Measure the wrapped block as one stage."""
+        run = _StageRun()
+        profiler = cProfile.Profile() if self.profile_dir else None
+        peak_before = peak_rss_mb()
+        started = perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        with track_source_reads() as reads:
+            yield run
+        if profiler is not None:
+            profiler.disable()
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(self.profile_dir / f"{name}.pstats")
+        peak_after = peak_rss_mb()
+        self.metrics.append(
+            StageMetricT(
+                stage=name,
+                rows=run.rows,
+                seconds=perf_counter() - started,
+                peak_rss_mb=peak_after,
+                peak_rss_growth_mb=max(peak_after - peak_before, 0.0),
+                source_reads=tuple(reads),
+            )
+        )
+
+
+def source_read_totals(metrics: Iterable[StageMetricT]) -> tuple[SourceReadT, ...]:
+    """Return parses and bytes read per source file across stages, by path."""
+    totals: dict[str, SourceReadT] = {}
+    for metric in metrics:
+        for read in metric.source_reads:
+            total = totals.get(read.path, SourceReadT(read.path, 0, 0))
+            totals[read.path] = SourceReadT(
+                read.path, total.parses + read.parses, total.bytes_read + read.bytes_read
+            )
+    return tuple(totals[path] for path in sorted(totals))
+
+
+def peak_rss_mb() -> float:
+    """Return the process peak resident set size in MiB (0 when unavailable)."""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+__all__ = [
+    "STAGE_METRIC_HEADERS",
+    "StageMeter",
+    "StageMetricT",
+    "peak_rss_mb",
+    "source_read_totals",
+]
@@ -18,8 +18,9 @@ from app.shared.source_truth.college_codes import (
     canonical_college_code,
     canonicalize_college_fields,
 )
-from app.shared.source_truth.io import RowT, read_rows
+from app.shared.source_truth.io import RowT
 from app.shared.source_truth.smartschool_normalize import semester_no
+from app.shared.source_truth.tables import iter_rows
 
 RowsT: TypeAlias = list[RowT]
 
@@ -30,7 +31,7 @@ def load_smartschool_payments(smartschool_dir: Path, ok_tables: set[str]) -> Row
         return []
     path = smartschool_dir / "dbo_payments.csv"
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         raw_payment_type = _first(row, "PaymentType")
         rows.append(
             {
@@ -56,7 +57,7 @@ def load_fundamental_students(fundamentals_dir: Path) -> RowsT:
     """Load historical SmartSchool student witnesses."""
     path = fundamentals_dir / "people_full_student.tsv"
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         rows.append(
             {
                 "source_name": "fundamentals_smartschool",
@@ -75,7 +76,7 @@ def load_grapro_students(grapro_dir: Path) -> RowsT:
     """Load GradPro student/account name witnesses."""
     path = grapro_dir / "Accounts.csv"
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         if _first(row, "AccountType").lower() != "student":
             continue
         name = _name_from_parts(
@@ -101,7 +102,7 @@ def load_grapro_import_students(grapro_dir: Path) -> RowsT:
     info_by_id = _grapro_student_info(grapro_dir)
     rows: RowsT = []
     seen_usernames: set[str] = set()
-    for row in read_rows(path):
+    for row in iter_rows(path):
         if _first(row, "AccountType").lower() != "student":
             continue
         student_id = _first(row, "AccountID")
@@ -191,7 +192,7 @@ def merge_missing_grapro_students(
 def load_passthrough_rows(path: Path, source_name: str) -> RowsT:
     """Load rows intended to be copied to import-ready outputs."""
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         out = canonicalize_college_fields(row)
         out["source_name"] = source_name
         out["source_path"] = str(path)
@@ -203,7 +204,7 @@ def _grapro_student_info(grapro_dir: Path) -> dict[str, RowT]:
     """Return GradPro StudentInfo rows keyed by AccountID."""
     return {
         _first(row, "AccountID"): row
-        for row in read_rows(grapro_dir / "StudentInfo.csv")
+        for row in iter_rows(grapro_dir / "StudentInfo.csv")
         if _first(row, "AccountID")
     }
 
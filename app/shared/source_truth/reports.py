@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TypeAlias
 
 from app.shared.source_truth.io import HeadersT, RowT
+from app.shared.source_truth.metrics import StageMetricT, source_read_totals
 
 RowsT: TypeAlias = list[RowT]
 CountsT: TypeAlias = dict[str, int]
@@ -271,7 +273,11 @@ def report_specs(**rows_by_name: RowsT) -> tuple[ReportSpecT, ...]:
 
 
 def summary_text(
-    output_dir: object, counts: CountsT, smartschool_integrity: RowsT
+    output_dir: object,
+    counts: CountsT,
+    smartschool_integrity: RowsT,
+    *,
+    stage_metrics: Sequence[StageMetricT] = (),
 ) -> str:
     """Return a compact summary for the run."""
     fallback_count = sum(
@@ -288,6 +294,24 @@ def summary_text(
         "counts:",
     ]
     lines.extend(f"  {name}: {count}" for name, count in sorted(counts.items()))
+    if stage_metrics:
+        lines.extend(["", "stages:"])
+        lines.extend(
+            f"  {metric.stage}: {metric.rows} rows in {metric.seconds:.2f}s "
+            f"({metric.rows_per_second:.0f} rows/s), "
+            f"peak RSS {metric.peak_rss_mb:.0f} MiB"
+            + (f" [cache {metric.cache}]" if metric.cache else "")
+            for metric in stage_metrics
+        )
+        source_reads = source_read_totals(stage_metrics)
+        total_mib = sum(read.bytes_read for read in source_reads) / (1024 * 1024)
+        parses = sum(read.parses for read in source_reads)
+        lines.extend(["", f"source_reads: {parses} parse(s), {total_mib:.1f} MiB"])
+        lines.extend(
+            f"  {read.path}: parsed {read.parses}x, "
+            f"{read.bytes_read / (1024 * 1024):.1f} MiB read"
+            for read in source_reads
+        )
     lines.extend(
         [
             "",
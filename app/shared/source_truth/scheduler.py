@@ -0,0 +1,266 @@
+"""Dependency-aware stage scheduler for source-truth builds.
+
+A build is a list of :class:`StageT` entries. Each names the configuration
+attributes and earlier stage results it consumes. :func:`run_stages` runs
+every stage once its inputs exist, in-process or on a process pool. Results
+are keyed by stage name, so scheduling order never reaches the outputs.
+
+Example:
+    >>> stages = (
+    ...     StageT("tuc_courses", load_tucurricula_courses,
+    ...            params=("tucurricula_import_dir",)),
+    ...     StageT("canonical", build_canonical, inputs=("tuc_courses",)),
+    ... )
+    >>> results, metrics = run_stages(stages, config, jobs=4, keep={"canonical"})
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections import Counter
+from collections.abc import Callable, Collection, Sequence, Sized
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from pathlib import Path
+from time import perf_counter
+from typing import TypeAlias
+
+from app.shared.source_truth.metrics import StageMeter, StageMetricT, peak_rss_mb
+from app.shared.source_truth.stage_cache import StageCache
+from app.shared.source_truth.tables import release_source_tables
+
+StageResultsT: TypeAlias = dict[str, object]
+ResultHookT: TypeAlias = Callable[[str, object], object]
+DoneHookT: TypeAlias = Callable[[str], object]
+
+
+class StageGraphError(ValueError):
+    """Raised when stages name unknown inputs, repeat a name or form a cycle."""
+
+
+@dataclass(frozen=True)
+class StageT:
+    """One named build step.
+
+    The stage is called as ``fn(*params, *inputs)``: ``params`` are attribute
+    names read from the build context, ``inputs`` are names of the stages
+    whose results it consumes. ``fn`` must be a module-level callable so it
+    can be sent to a worker process. Cached results already follow edits to
+    any ``app`` module the stage imports; bump ``version`` only when its
+    behaviour changes through something else (a third-party library, data
+    read from a path that is not one of its ``params``).
+    """
+
+    name: str
+    fn: Callable[..., object]
+    inputs: tuple[str, ...] = ()
+    params: tuple[str, ...] = ()
+    version: str = "1"
+
+
+def run_stages(
+    stages: Sequence[StageT],
+    context: object,
+    *,
+    jobs: int = 1,
+    keep: Collection[str] = (),
+    on_result: ResultHookT | None = None,
+    profile_dir: Path | None = None,
+    cache: StageCache | None = None,
+    on_done: DoneHookT | None = None,
+) -> tuple[StageResultsT, tuple[StageMetricT, ...]]:
+    """Run stages in dependency order, ``jobs`` at a time.
+
+    Args:
+        stages: Stage declarations; any order whose inputs are declared.
+        context: Object whose attributes feed stage ``params``.
+        jobs: Worker processes. With 1 every stage runs in this process.
+        keep: Results to return. Other results are released once their
+            last consumer has finished.
+        on_result: Optional hook called in this process with each result as
+            it lands; its return value replaces the result (for example to
+            spill rows to disk).
+        profile_dir: When set, each stage writes ``<name>.pstats`` here.
+        cache: Optional stage cache. Stages whose key is cached are not
+            run. Their results are loaded only when kept or consumed by a
+            stage that does run.
+        on_done: Optional hook called in this process with the name of each
+            stage once it has finished or was found in the cache (for
+            example to release source tables no later stage reads).
+
+    Returns:
+        Kept results and one metric per stage, both in declaration order.
+        With a cache, each metric's ``cache`` field is ``hit`` or ``miss``.
+    """
+    order = _topological_order(stages)
+    by_name = {stage.name: stage for stage in stages}
+    keys = cache.stage_keys(order, context) if cache is not None else {}
+    entries = {
+        name: entry
+        for name, key in keys.items()
+        if (entry := cache.lookup(name, key)) is not None
+    }
+    to_run = [stage for stage in order if stage.name not in entries]
+    consumers = Counter(name for stage in to_run for name in stage.inputs)
+    waiting = {stage.name: set(stage.inputs) - set(entries) for stage in to_run}
+    results: StageResultsT = {}
+    metrics: dict[str, StageMetricT] = {}
+
+    for name, entry in entries.items():
+        if name in keep or consumers[name]:
+            started = perf_counter()
+            results[name] = cache.load(name, keys[name])
+            if on_result:
+                results[name] = on_result(name, results[name])
+            seconds = perf_counter() - started
+        else:
+            seconds = 0.0
+        metrics[name] = StageMetricT(
+            stage=name,
+            rows=entry["rows"],
+            seconds=seconds,
+            peak_rss_mb=peak_rss_mb(),
+            peak_rss_growth_mb=0.0,
+            cache="hit",
+        )
+        if on_done:
+            on_done(name)
+
+    def finish(name: str, value: object, metric: StageMetricT) -> list[str]:
+        if cache is not None:
+            cache.store(name, keys[name], value, metric.rows)
+            metric = replace(metric, cache="miss")
+        results[name] = on_result(name, value) if on_result else value
+        metrics[name] = metric
+        if on_done:
+            on_done(name)
+        for input_name in by_name[name].inputs:
+            consumers[input_name] -= 1
+            if not consumers[input_name] and input_name not in keep:
+                results.pop(input_name, None)
+        ready = []
+        for stage in to_run:
+            pending = waiting[stage.name]
+            if name in pending:
+                pending.discard(name)
+                if not pending:
+                    ready.append(stage.name)
+        return ready
+
+    if jobs <= 1:
+        for stage in to_run:
+            args = _stage_args(stage, context, results)
+            finish(stage.name, *run_stage(stage, args, profile_dir))
+    elif to_run:
+        ready = [stage.name for stage in to_run if not waiting[stage.name]]
+        _run_on_pool(to_run, ready, context, results, finish, jobs, profile_dir)
+    kept = {stage.name: results[stage.name] for stage in stages if stage.name in keep}
+    return kept, tuple(metrics[stage.name] for stage in stages)
+
+
+def run_stage(
+    stage: StageT, args: Sequence[object], profile_dir: Path | None = None
+) -> tuple[object, StageMetricT]:
+    """Run one stage and measure it where it runs."""
+    meter = StageMeter(profile_dir=profile_dir)
+    with meter.stage(stage.name) as run:
+        value = stage.fn(*args)
+        run.rows = _row_count(value)
+    return value, meter.metrics[0]
+
+
+def _run_on_pool(
+    order: Sequence[StageT],
+    ready: list[str],
+    context: object,
+    results: StageResultsT,
+    finish: Callable[[str, object, StageMetricT], list[str]],
+    jobs: int,
+    profile_dir: Path | None,
+) -> None:
+    """Submit ready stages to a process pool until every stage has finished."""
+    by_name = {stage.name: stage for stage in order}
+    position = {stage.name: index for index, stage in enumerate(order)}
+    running: dict[Future[tuple[object, StageMetricT]], str] = {}
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=_fork_context()) as pool:
+        try:
+            while ready or running:
+                for name in ready:
+                    stage = by_name[name]
+                    args = _stage_args(stage, context, results)
+                    future = pool.submit(_run_in_worker, stage, args, profile_dir)
+                    running[future] = name
+                ready = []
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda item: position[running[item]]):
+                    value, metric = future.result()
+                    ready.extend(finish(running.pop(future), value, metric))
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
+
+
+def _run_in_worker(
+    stage: StageT, args: Sequence[object], profile_dir: Path | None
+) -> tuple[object, StageMetricT]:
+    """Run one stage in a pool worker, then drop the source tables it parsed."""
+    try:
+        return run_stage(stage, args, profile_dir)
+    finally:
+        release_source_tables()
+
+
+def _stage_args(
+    stage: StageT, context: object, results: StageResultsT
+) -> tuple[object, ...]:
+    """Return the positional arguments for one stage."""
+    return (
+        *(getattr(context, param) for param in stage.params),
+        *(results[name] for name in stage.inputs),
+    )
+
+
+def _topological_order(stages: Sequence[StageT]) -> list[StageT]:
+    """Return stages ordered so inputs come first, keeping declaration order."""
+    names = [stage.name for stage in stages]
+    if len(set(names)) != len(names):
+        duplicates = sorted(name for name, count in Counter(names).items() if count > 1)
+        raise StageGraphError(f"Duplicate stage names: {', '.join(duplicates)}")
+    known = set(names)
+    for stage in stages:
+        missing = [name for name in stage.inputs if name not in known]
+        if missing:
+            raise StageGraphError(
+                f"Stage {stage.name!r} needs unknown input(s): {', '.join(missing)}"
+            )
+    ordered: list[StageT] = []
+    placed: set[str] = set()
+    remaining = list(stages)
+    while remaining:
+        runnable = [stage for stage in remaining if placed.issuperset(stage.inputs)]
+        if not runnable:
+            cycle = ", ".join(stage.name for stage in remaining)
+            raise StageGraphError(f"Stage inputs form a cycle: {cycle}")
+        ordered.extend(runnable)
+        placed.update(stage.name for stage in runnable)
+        remaining = [stage for stage in remaining if stage.name not in placed]
+    return ordered
+
+
+def _fork_context() -> multiprocessing.context.BaseContext | None:
+    """Prefer fork so workers share the parent's imports and hash seed."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _row_count(value: object) -> int:
+    """Return the row count of a stage result (first item of a tuple result)."""
+    if isinstance(value, tuple) and value:
+        value = value[0]
+    if isinstance(value, Sized) and not isinstance(value, str | bytes):
+        return len(value)
+    return 0
+
+
+__all__ = ["StageGraphError", "StageT", "run_stage", "run_stages"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TypeAlias
 
@@ -10,11 +11,12 @@ from app.shared.source_truth.curriculum_match import (
 )
 from app.shared.source_truth.college_codes import canonical_college_code
 from app.shared.source_truth.fuzzy import course_key
-from app.shared.source_truth.io import RowT, read_rows
+from app.shared.source_truth.io import RowT
 from app.shared.source_truth.smartschool_normalize import (
     course_identity_from_row,
     first_value,
 )
+from app.shared.source_truth.tables import iter_rows, source_index
 
 RowsT: TypeAlias = list[RowT]
 
@@ -28,11 +30,11 @@ def load_smartschool_courses(smartschool_dir: Path, ok_tables: set[str]) -> Rows
     levels_path = smartschool_dir / "dbo_UM_CoursesLevels.csv"
     titles = {
         first_value(row, "CourseCode").upper(): first_value(row, "Course")
-        for row in read_rows(courses_path)
+        for row in iter_rows(courses_path)
         if first_value(row, "CourseCode")
     }
     rows: RowsT = []
-    for row in read_rows(levels_path):
+    for row in iter_rows(levels_path):
         identity = course_identity_from_row(row)
         if identity is None:
             continue
@@ -60,11 +62,11 @@ def load_smartschool_curricula(smartschool_dir: Path, ok_tables: set[str]) -> Ro
     rows_by_key: dict[str, RowT] = {}
     if "UM_Curriculums" in ok_tables:
         path = smartschool_dir / "dbo_UM_Curriculums.csv"
-        for row in read_rows(path):
+        for row in iter_rows(path):
             _add_curriculum_row(rows_by_key, path, first_value(row, "Curriculum"), "", "")
     if "UM_Programs" in ok_tables:
         path = smartschool_dir / "dbo_UM_Programs.csv"
-        for row in read_rows(path):
+        for row in iter_rows(path):
             _add_curriculum_row(
                 rows_by_key,
                 path,
@@ -74,7 +76,7 @@ def load_smartschool_curricula(smartschool_dir: Path, ok_tables: set[str]) -> Ro
             )
     if "UM_Students" in ok_tables:
         path = smartschool_dir / "dbo_UM_Students.csv"
-        for row in read_rows(path):
+        for row in iter_rows(path):
             college = first_value(row, "College")
             for label in (
                 first_value(row, "Major"),
@@ -84,7 +86,7 @@ def load_smartschool_curricula(smartschool_dir: Path, ok_tables: set[str]) -> Ro
                 _add_curriculum_row(rows_by_key, path, label, "", college)
     if "UM_Registrations" in ok_tables:
         path = smartschool_dir / "dbo_UM_Registrations.csv"
-        for row in read_rows(path):
+        for row in iter_rows(path):
             college = first_value(row, "College")
             for label in (first_value(row, "Major"), first_value(row, "EnrollmentType")):
                 _add_curriculum_row(rows_by_key, path, label, "", college)
@@ -101,7 +103,7 @@ def load_smartschool_curriculum_courses(
     path = smartschool_dir / "dbo_UM_CurriculumCourses.csv"
     course_lookup = load_smartschool_course_lookup(smartschool_dir)
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         identity = course_identity_from_row(row)
         curriculum = standardize_legacy_curriculum_label(first_value(row, "Curriculum"))
         if not curriculum or identity is None:
@@ -132,9 +134,18 @@ def load_smartschool_curriculum_courses(
 
 
 def load_smartschool_course_lookup(smartschool_dir: Path) -> dict[str, RowT]:
-    """Return latest SmartSchool course title/credit lookup by course key."""
+    """Return latest SmartSchool course title/credit lookup by course key.
+
+    The lookup is shared by every caller in a build; treat it as read-only.
+    """
+    path = smartschool_dir / "dbo_UM_CoursesLevels.csv"
+    return source_index(path, _course_lookup_rows)
+
+
+def _course_lookup_rows(source_rows: Iterable[RowT]) -> dict[str, RowT]:
+    """Index UM_CoursesLevels rows by course key."""
     rows: dict[str, RowT] = {}
-    for row in read_rows(smartschool_dir / "dbo_UM_CoursesLevels.csv"):
+    for row in source_rows:
         identity = course_identity_from_row(row)
         if identity is None:
             continue
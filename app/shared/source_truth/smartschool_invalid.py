@@ -11,8 +11,9 @@ from app.shared.course_wrangling import (
     normalize_course_number,
     parse_course_identity_result,
 )
-from app.shared.source_truth.io import RowT, read_rows
+from app.shared.source_truth.io import RowT
 from app.shared.source_truth.smartschool_normalize import first_value
+from app.shared.source_truth.tables import iter_rows
 
 RowsT: TypeAlias = list[RowT]
 CourseTableSpecT: TypeAlias = tuple[str, str]
@@ -35,7 +36,7 @@ def load_invalid_smartschool_course_identities(
         if table_name not in ok_tables:
             continue
         path = smartschool_dir / filename
-        for row_number, row in enumerate(read_rows(path), start=2):
+        for row_number, row in enumerate(iter_rows(path), start=2):
             raw_dept = first_value(row, "CourseCode")
             raw_number = first_value(row, "CourseNo")
             if not raw_dept and not raw_number:
@@ -67,7 +68,7 @@ def load_repaired_smartschool_course_identities(
         if table_name not in ok_tables:
             continue
         path = smartschool_dir / filename
-        for row_number, row in enumerate(read_rows(path), start=2):
+        for row_number, row in enumerate(iter_rows(path), start=2):
             raw_dept = first_value(row, "CourseCode")
             raw_number = first_value(row, "CourseNo")
             if not raw_dept and not raw_number:
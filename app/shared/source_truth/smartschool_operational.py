@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TypeAlias
 
@@ -10,7 +11,7 @@ from app.shared.source_truth.curriculum_match import (
 )
 from app.shared.source_truth.college_codes import canonical_college_code
 from app.shared.source_truth.fuzzy import course_key
-from app.shared.source_truth.io import RowT, read_rows
+from app.shared.source_truth.io import RowT
 from app.shared.source_truth.smartschool_catalog import load_smartschool_course_lookup
 from app.shared.source_truth.smartschool_normalize import (
     clean_student_id,
@@ -21,6 +22,7 @@ from app.shared.source_truth.smartschool_normalize import (
     legacy_curriculum_from_row,
     semester_no,
 )
+from app.shared.source_truth.tables import iter_rows, source_index
 from app.timetable.utils import normalize_academic_year
 
 RowsT: TypeAlias = list[RowT]
@@ -66,7 +68,7 @@ def load_smartschool_course_registrations(
     student_lookup = _student_lookup(smartschool_dir, ok_tables)
     course_lookup = load_smartschool_course_lookup(smartschool_dir)
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         student_id = clean_student_id(first_value(row, "StudentID"))
         identity = course_identity_from_row(row)
         if not student_id or identity is None:
@@ -112,7 +114,7 @@ def load_smartschool_semester_enrollments(
         return []
     path = smartschool_dir / "dbo_UM_Registrations.csv"
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         student_id = clean_student_id(first_value(row, "StudentID"))
         if not student_id:
             continue
@@ -147,7 +149,7 @@ def _grade_rows_from_table(
 ) -> RowsT:
     """Normalize one SmartSchool grade table."""
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         student_id = clean_student_id(first_value(row, "StudentID"))
         identity = course_identity_from_row(row)
         grade_code = first_value(row, "Grade")
@@ -193,8 +195,14 @@ def _registration_lookup(
     """Return semester registration context by student/year/semester."""
     if "UM_Registrations" not in ok_tables:
         return {}
+    path = smartschool_dir / "dbo_UM_Registrations.csv"
+    return source_index(path, _registration_lookup_rows)
+
+
+def _registration_lookup_rows(source_rows: Iterable[RowT]) -> RegistrationLookupT:
+    """Index UM_Registrations rows by student/year/semester."""
     rows: RegistrationLookupT = {}
-    for row in read_rows(smartschool_dir / "dbo_UM_Registrations.csv"):
+    for row in source_rows:
         student_id = clean_student_id(first_value(row, "StudentID"))
         academic_year = first_value(row, "AcademicYear")
         term_no = semester_no(first_value(row, "Semester"))
@@ -212,8 +220,13 @@ def _student_lookup(smartschool_dir: Path, ok_tables: set[str]) -> StudentLookup
     """Return fallback student context by student id."""
     if "UM_Students" not in ok_tables:
         return {}
+    return source_index(smartschool_dir / "dbo_UM_Students.csv", _student_lookup_rows)
+
+
+def _student_lookup_rows(source_rows: Iterable[RowT]) -> StudentLookupT:
+    """Index UM_Students rows by student id."""
     rows: StudentLookupT = {}
-    for row in read_rows(smartschool_dir / "dbo_UM_Students.csv"):
+    for row in source_rows:
         student_id = clean_student_id(first_value(row, "StudentID"))
         if not student_id:
             continue
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TypeAlias
 
@@ -11,7 +12,7 @@ from app.shared.source_truth.curriculum_match import (
     standardize_legacy_curriculum_label,
 )
 from app.shared.source_truth.college_codes import canonical_college_code
-from app.shared.source_truth.io import RowT, read_rows
+from app.shared.source_truth.io import RowT
 from app.shared.source_truth.smartschool_normalize import (
     clean_student_id,
     date_value,
@@ -22,6 +23,7 @@ from app.shared.source_truth.smartschool_normalize import (
     semester_code,
     semester_no,
 )
+from app.shared.source_truth.tables import iter_rows, source_index
 from app.timetable.utils import normalize_academic_year
 
 RowsT: TypeAlias = list[RowT]
@@ -51,7 +53,7 @@ def load_smartschool_students(smartschool_dir: Path, ok_tables: set[str]) -> Row
     last_terms = _student_last_terms(smartschool_dir, ok_tables)
     registration_curricula = _student_registration_curricula(smartschool_dir, ok_tables)
     rows: RowsT = []
-    for row in read_rows(path):
+    for row in iter_rows(path):
         student_id = clean_student_id(first_value(row, "StudentID"))
         if not student_id:
             continue
@@ -104,10 +106,16 @@ def load_smartschool_students(smartschool_dir: Path, ok_tables: set[str]) -> Row
 
 def _student_last_terms(smartschool_dir: Path, ok_tables: set[str]) -> dict[str, str]:
     """Return each student's latest semester code from SmartSchool registrations."""
-    terms: dict[str, tuple[int, int, str]] = {}
     if "UM_Registrations" not in ok_tables:
         return {}
-    for row in read_rows(smartschool_dir / "dbo_UM_Registrations.csv"):
+    path = smartschool_dir / "dbo_UM_Registrations.csv"
+    return source_index(path, _student_last_terms_rows)
+
+
+def _student_last_terms_rows(source_rows: Iterable[RowT]) -> dict[str, str]:
+    """Index the latest semester code of each student in UM_Registrations rows."""
+    terms: dict[str, tuple[int, int, str]] = {}
+    for row in source_rows:
         student_id = clean_student_id(first_value(row, "StudentID"))
         academic_year = normalize_academic_year(first_value(row, "AcademicYear"))
         term_no = semester_no(first_value(row, "Semester"))
@@ -128,10 +136,18 @@ def _student_registration_curricula(
     smartschool_dir: Path, ok_tables: set[str]
 ) -> StudentCurriculumCountsT:
     """Return legacy curriculum frequencies from operational registration rows."""
-    counts: StudentCurriculumCountsT = {}
     if "UM_Registrations" not in ok_tables:
-        return counts
-    for row in read_rows(smartschool_dir / "dbo_UM_Registrations.csv"):
+        return {}
+    path = smartschool_dir / "dbo_UM_Registrations.csv"
+    return source_index(path, _student_registration_curricula_rows)
+
+
+def _student_registration_curricula_rows(
+    source_rows: Iterable[RowT],
+) -> StudentCurriculumCountsT:
+    """Count legacy curricula per student in UM_Registrations rows."""
+    counts: StudentCurriculumCountsT = {}
+    for row in source_rows:
         student_id = clean_student_id(first_value(row, "StudentID"))
         legacy_curriculum = legacy_curriculum_from_row(row)
         if not student_id or not legacy_curriculum:
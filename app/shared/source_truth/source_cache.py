@@ -0,0 +1,252 @@
+"""Columnar cache of converted SmartSchool and GraPro source tables.
+
+``convert_sources`` parses each verified export once and stores it under
+``root/<sha256>/``:
+
+- ``meta.json`` holds the keys, headers, record count and source identity.
+- Each column is dictionary-encoded. ``c<i>.codes.npy`` holds the smallest
+  unsigned integer type that fits, and ``c<i>.values.utf8`` with
+  ``c<i>.offsets.npy`` holds the distinct cells.
+
+Loads memory-map the arrays, so encoding detection, CSV parsing and cell
+normalization are skipped. Columns stay encoded: cells are decoded as rows
+are read, a slice of codes at a time, and each distinct value once.
+``index.json`` maps each source path to its size, mtime and SHA-256. A
+path whose size or mtime changed is re-hashed; when only the mtime moved
+the entry is updated so the next lookup skips the hash. A path whose
+content changed, or one that was never converted, is a miss and the caller
+parses the CSV.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TypedDict, overload
+
+import numpy as np
+
+from app.shared.source_truth.io import READ_CHUNK_BYTES, SourceReadT, record_source_read
+from app.shared.source_truth.tables import SourceTableT
+
+CONVERTED_FORMAT = "1"
+INDEX_NAME = "index.json"
+META_NAME = "meta.json"
+# Codes converted to Python ints per step while iterating a column.
+DECODE_SLICE_ROWS = 65_536
+
+
+class ConvertedMetaT(TypedDict):
+    """``meta.json`` of one converted table."""
+
+    format: str
+    keys: list[str]
+    headers: list[str]
+    record_count: int
+    row_count: int
+    sha256: str
+    size_bytes: int
+
+
+class SourceIndexEntryT(TypedDict):
+    """Identity of a source file when it was converted."""
+
+    sha256: str
+    size_bytes: int
+    mtime_ns: int
+
+
+@dataclass
+class SourceCache:
+    """Converted source tables stored under ``root``, keyed by content hash."""
+
+    root: Path
+    _index: dict[str, SourceIndexEntryT] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        index_path = self.root / INDEX_NAME
+        if index_path.exists():
+            self._index = json.loads(index_path.read_text(encoding="utf-8"))
+
+    def lookup(self, path: Path) -> SourceTableT | None:
+        """Return the converted table for ``path``, or None when missing or stale."""
+        sha256 = self.current_sha256(path)
+        if sha256 is None or not (self.root / sha256 / META_NAME).exists():
+            return None
+        return self._load(path, self.root / sha256)
+
+    def current_sha256(self, path: Path) -> str | None:
+        """Return the recorded hash of ``path`` if its content is unchanged."""
+        entry = self._index.get(str(path.resolve()))
+        if entry is None or not path.exists():
+            return None
+        stat = path.stat()
+        if (stat.st_size, stat.st_mtime_ns) == (entry["size_bytes"], entry["mtime_ns"]):
+            return entry["sha256"]
+        if stat.st_size != entry["size_bytes"]:
+            return None
+        if _file_sha256(path) != entry["sha256"]:
+            return None
+        entry["mtime_ns"] = stat.st_mtime_ns
+        self._save_index()
+        return entry["sha256"]
+
+    def store(self, table: SourceTableT) -> Path:
+        """Write ``table`` to the cache and record its source identity."""
+        target = self.root / table.sha256
+        if not (target / META_NAME).exists():
+            partial = self.root / f"{table.sha256}.partial"
+            shutil.rmtree(partial, ignore_errors=True)
+            partial.mkdir(parents=True)
+            for position, column in enumerate(table.columns):
+                _write_column(partial, position, column)
+            meta: ConvertedMetaT = {
+                "format": CONVERTED_FORMAT,
+                "keys": list(table.keys),
+                "headers": list(table.headers),
+                "record_count": table.record_count,
+                "row_count": len(table),
+                "sha256": table.sha256,
+                "size_bytes": table.size_bytes,
+            }
+            (partial / META_NAME).write_text(json.dumps(meta), encoding="utf-8")
+            shutil.rmtree(target, ignore_errors=True)
+            os.replace(partial, target)
+        stat = table.path.stat()
+        self._index[str(table.path.resolve())] = {
+            "sha256": table.sha256,
+            "size_bytes": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        self._save_index()
+        return target
+
+    def _save_index(self) -> None:
+        """Persist the source identity index."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / INDEX_NAME).write_text(
+            json.dumps(self._index, indent=2, sort_keys=True), encoding="utf-8"
+        )
+
+    def _load(self, path: Path, table_dir: Path) -> SourceTableT | None:
+        """Rebuild a table from its memory-mapped column files."""
+        meta: ConvertedMetaT = json.loads(
+            (table_dir / META_NAME).read_text(encoding="utf-8")
+        )
+        if meta["format"] != CONVERTED_FORMAT:
+            return None
+        bytes_read = 0
+        columns: list[EncodedColumn] = []
+        for position in range(len(meta["keys"])):
+            column, size = _read_column(table_dir, position)
+            columns.append(column)
+            bytes_read += size
+        record_source_read(SourceReadT(str(path), 0, bytes_read))
+        return SourceTableT(
+            path=path,
+            keys=tuple(meta["keys"]),
+            columns=tuple(columns),
+            headers=tuple(meta["headers"]),
+            record_count=meta["record_count"],
+            sha256=meta["sha256"],
+            size_bytes=meta["size_bytes"],
+        )
+
+
+def _write_column(table_dir: Path, position: int, column: tuple[str, ...]) -> None:
+    """Write one dictionary-encoded column."""
+    codes_by_value: dict[str, int] = {}
+    codes = [codes_by_value.setdefault(cell, len(codes_by_value)) for cell in column]
+    encoded = [value.encode("utf-8") for value in codes_by_value]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+    (table_dir / f"c{position}.values.utf8").write_bytes(b"".join(encoded))
+    np.save(table_dir / f"c{position}.offsets.npy", offsets)
+    dtype = np.min_scalar_type(max(len(codes_by_value) - 1, 0))
+    np.save(table_dir / f"c{position}.codes.npy", np.asarray(codes, dtype=dtype))
+
+
+class EncodedColumn(Sequence[str]):
+    """A dictionary-encoded column read straight from its memory-mapped files.
+
+    Indexing decodes one cell, slicing returns another view over the same
+    arrays, and iteration converts :data:`DECODE_SLICE_ROWS` codes at a time.
+    Each distinct value is decoded once and then shared.
+    """
+
+    def __init__(
+        self, codes: np.ndarray, offsets: np.ndarray, blob: bytes | mmap.mmap
+    ) -> None:
+        self._codes = codes
+        self._offsets = offsets
+        self._blob = blob
+        self._values: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> EncodedColumn: ...
+
+    def __getitem__(self, index: int | slice) -> str | EncodedColumn:
+        if isinstance(index, slice):
+            column = EncodedColumn(self._codes[index], self._offsets, self._blob)
+            column._values = self._values
+            return column
+        return self._value(int(self._codes[index]))
+
+    def __iter__(self) -> Iterator[str]:
+        value = self._value
+        for start in range(0, len(self._codes), DECODE_SLICE_ROWS):
+            codes = self._codes[start : start + DECODE_SLICE_ROWS].tolist()
+            yield from map(value, codes)
+
+    def _value(self, code: int) -> str:
+        """Return the distinct value behind ``code``, decoding it once."""
+        value = self._values.get(code)
+        if value is None:
+            start, end = int(self._offsets[code]), int(self._offsets[code + 1])
+            value = self._values[code] = self._blob[start:end].decode("utf-8")
+        return value
+
+
+def _read_column(table_dir: Path, position: int) -> tuple[EncodedColumn, int]:
+    """Return one column over its mapped files and the bytes mapped for it."""
+    offsets = np.load(table_dir / f"c{position}.offsets.npy", mmap_mode="r")
+    codes = np.load(table_dir / f"c{position}.codes.npy", mmap_mode="r")
+    values_path = table_dir / f"c{position}.values.utf8"
+    size = values_path.stat().st_size
+    blob: bytes | mmap.mmap = b""
+    if size:
+        # The mapping outlives the file handle and is closed with the column.
+        with values_path.open("rb") as handle:
+            blob = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    column = EncodedColumn(codes, offsets, blob)
+    return column, size + offsets.nbytes + codes.nbytes
+
+
+def _file_sha256(path: Path) -> str:
+    """Return the SHA-256 of a file."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(READ_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+__all__ = [
+    "CONVERTED_FORMAT",
+    "ConvertedMetaT",
+    "EncodedColumn",
+    "SourceCache",
+    "SourceIndexEntryT",
+]
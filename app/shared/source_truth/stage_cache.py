@@ -0,0 +1,206 @@
+"""Content-addressed cache of source-truth stage results.
+
+A stage's key hashes its name and version, the code it runs (the
+source-truth package, the stage function's module and every ``app``
+module they import, directly or not), the content of every file behind
+its path parameters, and the keys of the stages it consumes. Editing one
+input file therefore invalidates exactly the stages downstream of it.
+Editing the approved course alias TSV, for example, leaves every loader
+cached.
+
+File digests are memoized by size and modification time in
+``file_hashes.json``, so unchanged multi-gigabyte exports are not re-read.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import pickle
+import sys
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict
+
+from app.shared.source_truth.io import READ_CHUNK_BYTES
+
+if TYPE_CHECKING:
+    from app.shared.source_truth.scheduler import StageT
+
+CACHE_FORMAT = "1"
+FILE_HASHES_NAME = "file_hashes.json"
+# Directory holding the ``app`` package; only its modules are followed.
+CODE_ROOT = Path(__file__).resolve().parents[3]
+
+
+class StageCacheEntryT(TypedDict):
+    """Sidecar metadata stored next to a cached stage result."""
+
+    rows: int
+
+
+@dataclass
+class StageCache:
+    """Stage results stored under ``root/<stage>/<key>.pickle``.
+
+    Only the newest entry per stage is kept. With ``force`` every lookup
+    misses, but fresh results are still stored.
+    """
+
+    root: Path
+    force: bool = False
+    _file_hashes: dict[str, list[object]] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        memo = self.root / FILE_HASHES_NAME
+        if memo.exists():
+            self._file_hashes = json.loads(memo.read_text(encoding="utf-8"))
+
+    def stage_keys(self, stages: Sequence[StageT], context: object) -> dict[str, str]:
+        """Return the cache key of every stage, inputs before consumers."""
+        keys: dict[str, str] = {}
+        for stage in stages:
+            parts = [
+                CACHE_FORMAT,
+                _code_version(stage.fn.__module__),
+                stage.name,
+                stage.version,
+                f"{stage.fn.__module__}.{stage.fn.__qualname__}",
+                *(self._fingerprint(getattr(context, param)) for param in stage.params),
+                *(keys[name] for name in stage.inputs),
+            ]
+            keys[stage.name] = hashlib.sha256("\0".join(parts).encode()).hexdigest()
+        self._save_file_hashes()
+        return keys
+
+    def lookup(self, name: str, key: str) -> StageCacheEntryT | None:
+        """Return the metadata of a cached result, or None on a miss."""
+        sidecar = self.root / name / f"{key}.json"
+        if self.force or not sidecar.exists():
+            return None
+        if not (self.root / name / f"{key}.pickle").exists():
+            return None
+        return json.loads(sidecar.read_text(encoding="utf-8"))
+
+    def load(self, name: str, key: str) -> object:
+        """Return a cached stage result."""
+        with (self.root / name / f"{key}.pickle").open("rb") as handle:
+            return pickle.load(handle)
+
+    def store(self, name: str, key: str, value: object, rows: int) -> None:
+        """Store a stage result and drop older entries of the same stage."""
+        stage_dir = self.root / name
+        stage_dir.mkdir(parents=True, exist_ok=True)
+        partial = stage_dir / f"{key}.pickle.partial"
+        with partial.open("wb") as handle:
+            pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial, stage_dir / f"{key}.pickle")
+        entry: StageCacheEntryT = {"rows": rows}
+        (stage_dir / f"{key}.json").write_text(json.dumps(entry), encoding="utf-8")
+        for path in stage_dir.iterdir():
+            if not path.name.startswith(key):
+                path.unlink()
+
+    def _fingerprint(self, value: object) -> str:
+        """Return a content fingerprint for one stage parameter."""
+        if not isinstance(value, Path):
+            return repr(value)
+        if value.is_file():
+            return self._file_digest(value)
+        if value.is_dir():
+            digest = hashlib.sha256()
+            for path in sorted(item for item in value.rglob("*") if item.is_file()):
+                relative = path.relative_to(value).as_posix()
+                digest.update(f"{relative}\0{self._file_digest(path)}\n".encode())
+            return digest.hexdigest()
+        return "missing"
+
+    def _file_digest(self, path: Path) -> str:
+        """Return the SHA-256 of a file, reusing the memo while it is unchanged."""
+        stat = path.stat()
+        memo_key = str(path.resolve())
+        cached = self._file_hashes.get(memo_key)
+        if cached and cached[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return str(cached[2])
+        digest = hashlib.sha256()
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(READ_CHUNK_BYTES), b""):
+                digest.update(chunk)
+        self._file_hashes[memo_key] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        return digest.hexdigest()
+
+    def _save_file_hashes(self) -> None:
+        """Persist the file digest memo."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / FILE_HASHES_NAME).write_text(
+            json.dumps(self._file_hashes, sort_keys=True), encoding="utf-8"
+        )
+
+
+def _module_paths(name: str) -> list[Path]:
+    """Return the source files of an ``app`` module or package."""
+    if name != "app" and not name.startswith("app."):
+        return []
+    base = CODE_ROOT.joinpath(*name.split("."))
+    return [
+        path for path in (base.with_suffix(".py"), base / "__init__.py") if path.is_file()
+    ]
+
+
+def _imported_names(path: Path) -> set[str]:
+    """Return every absolute module name imported anywhere in a source file."""
+    names: set[str] = set()
+    for node in ast.walk(ast.parse(path.read_bytes(), filename=str(path))):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return names
+
+
+def _code_files(module: str) -> list[Path]:
+    """Return the source files a stage defined in ``module`` can run.
+
+    Covers the source-truth package and the stage's module plus the import
+    closure of both within ``app`` (shared matchers, course wrangling, model
+    choices and constants, ...), including imports made inside functions.
+    """
+    pending = sorted(Path(__file__).parent.glob("*.py"))
+    module_file = getattr(sys.modules.get(module), "__file__", None)
+    if module_file:
+        pending.append(Path(module_file))
+    seen: set[Path] = set()
+    while pending:
+        path = pending.pop().resolve()
+        if path in seen:
+            continue
+        seen.add(path)
+        for name in _imported_names(path):
+            pending.extend(_module_paths(name))
+    return sorted(seen)
+
+
+@lru_cache(maxsize=None)
+def _code_version(module: str) -> str:
+    """Return a hash of the code a stage defined in ``module`` can run."""
+    digest = hashlib.sha256()
+    for path in _code_files(module):
+        digest.update(path.as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_summary(statuses: Mapping[str, str]) -> str:
+    """Return a one-line hit/miss summary for cache statuses by stage."""
+    hits = sorted(name for name, status in statuses.items() if status == "hit")
+    misses = sorted(name for name, status in statuses.items() if status == "miss")
+    line = f"stage cache: {len(hits)} hit(s), {len(misses)} miss(es)"
+    return f"{line}; recomputed: {', '.join(misses)}" if misses else line
+
+
+__all__ = ["StageCache", "StageCacheEntryT", "cache_summary"]
@@ -1,12 +1,19 @@
-"""SQLite staging primitives for source-truth builds."""
+"""SQLite staging primitives for source-truth builds.
+
+Rows are inserted with ``executemany`` in bounded batches and the writers do
+not commit: a build calls :func:`begin_stage_load`, stages everything in one
+transaction and calls :func:`finish_stage_load`, which builds the lookup
+indexes once and commits.
+"""
 
 from __future__ import annotations
 
 import hashlib
 import json
 import sqlite3
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import TypeAlias
 
@@ -14,6 +21,17 @@ from app.shared.source_truth.io import RowT
 
 RowsT: TypeAlias = Iterable[RowT]
 
+STAGE_BATCH_SIZE = 5_000
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-262144",
+    "PRAGMA mmap_size=268435456",
+)
+STAGE_INDEXES = {
+    "idx_witness_domain_key": "witness_rows(domain, row_key)",
+    "idx_report_name": "report_rows(report_name)",
+}
+
 
 @dataclass(frozen=True)
 class StageResultT:
@@ -29,49 +47,97 @@ def open_stage(path: Path) -> sqlite3.Connection:
     conn = sqlite3.connect(path)
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA synchronous=NORMAL")
+    for pragma in BULK_LOAD_PRAGMAS:
+        conn.execute(pragma)
     _init_schema(conn)
     return conn
 
 
+def begin_stage_load(conn: sqlite3.Connection) -> None:
+    """Drop lookup indexes so a bulk load only appends to the tables."""
+    for name in STAGE_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def finish_stage_load(conn: sqlite3.Connection) -> None:
+    """Build the lookup indexes and commit everything staged so far."""
+    _create_indexes(conn)
+    conn.commit()
+
+
 def stage_witness_rows(
     conn: sqlite3.Connection, domain: str, rows: RowsT, *, key_field: str = "row_key"
 ) -> int:
     """Store normalized witness rows with payload hashes."""
-    count = 0
-    for row in rows:
-        payload = _payload(row)
-        conn.execute(
-            """
-            INSERT INTO witness_rows(domain, source_name, row_key, payload_json, row_hash)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                domain,
-                row.get("source_name", ""),
-                row.get(key_field, "") or _hash_payload(payload),
-                payload,
-                _hash_payload(payload),
-            ),
-        )
-        count += 1
-    conn.commit()
-    return count
+    return _insert_batches(
+        conn,
+        """
+        INSERT INTO witness_rows(domain, source_name, row_key, payload_json, row_hash)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        (_witness_params(domain, row, key_field) for row in rows),
+    )
 
 
 def stage_report_rows(conn: sqlite3.Connection, report_name: str, rows: RowsT) -> int:
     """Store report rows in SQLite for traceability."""
-    count = 0
-    for row_number, row in enumerate(rows, start=1):
-        conn.execute(
+    return _insert_batches(
+        conn,
+        """
+        INSERT INTO report_rows(report_name, row_number, payload_json)
+        VALUES (?, ?, ?)
+        """,
+        (
+            (report_name, row_number, _payload(row))
+            for row_number, row in enumerate(rows, start=1)
+        ),
+    )
+
+
+class SpilledRows:
+    """Re-iterable rows spilled to the stage database.
+
+    Large operational datasets (grades, registrations, payments) are written
+    here once they are final, so the build holds one of them in memory at a
+    time. Each iteration streams the rows back in their original order with
+    their original column order.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, name: str, count: int) -> None:
+        self.conn = conn
+        self.name = name
+        self.count = count
+
+    def __iter__(self) -> Iterator[RowT]:
+        cursor = self.conn.execute(
             """
-            INSERT INTO report_rows(report_name, row_number, payload_json)
-            VALUES (?, ?, ?)
+            SELECT payload_json FROM spill_rows
+            WHERE spill_name = ? ORDER BY row_number
             """,
-            (report_name, row_number, _payload(row)),
+            (self.name,),
         )
-        count += 1
-    conn.commit()
-    return count
+        for (payload,) in cursor:
+            yield json.loads(payload)
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def spill_rows(conn: sqlite3.Connection, name: str, rows: RowsT) -> SpilledRows:
+    """Move rows into the stage database and return a lazy view of them."""
+    conn.execute("DELETE FROM spill_rows WHERE spill_name = ?", (name,))
+    count = _insert_batches(
+        conn,
+        """
+        INSERT INTO spill_rows(spill_name, row_number, payload_json)
+        VALUES (?, ?, ?)
+        """,
+        (
+            (name, row_number, json.dumps(row, ensure_ascii=False))
+            for row_number, row in enumerate(rows, start=1)
+        ),
+    )
+    return SpilledRows(conn, name, count)
 
 
 def stage_output_count(conn: sqlite3.Connection, filename: str, row_count: int) -> None:
@@ -83,7 +149,6 @@ def stage_output_count(conn: sqlite3.Connection, filename: str, row_count: int)
         """,
         (filename, row_count),
     )
-    conn.commit()
 
 
 def stage_truth_witnesses(
@@ -98,19 +163,23 @@ def stage_truth_witnesses(
     registrations: RowsT,
     semester_enrollments: RowsT,
     payments: RowsT,
-) -> None:
-    """Persist normalized source-truth witnesses into SQLite."""
-    stage_witness_rows(conn, "course", courses)
-    stage_witness_rows(conn, "curriculum", curricula, key_field="curriculum")
-    stage_witness_rows(
-        conn, "curriculum_course", curriculum_courses, key_field="curriculum"
+) -> int:
+    """Persist normalized source-truth witnesses into SQLite; return the count."""
+    return sum(
+        (
+            stage_witness_rows(conn, "course", courses),
+            stage_witness_rows(conn, "curriculum", curricula, key_field="curriculum"),
+            stage_witness_rows(
+                conn, "curriculum_course", curriculum_courses, key_field="curriculum"
+            ),
+            stage_witness_rows(conn, "curriculum_requirement", requirements),
+            stage_witness_rows(conn, "student", students, key_field="student_id"),
+            stage_witness_rows(conn, "grade", grades),
+            stage_witness_rows(conn, "registration", registrations),
+            stage_witness_rows(conn, "semester_enrollment", semester_enrollments),
+            stage_witness_rows(conn, "payment", payments),
+        )
     )
-    stage_witness_rows(conn, "curriculum_requirement", requirements)
-    stage_witness_rows(conn, "student", students, key_field="student_id")
-    stage_witness_rows(conn, "grade", grades)
-    stage_witness_rows(conn, "registration", registrations)
-    stage_witness_rows(conn, "semester_enrollment", semester_enrollments)
-    stage_witness_rows(conn, "payment", payments)
 
 
 def _init_schema(conn: sqlite3.Connection) -> None:
@@ -125,16 +194,18 @@ def _init_schema(conn: sqlite3.Connection) -> None:
             payload_json TEXT NOT NULL,
             row_hash TEXT NOT NULL
         );
-        CREATE INDEX IF NOT EXISTS idx_witness_domain_key
-            ON witness_rows(domain, row_key);
         CREATE TABLE IF NOT EXISTS report_rows (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             report_name TEXT NOT NULL,
             row_number INTEGER NOT NULL,
             payload_json TEXT NOT NULL
         );
-        CREATE INDEX IF NOT EXISTS idx_report_name
-            ON report_rows(report_name);
+        CREATE TABLE IF NOT EXISTS spill_rows (
+            spill_name TEXT NOT NULL,
+            row_number INTEGER NOT NULL,
+            payload_json TEXT NOT NULL,
+            PRIMARY KEY (spill_name, row_number)
+        );
         CREATE TABLE IF NOT EXISTS output_files (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             filename TEXT NOT NULL,
@@ -142,9 +213,43 @@ def _init_schema(conn: sqlite3.Connection) -> None:
         );
         """
     )
+    _create_indexes(conn)
     conn.commit()
 
 
+def _create_indexes(conn: sqlite3.Connection) -> None:
+    """Create the staging lookup indexes."""
+    for name, target in STAGE_INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+
+def _insert_batches(
+    conn: sqlite3.Connection, sql: str, params: Iterable[tuple[object, ...]]
+) -> int:
+    """Insert parameter tuples in ``STAGE_BATCH_SIZE`` chunks; return the count."""
+    params = iter(params)
+    count = 0
+    while batch := list(islice(params, STAGE_BATCH_SIZE)):
+        conn.executemany(sql, batch)
+        count += len(batch)
+    return count
+
+
+def _witness_params(
+    domain: str, row: RowT, key_field: str
+) -> tuple[str, str, str, str, str]:
+    """Return insert parameters for one witness row, hashing it once."""
+    payload = _payload(row)
+    row_hash = _hash_payload(payload)
+    return (
+        domain,
+        row.get("source_name", ""),
+        row.get(key_field, "") or row_hash,
+        payload,
+        row_hash,
+    )
+
+
 def _payload(row: RowT) -> str:
     """Serialize a row deterministically."""
     return json.dumps(row, sort_keys=True, ensure_ascii=True)
@@ -0,0 +1,242 @@
+"""Parse-once registry of the source tables shared by one truth build.
+
+Several loaders read the same SmartSchool and GraPro exports: registrations
+feed the student, grade, registration and enrollment loaders, and every
+table is also profiled by the inventory. Inside :func:`use_source_tables`
+the module-level :func:`iter_rows`, :func:`profile_file` and
+:func:`source_index` serve registered paths from one columnar parse. Other
+paths, or calls made outside a registry, stream from disk as
+:mod:`app.shared.source_truth.io` does.
+
+A registry built with ``readers`` (table path -> names of the stages that
+read it) drops each table once :meth:`SourceTables.stage_done` has been
+called for all of its readers, so a build holds only the tables that later
+stages still need. Worker processes parse into their own copy of the
+registry and release it after every stage (:func:`release_source_tables`),
+so a worker holds at most the tables of the stage it is running.
+
+Example:
+    >>> with use_source_tables(SourceTables({smartschool_dir / "dbo_UM_Students.csv"})):
+    ...     students = load_smartschool_students(smartschool_dir, ok_tables)
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import (
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar, cast
+
+from app.shared.source_truth import io
+from app.shared.source_truth.io import FileProfileT, RowT, read_header, safe_cell
+
+if TYPE_CHECKING:
+    from app.shared.source_truth.source_cache import SourceCache
+
+IndexT = TypeVar("IndexT")
+IndexBuilderT = Callable[[Iterable[RowT]], IndexT]
+
+
+@dataclass(frozen=True, eq=False)
+class SourceTableT:
+    """One source file parsed into columns, with its profile and key indexes.
+
+    ``keys`` are the row dictionary keys in row order and ``columns`` holds
+    one sequence of cells per key: a tuple when parsed from CSV, an encoded
+    view over memory-mapped arrays when loaded from the source cache.
+    Repeated cell values share one string.
+    """
+
+    path: Path
+    keys: tuple[str, ...]
+    columns: tuple[Sequence[str], ...]
+    headers: tuple[str, ...]
+    record_count: int
+    sha256: str
+    size_bytes: int
+    _indexes: dict[object, object] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def rows(self) -> Iterator[RowT]:
+        """Yield fresh row dictionaries, exactly as :func:`io.iter_rows` would."""
+        keys = self.keys
+        for values in zip(*self.columns, strict=True):
+            yield dict(zip(keys, values, strict=True))
+
+    def profile(self) -> FileProfileT:
+        """Return the file profile observed while parsing."""
+        return FileProfileT(
+            self.path, self.record_count, self.headers, self.sha256, self.size_bytes
+        )
+
+    def index(self, build: IndexBuilderT[IndexT]) -> IndexT:
+        """Return ``build(rows)``, computed once per table and builder.
+
+        Callers share the result and must treat it as read-only.
+        """
+        if build not in self._indexes:
+            self._indexes[build] = build(self.rows())
+        return cast(IndexT, self._indexes[build])
+
+
+def parse_source_table(path: Path) -> SourceTableT:
+    """Parse a source file into a :class:`SourceTableT` in one pass."""
+    io.ensure_csv_field_limit()
+    if not path.exists():
+        return SourceTableT(path, (), (), (), 0, "", 0)
+    size_bytes = path.stat().st_size
+    digest = hashlib.sha256()
+    with io.open_text(path, digest=digest) as handle:
+        slots, width, reader = read_header(handle)
+        # Duplicate headers keep their first position and their last value,
+        # like the row dictionaries built by iter_rows.
+        positions = {key: index for index, key in slots}
+        picks = tuple(positions.values())
+        columns: list[list[str]] = [[] for _ in picks]
+        shared: list[dict[str, str]] = [{} for _ in picks]
+        record_count = 0
+        if slots:
+            for raw in reader:
+                record_count += 1
+                if not raw:
+                    continue
+                if len(raw) < width:
+                    raw.extend([""] * (width - len(raw)))
+                for column, values, index in zip(columns, shared, picks, strict=True):
+                    cell = safe_cell(raw[index])
+                    column.append(values.setdefault(cell, cell))
+    return SourceTableT(
+        path=path,
+        keys=tuple(positions),
+        columns=tuple(tuple(column) for column in columns),
+        headers=tuple(key for _, key in slots),
+        record_count=record_count,
+        sha256=digest.hexdigest() if size_bytes else "",
+        size_bytes=size_bytes,
+    )
+
+
+@dataclass
+class SourceTables:
+    """Tables parsed at most once per process for the registered ``paths``.
+
+    With a converted ``cache`` (see ``convert_sources``), registered tables
+    whose content is unchanged are loaded from it instead of parsed.
+    Profiles of unregistered files are memoized too, so the inventory and
+    the integrity check hash each export once. A table read again after it
+    was released is parsed (or loaded) again.
+    """
+
+    paths: Collection[Path] = ()
+    cache: SourceCache | None = None
+    readers: Mapping[Path, Collection[str]] = field(default_factory=dict)
+    _tables: dict[Path, SourceTableT] = field(default_factory=dict, repr=False)
+    _profiles: dict[Path, FileProfileT] = field(default_factory=dict, repr=False)
+    _pending: dict[Path, set[str]] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self.paths = frozenset(self.paths)
+        self._pending = {path: set(names) for path, names in self.readers.items()}
+
+    def stage_done(self, name: str) -> None:
+        """Release the tables whose last pending reader was stage ``name``."""
+        for path, pending in self._pending.items():
+            if name in pending:
+                pending.discard(name)
+                if not pending:
+                    self.release(path)
+
+    def release(self, path: Path | None = None) -> None:
+        """Drop the parsed table of ``path``, or every parsed table."""
+        if path is None:
+            self._tables.clear()
+        else:
+            self._tables.pop(path, None)
+
+    def table(self, path: Path) -> SourceTableT | None:
+        """Return the parsed table for a registered path, else None."""
+        if path not in self.paths:
+            return None
+        if path not in self._tables:
+            table = self.cache.lookup(path) if self.cache is not None else None
+            self._tables[path] = table if table is not None else parse_source_table(path)
+        return self._tables[path]
+
+    def rows(self, path: Path) -> Iterator[RowT]:
+        """Yield the rows of ``path``."""
+        table = self.table(path)
+        return table.rows() if table is not None else io.iter_rows(path)
+
+    def profile(self, path: Path) -> FileProfileT:
+        """Return the profile of ``path``."""
+        table = self.table(path)
+        if table is not None:
+            return table.profile()
+        if path not in self._profiles:
+            self._profiles[path] = io.profile_file(path)
+        return self._profiles[path]
+
+    def index(self, path: Path, build: IndexBuilderT[IndexT]) -> IndexT:
+        """Return ``build`` applied to the rows of ``path``, shared when registered."""
+        table = self.table(path)
+        return table.index(build) if table is not None else build(io.iter_rows(path))
+
+
+_ACTIVE: list[SourceTables] = []
+
+
+@contextmanager
+def use_source_tables(tables: SourceTables) -> Iterator[SourceTables]:
+    """Serve source reads inside the block from ``tables``."""
+    _ACTIVE.append(tables)
+    try:
+        yield tables
+    finally:
+        _ACTIVE.remove(tables)
+
+
+def release_source_tables() -> None:
+    """Drop every table parsed by the active registries."""
+    for tables in _ACTIVE:
+        tables.release()
+
+
+def iter_rows(path: Path) -> Iterator[RowT]:
+    """Yield the rows of a source file through the active registry."""
+    return _ACTIVE[-1].rows(path) if _ACTIVE else io.iter_rows(path)
+
+
+def profile_file(path: Path) -> FileProfileT:
+    """Return a source file profile through the active registry."""
+    return _ACTIVE[-1].profile(path) if _ACTIVE else io.profile_file(path)
+
+
+def source_index(path: Path, build: IndexBuilderT[IndexT]) -> IndexT:
+    """Return a lookup built from a source file, shared through the registry.
+
+    ``build`` must be a module-level function: it identifies the index.
+    """
+    return _ACTIVE[-1].index(path, build) if _ACTIVE else build(io.iter_rows(path))
+
+
+__all__ = [
+    "SourceTableT",
+    "SourceTables",
+    "iter_rows",
+    "parse_source_table",
+    "profile_file",
+    "release_source_tables",
+    "source_index",
+    "use_source_tables",
+]
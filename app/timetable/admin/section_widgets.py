@@ -10,6 +10,7 @@ from app.academics.admin.widgets import (
     CurriWgt,
 )
 from app.people.admin.widgets import FacultyFullnameWgt
+from app.shared.identity_map import IdentityMap, identity_map
 from app.timetable.ensures import ensure_sem, ensure_sec, ensure_sem_code
 from app.shared.utils import get_in_row, asserts_keys, to_int
 from app.timetable.admin.core_widgets import SemCodeWgt, SemWgt
@@ -26,7 +27,9 @@ class SecWgt(widgets.ForeignKeyWidget):
         self.sem_w = SemWgt()
         self.faculty_w = FacultyFullnameWgt()
         self.fuzzy_threshold = fuzzy_threshold
-        self._cache: dict[tuple[int, int, int, int | None], Section] = {}
+        self._cache: IdentityMap[tuple[int, int, int, int | None], Section] = (
+            identity_map("timetable.widgets.sections")
+        )
 
     # ------------ widget API ------------
     def clean(self, value, row=None, *args, **kwargs) -> Section | None:
@@ -3,19 +3,11 @@
 from __future__ import annotations
 
 from datetime import date, time
-from typing import Dict, Optional, Tuple
+from typing import Optional, Tuple
 
 from app.academics.models.curriculum_course import CurriCrs
-from app.shared.types import (
-    RoomCacheT,
-    RoomKeyT,
-    ScheduleCacheT,
-    ScheduleKeyT,
-    SectionKeyMapT,
-    SessionCacheT,
-    SessionKeyT,
-    TwoStrIntMapT,
-)
+from app.shared.identity_map import IdentityMap, identity_map
+from app.shared.types import RoomKeyT, ScheduleKeyT, SessionKeyT
 from app.shared.utils import parse_str, to_int
 from app.timetable.models.academic_year import AcademicYear
 from app.timetable.models.schedule import Schedule
@@ -25,14 +17,24 @@ from app.timetable.models.session import SecSession
 from app.spaces.models.core import Room, Space
 from app.timetable.utils import normalize_academic_year, parse_sem_code
 
-# Simple in-memory caches keyed by normalized tokens
-SEMESTER_CACHE: Dict[Tuple[str, int], Semester] = {}
-SECTION_CACHE: Dict[Tuple[int, int, int, Optional[int]], Section] = {}
-SEMESTER_ID_CACHE: TwoStrIntMapT = {}
-SECTION_ID_CACHE: SectionKeyMapT = {}
-SCHEDULE_ID_CACHE: ScheduleCacheT = {}
-ROOM_ID_CACHE: RoomCacheT = {}
-SESSION_ID_CACHE: SessionCacheT = {}
+# Scoped identity maps keyed by normalized tokens
+SEMESTER_CACHE: IdentityMap[Tuple[str, int], Semester] = identity_map(
+    "timetable.semesters"
+)
+SECTION_CACHE: IdentityMap[Tuple[int, int, int, Optional[int]], Section] = identity_map(
+    "timetable.sections"
+)
+SEMESTER_ID_CACHE: IdentityMap[Tuple[str, int], int] = identity_map(
+    "timetable.semester_ids"
+)
+SECTION_ID_CACHE: IdentityMap[Tuple[int, int, int, Optional[int]], int] = identity_map(
+    "timetable.section_ids"
+)
+SCHEDULE_ID_CACHE: IdentityMap[ScheduleKeyT, int] = identity_map("timetable.schedule_ids")
+ROOM_ID_CACHE: IdentityMap[RoomKeyT, int] = identity_map("timetable.room_ids")
+SESSION_ID_CACHE: IdentityMap[SessionKeyT, Tuple[int, int]] = identity_map(
+    "timetable.session_ids"
+)
 
 
 def _sec_cache_key(
@@ -20,6 +20,7 @@ from app.academics.ensures import (
 from app.people.ensure_people import ensure_faculty
 from app.people.utils import name_parts_from_row
 
+from app.shared.identity_map import identity_map_scope
 from app.shared.importing import CsvRowLogger, log_invalid_row
 from app.shared.types import RowStrOptT, SectionCacheT, SessionKeyT
 
@@ -102,11 +103,15 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options) -> None:
+        """Run the import with lookup caches scoped to this run."""
+        with identity_map_scope():
+            self._import(options)
+
+    def _import(self, options) -> None:
         """Import session rows into SecSession.
 
         Args:
-            *args: Unused positional arguments.
-            **options: Command options (file, semester_code, batch_size).
+            options: Command options (file, semester_code, batch_size).
 
         Raises:
             CommandError: When the file is missing or import fails.
@@ -0,0 +1,45 @@
+"""Rebuild the denormalized section sort codes used by admin ordering."""
+
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from app.timetable.models.section import refresh_section_sort_codes
+
+
+class Command(BaseCommand):
+    """Recompute ``Section.sort_code`` from course codes and section numbers."""
+
+    help = (
+        "Rebuild Section.sort_code, the indexed key behind the Grade admin "
+        "section ordering. Run after adding the column or bulk course imports."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--course-id",
+            type=int,
+            action="append",
+            dest="course_ids",
+            help="Only refresh sections of this course (repeatable).",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Rewrite the sort codes and report the updated row count."""
+        started = time.perf_counter()
+        course_ids = options["course_ids"]
+        updated = refresh_section_sort_codes(
+            course_ids=course_ids if isinstance(course_ids, list) else None
+        )
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {updated} section sort code(s) in {elapsed:.1f}s."
+            )
+        )
+
+
+__all__ = ["Command"]
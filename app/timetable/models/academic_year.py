@@ -46,8 +46,19 @@ class AcademicYear(models.Model):
             # the day *before* next academic year starts
             self.end_date = self.start_date.replace(year=st.year + 1) - timedelta(days=1)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded code so saves can tell when it changed."""
+        instance = super().from_db(db, field_names, values)
+        instance._saved_code = instance.__dict__.get("code")
+        return instance
+
     def save(self, *args, **kwargs) -> None:
-        """Populate derived fields long_name and code before saving."""
+        """Populate derived fields long_name and code before saving.
+
+        Fee quotes look tuition rates up by year code, so a code change drops
+        the quotes of the year's semesters.
+        """
         # setting a default for the end_year
         ys = self.start_date.year
 
@@ -58,8 +69,16 @@ class AcademicYear(models.Model):
         ye = ys + 1
         self.long_name = f"{ys}-{ye}"
         self.code = f"{str(ys)[-2:]}-{str(ye)[-2:]}"
+        code_changed = not self._state.adding and (
+            getattr(self, "_saved_code", None) != self.code
+        )
 
         super().save(*args, **kwargs)
+        self._saved_code = self.code
+        if code_changed:
+            from app.finance.fee_quotes import invalidate_fee_quotes
+
+            invalidate_fee_quotes(academic_year_ids=[self.pk])
 
     @classmethod
     def get_dft(cls, today: date | None = None) -> "AcademicYear":
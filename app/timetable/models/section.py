@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from decimal import Decimal
-from typing import TYPE_CHECKING, Set
+from typing import TYPE_CHECKING, Any, Set
 
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models import CharField, Value
+from django.db.models.functions import Cast, Concat
 from simple_history.models import HistoricalRecords
 
 from app.academics.models.course import Course
@@ -17,6 +20,59 @@ if TYPE_CHECKING:
     from app.spaces.models.core import Room
     from app.academics.models.curriculum_course import CurriCrs
 
+SORT_CODE_FIELDS = frozenset({"curriculum_course", "curriculum_course_id", "number"})
+
+
+def section_sort_code(course: Course, number: int) -> str:
+    """Return the sortable ``<course short code>:s<number>`` key of a section.
+
+    Courses without a short code sort under their full code.
+    """
+    return f"{course.short_code or course.code}:s{number}"
+
+
+def refresh_section_sort_codes(
+    course_ids: Iterable[int] | None = None,
+    *,
+    sections: models.QuerySet[Section] | None = None,
+) -> int:
+    """Rewrite ``Section.sort_code`` for the sections of ``course_ids``.
+
+    With no ids every section is refreshed; ``sections`` narrows the rows
+    further (sections just moved to another curriculum course, say). Runs
+    one UPDATE per course, so it stays cheap after a course rename and is
+    also the backfill path.
+
+    Returns:
+        Number of section rows updated.
+    """
+    rows = Section.objects.all() if sections is None else sections
+    courses = Course.objects.order_by("pk")
+    if course_ids is not None:
+        courses = courses.filter(pk__in=list(course_ids))
+    if sections is not None:
+        courses = courses.filter(pk__in=rows.values("curriculum_course__course_id"))
+    updated = 0
+    for course_id, short_code, code in courses.values_list("pk", "short_code", "code"):
+        prefix = f"{short_code or code}:s"
+        updated += rows.filter(curriculum_course__course_id=course_id).update(
+            sort_code=Concat(Value(prefix), Cast("number", CharField()))
+        )
+    return updated
+
+
+class SectionQuerySet(models.QuerySet["Section"]):
+    """Section queries whose bulk updates keep ``sort_code`` in step."""
+
+    def update(self, **kwargs: Any) -> int:
+        """Update rows, refreshing sort codes when the course or number moves."""
+        if not SORT_CODE_FIELDS & kwargs.keys():
+            return super().update(**kwargs)
+        pks = list(self.values_list("pk", flat=True))
+        updated = super().update(**kwargs)
+        refresh_section_sort_codes(sections=Section.objects.filter(pk__in=pks))
+        return updated
+
 
 class Section(models.Model):
     """A single course offering in a given semester (by a faculty).
@@ -69,6 +125,12 @@ class Section(models.Model):
     # to be defined by Admin & VPA
     max_seats = models.PositiveIntegerField(default=30, validators=[MinValueValidator(3)])
 
+    # ~~~~ Read-only ~~~~
+    # Denormalized ``short_code`` so admin changelists sort on an index.
+    sort_code = models.CharField(max_length=40, default="", editable=False)
+
+    objects = SectionQuerySet.as_manager()
+
     def __str__(self) -> str:  # pragma: no cover
         """Return a human readable identifier for the section, with allocated rooms."""
         space = f" | {self.space_codes}" if self.space_codes else ""
@@ -125,9 +187,24 @@ class Section(models.Model):
         return self.current_registrations < self.max_seats
 
     def fee_total_amount(self) -> Decimal:
-        """Return the total fee for the section including tuition."""
+        """Return the total fee for the section including tuition.
+
+        Reads the quote attached by ``prime_section_fee_quotes`` when present.
+        """
+        quote = getattr(self, "_fee_quote", None)
+        if quote is not None:
+            return quote.total_amount
         return self.curriculum_course.total_fee(self.semester)
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Keep ``sort_code`` in step with the course and section number."""
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or SORT_CODE_FIELDS & set(update_fields):
+            self.sort_code = section_sort_code(self.curriculum_course.course, self.number)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "sort_code"}
+        super().save(*args, **kwargs)
+
     def clean(self) -> None:
         """Check that the dates are correct."""
         if self.end_date is not None:
@@ -145,5 +222,7 @@ class Section(models.Model):
         indexes = [
             models.Index(fields=["semester", "curriculum_course"]),
             models.Index(fields=["semester", "curriculum_course", "number"]),
+            models.Index(fields=["sort_code"]),
+            models.Index(fields=["faculty", "sort_code"]),
         ]
         ordering = ["semester", "curriculum_course", "number"]
@@ -114,11 +114,56 @@ class Semester(StatusableMixin, models.Model):
         if not self.status_id:
             self.status_id = "planning"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded fee pricing inputs so saves can tell changes."""
+        instance = super().from_db(db, field_names, values)
+        instance._saved_price_key = (
+            instance.__dict__.get("academic_year_id"),
+            instance.__dict__.get("number"),
+            instance.__dict__.get("start_date"),
+        )
+        return instance
+
     def save(self, *args, **kwargs):
         # Ensure default date ranges are always set, even outside form validation.
         self._ensure_dft_dates()
         self._ensure_status()
-        return super().save(*args, **kwargs)
+        opening = self.is_regio_open() and not (
+            self.pk
+            and Semester.objects.filter(
+                pk=self.pk, status_id=self.REGISTRATION_OPEN_CODES
+            ).exists()
+        )
+        price_key = (self.academic_year_id, self.number, self.start_date)
+        price_changed = not self._state.adding and (
+            getattr(self, "_saved_price_key", None) != price_key
+        )
+        save_result = super().save(*args, **kwargs)
+        self._saved_price_key = price_key
+        self._refresh_fee_quotes(opening, price_changed)
+        return save_result
+
+    def _refresh_fee_quotes(self, opening: bool, price_changed: bool) -> None:
+        """Rebuild fee quotes when registration opens, else keep them current.
+
+        Pricing inputs are the year and number (tuition rate) and the start
+        date (fee line activation, including lines of other semesters that take
+        effect from this one). When they move the affected quotes are dropped,
+        and an open semester rebuilds its own right away.
+        """
+        from app.finance.fee_quotes import invalidate_fee_quotes, rebuild_sem_fee_quotes
+        from app.finance.models.fee_stack import FeeStackLine
+
+        if price_changed:
+            invalidate_fee_quotes(
+                semester_ids=[self.pk],
+                fee_stack_ids=FeeStackLine.objects.filter(
+                    effective_from_semester=self
+                ).values_list("fee_stack_id", flat=True),
+            )
+        if opening or (price_changed and self.is_regio_open()):
+            rebuild_sem_fee_quotes(self)
 
     def is_regio_open(self) -> bool:
         """Return True when the semester is open for course selection."""
@@ -6,3 +6,9 @@ from django.apps import AppConfig
 class WebsiteConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app.website"
+
+    def ready(self):
+        """Keep cached user access snapshots in sync with role changes."""
+        from app.website.services.staff_access import connect_user_access_signals
+
+        connect_user_access_signals()
@@ -10,6 +10,7 @@ from app.people.models.donor import Donor
 from app.people.models.faculty import Faculty
 from app.people.models.staffs import Staff
 from app.people.models.student import Student
+from app.website.services.staff_access import user_access
 
 PersonProfileT: TypeAlias = Staff | Student | Donor
 ProfileKindT: TypeAlias = Literal["Faculty", "Staff", "Student", "Donor", "Account"]
@@ -34,7 +35,15 @@ class ProfileFactT(TypedDict):
 
 def profile_for_user(user: User) -> PersonProfileT | None:
     """Return the first person profile attached to the user account."""
+    access = user_access(user)
+    present = {
+        "staff": access.staff_id is not None,
+        "student": access.student_id is not None,
+        "donor": access.donor_id is not None,
+    }
     for attr in ("staff", "student", "donor"):
+        if not present[attr]:
+            continue
         try:
             return cast(PersonProfileT, getattr(user, attr))
         except (
@@ -55,10 +64,17 @@ def _has_faculty_profile(profile: Staff) -> bool:
     return Faculty.objects.filter(staff_profile_id=profile_id).exists()
 
 
-def profile_kind(profile: PersonProfileT | None) -> ProfileKindT:
-    """Return the user-facing profile type."""
+def profile_kind(
+    profile: PersonProfileT | None, *, has_faculty: bool | None = None
+) -> ProfileKindT:
+    """Return the user-facing profile type.
+
+    ``has_faculty`` skips the faculty lookup when the caller already knows.
+    """
     if isinstance(profile, Staff):
-        if _has_faculty_profile(profile):
+        if has_faculty is None:
+            has_faculty = _has_faculty_profile(profile)
+        if has_faculty:
             return "Faculty"
         return "Staff"
     if isinstance(profile, Student):
@@ -103,7 +119,9 @@ def build_portal_identity(user: User) -> PortalIdentityT:
         "subtitle": subtitle,
         "initial": initial,
         "avatar_url": profile_avatar_url(profile),
-        "kind": profile_kind(profile),
+        "kind": profile_kind(
+            profile, has_faculty=user_access(user).faculty_id is not None
+        ),
     }
 
 
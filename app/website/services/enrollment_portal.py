@@ -14,6 +14,7 @@ from django.urls import reverse
 from app.academics.models.college import College
 from app.academics.models.curriculum import Curriculum
 from app.people.models.student import Student
+from app.people.student_search import SEARCH_LIMIT, search_students
 from app.registry.models.document import DocStd
 from app.registry.models.grade import Grade
 from app.registry.models.registration import Registration
@@ -89,30 +90,12 @@ def apply_student_filters(
     queryset: QuerySet[Student],
     filters: StudentFiltersT,
 ) -> QuerySet[Student]:
-    """Apply directory and autocomplete filters to a student queryset."""
-    q_value = filters["q"]
-    if q_value:
-        text_query = (
-            Q(student_id__icontains=q_value)
-            | Q(long_name__icontains=q_value)
-            | Q(user__username__icontains=q_value)
-            | Q(user__first_name__icontains=q_value)
-            | Q(user__last_name__icontains=q_value)
-            | Q(curricula__short_name__icontains=q_value)
-            | Q(curricula__long_name__icontains=q_value)
-            | Q(curricula__college__code__icontains=q_value)
-            | Q(curricula__college__long_name__icontains=q_value)
-            | Q(entry_semester__academic_year__code__icontains=q_value)
-            | Q(entry_semester__academic_year__long_name__icontains=q_value)
-            | Q(last_enrolled_semester__academic_year__code__icontains=q_value)
-            | Q(last_enrolled_semester__academic_year__long_name__icontains=q_value)
-        )
-        semester_number = clean_int(q_value)
-        if semester_number is not None:
-            text_query |= Q(entry_semester__number=semester_number) | Q(
-                last_enrolled_semester__number=semester_number
-            )
-        queryset = queryset.filter(text_query)
+    """Apply directory and autocomplete filters to a student queryset.
+
+    The text query goes through the shared student search documents and
+    annotates ``search_rank`` (zero without a query).
+    """
+    queryset = search_students(queryset, filters["q"])
 
     college_id = filters["college"]
     if college_id:
@@ -153,7 +136,7 @@ def build_student_directory_context(request: HttpRequest) -> dict[str, object]:
     """Build context for the enrollment student directory."""
     filters = parse_student_filters(request.GET)
     queryset = apply_student_filters(student_search_queryset(), filters).order_by(
-        "long_name", "student_id"
+        "-search_rank", "long_name", "student_id"
     )
     paginator = Paginator(queryset, STUDENT_DIRECTORY_PAGE_SIZE)
     page_obj = paginator.get_page(request.GET.get("page"))
@@ -189,8 +172,8 @@ def build_student_autocomplete_results(request: HttpRequest) -> list[StudentResu
     if not any(filters.values()):
         return []
     suggestions = apply_student_filters(student_search_queryset(), filters).order_by(
-        "student_id", "long_name"
-    )[:15]
+        "-search_rank", "student_id", "long_name"
+    )[:SEARCH_LIMIT]
     return [
         {
             "pk": student.pk,
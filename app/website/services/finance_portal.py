@@ -11,6 +11,7 @@ from django.db.models import Exists, Max, Min, OuterRef, Q, QuerySet
 from django.http import HttpRequest, QueryDict
 from django.urls import NoReverseMatch, reverse
 
+from app.finance.fee_quotes import prime_section_fee_quotes
 from app.finance.models.invoice import CrsInvoice
 from app.finance.models.payment import Payment
 from app.finance.payment_application import (
@@ -30,7 +31,9 @@ from app.finance.registration_invoices import (
     registration_invoice_amount,
 )
 from app.people.models.student import Student
+from app.people.student_search import search_students
 from app.registry.models.registration import Registration
+from app.shared.perf import timed_block
 from app.timetable.models.semester import Semester
 from app.timetable.utils import format_datetime
 from app.website.services.portal_types import PortalContextT
@@ -192,14 +195,8 @@ def finance_stds(query: str | None = None) -> QuerySet[Student]:
     """Return a queryset of finance-relevant students matching a query."""
     if not query:
         return Student.objects.none()
-    qs = finance_relevant_std_qs().filter(
-        Q(student_id__icontains=query)
-        | Q(long_name__icontains=query)
-        | Q(user__first_name__icontains=query)
-        | Q(user__last_name__icontains=query)
-        | Q(user__username__icontains=query)
-    )
-    return qs.order_by("long_name")
+    qs = search_students(finance_relevant_std_qs(), query)
+    return qs.order_by("-search_rank", "long_name")
 
 
 def finance_std_by_id(student_id: int) -> Optional[Student]:
@@ -422,6 +419,8 @@ def gp_uninvoiced_registrations(
     """Group invoiceable registrations that do not yet have course invoices."""
     groups: list[UninvoicedRegistrationGpT] = []
     group_lookup: dict[int, UninvoicedRegistrationGpT] = {}
+    registrations = list(registrations)
+    prime_section_fee_quotes(registration.section for registration in registrations)
     for registration in registrations:
         amount_due = registration_invoice_amount(registration)
         if amount_due <= Decimal("0.00"):
@@ -447,6 +446,8 @@ def gp_fee_setup_registrations(
     """Group zero-amount registrations that need a finance fee decision."""
     groups: list[FeeSetupRegistrationGpT] = []
     group_lookup: dict[int, FeeSetupRegistrationGpT] = {}
+    registrations = list(registrations)
+    prime_section_fee_quotes(registration.section for registration in registrations)
     for registration in registrations:
         amount_due = registration_invoice_amount(registration)
         if amount_due > Decimal("0.00"):
@@ -607,6 +608,7 @@ def _pagination_state(
     }
 
 
+@timed_block("finance_console")
 def build_finance_console_context(request: HttpRequest) -> PortalContextT:
     """Build context for the finance officer invoice and payment console."""
     user = cast(User, request.user)
@@ -8,15 +8,16 @@ from typing import TypeAlias, TypedDict, cast
 
 from django.contrib.auth.models import User
 from django.core.paginator import Paginator
-from django.db.models import Q
 from django.http import HttpRequest
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils import timezone
 
 from app.people.models.student import Student
+from app.people.student_search import top_students
 from app.registry.gpa import get_grade_points_and_credits
 from app.registry.models.grade import Grade
+from app.shared.perf import timed_block
 from app.shared.utils import parse_str
 from app.timetable.models.semester import Semester, SemesterStatus
 from app.website.services.portal_types import PortalContextT
@@ -212,16 +213,8 @@ def registrar_student_results(query: str | None) -> list[StudentAutocompleteResu
     clean_query = parse_str(query)
     if not clean_query:
         return []
-    students = (
-        Student.objects.select_related("user")
-        .filter(
-            Q(student_id__icontains=clean_query)
-            | Q(long_name__icontains=clean_query)
-            | Q(user__first_name__icontains=clean_query)
-            | Q(user__last_name__icontains=clean_query)
-            | Q(user__username__icontains=clean_query)
-        )
-        .order_by("long_name")[:15]
+    students = top_students(
+        clean_query, Student.objects.select_related("user"), order_by=("long_name",)
     )
     return [
         {
@@ -264,6 +257,7 @@ def _pagination_hidden_fields(request: HttpRequest) -> tuple[str, list[dict[str,
     return pagination_params.urlencode(), hidden_fields
 
 
+@timed_block("registrar_grades")
 def build_reg_grades_context(request: HttpRequest) -> ContextT:
     """Build context for the registrar grade dashboard."""
     user = cast(User, request.user)
@@ -349,6 +343,7 @@ def build_reg_grades_context(request: HttpRequest) -> ContextT:
     }
 
 
+@timed_block("registrar_grade_groups")
 def build_student_grade_groups(students: list[Student], grades) -> list[RegStdGpT]:
     """Group grade rows by student and semester for registrar pages."""
     student_groups: list[RegStdGpT] = []
@@ -0,0 +1,271 @@
+"""Per-request snapshot of a user's groups, staff roles and profile ids.
+
+Role resolution, the sidebar, the role switcher, permission checks and the
+portal identity all need the same facts about ``request.user``. They read
+them from one :class:`UserAccess` built on first use and memoized on the
+user instance, which lives exactly as long as the request.
+
+When ``USER_ACCESS_CACHE_SECONDS`` is positive the snapshot is also kept in
+the default cache under a versioned key. Group membership changes,
+``RoleAssignment`` saves/deletes and group renames bump the version (see
+:func:`connect_user_access_signals`), so stale snapshots are never read.
+
+Example:
+    >>> access = user_access(request.user)
+    >>> access.primary_role, "dean" in access.accessible_roles
+    ('chair', False)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser, Group, User
+from django.core.cache import cache
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils import timezone
+
+from app.people.models.donor import Donor
+from app.people.models.faculty import Faculty
+from app.people.models.role_assignment import RoleAssignment
+from app.people.models.staffs import Staff
+from app.people.models.student import Student
+
+ACCESS_ATTR = "_user_access_snapshot"
+_KEY_PREFIX = "user-access"
+_GLOBAL_VERSION_KEY = f"{_KEY_PREFIX}:version"
+
+RoleScopeT = tuple[str, int | None, int | None]
+
+
+@dataclass(frozen=True)
+class UserAccess:
+    """Everything the portal needs to know about who a user is.
+
+    Attributes:
+        group_names: Names of the user's auth groups.
+        membership_roles: Staff role slugs granted directly by the groups.
+        accessible_roles: Role slugs reachable through role inheritance.
+        primary_role: Highest-priority role (``"general"`` when none).
+        staff_id: Primary key of the Staff profile, if any.
+        faculty_id: Primary key of the Faculty profile, if any.
+        donor_id: Primary key of the Donor profile, if any.
+        student_id: Primary key of the Student profile, if any.
+        role_scopes: Active ``RoleAssignment`` rows as
+            ``(group name, college id, department id)``.
+    """
+
+    user_id: int | None
+    is_superuser: bool
+    group_names: frozenset[str]
+    membership_roles: frozenset[str]
+    accessible_roles: frozenset[str]
+    primary_role: str
+    staff_id: int | None = None
+    faculty_id: int | None = None
+    donor_id: int | None = None
+    student_id: int | None = None
+    role_scopes: frozenset[RoleScopeT] = frozenset()
+
+    @property
+    def college_ids(self) -> frozenset[int]:
+        """Return the colleges the user's active role assignments cover."""
+        return frozenset(college for _, college, _ in self.role_scopes if college)
+
+    @property
+    def department_ids(self) -> frozenset[int]:
+        """Return the departments the user's active role assignments cover."""
+        return frozenset(dept for _, _, dept in self.role_scopes if dept)
+
+    def scopes_for(self, group_name: str) -> frozenset[RoleScopeT]:
+        """Return the active assignment scopes held through ``group_name``."""
+        return frozenset(scope for scope in self.role_scopes if scope[0] == group_name)
+
+
+def _cache_seconds() -> int:
+    return int(getattr(settings, "USER_ACCESS_CACHE_SECONDS", 0) or 0)
+
+
+def _user_version_key(user_id: int) -> str:
+    return f"{_KEY_PREFIX}:{user_id}:version"
+
+
+def _profile_ids(user: User) -> tuple[int | None, ...]:
+    row = (
+        User.objects.filter(pk=user.pk)
+        .values_list("staff__id", "staff__faculty__id", "donor__id", "student__id")
+        .first()
+    )
+    return row or (None, None, None, None)
+
+
+def _role_scopes(user: User) -> frozenset[RoleScopeT]:
+    today = timezone.now().date()
+    rows = (
+        RoleAssignment.objects.filter(user=user, start_date__lte=today)
+        .filter(Q(end_date__isnull=True) | Q(end_date__gte=today))
+        .values_list("group__name", "college_id", "department_id")
+    )
+    return frozenset(rows)
+
+
+def build_user_access(user: User) -> UserAccess:
+    """Compute a fresh :class:`UserAccess` from the database."""
+    from app.website.services.staff_roles import role_access_for_groups
+
+    if not user.is_authenticated or user.pk is None:
+        return UserAccess(
+            user_id=None,
+            is_superuser=False,
+            group_names=frozenset(),
+            membership_roles=frozenset(),
+            accessible_roles=frozenset({"general"}),
+            primary_role="general",
+        )
+    group_names = frozenset(user.groups.values_list("name", flat=True))
+    membership, accessible, primary = role_access_for_groups(
+        group_names, is_superuser=user.is_superuser
+    )
+    staff_id, faculty_id, donor_id, student_id = _profile_ids(user)
+    return UserAccess(
+        user_id=user.pk,
+        is_superuser=user.is_superuser,
+        group_names=group_names,
+        membership_roles=membership,
+        accessible_roles=accessible,
+        primary_role=primary,
+        staff_id=staff_id,
+        faculty_id=faculty_id,
+        donor_id=donor_id,
+        student_id=student_id,
+        role_scopes=_role_scopes(user),
+    )
+
+
+def _cached_user_access(user: User, timeout: int) -> UserAccess:
+    """Return the snapshot from the versioned cache entry, filling it if needed."""
+    version_key = _user_version_key(user.pk)
+    versions = cache.get_many([_GLOBAL_VERSION_KEY, version_key])
+    global_version = versions.get(_GLOBAL_VERSION_KEY) or ""
+    user_version = versions.get(version_key)
+    if user_version is None:
+        user_version = uuid4().hex
+        cache.set(version_key, user_version, None)
+    key = f"{_KEY_PREFIX}:{user.pk}:{global_version}:{user_version}"
+    access = cache.get(key)
+    if not isinstance(access, UserAccess) or access.is_superuser != user.is_superuser:
+        access = build_user_access(user)
+        cache.set(key, access, timeout)
+    return access
+
+
+def user_access(user: User | AnonymousUser) -> UserAccess:
+    """Return the user's access snapshot, computing it at most once per request."""
+    access = getattr(user, ACCESS_ATTR, None)
+    if isinstance(access, UserAccess):
+        return access
+    timeout = _cache_seconds()
+    if timeout > 0 and user.is_authenticated and user.pk is not None:
+        access = _cached_user_access(user, timeout)
+    else:
+        access = build_user_access(user)
+    setattr(user, ACCESS_ATTR, access)
+    return access
+
+
+def forget_user_access(user: User | AnonymousUser) -> None:
+    """Drop the snapshot memoized on ``user`` (not the shared cache entry)."""
+    try:
+        delattr(user, ACCESS_ATTR)
+    except AttributeError:
+        pass
+
+
+def invalidate_user_access(user_ids: object) -> None:
+    """Bump the cache version of the given users' snapshots."""
+    if _cache_seconds() <= 0:
+        return
+    ids = user_ids if isinstance(user_ids, (list, set, tuple, frozenset)) else [user_ids]
+    cache.set_many({_user_version_key(pk): uuid4().hex for pk in ids if pk}, None)
+
+
+def invalidate_all_user_access() -> None:
+    """Bump the global version so every cached snapshot is rebuilt."""
+    if _cache_seconds() > 0:
+        cache.set(_GLOBAL_VERSION_KEY, uuid4().hex, None)
+
+
+def _groups_changed(sender, instance, action, reverse, pk_set, **kwargs) -> None:
+    if action not in {"post_add", "post_remove", "pre_clear", "post_clear"}:
+        return
+    if not reverse:
+        forget_user_access(instance)
+        invalidate_user_access(instance.pk)
+    elif action == "pre_clear":
+        invalidate_user_access(list(instance.user_set.values_list("pk", flat=True)))
+    elif pk_set:
+        invalidate_user_access(list(pk_set))
+
+
+def _role_assignment_changed(sender, instance, **kwargs) -> None:
+    invalidate_user_access(instance.user_id)
+
+
+def _group_changed(sender, instance, **kwargs) -> None:
+    invalidate_all_user_access()
+
+
+def _profile_changed(sender, instance, created: bool = True, **kwargs) -> None:
+    """Refresh profile ids when a person profile appears or disappears."""
+    if not created:
+        return
+    person = instance
+    if isinstance(instance, Faculty):
+        person = instance._state.fields_cache.get("staff_profile")
+        if person is None:
+            person = Staff.objects.filter(pk=instance.staff_profile_id).first()
+    user = person._state.fields_cache.get("user") if person else None
+    if user is not None:
+        forget_user_access(user)
+    if person is not None:
+        invalidate_user_access(person.user_id)
+
+
+def connect_user_access_signals() -> None:
+    """Invalidate snapshots on group, role assignment and profile changes."""
+    m2m_changed.connect(
+        _groups_changed,
+        sender=User.groups.through,
+        dispatch_uid="user_access_groups_changed",
+    )
+    for signal in (post_save, post_delete):
+        signal.connect(
+            _role_assignment_changed,
+            sender=RoleAssignment,
+            dispatch_uid=f"user_access_role_assignment_{signal is post_save}",
+        )
+        signal.connect(
+            _group_changed,
+            sender=Group,
+            dispatch_uid=f"user_access_group_{signal is post_save}",
+        )
+        for model in (Staff, Faculty, Donor, Student):
+            signal.connect(
+                _profile_changed,
+                sender=model,
+                dispatch_uid=f"user_access_{model.__name__}_{signal is post_save}",
+            )
+
+
+__all__ = [
+    "UserAccess",
+    "build_user_access",
+    "connect_user_access_signals",
+    "forget_user_access",
+    "invalidate_all_user_access",
+    "invalidate_user_access",
+    "user_access",
+]
@@ -12,6 +12,7 @@ from django.urls import NoReverseMatch, reverse
 from app.people.models.donor import Donor
 from app.people.models.faculty import Faculty
 from app.website.services.portal_types import ActionT, AdminShortcutT, RoleContextT
+from app.website.services.staff_access import user_access
 
 ADMIN_PORTAL_GROUPS = {"System Administrator", "IT Support"}
 AdminModelShortcutSpecT: TypeAlias = tuple[str, type[Model]]
@@ -24,11 +25,13 @@ def as_user(user: User | AnonymousUser) -> User:
 
 def user_gp_names(user: User) -> set[str]:
     """Return the group names attached to a user."""
-    return set(user.groups.values_list("name", flat=True))
+    return set(user_access(user).group_names)
 
 
 def get_faculty_profile(user: User) -> Faculty | None:
     """Return the faculty profile linked through staff, if present."""
+    if user_access(user).faculty_id is None:
+        return None
     staff = getattr(user, "staff", None)
     if not staff:
         return None
@@ -40,6 +43,8 @@ def get_faculty_profile(user: User) -> Faculty | None:
 
 def get_donor_profile(user: User) -> Donor | None:
     """Return the donor profile attached to a user, if any."""
+    if user_access(user).donor_id is None:
+        return None
     try:
         return user.donor
     except Donor.DoesNotExist:
@@ -8,6 +8,7 @@ from django.http import Http404, HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.urls import reverse
 
+from app.shared.perf import timed_block
 from app.website.services.portal_types import (
     ActionT,
     BreadcrumbT,
@@ -61,7 +62,8 @@ def render_role_dashboard(request: HttpRequest, role_slug: str) -> HttpResponse:
     config = ROLE_CONFIG.get(role_slug)
     if not config:
         raise Http404("Unknown staff dashboard.")
-    context = config["builder"](request)
+    with timed_block(f"staff.{role_slug}"):
+        context = config["builder"](request)
     accessible_links = _build_accessible_dashboard_links(
         _as_user(request.user), role_slug
     )
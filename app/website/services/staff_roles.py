@@ -20,7 +20,8 @@ from app.website.services.portal_types import (
     RoleTaskT,
     SidebarLinkT,
 )
-from app.website.services.staff_common import _as_user, _maybe_reverse, _user_gp_names
+from app.website.services.staff_access import user_access
+from app.website.services.staff_common import _as_user, _maybe_reverse
 from app.website.services.staff_contexts import (
     _build_cashier_context,
     _build_chair_context,
@@ -429,14 +430,19 @@ ROLE_ORDER: dict[str, int] = {slug: idx for idx, slug in enumerate(ROLE_PRIORITY
 LOW_VALUE_SWITCHER_SLUGS: frozenset[RoleSlugT] = frozenset({"staff", "general"})
 
 
-def _user_membership_slugs(user: User) -> set[str]:
+def _membership_slugs_for(group_names: Iterable[str]) -> set[str]:
+    names = set(group_names)
     return {
         slug
         for slug, config in ROLE_CONFIG.items()
-        if config["groups"] and _user_has_membership(user, slug)
+        if config["groups"] and names.intersection(config["groups"])
     }
 
 
+def _user_membership_slugs(user: User) -> set[str]:
+    return set(user_access(user).membership_roles)
+
+
 def _role_access_closure(role_slugs: Iterable[RoleSlugT]) -> set[RoleSlugT]:
     """Return every workspace reachable from the direct role memberships."""
     accessible = set(role_slugs)
@@ -452,17 +458,37 @@ def _role_access_closure(role_slugs: Iterable[RoleSlugT]) -> set[RoleSlugT]:
     return accessible
 
 
+def _primary_role_for(group_names: Iterable[str]) -> str:
+    names = set(group_names)
+    for slug in ROLE_PRIORITY:
+        config = ROLE_CONFIG.get(slug)
+        if not config:
+            continue
+        config_groups = config["groups"]
+        if not config_groups and slug == "general":
+            continue
+        if names.intersection(config_groups):
+            return slug
+    return "general"
+
+
+def role_access_for_groups(
+    group_names: Iterable[str], *, is_superuser: bool = False
+) -> tuple[frozenset[str], frozenset[str], str]:
+    """Return direct roles, accessible roles and primary role for group names."""
+    names = frozenset(group_names)
+    membership = _membership_slugs_for(names)
+    if is_superuser:
+        accessible = set(ROLE_CONFIG.keys())
+        if len(accessible) > 1:
+            accessible.discard("general")
+    else:
+        accessible = _role_access_closure(membership) or {"general"}
+    return frozenset(membership), frozenset(accessible), _primary_role_for(names)
+
+
 def _accessible_role_slugs(user: User) -> set[str]:
-    if user.is_superuser:
-        slugs = set(ROLE_CONFIG.keys())
-        if len(slugs) > 1:
-            slugs.discard("general")
-        return slugs
-    membership = _user_membership_slugs(user)
-    slugs = _role_access_closure(membership)
-    if not slugs:
-        return {"general"}
-    return slugs
+    return set(user_access(user).accessible_roles)
 
 
 def _build_accessible_dashboard_links(
@@ -557,10 +583,7 @@ def build_staff_sidebar_links(
 
 
 def _user_has_membership(user: User, role_slug: str) -> bool:
-    config = ROLE_CONFIG.get(role_slug)
-    if not config or not config["groups"]:
-        return False
-    return bool(_user_gp_names(user).intersection(config["groups"]))
+    return role_slug in user_access(user).membership_roles
 
 
 def user_can_access_role(user: User | AnonymousUser, role_slug: str) -> bool:
@@ -578,18 +601,7 @@ def user_can_access_role(user: User | AnonymousUser, role_slug: str) -> bool:
 
 def resolve_staff_role(user: User | AnonymousUser) -> str:
     """Resolve the highest-priority staff role for a user."""
-    user = _as_user(user)
-    group_names = _user_gp_names(user)
-    for slug in ROLE_PRIORITY:
-        config = ROLE_CONFIG.get(slug)
-        if not config:
-            continue
-        config_groups = config["groups"]
-        if not config_groups and slug == "general":
-            continue
-        if group_names.intersection(config_groups):
-            return slug
-    return "general"
+    return user_access(_as_user(user)).primary_role
 
 
 __all__ = [
@@ -602,5 +614,6 @@ __all__ = [
     "build_staff_role_switcher",
     "build_staff_sidebar_links",
     "resolve_staff_role",
+    "role_access_for_groups",
     "user_can_access_role",
 ]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TypeAlias, TypedDict
 
-from django.db.models import Q
+from django.db.models import Q, prefetch_related_objects
 
 from app.academics.models.curriculum_course import CurriCrs
 from app.academics.models.course import Course
@@ -195,9 +195,11 @@ def build_student_course_info(
             note="Required before registration",
         )
 
-    for group in curriculum_course.requirement_groups.all().prefetch_related(
-        "members__required_course"
-    ):
+    # Reuse the caller's prefetch cache when present instead of re-querying.
+    prefetch_related_objects(
+        [curriculum_course], "requirement_groups__members__required_course"
+    )
+    for group in curriculum_course.requirement_groups.all():
         if group.kind not in {
             ReqKind.PREREQ_ALL,
             ReqKind.PREREQ_ANY,
@@ -26,6 +26,8 @@ from app.finance.fee_assignment import (
     attach_sem_fee_stacks,
     optional_sem_stack_choices,
 )
+from app.finance.fee_quotes import prime_section_fee_quotes
+from app.finance.invoice_queue import mark_invoices_dirty
 from app.finance.models.invoice import CrsInvoice, StdSemesterInvoice
 from app.finance.models.payment import Payment
 from app.finance.payment_application import payment_application_for_parent_invoice
@@ -34,6 +36,8 @@ from app.people.models.student import Student
 from app.registry.gpa import effective_transcript_grades, get_grade_points_and_credits
 from app.registry.models.grade import Grade
 from app.registry.models.registration import Registration, RegistrationStatus
+from app.registry.seats import SectionFullError, register_with_seat
+from app.shared.perf import timed_block
 from app.timetable.choices import WEEKDAYS_NUMBER
 from app.timetable.models.section import Section
 from app.timetable.models.semester import Semester
@@ -42,7 +46,8 @@ from app.timetable.utils import format_datetime, format_short_datetime
 from app.website.views.course_requirements import (
     ReqCheckResultT,
     build_req_context,
-    eval_curri_crs_reqs,
+    eval_req_table,
+    load_req_table,
     req_failure_msgs,
 )
 from app.website.views.student_helpers import (
@@ -137,6 +142,7 @@ def _curri_level_hint(curriculum_course: CurriCrs) -> str:
     return ""
 
 
+@timed_block("student_dashboard")
 def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C901
     """Render the student dashboard backed with live data.
 
@@ -311,9 +317,6 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
             sections = (
                 Section.objects.filter(id__in=section_ids, semester=semester)
                 .select_related("curriculum_course__course")
-                .prefetch_related(
-                    "curriculum_course__requirement_groups__members__required_course"
-                )
                 .order_by("id")
             )
             existing_regs = Registration.objects.filter(
@@ -337,19 +340,18 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
                     section.curriculum_course
                 )
                 new_credit_total += int(section.curriculum_course.credit_hours.code)
-            requirement_context = build_req_context(student)
+            requirement_results = eval_req_table(
+                load_req_table(selected_curriculum_course_by_course_id.values()),
+                context=build_req_context(student),
+                selected_course_ids=selected_course_ids,
+            )
             blocked_by_requirements: dict[int, ReqCheckResultT] = {}
             requirement_errors_by_course: dict[int, str] = {}
             for (
                 course_id,
                 curriculum_course,
             ) in selected_curriculum_course_by_course_id.items():
-                requirement_result = eval_curri_crs_reqs(
-                    student=student,
-                    curriculum_course=curriculum_course,
-                    selected_course_ids=selected_course_ids,
-                    context=requirement_context,
-                )
+                requirement_result = requirement_results[curriculum_course.id]
                 if requirement_result["ok"]:
                     continue
                 blocked_by_requirements[course_id] = requirement_result
@@ -376,6 +378,7 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
             attempts_blocked = 0
             duplicate_course_skipped = 0
             requirement_blocked = 0
+            full_skipped = 0
             cooldown_cutoff = timezone.now() - timedelta(hours=48)
             blocked_courses = _attempt_blocked_crss(student, semester)
             cooldown_course_locks_for_register = _cooldown_crss(
@@ -412,25 +415,25 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
                     if course_id in blocked_by_requirements:
                         requirement_blocked += 1
                         continue
+                    try:
+                        registration, took_seat = register_with_seat(
+                            student_id=student.id,
+                            section_id=section.id,
+                            status=pending_status,
+                        )
+                    except SectionFullError:
+                        full_skipped += 1
+                        continue
                     selection_course_ids.add(course_id)
-                    registration, was_created = Registration.objects.get_or_create(
-                        student=student,
-                        section=section,
-                        defaults={"status": pending_status},
-                    )
-                    if was_created:
-                        created += 1
-                        current_course_ids.add(course_id)
-                        _ensure_invoice_for_reg(registration)
+                    if not took_seat:
+                        skipped += 1
                         continue
-                    if registration.status_id in {"canceled", "removed"}:
-                        registration.status = pending_status
-                        registration.save(update_fields=["status"])
+                    if section.id in existing_by_section:
                         updated += 1
-                        current_course_ids.add(course_id)
-                        _ensure_invoice_for_reg(registration)
                     else:
-                        skipped += 1
+                        created += 1
+                    current_course_ids.add(course_id)
+                    _ensure_invoice_for_reg(registration)
                 if semester is not None:
                     fee_assignment_summary = attach_sem_fee_stacks(
                         student=student,
@@ -464,6 +467,11 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
                     "info",
                     f"Skipped {skipped} section(s) already registered or unavailable.",
                 )
+            if full_skipped:
+                full_msg = f"{full_skipped} section(s) are full; no seat was reserved."
+                _push_msg("error", full_msg)
+                if _is_ajax_request() and not (created or updated):
+                    return JsonResponse({"ok": False, "message": full_msg}, status=400)
             if cooldown_skipped:
                 _push_msg(
                     "warning",
@@ -574,7 +582,9 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
                             or has_semester_fees
                             or has_non_reversible_history
                         ):
-                            parent_invoice.refresh_totals_from_sources(save_model=True)
+                            mark_invoices_dirty(
+                                [parent_invoice.id], reason="registration_cancel"
+                            )
                             continue
                         Payment.objects.filter(
                             student_semester_invoice=parent_invoice,
@@ -582,7 +592,9 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
                         ).delete()
                         if parent_invoice.payments.exists():
                             # Keep SSI when non-pending payments are still present.
-                            parent_invoice.refresh_totals_from_sources(save_model=True)
+                            mark_invoices_dirty(
+                                [parent_invoice.id], reason="registration_cancel"
+                            )
                             continue
                         parent_invoice.delete()
             _push_msg("success", "Registration canceled.")
@@ -695,7 +707,9 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
 
     course_status_rows = []
     course_status_total_credits = 0
-    for reg in registrations:
+    registration_list = list(registrations)
+    prime_section_fee_quotes(reg.section for reg in registration_list)
+    for reg in registration_list:
         if reg.status_id == "canceled":
             continue
         section = reg.section
@@ -740,10 +754,10 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
     curriculum_courses_qs = (
         CurriCrs.objects.filter(curriculum=curriculum)
         .select_related("course", "credit_hours")
-        .prefetch_related("requirement_groups__members__required_course")
         .order_by("course__short_code")
     )
     curriculum_courses = list(curriculum_courses_qs)
+    requirement_table = load_req_table(curriculum_courses)
     curriculum_course_ids = [cc.id for cc in curriculum_courses]
     course_ids = [cc.course_id for cc in curriculum_courses]
 
@@ -767,6 +781,9 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
     sections_by_course: dict[int, list[Section]] = defaultdict(list)
     for section in dashboard_sections_qs:
         sections_by_course[section.curriculum_course.course_id].append(section)
+    prime_section_fee_quotes(
+        section for sections in sections_by_course.values() for section in sections
+    )
 
     registered_course_ids: set[int] = set()
     pending_course_ids: set[int] = set()
@@ -832,16 +849,22 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
             prereq_course.id in passed_course_ids,
         )
     for curriculum_course in curriculum_courses:
-        for req_group in curriculum_course.requirement_groups.all():
-            if req_group.kind not in {ReqKind.PREREQ_ALL, ReqKind.PREREQ_ANY}:
+        for rule in requirement_table[curriculum_course.id]["rules"]:
+            if rule["group_kind"] not in {ReqKind.PREREQ_ALL, ReqKind.PREREQ_ANY}:
                 continue
-            for member in req_group.members.all():
-                required_course = member.required_course
+            for required_id, label in zip(
+                rule["member_ids"], rule["member_labels"], strict=True
+            ):
                 _append_prereq_chip(
                     curriculum_course.course_id,
-                    required_course.short_code or required_course.code,
-                    required_course.id in passed_course_ids,
+                    label,
+                    required_id in passed_course_ids,
                 )
+    requirement_results = eval_req_table(
+        requirement_table,
+        context=requirement_context,
+        selected_by_curri_crs={cc.id: {cc.course_id} for cc in curriculum_courses},
+    )
 
     available_courses: list[CourseCardT] = []
     registered_courses: list[CourseCardT] = []
@@ -853,12 +876,7 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
         course_sections = sections_by_course.get(course.id, [])
         has_scheduled_section = bool(course_sections)
         prereq_data = prereq_map.get(course.id, [])
-        requirement_result = eval_curri_crs_reqs(
-            student=student,
-            curriculum_course=cc,
-            selected_course_ids={course.id},
-            context=requirement_context,
-        )
+        requirement_result = requirement_results[cc.id]
         requirement_failures = requirement_result["failures"]
         blocking_failures = [
             failure
@@ -1006,6 +1024,7 @@ def student_dashboard_response(request: HttpRequest) -> HttpResponse:  # noqa: C
         "section__curriculum_course__credit_hours",
     )
     pending_registrations_list = list(pending_registrations)
+    prime_section_fee_quotes(reg.section for reg in pending_registrations_list)
     pending_total = sum(
         (
             reg.section.fee_total_amount()
@@ -7,12 +7,12 @@ from typing import Iterable, TypeAlias, TypedDict
 from app.academics.models.curriculum_course import CurriCrs
 from app.academics.models.requirement_group import (
     CurriCrsReqGp,
+    CurriCrsReqMember,
     ReqKind,
 )
 from app.people.models.student import Student
 
 CrsIdsT: TypeAlias = set[int]
-CrsLabelPairT: TypeAlias = tuple[int, str]
 ReqFailureListT: TypeAlias = list["ReqFailureT"]
 
 
@@ -52,35 +52,109 @@ def build_req_context(student: Student) -> ReqContextT:
     }
 
 
-def _gp_member_pairs(
-    group: CurriCrsReqGp,
-) -> list[CrsLabelPairT]:
-    """Return `(course_id, display_label)` pairs for one requirement group."""
-    return [
-        (
-            member.required_course_id,
-            member.required_course.short_code or member.required_course.code,
+class ReqRuleT(TypedDict):
+    """One requirement group flattened to parallel member id/label arrays."""
+
+    group_id: int
+    group_kind: str
+    group_label: str
+    member_ids: list[int]
+    member_labels: list[str]
+
+
+class CrsReqRulesT(TypedDict):
+    """All requirement rules attached to one curriculum course."""
+
+    min_credits: int
+    rules: list[ReqRuleT]
+
+
+# Keyed by curriculum-course id.
+ReqTableT: TypeAlias = dict[int, CrsReqRulesT]
+ReqResultMapT: TypeAlias = dict[int, ReqCheckResultT]
+
+
+def _crs_label(short_code: str | None, code: str | None) -> str:
+    return short_code or code or ""
+
+
+def load_req_table(curriculum_courses: Iterable[CurriCrs]) -> ReqTableT:
+    """Load requirement rules for many curriculum courses in two queries.
+
+    Args:
+        curriculum_courses: Already-loaded curriculum courses; only their ids and
+            ``min_validated_credits`` are read.
+
+    Returns:
+        Rule table keyed by curriculum-course id, groups and members kept in
+        their model ordering.
+    """
+    table: ReqTableT = {
+        cc.id: {"min_credits": int(cc.min_validated_credits or 0), "rules": []}
+        for cc in curriculum_courses
+    }
+    if not table:
+        return table
+    rules_by_group: dict[int, ReqRuleT] = {}
+    groups = (
+        CurriCrsReqGp.objects.filter(curriculum_course_id__in=list(table))
+        .order_by("curriculum_course_id", "order", "id")
+        .values_list("id", "curriculum_course_id", "kind", "label")
+    )
+    for group_id, curri_crs_id, kind, label in groups:
+        rule: ReqRuleT = {
+            "group_id": group_id,
+            "group_kind": kind,
+            "group_label": label,
+            "member_ids": [],
+            "member_labels": [],
+        }
+        rules_by_group[group_id] = rule
+        table[curri_crs_id]["rules"].append(rule)
+    members = (
+        CurriCrsReqMember.objects.filter(group_id__in=list(rules_by_group))
+        .order_by("group_id", "order", "required_course__code")
+        .values_list(
+            "group_id",
+            "required_course_id",
+            "required_course__short_code",
+            "required_course__code",
         )
-        for member in group.members.all()
-    ]
+    )
+    for group_id, course_id, short_code, code in members:
+        rule = rules_by_group[group_id]
+        rule["member_ids"].append(course_id)
+        rule["member_labels"].append(_crs_label(short_code, code))
+    return table
 
 
-def eval_curri_crs_reqs(
+def _missing_failure(
+    rule: ReqRuleT,
+    code: str,
+    missing_ids: list[int],
+    missing_labels: list[str],
+) -> ReqFailureT:
+    return {
+        "group_id": rule["group_id"],
+        "group_kind": rule["group_kind"],
+        "group_label": rule["group_label"],
+        "code": code,
+        "missing_course_ids": missing_ids,
+        "missing_course_labels": missing_labels,
+    }
+
+
+def _eval_rules(
+    crs_rules: CrsReqRulesT,
     *,
-    student: Student,
-    curriculum_course: CurriCrs,
-    selected_course_ids: Iterable[int],
-    context: ReqContextT | None = None,
+    passed_ids: CrsIdsT,
+    selected_ids: CrsIdsT,
+    validated_credits: int,
 ) -> ReqCheckResultT:
-    """Evaluate credit/prerequisite/corequisite rules for one curriculum course."""
-    eval_context = context or build_req_context(student)
-    selected_ids = set(selected_course_ids)
-    passed_ids = eval_context["passed_course_ids"]
-    validated_credits = int(eval_context["validated_credits"])
-
+    """Evaluate one course's rules against the student's passed/selected sets."""
     failures: ReqFailureListT = []
 
-    min_credits = int(curriculum_course.min_validated_credits or 0)
+    min_credits = crs_rules["min_credits"]
     if validated_credits < min_credits:
         failures.append(
             {
@@ -91,74 +165,102 @@ def eval_curri_crs_reqs(
             }
         )
 
-    groups = curriculum_course.requirement_groups.all().prefetch_related(
-        "members__required_course"
-    )
-    for group in groups:
-        member_pairs = _gp_member_pairs(group)
-        if not member_pairs:
+    for rule in crs_rules["rules"]:
+        member_ids = rule["member_ids"]
+        if not member_ids:
             continue
-        group_common: ReqFailureT = {
-            "group_id": group.id,
-            "group_kind": group.kind,
-            "group_label": group.label,
-        }
-
-        if group.kind == ReqKind.PREREQ_ALL:
-            missing_pairs = [
-                (course_id, label)
-                for course_id, label in member_pairs
-                if course_id not in passed_ids
-            ]
-            if missing_pairs:
+        kind = rule["group_kind"]
+        if kind == ReqKind.PREREQ_ANY:
+            if not any(course_id in passed_ids for course_id in member_ids):
                 failures.append(
-                    {
-                        **group_common,
-                        "code": "missing_prereq_all",
-                        "missing_course_ids": [
-                            course_id for course_id, _ in missing_pairs
-                        ],
-                        "missing_course_labels": [label for _, label in missing_pairs],
-                    }
+                    _missing_failure(
+                        rule,
+                        "unsatisfied_prereq_any",
+                        list(member_ids),
+                        list(rule["member_labels"]),
+                    )
                 )
             continue
-
-        if group.kind == ReqKind.PREREQ_ANY:
-            has_any_match = any(course_id in passed_ids for course_id, _ in member_pairs)
-            if not has_any_match:
-                failures.append(
-                    {
-                        **group_common,
-                        "code": "unsatisfied_prereq_any",
-                        "missing_course_ids": [
-                            course_id for course_id, _ in member_pairs
-                        ],
-                        "missing_course_labels": [label for _, label in member_pairs],
-                    }
-                )
+        if kind == ReqKind.PREREQ_ALL:
+            code, pool = "missing_prereq_all", passed_ids
+        elif kind == ReqKind.COREQ_ALL:
+            code, pool = "incomplete_coreq_all", selected_ids
+        else:
             continue
-
-        if group.kind == ReqKind.COREQ_ALL:
-            missing_pairs = [
-                (course_id, label)
-                for course_id, label in member_pairs
-                if course_id not in selected_ids
-            ]
-            if missing_pairs:
-                failures.append(
-                    {
-                        **group_common,
-                        "code": "incomplete_coreq_all",
-                        "missing_course_ids": [
-                            course_id for course_id, _ in missing_pairs
-                        ],
-                        "missing_course_labels": [label for _, label in missing_pairs],
-                    }
+        missing = [
+            index for index, course_id in enumerate(member_ids) if course_id not in pool
+        ]
+        if missing:
+            failures.append(
+                _missing_failure(
+                    rule,
+                    code,
+                    [member_ids[index] for index in missing],
+                    [rule["member_labels"][index] for index in missing],
                 )
+            )
 
     return {"ok": not failures, "failures": failures}
 
 
+def eval_req_table(
+    table: ReqTableT,
+    *,
+    context: ReqContextT,
+    selected_course_ids: Iterable[int] | None = None,
+    selected_by_curri_crs: dict[int, CrsIdsT] | None = None,
+) -> ReqResultMapT:
+    """Evaluate every course in a rule table in one pass.
+
+    Args:
+        table: Rule table from :func:`load_req_table`.
+        context: Student facts from :func:`build_req_context`.
+        selected_course_ids: Course ids selected together (shared by all rows).
+        selected_by_curri_crs: Optional per-curriculum-course selection overriding
+            ``selected_course_ids``; the dashboard evaluates each course alone.
+
+    Returns:
+        Requirement result keyed by curriculum-course id.
+    """
+    passed_ids = context["passed_course_ids"]
+    validated_credits = int(context["validated_credits"])
+    shared_selected = set(selected_course_ids or ())
+    per_course = selected_by_curri_crs or {}
+    return {
+        curri_crs_id: _eval_rules(
+            crs_rules,
+            passed_ids=passed_ids,
+            selected_ids=per_course.get(curri_crs_id, shared_selected),
+            validated_credits=validated_credits,
+        )
+        for curri_crs_id, crs_rules in table.items()
+    }
+
+
+def eval_curri_crs_reqs(
+    *,
+    student: Student,
+    curriculum_course: CurriCrs,
+    selected_course_ids: Iterable[int],
+    context: ReqContextT | None = None,
+    table: ReqTableT | None = None,
+) -> ReqCheckResultT:
+    """Evaluate credit/prerequisite/corequisite rules for one curriculum course.
+
+    Callers evaluating several courses should pass a ``table`` loaded once with
+    :func:`load_req_table`; without it the course's rules cost two queries.
+    """
+    eval_context = context or build_req_context(student)
+    if table is None or curriculum_course.id not in table:
+        table = load_req_table([curriculum_course])
+    return _eval_rules(
+        table[curriculum_course.id],
+        passed_ids=eval_context["passed_course_ids"],
+        selected_ids=set(selected_course_ids),
+        validated_credits=int(eval_context["validated_credits"]),
+    )
+
+
 def req_failure_msgs(
     failures: ReqFailureListT,
 ) -> list[str]:
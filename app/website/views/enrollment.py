@@ -62,7 +62,11 @@ class StdAdminLookupForm(forms.Form):
             "program": None,
             "semester": None,
         }
-        student = apply_student_filters(student_search_queryset(), filters).first()
+        student = (
+            apply_student_filters(student_search_queryset(), filters)
+            .order_by("-search_rank", "student_id")
+            .first()
+        )
         if not student:
             raise forms.ValidationError("Select a student from the autocomplete list.")
         cleaned["student"] = student.pk
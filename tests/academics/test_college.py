@@ -4,6 +4,7 @@ from datetime import date
 
 import pytest
 from app.registry.models.grade import Grade, GradeValue
+from app.registry.models.standing import StdStanding
 from app.timetable.models.academic_year import AcademicYear
 from app.timetable.models.semester import Semester
 from app.timetable.models.section import Section
@@ -68,3 +69,21 @@ def test_college_computed_fields(
         f"{college.departments.all()}"
     )
     assert "sophomore: 1" in college.std_counts_by_level, f"{college.std_counts_by_level}"
+
+
+def test_college_level_counts_keep_students_with_equal_credits(
+    curri_factory, std_factory
+):
+    """Students sharing a credit total are each counted in their level."""
+    curriculum = curri_factory("CUR2")
+    for uname in ("twin_a", "twin_b"):
+        student = std_factory(uname, curriculum.short_name)
+        StdStanding.objects.update_or_create(
+            student=student, defaults={"earned_credits": 40}
+        )
+    newcomer = std_factory("newcomer", curriculum.short_name)
+    StdStanding.objects.filter(student=newcomer).delete()
+
+    counts = curriculum.college.std_counts_by_level
+    assert "sophomore: 2" in counts, counts
+    assert "freshman: 1" in counts, counts
@@ -0,0 +1,171 @@
+"""Tests for the fuzzy catalog index behind course/curriculum fuzzy reuse."""
+
+import random
+
+import pytest
+from django.db import transaction
+
+from app.academics.fuzzy_catalog import CATALOG_INDEX, COURSE_TOKENS, min_length_ratio
+from app.academics.models.college import College
+from app.academics.models.course import Course
+from app.academics.models.curriculum import Curriculum
+from app.academics.models.department import Department
+from app.shared.fuzzy_matching import jarowinkler_similarity, token_similarity
+from app.shared.identity_map import identity_map_scope
+
+pytestmark = pytest.mark.django_db
+
+TITLES = ["Calculus", "Calculus I", "Algebra", "Biology", "Chemistry", "Physics"]
+
+
+def _scan_course(department, number, title, threshold):
+    """Reference: the per-row scan find_fuzzy_match used to run."""
+    token = Course.objects._token(department, number, title)
+    best = (None, 0.0)
+    for course in Course.objects.filter(department=department):
+        other = Course.objects._token(course.department, course.number, course.title)
+        score, ok = token_similarity(token, other, threshold=threshold)
+        if ok and score > best[1]:
+            best = (course, score)
+    return best[0]
+
+
+def _curri_key(cur, score, dft_code):
+    has_long = bool(cur.long_name and cur.long_name != cur.short_name)
+    return (score, has_long, cur.college.code != dft_code, -cur.id)
+
+
+def _scan_curri(short_name, long_name, college, threshold):
+    """Reference: the per-row curriculum scan with its tie-breaking rules."""
+    token = Curriculum.objects._token(short_name, long_name)
+    dft_code = College.get_dft().code
+    best = (None, 0.0)
+    for cur in Curriculum.objects.all():
+        if dft_code not in (cur.college.code, college.code) and (
+            cur.college.code != college.code
+        ):
+            continue
+        other = Curriculum.objects._token(cur.short_name, cur.long_name)
+        score, ok = token_similarity(token, other, threshold=threshold)
+        if not ok or score <= 0:
+            continue
+        if best[0] is None or _curri_key(cur, score, dft_code) > _curri_key(
+            best[0], best[1], dft_code
+        ):
+            best = (cur, score)
+    return best
+
+
+def test_length_window_never_drops_a_match():
+    """Tokens outside the length window cannot reach the threshold."""
+    rng = random.Random(3)
+    alphabet = "abcde"
+    for _ in range(2000):
+        threshold = rng.choice([0.85, 0.9, 0.95])
+        left = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+        right = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+        short, long = sorted((len(left), len(right)))
+        if short / long < min_length_ratio(threshold):
+            assert jarowinkler_similarity(left, right) < threshold
+
+
+def test_course_lookup_matches_reference_scan():
+    """Indexed lookups return what the per-row scan returned."""
+    rng = random.Random(11)
+    college = College.objects.create(code="FZC")
+    department = Department.objects.create(code="FZD", college=college)
+    for index in range(60):
+        Course.objects.create(
+            department=department,
+            number=f"{rng.randint(100, 130)}{rng.choice(['', 'A', 'B'])}{index}",
+            title=rng.choice(TITLES + [None]),
+        )
+    for _ in range(80):
+        number = f"{rng.randint(100, 130)}{rng.choice(['', 'A'])}{rng.randint(0, 59)}"
+        title = rng.choice(TITLES + [None])
+        threshold = rng.choice([0.8, 0.85, 0.9, 0.95])
+        expected = _scan_course(department, number, title, threshold)
+        found = Course.objects.find_fuzzy_match(
+            department=department, number=number, title=title, threshold=threshold
+        )
+        assert found == expected, (number, title, threshold)
+
+
+def test_curriculum_lookup_matches_reference_scan():
+    """Curriculum lookups keep the college rule and the tie-breaking."""
+    rng = random.Random(5)
+    colleges = [College.get_dft()] + [
+        College.objects.create(code=code, long_name=code) for code in ("FZX", "FZY")
+    ]
+    names = ["BSCS", "BS CS", "BSC", "BSIT", "BSN", "BA ENG"]
+    for index in range(40):
+        short = f"{rng.choice(names)}{rng.choice(['', str(index)])}"
+        Curriculum.objects.get_or_create(
+            short_name=short,
+            college=rng.choice(colleges),
+            defaults={"long_name": rng.choice(["", short, f"Bachelor {short}"])},
+        )
+    for _ in range(60):
+        short = rng.choice(names)
+        long_name = rng.choice(["", f"Bachelor {short}"])
+        college = rng.choice(colleges)
+        threshold = rng.choice([0.8, 0.9])
+        assert Curriculum.objects.find_fuzzy_match(
+            short_name=short, long_name=long_name, college=college, threshold=threshold
+        ) == _scan_curri(short, long_name, college, threshold)
+
+
+def test_index_loads_once_and_follows_saves(django_assert_num_queries):
+    """Lookups reuse the loaded partition; saves invalidate it."""
+    college = College.objects.create(code="FZI")
+    department = Department.objects.create(code="FZI", college=college)
+    algebra = Course.objects.create(department=department, number="101", title="Algebra")
+    Course.objects.find_fuzzy_match(department=department, number="101", title="Algebra")
+
+    # Only the winner is re-read.
+    with django_assert_num_queries(1):
+        found = Course.objects.find_fuzzy_match(
+            department=department, number="101", title="Algebr"
+        )
+    assert found == algebra
+
+    optics = Course.objects.create(department=department, number="205", title="Optics")
+    # The save updated the loaded partition instead of dropping it.
+    with django_assert_num_queries(1):
+        found = Course.objects.find_fuzzy_match(
+            department=department, number="205", title="Optic"
+        )
+    assert found == optics
+
+    Course.objects.filter(pk=optics.pk).delete()
+    assert (
+        Course.objects.find_fuzzy_match(
+            department=department, number="205", title="Optic"
+        )
+        is None
+    )
+    assert CATALOG_INDEX.course_partition(department.id, list).pks == {algebra.pk}
+
+
+def test_index_follows_rollbacks_and_scopes():
+    """Partitions changed in a rolled-back savepoint go; scopes start empty."""
+    college = College.objects.create(code="FZR")
+    department = Department.objects.create(code="FZR", college=college)
+    Course.objects.create(department=department, number="101", title="Algebra")
+    Course.objects.find_fuzzy_match(department=department, number="101", title="Algebra")
+    assert department.id in COURSE_TOKENS
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            Course.objects.create(department=department, number="301", title="Topology")
+            raise RuntimeError("abort")
+
+    assert department.id not in COURSE_TOKENS
+    assert (
+        Course.objects.find_fuzzy_match(
+            department=department, number="301", title="Topology"
+        )
+        is None
+    )
+    with identity_map_scope():
+        assert department.id not in COURSE_TOKENS
@@ -0,0 +1,131 @@
+"""Tests for the set-based registration invoice materialization."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+
+from app.finance.bulk_invoices import bulk_materialize_registration_invoices
+from app.finance.models.fee_stack import FeeStack, FeeStackLine
+from app.finance.models.invoice import CrsInvoice, StdSemesterInvoice
+from app.finance.models.payment import Payment
+from app.finance.models.status_types_methods import FeeType, PaymentStatus
+from app.finance.registration_invoices import (
+    invoiceable_registration_qs,
+    materialize_registration_invoices,
+)
+from app.registry.models.registration import Registration
+from app.registry.models.status_types import RegistrationStatus
+
+pytestmark = pytest.mark.django_db
+
+
+def _snapshot() -> dict[str, object]:
+    """Return invoice, parent and registration state keyed by natural keys."""
+    return {
+        "invoices": {
+            (row.student_id, row.curriculum_course_id, row.semester_id): (
+                row.initial_amount_due,
+                row.balance,
+                row.status_id,
+                row.student_semester_invoice.semester_id,
+            )
+            for row in CrsInvoice.objects.select_related("student_semester_invoice")
+        },
+        "parents": {
+            (row.student_id, row.semester_id): (
+                row.initial_amount_due,
+                row.required_deposit_amount,
+                row.balance,
+                row.fee_payer_id,
+                row.status_id,
+            )
+            for row in StdSemesterInvoice.objects.all()
+        },
+        "registrations": dict(Registration.objects.values_list("pk", "status_id")),
+    }
+
+
+def _run(materialize) -> tuple[dict[str, object], dict[str, object]]:
+    """Materialize every invoiceable registration, snapshot and roll back."""
+    with transaction.atomic():
+        registrations = list(invoiceable_registration_qs(missing_only=False))
+        summary = materialize(registrations)
+        state = _snapshot()
+        transaction.set_rollback(True)
+    return summary, state
+
+
+@pytest.fixture
+def backlog(std_factory, sec_factory) -> None:
+    """Students with missing, stale, orphaned and duplicate invoices."""
+    students = [std_factory(f"bulk_std_{index}", "CURRI_BULK") for index in range(3)]
+    sections = [sec_factory(f"9{index:02d}", "CURRI_BULK") for index in range(4)]
+    sections.append(sec_factory("950", "CURRI_BULK", 1, 2))
+    for student in students:
+        for section in sections:
+            Registration.objects.create(student=student, section=section)
+    duplicate = sec_factory("900", "CURRI_BULK", 2)
+    Registration.objects.create(student=students[0], section=duplicate)
+    cleared = Registration.objects.create(
+        student=students[2], section=sec_factory("960", "CURRI_BULK")
+    )
+    Registration.objects.filter(pk=cleared.pk).update(status=RegistrationStatus.cleared())
+
+    first, second, third = students
+    semester = sections[0].semester
+    stale = CrsInvoice.objects.create(
+        student=first,
+        curriculum_course=sections[1].curriculum_course,
+        semester=semester,
+        initial_amount_due=Decimal("0.00"),
+    )
+    Payment.objects.create(
+        student_semester_invoice=stale.student_semester_invoice,
+        amount_paid=Decimal("60.00"),
+        status=PaymentStatus.cleared(),
+    )
+    orphan = CrsInvoice.objects.create(
+        student=second,
+        curriculum_course=sections[2].curriculum_course,
+        semester=semester,
+        initial_amount_due=Decimal("10.00"),
+    )
+    CrsInvoice.objects.filter(pk=orphan.pk).update(
+        student_semester_invoice=None, balance=None
+    )
+    parent = StdSemesterInvoice.objects.create(student=third, semester=semester)
+    fee_type, _ = FeeType.objects.get_or_create(code="lab", defaults={"label": "Lab"})
+    stack = FeeStack.objects.create(name="Bulk Stack", payer_id="gov")
+    FeeStackLine.objects.create(fee_stack=stack, fee_type=fee_type, amount=Decimal(20))
+    parent.fee_stacks.add(stack)
+
+
+def test_bulk_path_matches_per_row_path(backlog) -> None:
+    """Both engines leave the same invoices, parents and registrations."""
+    per_row_summary, per_row_state = _run(materialize_registration_invoices)
+    bulk_summary, bulk_state = _run(bulk_materialize_registration_invoices)
+
+    assert bulk_summary == per_row_summary
+    assert bulk_summary["created"] and bulk_summary["updated"]
+    assert bulk_state == per_row_state
+
+
+def test_bulk_path_runs_constant_queries(backlog, django_assert_max_num_queries) -> None:
+    """The statement count does not grow with the number of registrations."""
+    registrations = list(invoiceable_registration_qs(missing_only=False))
+    with django_assert_max_num_queries(50):
+        bulk_materialize_registration_invoices(registrations)
+
+
+def test_backfill_command_reports_bulk_phases(backlog, capsys) -> None:
+    """The command prints per-phase timings and writes nothing on dry runs."""
+    before = CrsInvoice.objects.count()
+    call_command("backfill_registration_invoices", include_existing=True, dry_run=True)
+    output = capsys.readouterr().out
+    assert "parent_totals:" in output
+    assert "registration_statuses:" in output
+    assert CrsInvoice.objects.count() == before
@@ -0,0 +1,158 @@
+"""Tests for the in-memory child invoice balance allocation."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from django.db import transaction
+
+from app.finance.models.invoice import (
+    CrsInvoice,
+    StdSemesterInvoice,
+    _clamp_non_negative,
+    _quantize_money,
+)
+from app.finance.models.status_types_methods import InvoiceStatus
+from app.registry.models.registration import Registration
+from app.registry.models.status_types import RegistrationStatus
+
+pytestmark = pytest.mark.django_db
+
+REGISTRATION_CODES = ["pending", "partialy_cleared", "cleared", "canceled"]
+
+
+def _legacy_status(child: CrsInvoice) -> None:
+    balance = child.get_balance()
+    if balance == child.initial_amount_due:
+        child.status = InvoiceStatus.initial()
+    elif balance == Decimal("0.00"):
+        child.status = InvoiceStatus.cleared()
+    elif balance <= child.clearance_balance():
+        child.status = InvoiceStatus.settled()
+    else:
+        child.status = InvoiceStatus.updated()
+
+
+def _legacy_regio_status(invoice: CrsInvoice) -> None:
+    cleared_status = RegistrationStatus.cleared()
+    if invoice.status_id in {"initial", "updated"}:
+        reg_status = RegistrationStatus.pending()
+    if invoice.status_id == "settled":
+        reg_status = RegistrationStatus.partialy_cleared()
+    if invoice.status_id == "cleared":
+        reg_status = cleared_status
+    Registration.objects.filter(
+        student=invoice.student,
+        section__curriculum_course=invoice.curriculum_course,
+        section__semester=invoice.semester,
+    ).exclude(status=cleared_status).update(status=reg_status)
+
+
+def _legacy_refresh(parent: StdSemesterInvoice, course_total: Decimal) -> None:
+    """The per-row propagation this change replaced, kept as the reference."""
+    child_invoices = list(parent.course_invoices.select_related("status").order_by("pk"))
+    if not child_invoices:
+        return
+    if parent.initial_amount_due <= Decimal("0.00") or course_total <= Decimal("0.00"):
+        course_balance_total = Decimal("0.00")
+    else:
+        course_balance_total = _quantize_money(
+            parent.get_balance() * (course_total / parent.initial_amount_due)
+        )
+    remaining_balance = _clamp_non_negative(course_balance_total)
+    for index, child_invoice in enumerate(child_invoices):
+        if index == len(child_invoices) - 1:
+            child_balance = _clamp_non_negative(remaining_balance)
+        else:
+            child_balance = min(child_invoice.initial_amount_due, remaining_balance)
+        remaining_balance = _clamp_non_negative(remaining_balance - child_balance)
+        child_invoice.balance = child_balance
+        _legacy_status(child_invoice)
+        CrsInvoice.objects.filter(pk=child_invoice.pk).update(
+            balance=child_invoice.balance, status_id=child_invoice.status_id
+        )
+        _legacy_regio_status(child_invoice)
+
+
+def _state() -> tuple[dict[int, tuple[Decimal, str]], dict[int, str]]:
+    return (
+        {
+            pk: (balance, status)
+            for pk, balance, status in CrsInvoice.objects.values_list(
+                "pk", "balance", "status_id"
+            )
+        },
+        dict(Registration.objects.values_list("pk", "status_id")),
+    )
+
+
+def _propagate(refresh, parent: StdSemesterInvoice, course_total: Decimal):
+    with transaction.atomic():
+        refresh(parent, course_total)
+        state = _state()
+        transaction.set_rollback(True)
+    return state
+
+
+def _money(rng: random.Random, high: int) -> Decimal:
+    return Decimal(rng.randint(0, high)) / 100
+
+
+@pytest.fixture
+def random_parents(std_factory, sec_factory, sem_factory) -> list[StdSemesterInvoice]:
+    """Parents with random children, balances and registration statuses."""
+    rng = random.Random(1515)
+    for code in REGISTRATION_CODES:
+        RegistrationStatus.get_by_code(code)
+    semester = sem_factory(1, datetime(2024, 9, 1))
+    parents = []
+    for trial in range(12):
+        student = std_factory(f"alloc_std_{trial}", "CURRI_ALLOC")
+        parent = StdSemesterInvoice.objects.create(student=student, semester=semester)
+        children = []
+        for index in range(rng.randint(1, 8)):
+            section = sec_factory(f"6{index:02d}", "CURRI_ALLOC", trial + 1)
+            registration = Registration.objects.create(student=student, section=section)
+            Registration.objects.filter(pk=registration.pk).update(
+                status_id=rng.choice(REGISTRATION_CODES)
+            )
+            children.append(
+                CrsInvoice(
+                    student=student,
+                    curriculum_course=section.curriculum_course,
+                    semester=semester,
+                    student_semester_invoice=parent,
+                    initial_amount_due=_money(rng, 40000) * rng.choice([0, 1, 1, 1]),
+                    balance=_money(rng, 40000),
+                    status_id="initial",
+                )
+            )
+        CrsInvoice.objects.bulk_create(children)
+        course_total = sum((child.initial_amount_due for child in children), Decimal(0))
+        parent.initial_amount_due = _quantize_money(course_total + _money(rng, 9000))
+        parent.balance = _money(rng, int(parent.initial_amount_due * 100) + 2000)
+        parent.course_total = course_total
+        parents.append(parent)
+    return parents
+
+
+def test_bulk_allocation_matches_per_row_updates(random_parents) -> None:
+    """Balances, statuses and registrations match the per-row reference."""
+    for parent in random_parents:
+        expected = _propagate(_legacy_refresh, parent, parent.course_total)
+        actual = _propagate(
+            StdSemesterInvoice._refresh_crs_invoice_balances, parent, parent.course_total
+        )
+        assert actual == expected
+
+
+def test_propagation_statement_count_is_flat(
+    random_parents, django_assert_max_num_queries
+) -> None:
+    """Eight children cost the same few statements as one."""
+    parent = max(random_parents, key=lambda item: item.course_invoices.count())
+    with django_assert_max_num_queries(12):
+        parent._refresh_crs_invoice_balances(parent.course_total)
@@ -0,0 +1,185 @@
+"""Tests for the stored course fee quotes."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.academics.models.course import Course
+from app.academics.models.curriculum_course import CurriCrs
+from app.academics.models.department import Department
+from app.finance import course_fee_policy
+from app.finance.fee_quotes import (
+    build_fee_quote,
+    fee_quote_for,
+    prime_section_fee_quotes,
+    rebuild_sem_fee_quotes,
+)
+from app.finance.models.fee_quote import CrsFeeQuote
+from app.finance.models.fee_stack import CrsFeeStack, FeeStack, FeeStackLine
+from app.finance.models.status_types_methods import FeeType
+from app.timetable.models.academic_year import AcademicYear
+from app.shared.models import CreditHour
+from app.timetable.models.section import Section
+from app.timetable.models.semester import Semester
+
+pytestmark = pytest.mark.django_db
+
+
+def _lab_stack(name: str, amount: str) -> FeeStack:
+    fee_type, _ = FeeType.objects.get_or_create(code="lab", defaults={"label": "Lab"})
+    stack = FeeStack.objects.create(name=name)
+    FeeStackLine.objects.create(
+        fee_stack=stack, fee_type=fee_type, amount=Decimal(amount)
+    )
+    return stack
+
+
+def _sections(curriculum_course_factory, semester, count: int) -> list[Section]:
+    return [
+        Section.objects.create(
+            semester=semester,
+            curriculum_course=curriculum_course_factory(f"3{index:02d}", "CURRI_QUOTE"),
+            number=1,
+        )
+        for index in range(count)
+    ]
+
+
+def test_primed_sections_read_prices_without_queries(
+    curriculum_course_factory, sem_factory, django_assert_num_queries
+) -> None:
+    """One bulk read prices every section; the quote matches a live build."""
+    semester = sem_factory(1, datetime(2024, 9, 1))
+    sections = _sections(curriculum_course_factory, semester, 6)
+    stack = _lab_stack("Quote Lab", "15.00")
+    course = sections[0].curriculum_course.course
+    CrsFeeStack.objects.create(course=course, fee_stack=stack)
+
+    rebuild_sem_fee_quotes(semester)
+    fresh = list(Section.objects.filter(semester=semester).order_by("id"))
+    with django_assert_num_queries(1):
+        prime_section_fee_quotes(fresh)
+        totals = [section.fee_total_amount() for section in fresh]
+
+    live = build_fee_quote(sections[0].curriculum_course, semester)
+    assert totals[0] == live.total_amount
+    assert totals[0] - totals[1] == Decimal("15.00")
+    quote = CrsFeeQuote.objects.get(curriculum_course=sections[0].curriculum_course)
+    assert quote.fee_lines == {"lab": {"label": "Lab", "amount": "15.00"}}
+
+
+def test_fee_changes_invalidate_quotes(curriculum_course_factory, sem_factory) -> None:
+    """Fee line edits and stack detachments reprice the course."""
+    semester = sem_factory(1, datetime(2024, 9, 1))
+    (section,) = _sections(curriculum_course_factory, semester, 1)
+    base = section.fee_total_amount()
+    stack = _lab_stack("Quote Change", "10.00")
+    link = CrsFeeStack.objects.create(
+        course=section.curriculum_course.course, fee_stack=stack
+    )
+    assert section.fee_total_amount() == base + Decimal("10.00")
+
+    line = stack.fees.get()
+    line.amount = Decimal("25.00")
+    line.save(update_fields=["amount"])
+    assert section.fee_total_amount() == base + Decimal("25.00")
+
+    link.delete()
+    assert section.fee_total_amount() == base
+
+
+def test_policy_table_changes_make_quotes_stale(
+    curriculum_course_factory, sem_factory, monkeypatch, tmp_path
+) -> None:
+    """Quotes built against older policy tables are recomputed."""
+    semester = sem_factory(1, datetime(2024, 9, 1))
+    (section,) = _sections(curriculum_course_factory, semester, 1)
+    quote = fee_quote_for(section.curriculum_course, semester)
+
+    rates = tmp_path / "tuition_rates.tsv"
+    rates.write_text("academic_year\tsemester_no\ttuition_per_credit\n", encoding="utf-8")
+    monkeypatch.setattr(course_fee_policy, "DEFAULT_TUITION_RATES_PATH", rates)
+    rebuilt = fee_quote_for(section.curriculum_course, semester)
+
+    assert rebuilt.policy_version != quote.policy_version
+    rebuild_sem_fee_quotes(semester)
+    assert CrsFeeQuote.objects.get().policy_version == rebuilt.policy_version
+
+
+def test_reading_prices_writes_no_quotes(curriculum_course_factory, sem_factory) -> None:
+    """Section prices are computed on read; only rebuilds store quotes."""
+    semester = sem_factory(1, datetime(2024, 9, 1))
+    sections = _sections(curriculum_course_factory, semester, 2)
+    prime_section_fee_quotes(sections)
+    totals = [section.fee_total_amount() for section in sections]
+    assert sections[0].curriculum_course.total_fee(semester) == totals[0]
+    assert not CrsFeeQuote.objects.exists()
+
+
+def test_code_changes_invalidate_quotes(curriculum_course_factory, sem_factory) -> None:
+    """Renaming a department or moving an academic year drops its quotes."""
+    semester = sem_factory(1, datetime(2024, 9, 1))
+    (section,) = _sections(curriculum_course_factory, semester, 1)
+    rebuild_sem_fee_quotes(semester)
+    department = Department.objects.get(pk=section.curriculum_course.course.department_id)
+    department.long_name = "Renamed"
+    department.save()
+    assert CrsFeeQuote.objects.exists()
+    department.code = "ZQT"
+    department.save()
+    assert not CrsFeeQuote.objects.exists()
+
+    rebuild_sem_fee_quotes(semester)
+    academic_year = AcademicYear.objects.get(pk=semester.academic_year_id)
+    academic_year.save()
+    assert CrsFeeQuote.objects.exists()
+    academic_year.start_date = academic_year.start_date.replace(
+        year=academic_year.start_date.year - 5
+    )
+    academic_year.end_date = academic_year.end_date.replace(
+        year=academic_year.end_date.year - 5
+    )
+    academic_year.save()
+    assert not CrsFeeQuote.objects.exists()
+
+
+def test_opening_registration_rebuilds_semester_quotes(
+    curriculum_course_factory, sem_factory
+) -> None:
+    """Opening a semester prices every offered course up front."""
+    semester = sem_factory(1, datetime(2024, 9, 1))
+    _sections(curriculum_course_factory, semester, 3)
+    assert not CrsFeeQuote.objects.exists()
+
+    semester.status_id = "registration"
+    semester.save()
+    assert CrsFeeQuote.objects.filter(semester=semester).count() == 3
+
+
+def test_unrelated_saves_keep_quotes(curriculum_course_factory, sem_factory) -> None:
+    """Only pricing inputs drop quotes; an open semester reprices right away."""
+    semester = sem_factory(1, datetime(2024, 9, 1))
+    (section,) = _sections(curriculum_course_factory, semester, 1)
+    rebuild_sem_fee_quotes(semester)
+    curriculum_course = CurriCrs.objects.get(pk=section.curriculum_course_id)
+    course = Course.objects.get(pk=curriculum_course.course_id)
+    course.title = "Renamed Course"
+    course.save()
+    curriculum_course.save()
+    semester = Semester.objects.get(pk=semester.pk)
+    semester.info = "Unrelated note"
+    semester.save()
+    assert CrsFeeQuote.objects.count() == 1
+
+    curriculum_course.credit_hours = CreditHour.objects.get(code=10)
+    curriculum_course.save()
+    assert not CrsFeeQuote.objects.exists()
+
+    semester.status_id = "registration"
+    semester.save()
+    semester.start_date = semester.start_date.replace(day=2)
+    semester.save()
+    assert CrsFeeQuote.objects.get().credit_hours == 10
@@ -0,0 +1,76 @@
+"""Tests for the deferred parent-invoice refresh queue."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+
+from app.finance.invoice_queue import deferred_invoice_refresh, invoice_queue_stats
+from app.finance.models.fee_stack import FeeStack, FeeStackLine
+from app.finance.models.invoice import StdSemesterInvoice
+from app.finance.models.invoice_queue import DirtyInvoice
+from app.finance.models.status_types_methods import FeeType
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def stacked_invoice(std_factory, sem_factory) -> StdSemesterInvoice:
+    """A parent invoice whose only charge is one fee-stack line."""
+    invoice = StdSemesterInvoice.objects.create(
+        student=std_factory("queue_std", "CURRI_QUEUE"),
+        semester=sem_factory(1, datetime(2024, 9, 1)),
+    )
+    fee_type, _ = FeeType.objects.get_or_create(code="lab", defaults={"label": "Lab"})
+    stack = FeeStack.objects.create(name="Queue Stack")
+    FeeStackLine.objects.create(fee_stack=stack, fee_type=fee_type, amount=Decimal(10))
+    invoice.fee_stacks.add(stack)
+    invoice.refresh_from_db()
+    assert invoice.initial_amount_due == Decimal("10.00")
+    return invoice
+
+
+def _set_line_amount(invoice: StdSemesterInvoice, amount: str) -> None:
+    line = FeeStackLine.objects.get(fee_stack__student_semester_invoices=invoice)
+    line.amount = Decimal(amount)
+    line.save(update_fields=["amount"])
+
+
+def test_marks_coalesce_and_refresh_when_the_scope_ends(stacked_invoice) -> None:
+    """Repeated edits in one scope queue one row and refresh once at the end."""
+    with deferred_invoice_refresh():
+        _set_line_amount(stacked_invoice, "20.00")
+        _set_line_amount(stacked_invoice, "30.00")
+        assert DirtyInvoice.objects.get().student_semester_invoice == stacked_invoice
+        stacked_invoice.refresh_from_db()
+        assert stacked_invoice.initial_amount_due == Decimal("10.00")
+
+    stacked_invoice.refresh_from_db()
+    assert stacked_invoice.initial_amount_due == Decimal("30.00")
+    assert not DirtyInvoice.objects.exists()
+
+
+def test_large_marks_wait_for_the_worker(stacked_invoice, settings) -> None:
+    """Above the sync limit marks stay queued until the drain command runs."""
+    settings.INVOICE_REFRESH_SYNC_LIMIT = 0
+    _set_line_amount(stacked_invoice, "25.00")
+    stats = invoice_queue_stats()
+    assert stats["depth"] == 1
+    assert stats["oldest_marked_at"] is not None
+
+    call_command("drain_invoice_queue", batch_size=10)
+
+    stacked_invoice.refresh_from_db()
+    assert stacked_invoice.initial_amount_due == Decimal("25.00")
+    assert invoice_queue_stats()["depth"] == 0
+
+
+def test_small_marks_outside_a_scope_refresh_immediately(stacked_invoice) -> None:
+    """Shell and job edits keep their synchronous behaviour when small."""
+    _set_line_amount(stacked_invoice, "12.50")
+    stacked_invoice.refresh_from_db()
+    assert stacked_invoice.initial_amount_due == Decimal("12.50")
+    assert not DirtyInvoice.objects.exists()
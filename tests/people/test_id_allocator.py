@@ -0,0 +1,58 @@
+"""Tests for counter-backed person ID allocation."""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+from app.people.models.donor import Donor
+from app.people.models.id_counter import PersonIdCounter
+from app.people.models.student import Student
+
+pytestmark = pytest.mark.django_db
+
+
+def test_counter_seeds_from_existing_ids_once(django_assert_max_num_queries) -> None:
+    """The first allocation scans existing IDs; later ones only touch the counter."""
+    Student.objects.bulk_create(
+        [
+            Student(
+                student_id="TU-STD00041",
+                user=User.objects.create(username="seed_a"),
+                long_name="A",
+            )
+        ]
+    )
+
+    first = Student.objects.create(first_name="Ada", last_name="Counter")
+    assert first.student_id == "TU-STD00042"
+    assert PersonIdCounter.objects.get(model_label="people.student").last_value == 42
+
+    # Savepoint, locked read, update and release: no scan of student rows.
+    with django_assert_max_num_queries(4):
+        assert Student.reserve_ids(1) == ["TU-STD00043"]
+
+
+def test_reserve_ids_hands_out_contiguous_block() -> None:
+    """Bulk importers can take a block and assign it without further queries."""
+    block = Donor.reserve_ids(3)
+    donor = Donor.objects.create(first_name="Bea", last_name="Block")
+
+    assert block == ["TU-DNR00001", "TU-DNR00002", "TU-DNR00003"]
+    assert donor.donor_id == "TU-DNR00004"
+    assert Donor.reserve_ids(0) == []
+
+
+def test_explicit_ids_advance_counter_and_seed_command() -> None:
+    """Hand-set IDs must not be handed out again by the counter."""
+    Student.objects.create(first_name="Cy", last_name="Auto")
+    Student.objects.create(first_name="Di", last_name="Manual", student_id="TU-STD00200")
+
+    assert Student.objects.create(first_name="Ed", last_name="Next").student_id == (
+        "TU-STD00201"
+    )
+
+    PersonIdCounter.objects.filter(model_label="people.student").update(last_value=5)
+    call_command("seed_person_ids", "--model", "student")
+    assert PersonIdCounter.objects.get(model_label="people.student").last_value == 201
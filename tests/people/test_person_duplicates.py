@@ -0,0 +1,111 @@
+"""Tests for the persisted person-duplicate index."""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import RequestFactory
+
+from app.people.admin.student_admin import StdAdmin
+from app.people.models.duplicates import PersonDuplicate
+from app.people.models.student import Student
+
+pytestmark = pytest.mark.django_db
+
+
+def _student(username: str, first: str, last: str) -> Student:
+    """Create a student without going through the fuzzy-matching manager."""
+    user = User.objects.create(username=username, first_name=first, last_name=last)
+    student = Student(user=user)
+    student.save()
+    return student
+
+
+def _edges(label: str = "people.student") -> set[tuple[int, int]]:
+    return set(
+        PersonDuplicate.objects.filter(model_label=label).values_list(
+            "person_id", "other_id"
+        )
+    )
+
+
+def test_person_save_and_delete_maintain_edges() -> None:
+    """Saves add both edge directions; deletes drop them."""
+    john = _student("john.kollie", "John", "Kollie")
+    jon = _student("jon.kollie", "Jon", "Kollie")
+    mary = _student("mary.kollie", "Mary", "Kollie")
+
+    assert _edges() == {(john.pk, jon.pk), (jon.pk, john.pk)}
+    assert (john.user_id, jon.user_id) in _edges("auth.user")
+    assert not {mary.pk} & {pk for pair in _edges() for pk in pair}
+
+    jon.delete()
+    assert _edges() == set()
+
+
+def test_rebuild_command_matches_incremental_index() -> None:
+    """The batch rebuild and the save-time refresh agree."""
+    for username, first, last in (
+        ("ada.doe", "Ada", "Doe"),
+        ("a.doe", "A.", "Doe"),
+        ("bea.doe", "Bea", "Doe"),
+        ("ada.toe", "Ada", "Toe"),
+    ):
+        _student(username, first, last)
+    incremental = _edges()
+    PersonDuplicate.objects.all().delete()
+
+    call_command("rebuild_person_duplicates", "--model", "student")
+
+    assert _edges() == incremental
+    assert len(incremental) == 2
+
+
+def test_std_admin_reads_index_for_ordering_and_filter(superuser) -> None:
+    """The changelist annotates counts from the index and filters dups_for."""
+    john = _student("john.kollie", "John", "Kollie")
+    jon = _student("jon.kollie", "Jon", "Kollie")
+    _student("mary.kollie", "Mary", "Kollie")
+    model_admin = StdAdmin(Student, admin.site)
+
+    request = RequestFactory().get("/admin/people/student/", {"dups_for": john.pk})
+    request.user = superuser
+    rows = list(model_admin.get_queryset(request).order_by("-duplicate_score_sort"))
+
+    assert {row.pk for row in rows} == {john.pk, jon.pk}
+    assert {row.duplicate_count_sort for row in rows} == {1}
+    assert rows[0].duplicate_score_sort == pytest.approx(0.9428, abs=1e-3)
+    assert model_admin.duplicate_count_link(rows[0]).endswith(">1</a>")
+    assert john.student_id in model_admin.possible_duplicates(jon)
+
+
+def test_only_name_changes_refresh_edges() -> None:
+    """Saves that leave the matched names alone do not rescore the row."""
+    john = _student("john.kollie", "John", "Kollie")
+    jon = _student("jon.kollie", "Jon", "Kollie")
+    PersonDuplicate.objects.all().delete()
+
+    reloaded = Student.objects.get(pk=john.pk)
+    reloaded.birth_place = "Harper"
+    reloaded.save()
+    reloaded.user.save(update_fields=["email"])
+    assert _edges() == set()
+
+    reloaded.user.first_name = "Johnny"
+    reloaded.user.save()
+    assert _edges() == {(john.pk, jon.pk), (jon.pk, john.pk)}
+
+
+def test_queryset_and_cascade_deletes_drop_edges() -> None:
+    """Edges go with rows removed by QuerySet.delete() or a cascade."""
+    john = _student("john.kollie", "John", "Kollie")
+    jon = _student("jon.kollie", "Jon", "Kollie")
+
+    Student.objects.filter(pk=jon.pk).delete()
+    assert _edges() == set()
+
+    User.objects.filter(pk=jon.user_id).delete()
+    assert (john.user_id, jon.user_id) not in _edges("auth.user")
+    assert not PersonDuplicate.objects.filter(other_id=jon.user_id).exists()
@@ -0,0 +1,93 @@
+"""Tests for the shared student search documents."""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth.models import User
+
+from app.academics.models.college import College
+from app.academics.models.curriculum import Curriculum
+from app.people.models.search_doc import StudentSearchDoc
+from app.people.models.student import Student
+from app.people.models.student_curriculum_enrollment import (
+    StdCurriEnroll,
+    set_primary_std_curri_enroll,
+)
+from app.people.student_search import (
+    rebuild_student_search_docs,
+    search_students,
+    top_students,
+)
+from app.website.services.finance_portal import finance_stds
+from app.website.services.registrar_portal import registrar_student_results
+
+pytestmark = pytest.mark.django_db
+
+
+def _student(username: str, first: str, last: str, student_id: str) -> Student:
+    user = User.objects.create(username=username, first_name=first, last_name=last)
+    student = Student(user=user, student_id=student_id)
+    student.save()
+    return student
+
+
+@pytest.fixture
+def agri() -> Curriculum:
+    college = College.objects.create(code="CAFS", long_name="Agriculture and Forestry")
+    return Curriculum.objects.create(
+        short_name="BSC AGRI", long_name="Bachelor of Agriculture", college=college
+    )
+
+
+def test_document_follows_student_and_enrollment_changes(agri) -> None:
+    """Saves and enrollment changes refresh the student's document."""
+    student = _student("mkollie", "Musu", "Kollie", "TU-STD-0101")
+    document = StudentSearchDoc.objects.get(student=student).document
+    assert "tu-std-0101" in document
+    assert "musu kollie" in document
+    assert "mkollie" in document
+
+    set_primary_std_curri_enroll(student, agri)
+    assert "bachelor of agriculture cafs" in (
+        StudentSearchDoc.objects.get(student=student).document
+    )
+
+    StdCurriEnroll.objects.get(student=student, curriculum=agri).delete()
+    assert "cafs" not in StudentSearchDoc.objects.get(student=student).document
+
+
+def test_search_requires_every_term_and_ranks_exact_id_first() -> None:
+    """Terms are ANDed; an exact student-id hit comes before substrings."""
+    first = _student("jdoe", "Jane", "Doe", "TU-STD-0012")
+    second = _student("jdoe2", "John", "Doe", "TU-STD-00120")
+    _student("aroe", "Ann", "Roe", "TU-STD-0200")
+
+    matches = search_students(Student.objects.all(), "tu-std-0012")
+    assert list(matches.order_by("-search_rank", "-student_id")) == [first, second]
+    assert set(search_students(Student.objects.all(), "doe JOHN")) == {second}
+    assert top_students("doe", limit=1, order_by=("student_id",)) == [first]
+    assert top_students("  ") == []
+
+
+def test_portals_share_the_search_documents(agri) -> None:
+    """Finance and registrar lookups go through the same documents."""
+    student = _student("fkpan", "Fatu", "Kpan", "TU-STD-0300")
+    set_primary_std_curri_enroll(student, agri)
+
+    assert registrar_student_results("kpan agri") == [
+        {"id": student.id, "text": f"{student.student_id} — {student.long_name}"}
+    ]
+    assert list(finance_stds("kpan")) == []  # not finance-relevant yet
+
+
+def test_rebuild_backfills_missing_documents() -> None:
+    """Students without a document still match; the rebuild restores it."""
+    student = _student("ysiah", "Yassah", "Siah", "TU-STD-0400")
+    _student("ksiah", "Kebeh", "Siah", "TU-STD-0401")
+    StudentSearchDoc.objects.filter(student=student).delete()
+    assert set(search_students(Student.objects.all(), "yassah SIAH")) == {student}
+    assert search_students(Student.objects.all(), "siah").count() == 2
+
+    assert rebuild_student_search_docs(missing_only=True) == 1
+    assert list(search_students(Student.objects.all(), "yassah")) == [student]
+    assert StudentSearchDoc.objects.filter(student=student).exists()
@@ -0,0 +1,56 @@
+"""Tests for batch username allocation."""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth.models import User
+from tablib import Dataset
+
+from app.people.admin.resources import StdResource
+from app.people.usernames import UsernameAllocator
+from app.people.utils import mk_username
+
+pytestmark = pytest.mark.django_db
+
+
+def test_allocator_fills_suffixes_from_one_query(django_assert_num_queries) -> None:
+    """Taken names, gaps included, are indexed once for a whole batch."""
+    for username in ("es.thot", "es.thot2", "es.thot4", "es.thotte", "ad.love"):
+        User.objects.create(username=username)
+    allocator = UsernameAllocator()
+
+    with django_assert_num_queries(1):
+        allocated = allocator.allocate_many(
+            ["es.thot", "es.thot", "es.thot", "ad.love", "new.name"]
+        )
+
+    assert allocated == ["es.thot3", "es.thot5", "es.thot6", "ad.love2", "new.name"]
+    assert mk_username("Esai", "Thot", unique=True, prefix_len=2) == "es.thot3"
+
+
+def test_create_user_retries_after_concurrent_insert() -> None:
+    """A stale index should not surface as an import failure."""
+    allocator = UsernameAllocator()
+    allocator.prefetch(["jo.doe"])
+    User.objects.create(username="jo.doe")  # another importer wins the race
+
+    user = allocator.create_user("jo.doe", first_name="Jo", last_name="Doe")
+
+    assert user.username == "jo.doe2"
+
+
+def test_student_import_allocates_usernames_per_batch() -> None:
+    """Same-name students in one import get distinct usernames."""
+    User.objects.create(username="mary.kollie")
+    dataset = Dataset(headers=["student_id", "username", "long_name"])
+    dataset.append(["TU-STD09001", "", "Mary Kollie"])
+    dataset.append(["TU-STD09002", "", "Mary Kollie"])
+
+    result = StdResource().import_data(dataset, raise_errors=True)
+
+    assert not result.has_errors()
+    assert set(
+        User.objects.filter(username__startswith="mary").values_list(
+            "username", flat=True
+        )
+    ) == {"mary.kollie", "mary.kollie2", "mary.kollie3"}
@@ -0,0 +1,94 @@
+"""Tests for set-based effective-grade recomputation."""
+
+from __future__ import annotations
+
+import pytest
+from django.core.management import call_command
+
+from app.registry.effective_grades import recompute_effective_grades
+from app.registry.models.grade import Grade, GradeValue
+
+pytestmark = pytest.mark.django_db
+
+
+def _bulk_grades(student, sections) -> list[Grade]:
+    """Insert grades without Grade.save(), leaving every row flagged effective."""
+    value, _created = GradeValue.objects.get_or_create(code="b")
+    return Grade.objects.bulk_create(
+        Grade(student=student, section=section, value=value, is_effective=True)
+        for section in sections
+    )
+
+
+def _effective_ids(student) -> set[int]:
+    return set(
+        Grade.objects.filter(student=student, is_effective=True).values_list(
+            "id", flat=True
+        )
+    )
+
+
+def test_recompute_effective_grades_keeps_latest_attempt_per_pair(
+    std_factory, sec_factory
+) -> None:
+    """Only the requested pairs are ranked; the latest attempt wins."""
+    student = std_factory("repeat_std", "CURRI_TEST")
+    other = std_factory("other_std", "CURRI_TEST")
+    first, second = (
+        sec_factory("201", number=1, semester_number=1),
+        sec_factory("201", number=1, semester_number=2),
+    )
+    elective = sec_factory("202", number=1, semester_number=1)
+    _first_grade, second_grade, elective_grade = _bulk_grades(
+        student, [first, second, elective]
+    )
+    _bulk_grades(other, [first, second])
+    course_id = first.curriculum_course.course_id
+
+    changed = recompute_effective_grades(
+        [(student.id, course_id)], refresh_standing=False
+    )
+
+    assert changed == 1
+    assert _effective_ids(student) == {second_grade.id, elective_grade.id}
+    assert Grade.objects.filter(student=other, is_effective=True).count() == 2
+
+
+def test_recompute_effective_grades_matches_per_row_method(
+    std_factory, sec_factory
+) -> None:
+    """Recomputing everything agrees with the per-pair model method."""
+    student = std_factory("all_std", "CURRI_TEST")
+    sections = [
+        sec_factory("301", number=number, semester_number=semester_number)
+        for semester_number in (1, 2)
+        for number in (1, 2)
+    ]
+    grades = _bulk_grades(student, sections)
+
+    assert recompute_effective_grades(refresh_standing=False) == 3
+    bulk_effective = _effective_ids(student)
+    Grade.objects.update(is_effective=False)
+    Grade.recompute_effective_for_student_course(
+        student_id=student.id,
+        course_id=sections[0].curriculum_course.course_id,
+        refresh_standing=False,
+    )
+
+    assert bulk_effective == _effective_ids(student) == {grades[-1].id}
+    assert recompute_effective_grades(refresh_standing=False) == 0
+
+
+def test_recompute_effective_grades_command_dry_run(
+    std_factory, sec_factory, capsys
+) -> None:
+    """--dry-run reports the rows to change and leaves them untouched."""
+    student = std_factory("command_std", "CURRI_TEST")
+    _bulk_grades(student, [sec_factory("401"), sec_factory("401", semester_number=2)])
+
+    call_command("recompute_effective_grades", dry_run=True)
+    assert "1 row(s) updated" in capsys.readouterr().out
+    assert len(_effective_ids(student)) == 2
+
+    call_command("recompute_effective_grades", student=str(student.id))
+    assert len(_effective_ids(student)) == 1
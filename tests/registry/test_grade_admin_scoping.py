@@ -14,6 +14,7 @@ from app.people.models.student import Student
 from app.registry.admin.grade_admin import GradeAdmin
 from app.registry.models.grade import Grade
 from app.registry.models.registration import Registration
+from app.shared.admin import pagination
 from app.shared.auth.perms import UserRole
 from app.timetable.models.section import Section
 
@@ -287,3 +288,50 @@ def test_grade_student_autocomplete_registrar_section_scope_keeps_selected_roste
 
     assert own_grade.student_id not in student_ids
     assert other_grade.student_id in student_ids
+
+
+@pytest.mark.django_db
+def test_grade_admin_changelist_sorts_on_section_sort_code(
+    faculty,
+    sec_factory,
+    std_factory,
+) -> None:
+    """The section column orders by the indexed sort code and counts exactly."""
+    later = _make_grade(faculty, sec_factory, std_factory, "13")
+    earlier = _make_grade(faculty, sec_factory, std_factory, "12")
+    user = User.objects.create_superuser("grade_admin_sorter")
+    request = RequestFactory().get("/admin/registry/grade/", data={"o": "2"})
+    request.user = user
+    admin_obj = GradeAdmin(Grade, admin.site)
+
+    changelist = admin_obj.get_changelist_instance(request)
+
+    grade_ids = [grade.id for grade in changelist.result_list]
+    assert grade_ids.index(earlier.id) < grade_ids.index(later.id)
+    assert "section_sort_code" not in changelist.queryset.query.annotations
+    assert changelist.result_count == Grade.objects.count()
+
+
+@pytest.mark.django_db
+def test_grade_admin_changelist_uses_table_estimate_for_large_lists(
+    faculty,
+    sec_factory,
+    std_factory,
+    monkeypatch,
+) -> None:
+    """Past the threshold an unfiltered changelist shows the planner estimate."""
+    _make_grade(faculty, sec_factory, std_factory, "14")
+    estimate = pagination.ESTIMATED_COUNT_MIN_ROWS + 5
+    monkeypatch.setattr(pagination, "estimated_table_count", lambda queryset: estimate)
+    request = _admin_request(User.objects.create_superuser("grade_admin_estimator"))
+    admin_obj = GradeAdmin(Grade, admin.site)
+
+    changelist = admin_obj.get_changelist_instance(request)
+
+    assert changelist.result_count == estimate
+    assert changelist.paginator.num_pages > 1
+    assert len(changelist.result_list) == Grade.objects.count()
+
+    monkeypatch.setattr(pagination, "estimated_table_count", lambda queryset: 5)
+    small = pagination.EstimatedCountPaginator(Grade.objects.all(), 10)
+    assert small.count == Grade.objects.count()
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+from io import StringIO
 from pathlib import Path
 from typing import Iterable, Mapping
 
 import pytest
 from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
 
 from app.people.models.student import Student
 from app.registry.models.grade import Grade, GradeValue
 from app.registry.models.registration import Registration
+from app.registry.models.standing import StdStanding
 
 pytestmark = pytest.mark.django_db  # replace the @pytest.mark.django_db decorator
 
@@ -144,3 +148,100 @@ def test_import_grades_can_skip_registration_reconstruction(
 
     assert Grade.objects.count() == 1
     assert Registration.objects.count() == 0
+
+
+def test_import_grades_marks_latest_attempt_effective(tmp_path, grade_values) -> None:
+    """Bulk-created repeat attempts leave a single effective grade per course."""
+    tsv_path = tmp_path / "grades.tsv"
+    _write_grades_tsv(
+        tsv_path,
+        [_grade_row(semester_no="2", grade_code="A"), _grade_row(grade_code="B")],
+    )
+
+    call_command("import_grades", file=tsv_path, batch_size=1)
+
+    assert Grade.objects.count() == 2
+    effective = Grade.objects.get(is_effective=True)
+    assert effective.section.semester.number == 2
+    standing = StdStanding.objects.get(student_id=effective.student_id)
+    assert standing.attempted_credits == 3
+    assert standing.passed_course_ids == [effective.section.curriculum_course.course_id]
+
+
+def test_import_grades_copy_method_requires_postgresql(tmp_path, grade_values) -> None:
+    """The COPY staging path is PostgreSQL-only; auto falls back to rows."""
+    if connection.vendor == "postgresql":
+        pytest.skip("COPY is available on PostgreSQL.")
+    tsv_path = tmp_path / "grades.tsv"
+    _write_grades_tsv(tsv_path, [_grade_row()])
+
+    with pytest.raises(CommandError, match="PostgreSQL"):
+        call_command("import_grades", file=tsv_path, method="copy")
+    assert Grade.objects.count() == 0
+
+    call_command("import_grades", file=tsv_path, method="auto")
+    assert Grade.objects.count() == 1
+
+
+def test_import_grades_auto_uses_copy_on_postgresql(tmp_path, grade_values) -> None:
+    """On PostgreSQL, auto goes through COPY and dry runs roll it back."""
+    if connection.vendor != "postgresql":
+        pytest.skip("The COPY staging import needs PostgreSQL.")
+    tsv_path = tmp_path / "grades.tsv"
+    _write_grades_tsv(tsv_path, [_grade_row()])
+
+    out = StringIO()
+    call_command("import_grades", file=tsv_path, method="auto", dry_run=True, stdout=out)
+    assert "COPY import: 1 rows" in out.getvalue()
+    assert Grade.objects.count() == 0
+
+    call_command("import_grades", file=tsv_path, method="copy", stdout=StringIO())
+    grade = Grade.objects.get()
+    assert grade.is_effective
+    assert StdStanding.objects.filter(student_id=grade.student_id).exists()
+
+
+def _import_snapshot() -> tuple[list[tuple], list[tuple], list[tuple]]:
+    """Return the grades, registrations and standings an import produced."""
+    section = (
+        "section__semester__academic_year__code",
+        "section__semester__number",
+        "section__curriculum_course__course__code",
+        "section__number",
+    )
+    grades = Grade.objects.values_list(
+        "student__student_id", *section, "value__code", "is_effective"
+    )
+    registrations = Registration.objects.values_list(
+        "student__student_id", *section, "status_id"
+    )
+    standings = StdStanding.objects.values_list(
+        "student__student_id", "gpa", "attempted_credits", "earned_credits"
+    )
+    return sorted(grades), sorted(registrations), sorted(standings)
+
+
+def test_import_grades_copy_matches_rows_on_postgresql(tmp_path, grade_values) -> None:
+    """The COPY path writes the same grades and registrations as the row path."""
+    if connection.vendor != "postgresql":
+        pytest.skip("The COPY staging import needs PostgreSQL.")
+    tsv_path = tmp_path / "grades.tsv"
+    _write_grades_tsv(
+        tsv_path,
+        [
+            _grade_row(semester_no="2", grade_code="A"),
+            _grade_row(grade_code="B"),
+            _grade_row(student_id="TU-0002", grade_code="Z"),
+            _grade_row(student_id="TU-0003", course_no="102"),
+            _grade_row(student_id="TU-0003", course_no="102"),
+        ],
+    )
+
+    call_command("import_grades", file=tsv_path, method="rows")
+    by_rows = _import_snapshot()
+    Grade.objects.all().delete()
+    Registration.objects.all().delete()
+    StdStanding.objects.all().delete()
+    call_command("import_grades", file=tsv_path, method="copy")
+
+    assert _import_snapshot() == by_rows
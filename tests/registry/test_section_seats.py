@@ -0,0 +1,119 @@
+"""Tests for section seat accounting and concurrent seat reservation."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.management import call_command
+from django.db import connection, connections
+
+from app.registry.models.registration import Registration, RegistrationStatus
+from app.registry.seats import SectionFullError, register_with_seat
+from app.timetable.models.section import Section
+
+
+def _seat_count(section: Section) -> int:
+    section.refresh_from_db(fields=["current_registrations"])
+    return section.current_registrations
+
+
+@pytest.mark.django_db
+def test_registration_lifecycle_keeps_seat_counter(std_factory, sec_factory) -> None:
+    """Create, cancel, revive and delete should move the counter by one seat."""
+    canceled, _ = RegistrationStatus.objects.get_or_create(
+        code="canceled", defaults={"label": "Canceled"}
+    )
+    section = sec_factory("501", "SEATS")
+    student = std_factory("seat_student", "SEATS")
+
+    registration = Registration.objects.create(student=student, section=section)
+    assert _seat_count(section) == 1
+
+    registration.status = canceled
+    registration.save(update_fields=["status"])
+    assert _seat_count(section) == 0
+
+    revived, took_seat = register_with_seat(
+        student_id=student.id,
+        section_id=section.id,
+        status=RegistrationStatus.get_dft(),
+    )
+    assert (revived.pk, took_seat) == (registration.pk, True)
+    assert _seat_count(section) == 1
+
+    revived.delete()
+    assert _seat_count(section) == 0
+
+
+@pytest.mark.django_db
+def test_register_with_seat_rejects_full_section(std_factory, sec_factory) -> None:
+    """A full section should reject new registrations without writing rows."""
+    section = sec_factory("502", "SEATS")
+    section.max_seats = 3
+    section.save(update_fields=["max_seats"])
+    pending = RegistrationStatus.get_dft()
+    students = [std_factory(f"full_std_{index}", "SEATS") for index in range(4)]
+
+    for student in students[:3]:
+        register_with_seat(student_id=student.id, section_id=section.id, status=pending)
+    with pytest.raises(SectionFullError):
+        register_with_seat(
+            student_id=students[3].id, section_id=section.id, status=pending
+        )
+
+    section.refresh_from_db()
+    assert section.current_registrations == 3
+    assert not section.has_available_seats()
+    assert not Registration.objects.filter(student=students[3]).exists()
+
+
+@pytest.mark.django_db
+def test_reconcile_command_repairs_counter_drift(std_factory, sec_factory) -> None:
+    """Bulk writes bypass save(); the reconcile command recounts seats."""
+    section = sec_factory("503", "SEATS")
+    Registration.objects.bulk_create(
+        [
+            Registration(
+                student=std_factory(f"bulk_std_{index}", "SEATS"),
+                section=section,
+                status=RegistrationStatus.get_dft(),
+            )
+            for index in range(2)
+        ]
+    )
+    Section.objects.filter(pk=section.pk).update(current_registrations=7)
+
+    call_command("reconcile_section_seats", "--section", str(section.pk))
+
+    assert _seat_count(section) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_registrations_never_oversubscribe(std_factory, sec_factory) -> None:
+    """Hundreds of parallel registrations should fill the section exactly."""
+    if connection.vendor == "sqlite":
+        pytest.skip("SQLite serializes writers; run the load test on PostgreSQL.")
+    section = sec_factory("504", "SEATS")
+    section.max_seats = 25
+    section.save(update_fields=["max_seats"])
+    pending = RegistrationStatus.get_dft()
+    student_ids = [std_factory(f"load_std_{index}", "SEATS").id for index in range(200)]
+
+    def _attempt(student_id: int) -> bool:
+        try:
+            register_with_seat(
+                student_id=student_id, section_id=section.id, status=pending
+            )
+            return True
+        except SectionFullError:
+            return False
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        outcomes = list(pool.map(_attempt, student_ids))
+
+    assert sum(outcomes) == 25
+    assert Registration.objects.filter(section=section).count() == 25
+    assert _seat_count(section) == 25
@@ -0,0 +1,122 @@
+"""Tests for materialized student standing rows."""
+
+from __future__ import annotations
+
+import pytest
+from django.core.management import call_command
+
+from app.people.models.student import Student
+from app.registry.gpa import (
+    _compute_gpa_from_grades,
+    build_gpa_queryset,
+    get_cumulative_gpa,
+    get_gpa,
+)
+from app.registry.models.credit_hours import CreditHour
+from app.registry.models.grade import Grade, GradeValue
+from app.registry.models.standing import StdSemStanding, StdStanding
+from app.timetable.models.section import Section
+
+pytestmark = pytest.mark.django_db
+
+
+def _section(curriculum_course_factory, semester, course_no: str, credits: int = 3):
+    """Create one section whose curriculum course carries the given credits."""
+    curriculum_course = curriculum_course_factory(course_no, "STANDING")
+    curriculum_course.credit_hours = CreditHour.objects.get(code=credits)
+    curriculum_course.save(update_fields=["credit_hours"])
+    return Section.objects.create(
+        curriculum_course=curriculum_course,
+        semester=semester,
+        number=1,
+    )
+
+
+def _grade_value(code: str) -> GradeValue:
+    """Return a grade value with normalized grading metadata."""
+    return GradeValue.objects.get_or_create(code=code)[0]
+
+
+def test_grade_save_and_delete_refresh_standing(
+    curriculum_course_factory,
+    sem_factory,
+) -> None:
+    """Grade writes should keep cumulative and semester standing in sync."""
+    student = Student.objects.create(first_name="Stand", last_name="Ing")
+    first, second = sem_factory(1), sem_factory(2)
+    passed = Grade.objects.create(
+        student=student,
+        section=_section(curriculum_course_factory, first, "601", 3),
+        value=_grade_value("a"),
+    )
+    Grade.objects.create(
+        student=student,
+        section=_section(curriculum_course_factory, second, "602", 4),
+        value=_grade_value("f"),
+    )
+
+    standing = StdStanding.objects.get(student=student)
+    assert standing.earned_credits == 3
+    assert standing.attempted_credits == 7
+    assert standing.passed_course_ids == [passed.section.curriculum_course.course_id]
+    assert standing.gpa == pytest.approx(12 / 7)
+    sem_row = StdSemStanding.objects.get(student=student, semester=first)
+    assert (sem_row.earned_credits, sem_row.gpa) == (3, 4.0)
+
+    passed.delete()
+    standing.refresh_from_db()
+    assert standing.earned_credits == 0
+    assert standing.passed_course_ids == []
+    assert not StdSemStanding.objects.filter(student=student, semester=first).exists()
+
+
+def test_standing_reads_match_live_aggregates(
+    curriculum_course_factory,
+    sem_factory,
+    django_assert_num_queries,
+) -> None:
+    """Student reads should use one row lookup and match the grade aggregates."""
+    student = Student.objects.create(first_name="Live", last_name="Match")
+    semester = sem_factory(1)
+    sections = [
+        _section(curriculum_course_factory, semester, "611", 3),
+        _section(curriculum_course_factory, semester, "612", 2),
+        _section(curriculum_course_factory, semester, "613", 4),
+    ]
+    for section, code in zip(sections, ("a", "c", "d"), strict=True):
+        Grade.objects.create(student=student, section=section, value=_grade_value(code))
+    curriculum = sections[0].curriculum_course.curriculum
+    live = _compute_gpa_from_grades(build_gpa_queryset(student, curriculum))
+
+    with django_assert_num_queries(1):
+        assert student.completed_credits == 9
+    assert get_cumulative_gpa(student) == live
+    assert get_gpa(semester, student) == live
+    assert set(student.passed_crss()) == {
+        section.curriculum_course.course for section in sections
+    }
+
+
+def test_rebuild_command_repairs_bulk_created_grades(
+    curriculum_course_factory,
+    sem_factory,
+) -> None:
+    """Bulk imports bypass Grade.save(); the rebuild command repairs standing."""
+    student = Student.objects.create(first_name="Bulk", last_name="Import")
+    semester = sem_factory(1)
+    assert student.completed_credits == 0
+    Grade.objects.bulk_create(
+        [
+            Grade(
+                student=student,
+                section=_section(curriculum_course_factory, semester, "621", 3),
+                value=_grade_value("b"),
+            )
+        ]
+    )
+    assert student.completed_credits == 0
+
+    call_command("rebuild_std_standing", "--student", str(student.pk))
+
+    assert student.completed_credits == 3
+    assert student.class_level == "freshman"
@@ -0,0 +1,88 @@
+"""Tests for the scoped, rollback-aware identity maps."""
+
+from __future__ import annotations
+
+import pytest
+from django.db import transaction
+
+from app.academics.ensures import DEPARTMENT_ID_CACHE, ensure_college_id, ensure_dpt_id
+from app.academics.models.department import Department
+from app.shared.identity_map import _current_scope, identity_map, identity_map_scope
+
+
+def test_identity_map_evicts_least_recently_used_and_counts() -> None:
+    """Past maxsize the oldest unread entry goes; reads count hits and misses."""
+    cache = identity_map("tests.lru", maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+
+    assert sorted(cache) == ["a", "c"]
+    assert cache.get("b") is None
+    assert cache.stats() == {
+        "name": "tests.lru",
+        "size": 2,
+        "maxsize": 2,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "rollbacks": 0,
+    }
+
+
+def test_identity_map_scope_isolates_entries() -> None:
+    """A scope starts empty and its entries end with it."""
+    cache = identity_map("tests.scope")
+    cache["outer"] = 1
+    with identity_map_scope():
+        assert "outer" not in cache
+        cache["inner"] = 2
+        with identity_map_scope():
+            assert cache["inner"] == 2
+    assert dict(cache) == {"outer": 1}
+
+
+@pytest.mark.django_db
+def test_rolled_back_savepoint_evicts_created_ids() -> None:
+    """Ids cached for rows a savepoint rolled back are not handed out again."""
+    college_id = ensure_college_id("COAS")
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            rolled_back_id = ensure_dpt_id("ZRB", college_id)
+            assert DEPARTMENT_ID_CACHE[("ZRB", college_id)] == rolled_back_id
+            raise RuntimeError("abort")
+
+    assert ("ZRB", college_id) not in DEPARTMENT_ID_CACHE
+    assert DEPARTMENT_ID_CACHE.stats()["rollbacks"] >= 1
+    department_id = ensure_dpt_id("ZRB", college_id)
+    assert Department.objects.filter(pk=department_id).exists()
+
+
+@pytest.mark.django_db
+def test_released_savepoint_keeps_entries() -> None:
+    """Entries written in a savepoint that is released stay cached."""
+    college_id = ensure_college_id("COAS")
+    with transaction.atomic():
+        department_id = ensure_dpt_id("ZKP", college_id)
+    with transaction.atomic():
+        assert DEPARTMENT_ID_CACHE[("ZKP", college_id)] == department_id
+    assert DEPARTMENT_ID_CACHE.stats()["rollbacks"] == 0
+
+
+@pytest.mark.django_db
+def test_journal_is_bounded_by_the_cached_entries(
+    django_capture_on_commit_callbacks,
+) -> None:
+    """Evicted or deleted entries leave the uncommitted-write journal."""
+    cache = identity_map("tests.journal", maxsize=2)
+    with django_capture_on_commit_callbacks(execute=True), transaction.atomic():
+        for key in range(50):
+            with transaction.atomic():
+                cache[key] = key
+        del cache[49]
+        scope = _current_scope()
+        assert set(scope.journaled) == {("tests.journal", 48)}
+        assert sum(len(group.keys) for group in scope.pending.values()) == 1
+    assert not _current_scope().journaled
+    assert dict(cache) == {48: 48}
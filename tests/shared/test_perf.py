@@ -0,0 +1,78 @@
+"""Tests for the per-request query and timing instrumentation."""
+
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory
+
+from app.shared.perf import PerfMiddleware, current_timings, timed_block
+
+pytestmark = pytest.mark.django_db
+
+
+def _view(request):
+    with timed_block("lookup"):
+        User.objects.count()
+        User.objects.exists()
+    Template("{{ value }}").render(Context({"value": User.objects.count()}))
+    return HttpResponse("ok")
+
+
+def _call(user=None) -> HttpResponse:
+    request = RequestFactory().get("/probe/")
+    if user is not None:
+        request.user = user
+    return PerfMiddleware(_view)(request)
+
+
+def test_counts_queries_and_named_blocks() -> None:
+    """Every query is counted and attributed to its enclosing block."""
+    response = _call()
+    timings = response.perf
+    assert timings.queries == 3
+    assert timings.blocks["lookup"].calls == 1
+    assert timings.blocks["lookup"].queries == 2
+    assert timings.template_time > 0
+    assert timings.total_time >= timings.db_time
+    assert current_timings() is None
+
+
+def test_server_timing_is_only_shown_to_staff(settings) -> None:
+    """Staff (or DEBUG) get the header; other users do not."""
+    settings.DEBUG = False
+    assert "Server-Timing" not in _call(User(username="std"))
+
+    header = _call(User(username="ops", is_staff=True))["Server-Timing"]
+    assert header.startswith("total;dur=")
+    assert "db;dur=" in header and 'desc="3 queries"' in header
+    assert "blk.lookup;dur=" in header
+
+
+def test_slow_requests_log_one_json_line(settings, caplog) -> None:
+    """Requests over the threshold are logged at INFO as JSON."""
+    settings.PERF_SLOW_REQUEST_MS = 0
+    with caplog.at_level(logging.INFO, logger="app.perf"):
+        _call()
+    (record,) = [r for r in caplog.records if r.name == "app.perf"]
+    payload = json.loads(record.getMessage())
+    assert payload["event"] == "request_timing"
+    assert payload["path"] == "/probe/"
+    assert payload["queries"] == 3
+    assert payload["blocks"]["lookup"]["queries"] == 2
+
+
+def test_timed_block_is_inert_outside_requests() -> None:
+    """Commands and shells can call decorated services freely."""
+
+    @timed_block("offline")
+    def _service() -> int:
+        return User.objects.count()
+
+    assert _service() == User.objects.count()
+    assert current_timings() is None
@@ -418,6 +418,12 @@ def test_build_tusis_truth_uses_latest_smartschool_operational_exports(
     curricula = _read_tsv(output / "import_ready" / "academic_curriculum.tsv")
     revised = [row for row in curricula if row["curriculum"] == "CHS-NURS"][0]
     assert revised["status"] == "approved"
+
+    metrics = {row["stage"]: row for row in _read_tsv(output / "stage_metrics.tsv")}
+    assert metrics["grades"]["rows"] == str(len(grades))
+    summary = (output / "SUMMARY.txt").read_text(encoding="utf-8")
+    assert "stages:" in summary
+    assert f"{smartschool / 'dbo_UM_Registrations.csv'}: parsed 1x" in summary
     assert revised["is_active"] == "true"
 
     runbook = (output / "IMPORT_RUNBOOK.org").read_text(encoding="utf-8")
@@ -0,0 +1,89 @@
+"""Tests for streaming source-truth row IO."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+from types import GeneratorType
+
+from app.shared.source_truth import io as truth_io
+from app.shared.source_truth.io import iter_rows, profile_file, read_rows
+from app.shared.source_truth.staging import open_stage, spill_rows
+
+LEGACY_EXPORT = (
+    ' StudentID ,"Name",Grade,,Name\r\n'
+    "100,Ada,A,x,Ada L.\r\n"
+    "\r\n"
+    '101,"Grace\r\nHopper",B\r\n'
+    "102,Alan,C,y,Alan T.,extra\r\n"
+)
+
+
+def _reference_rows(text: str) -> list[dict[str, str]]:
+    """Parse like the former whole-file reader did."""
+    reader = csv.DictReader(text.splitlines())
+    keys = {key: truth_io.normalize_header(key) for key in reader.fieldnames or []}
+    return [
+        {
+            keys[key]: truth_io.safe_cell(value)
+            for key, value in raw.items()
+            if keys.get(key)
+        }
+        for raw in reader
+    ]
+
+
+def test_iter_rows_streams_the_same_rows_as_the_whole_file_parse(
+    tmp_path: Path,
+) -> None:
+    """Headers, padding, blank lines and quoted newlines survive streaming."""
+    path = tmp_path / "export.csv"
+    path.write_bytes(b"\xef\xbb\xbf" + LEGACY_EXPORT.encode("utf-8"))
+
+    rows = iter_rows(path)
+
+    assert isinstance(rows, GeneratorType)
+    assert list(rows) == _reference_rows(LEGACY_EXPORT)
+    assert read_rows(path)[1] == {"StudentID": "101", "Name": "", "Grade": "B"}
+
+
+def test_iter_rows_detects_utf16_and_split_multibyte_chunks(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """UTF-16 exports decode, and a sniff cut mid-character stays UTF-8."""
+    utf16 = tmp_path / "utf16.tsv"
+    utf16.write_text("StudentID\tName\n100\tAdé\n", encoding="utf-16")
+    assert read_rows(utf16) == [{"StudentID": "100", "Name": "Adé"}]
+
+    monkeypatch.setattr(truth_io, "ENCODING_SNIFF_BYTES", 13)
+    utf8 = tmp_path / "utf8.csv"
+    utf8.write_text("Name,City\nAdé,Zwedru\n", encoding="utf-8")
+    assert read_rows(utf8) == [{"Name": "Adé", "City": "Zwedru"}]
+
+
+def test_profile_file_counts_rows_without_reading_them_into_memory(
+    tmp_path: Path,
+) -> None:
+    """Streaming profiles keep the former row count and hash."""
+    path = tmp_path / "export.csv"
+    path.write_text(LEGACY_EXPORT, encoding="utf-8")
+
+    profile = profile_file(path)
+
+    assert profile.headers == ("StudentID", "Name", "Grade", "Name")
+    assert profile.actual_rows == 4
+    assert profile.size_bytes == len(LEGACY_EXPORT.encode("utf-8"))
+    assert profile_file(tmp_path / "missing.csv").actual_rows == 0
+
+
+def test_spilled_rows_round_trip_in_order(tmp_path: Path) -> None:
+    """Spilled rows keep row and column order and can be read repeatedly."""
+    conn = open_stage(tmp_path / "truth.sqlite")
+    rows = [{"b": str(index), "a": "é"} for index in range(7)]
+
+    spilled = spill_rows(conn, "grade", iter(rows))
+
+    assert len(spilled) == 7
+    assert list(spilled) == rows
+    assert [list(row) for row in spilled][0] == ["b", "a"]
+    conn.close()
@@ -0,0 +1,96 @@
+"""Tests for the source-truth stage scheduler."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from django.core.management import call_command
+
+from app.shared.source_truth.scheduler import StageGraphError, StageT, run_stages
+
+
+def _numbers(count: int) -> list[int]:
+    """Return the first ``count`` integers."""
+    return list(range(count))
+
+
+def _squares(numbers: list[int]) -> list[int]:
+    """Return the squares of ``numbers``."""
+    return [number * number for number in numbers]
+
+
+def _total(numbers: list[int], squares: list[int]) -> tuple[int, int]:
+    """Return both sums."""
+    return sum(numbers), sum(squares)
+
+
+STAGES = (
+    StageT("total", _total, inputs=("numbers", "squares")),
+    StageT("squares", _squares, inputs=("numbers",)),
+    StageT("numbers", _numbers, params=("count",)),
+)
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_run_stages_orders_by_inputs_and_releases_intermediates(jobs: int) -> None:
+    """Results match across job counts; unkept results are not returned."""
+    seen: list[str] = []
+
+    def on_result(name: str, value: object) -> object:
+        seen.append(name)
+        return value
+
+    results, metrics = run_stages(
+        STAGES,
+        SimpleNamespace(count=5),
+        jobs=jobs,
+        keep={"total", "squares"},
+        on_result=on_result,
+    )
+
+    assert results == {"total": (10, 30), "squares": [0, 1, 4, 9, 16]}
+    assert seen == ["numbers", "squares", "total"]
+    assert [metric.stage for metric in metrics] == ["total", "squares", "numbers"]
+    assert metrics[2].rows == 5
+
+
+def test_run_stages_rejects_unknown_inputs_and_cycles() -> None:
+    """Broken graphs fail before any stage runs."""
+    with pytest.raises(StageGraphError, match="unknown input"):
+        run_stages((StageT("squares", _squares, inputs=("numbers",)),), None)
+    with pytest.raises(StageGraphError, match="cycle"):
+        run_stages(
+            (
+                StageT("numbers", _squares, inputs=("squares",)),
+                StageT("squares", _squares, inputs=("numbers",)),
+            ),
+            None,
+        )
+
+
+def test_build_command_runs_stages_in_parallel_with_profile(
+    tmp_path: Path, capsys
+) -> None:
+    """--jobs and --profile report each stage and write cProfile stats."""
+    output = tmp_path / "out"
+    call_command(
+        "build_tusis_truth",
+        smartschool_dir=str(tmp_path / "smartschool"),
+        smartschool_fallback_dir=str(tmp_path / "fundamentals"),
+        grapro_csv_dir=str(tmp_path / "grapro"),
+        grapro_mdb=str(tmp_path / "missing.mdb"),
+        tucurricula_import_dir=str(tmp_path / "tucurricula"),
+        course_aliases=str(tmp_path / "aliases.tsv"),
+        output_dir=str(output),
+        no_cache=True,
+        jobs=2,
+        profile=True,
+    )
+
+    stdout = capsys.readouterr().out
+    assert "  grades: " in stdout
+    assert "  stage_indexes: " in stdout
+    assert (output / "profile" / "grades.pstats").exists()
+    assert (output / "import_ready" / "full_grades.tsv").exists()
@@ -0,0 +1,98 @@
+"""Tests for the converted columnar source cache."""
+
+from __future__ import annotations
+
+import os
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
+from django.core.management import call_command
+
+from app.shared.source_truth import source_cache
+from app.shared.source_truth.io import track_source_reads
+from app.shared.source_truth.source_cache import EncodedColumn, SourceCache
+from app.shared.source_truth.tables import SourceTables, parse_source_table
+
+EXPORT = (
+    "StudentID,Name,Grade,Name\r\n"
+    "100,Ada,A,Ada L.\r\n"
+    "\r\n"
+    '101,"Grace\r\nHopper",,\r\n'
+    "102,Alan,A\r\n"
+)
+
+
+def test_converted_table_round_trips_and_detects_stale_sources(tmp_path: Path) -> None:
+    """Cached tables match the CSV parse until the source content changes."""
+    path = tmp_path / "dbo_UM_Students.csv"
+    path.write_text(EXPORT, encoding="utf-8")
+    table = parse_source_table(path)
+    cache = SourceCache(tmp_path / "sources")
+
+    target = cache.store(table)
+    loaded = SourceCache(tmp_path / "sources").lookup(path)
+
+    assert target.name == table.sha256
+    assert loaded is not None
+    assert list(loaded.rows()) == list(table.rows())
+    assert loaded.profile() == table.profile()
+    assert np.load(target / "c2.codes.npy").dtype == np.uint8
+    student_ids = loaded.columns[0]
+    assert isinstance(student_ids, EncodedColumn)
+    assert list(student_ids[1:]) == ["101", "102"]
+    assert student_ids[-1] == "102"
+
+
+def test_touched_sources_are_hashed_once(tmp_path: Path, monkeypatch) -> None:
+    """After an mtime-only change the re-hash refreshes the index entry."""
+    path = tmp_path / "dbo_UM_Students.csv"
+    path.write_text(EXPORT, encoding="utf-8")
+    cache = SourceCache(tmp_path / "sources")
+    cache.store(parse_source_table(path))
+    hashes: list[Path] = []
+    file_sha256 = source_cache._file_sha256
+    monkeypatch.setattr(
+        source_cache,
+        "_file_sha256",
+        lambda source: hashes.append(source) or file_sha256(source),
+    )
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.lookup(path) is not None
+    assert SourceCache(tmp_path / "sources").lookup(path) is not None
+    assert hashes == [path]
+    path.write_text(EXPORT.replace("Ada", "Ida"), encoding="utf-8")
+    assert cache.lookup(path) is None
+
+
+def test_convert_sources_feeds_the_source_registry(tmp_path: Path) -> None:
+    """Verified exports are converted once and then load without CSV parsing."""
+    smartschool = tmp_path / "smartschool"
+    smartschool.mkdir()
+    (smartschool / "_table_manifest.csv").write_text(
+        "table_name,row_count\nUM_Students,4\nUM_Courses,5\n", encoding="utf-8"
+    )
+    students = smartschool / "dbo_UM_Students.csv"
+    students.write_text(EXPORT, encoding="utf-8")
+    (smartschool / "dbo_UM_Courses.csv").write_text("CourseCode\nMATH\n", "utf-8")
+    options = {
+        "smartschool_dir": str(smartschool),
+        "grapro_csv_dir": str(tmp_path / "grapro"),
+        "source_cache_dir": str(tmp_path / "sources"),
+    }
+
+    first, second = StringIO(), StringIO()
+    call_command("convert_sources", stdout=first, **options)
+    call_command("convert_sources", stdout=second, **options)
+
+    assert "Converted 1 source table(s); 0 already current." in first.getvalue()
+    assert "Converted 0 source table(s); 1 already current." in second.getvalue()
+    tables = SourceTables([students], cache=SourceCache(tmp_path / "sources"))
+    with track_source_reads() as reads:
+        assert list(tables.rows(students)) == list(parse_source_table(students).rows())
+    assert [(read.path, read.parses) for read in reads] == [
+        (str(students), 0),
+        (str(students), 1),
+    ]
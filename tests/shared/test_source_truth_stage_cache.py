@@ -0,0 +1,117 @@
+"""Tests for the content-addressed source-truth stage cache."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+from types import SimpleNamespace
+
+from django.core.management import call_command
+
+from app.shared.source_truth.scheduler import StageT, run_stages
+from app.shared.source_truth.stage_cache import CODE_ROOT, StageCache, _code_files
+
+CALLS: list[str] = []
+
+
+def _read_numbers(path: Path) -> list[int]:
+    """Return the integers listed in a file."""
+    CALLS.append("numbers")
+    return [int(line) for line in path.read_text().split()]
+
+
+def _read_factor(path: Path) -> int:
+    """Return the integer in a file."""
+    CALLS.append("factor")
+    return int(path.read_text())
+
+
+def _scaled(numbers: list[int], factor: int) -> list[int]:
+    """Return ``numbers`` multiplied by ``factor``."""
+    CALLS.append("scaled")
+    return [number * factor for number in numbers]
+
+
+STAGES = (
+    StageT("numbers", _read_numbers, params=("numbers_path",)),
+    StageT("factor", _read_factor, params=("factor_path",)),
+    StageT("scaled", _scaled, inputs=("numbers", "factor")),
+)
+
+
+def _run(context: SimpleNamespace, cache: StageCache) -> tuple[object, dict[str, str]]:
+    """Run the sample graph and return the result and cache status per stage."""
+    CALLS.clear()
+    results, metrics = run_stages(STAGES, context, keep={"scaled"}, cache=cache)
+    return results["scaled"], {metric.stage: metric.cache for metric in metrics}
+
+
+def test_stage_cache_reuses_unchanged_stages(tmp_path: Path) -> None:
+    """Only stages downstream of a changed file run again."""
+    context = SimpleNamespace(
+        numbers_path=tmp_path / "numbers.txt", factor_path=tmp_path / "factor.txt"
+    )
+    context.numbers_path.write_text("1 2 3")
+    context.factor_path.write_text("2")
+    cache = StageCache(tmp_path / "cache")
+
+    names = ("numbers", "factor", "scaled")
+    assert _run(context, cache) == ([2, 4, 6], dict.fromkeys(names, "miss"))
+    assert _run(context, cache) == ([2, 4, 6], dict.fromkeys(names, "hit"))
+    assert CALLS == []
+
+    context.factor_path.write_text("10")
+    assert _run(context, cache) == (
+        [10, 20, 30],
+        {"numbers": "hit", "factor": "miss", "scaled": "miss"},
+    )
+    assert CALLS == ["factor", "scaled"]
+
+    _, statuses = _run(context, StageCache(tmp_path / "cache", force=True))
+    assert set(statuses.values()) == {"miss"}
+    assert len(list((tmp_path / "cache" / "scaled").glob("*.pickle"))) == 1
+
+
+def test_build_command_reports_cache_hits_and_misses(tmp_path: Path, capsys) -> None:
+    """A rebuild after an alias edit only recomputes alias-dependent stages."""
+    aliases = tmp_path / "aliases.tsv"
+    aliases.write_text("source_course_dept\tsource_course_no\n", encoding="utf-8")
+    options = {
+        "smartschool_dir": str(tmp_path / "smartschool"),
+        "smartschool_fallback_dir": str(tmp_path / "fundamentals"),
+        "grapro_csv_dir": str(tmp_path / "grapro"),
+        "grapro_mdb": str(tmp_path / "missing.mdb"),
+        "tucurricula_import_dir": str(tmp_path / "tucurricula"),
+        "course_aliases": str(aliases),
+        "cache_dir": str(tmp_path / "cache"),
+    }
+
+    call_command("build_tusis_truth", output_dir=str(tmp_path / "first"), **options)
+    assert "0 hit(s)" in capsys.readouterr().out
+    call_command("build_tusis_truth", output_dir=str(tmp_path / "second"), **options)
+    assert "0 miss(es)" in capsys.readouterr().out
+
+    aliases.write_text(
+        "source_course_dept\tsource_course_no\nMATH\t3\n", encoding="utf-8"
+    )
+    call_command("build_tusis_truth", output_dir=str(tmp_path / "third"), **options)
+    summary = capsys.readouterr().out
+    assert "recomputed: approved_course_aliases," in summary
+    with (tmp_path / "third" / "stage_metrics.tsv").open(encoding="utf-8") as handle:
+        rows = csv.DictReader(handle, delimiter="\t")
+        statuses = {row["stage"]: row["cache"] for row in rows}
+    assert statuses["tuc_courses"] == "hit"
+    assert statuses["courses"] == "miss"
+
+
+def test_stage_keys_cover_imported_app_modules() -> None:
+    """Helpers the stages import from outside the package are part of the key."""
+    files = {path.relative_to(CODE_ROOT).as_posix() for path in _code_files(__name__)}
+    assert {
+        "app/shared/fuzzy_matching.py",
+        "app/shared/course_wrangling.py",
+        "app/timetable/utils.py",
+        "app/academics/choices.py",
+        "app/registry/constants.py",
+        "app/people/utils.py",
+    } <= files
@@ -0,0 +1,50 @@
+"""Tests for batched source-truth SQLite staging."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+
+from app.shared.source_truth import staging
+from app.shared.source_truth.staging import (
+    begin_stage_load,
+    finish_stage_load,
+    open_stage,
+    stage_report_rows,
+    stage_witness_rows,
+)
+
+
+def test_batched_staging_commits_once_with_indexes(tmp_path: Path, monkeypatch) -> None:
+    """Rows span several batches, land in one commit and are indexed after."""
+    monkeypatch.setattr(staging, "STAGE_BATCH_SIZE", 3)
+    path = tmp_path / "truth.sqlite"
+    conn = open_stage(path)
+    begin_stage_load(conn)
+    rows = [{"source_name": "gp", "student_id": str(index)} for index in range(7)]
+    rows.append({"source_name": "gp", "student_id": ""})
+
+    assert stage_witness_rows(conn, "student", rows, key_field="student_id") == 8
+    assert stage_report_rows(conn, "report.tsv", rows[:4]) == 4
+    reader = sqlite3.connect(path)
+    assert reader.execute("SELECT COUNT(*) FROM witness_rows").fetchone() == (0,)
+
+    finish_stage_load(conn)
+
+    staged = reader.execute(
+        "SELECT row_key, payload_json, row_hash FROM witness_rows ORDER BY id"
+    ).fetchall()
+    assert [key for key, _, _ in staged[:7]] == [str(index) for index in range(7)]
+    payload = json.dumps(rows[-1], sort_keys=True, ensure_ascii=True)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    assert staged[-1] == (digest, payload, digest)
+    indexes = {
+        name
+        for (name,) in reader.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    }
+    assert set(staging.STAGE_INDEXES) <= indexes
+    assert reader.execute("SELECT MAX(row_number) FROM report_rows").fetchone() == (4,)
+    reader.close()
+    conn.close()
@@ -0,0 +1,109 @@
+"""Tests for the parse-once source table registry."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from pathlib import Path
+from types import SimpleNamespace
+
+from app.shared.source_truth import io as truth_io
+from app.shared.source_truth.builder import table_readers
+from app.shared.source_truth.io import RowT, track_source_reads
+from app.shared.source_truth.scheduler import StageT, run_stages
+from app.shared.source_truth.tables import (
+    SourceTables,
+    iter_rows,
+    parse_source_table,
+    profile_file,
+    source_index,
+    use_source_tables,
+)
+
+LEGACY_EXPORT = (
+    ' StudentID ,"Name",Grade,,Name\r\n'
+    "100,Ada,A,x,Ada L.\r\n"
+    "\r\n"
+    '101,"Grace\r\nHopper",B\r\n'
+    "102,Alan,A,y,Alan T.,extra\r\n"
+)
+
+
+def _grades_by_student(rows: Iterable[RowT]) -> dict[str, str]:
+    """Index grades by student id."""
+    return {row["StudentID"]: row["Grade"] for row in rows}
+
+
+def _count_rows(path: Path) -> int:
+    """Return the number of rows of a source file."""
+    return sum(1 for _ in iter_rows(path))
+
+
+def _count_shared_rows(exports_dir: Path, first: int) -> int:
+    """Return the rows of ``shared.csv`` once ``first`` has run."""
+    return _count_rows(exports_dir / "shared.csv")
+
+
+def test_parsed_table_matches_streaming_rows_and_profile(tmp_path: Path) -> None:
+    """Columns rebuild the streamed rows; the parse also yields the profile."""
+    path = tmp_path / "export.csv"
+    path.write_text(LEGACY_EXPORT, encoding="utf-8")
+
+    table = parse_source_table(path)
+
+    assert list(table.rows()) == list(truth_io.iter_rows(path))
+    assert len(table) == 3
+    assert table.profile() == truth_io.profile_file(path)
+    assert table.sha256 == hashlib.sha256(path.read_bytes()).hexdigest()
+    assert table.columns[2][0] is table.columns[2][2]
+    assert parse_source_table(tmp_path / "missing.csv").profile().actual_rows == 0
+
+
+def test_registered_tables_are_parsed_once_per_build(tmp_path: Path) -> None:
+    """Rows, profiles and indexes of a registered file share one parse."""
+    shared = tmp_path / "shared.csv"
+    streamed = tmp_path / "streamed.csv"
+    shared.write_text(LEGACY_EXPORT, encoding="utf-8")
+    streamed.write_text(LEGACY_EXPORT, encoding="utf-8")
+
+    with track_source_reads() as reads, use_source_tables(SourceTables([shared])):
+        first = list(iter_rows(shared))
+        first[0]["Grade"] = "changed"
+        assert list(iter_rows(shared))[0]["Grade"] == "A"
+        assert profile_file(shared).actual_rows == 4
+        index = source_index(shared, _grades_by_student)
+        assert source_index(shared, _grades_by_student) is index
+        assert profile_file(streamed) is profile_file(streamed)
+        list(iter_rows(streamed))
+
+    assert index == {"100": "A", "101": "B", "102": "A"}
+    parses = {read.path: 0 for read in reads}
+    for read in reads:
+        parses[read.path] += read.parses
+    assert parses == {str(shared): 1, str(streamed): 2}
+    assert {read.bytes_read for read in reads} == {shared.stat().st_size}
+
+
+def test_tables_are_released_after_their_last_reader(tmp_path: Path) -> None:
+    """A table is dropped once every stage that may read it has finished."""
+    shared = tmp_path / "exports" / "shared.csv"
+    shared.parent.mkdir()
+    shared.write_text(LEGACY_EXPORT, encoding="utf-8")
+    context = SimpleNamespace(exports_dir=shared.parent, shared_path=shared)
+    stages = (
+        StageT("first", _count_rows, params=("shared_path",)),
+        StageT("second", _count_shared_rows, inputs=("first",), params=("exports_dir",)),
+        StageT("total", lambda count: count, inputs=("second",)),
+    )
+    readers = table_readers([shared], stages, context)
+    assert readers == {shared: {"first", "second"}}
+
+    tables = SourceTables([shared], readers=readers)
+    with track_source_reads() as reads, use_source_tables(tables):
+        results, _ = run_stages(
+            stages, context, keep={"total"}, on_done=tables.stage_done
+        )
+        assert results == {"total": 3}
+        assert sum(read.parses for read in reads) == 1
+        list(iter_rows(shared))  # released, so parsed again
+    assert sum(read.parses for read in reads) == 2
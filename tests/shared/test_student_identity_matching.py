@@ -0,0 +1,69 @@
+"""Tests for blocked source-truth student identity matching."""
+
+import pytest
+
+from app.shared.fuzzy_matching import name_similarity, soundex
+from app.shared.source_truth.fuzzy_students import (
+    build_student_identity_candidates,
+    surname_block_keys,
+)
+
+
+def _row(student_id: str, name: str, source: str) -> dict[str, str]:
+    return {"student_id": student_id, "student_name": name, "source_name": source}
+
+
+def test_soundex_codes():
+    """Soundex follows the American rules (h/w do not split codes)."""
+    assert soundex("Robert") == "R163"
+    assert soundex("Tymczak") == "T522"
+    assert soundex("Pfister") == "P236"
+    assert soundex("Kollie") == soundex("Kolie") == "K400"
+    assert soundex("") == ""
+
+
+def test_single_letter_typos_share_a_block():
+    """Drops, doublings and phonetic variants land in a shared block."""
+    assert surname_block_keys("kollie") & surname_block_keys("kolie")
+    assert surname_block_keys("harmon") & surname_block_keys("harrmon")
+    assert surname_block_keys("") == set()
+
+
+def test_misspelled_surname_is_matched():
+    """A typo in the surname no longer hides the GraPro student."""
+    source = [_row("SS1", "Abraham Harrmon", "smartschool")]
+    grapro = [
+        _row("GP1", "Abraham Harmon", "grapro"),
+        _row("GP2", "Abraham Johnson", "grapro"),
+    ]
+
+    rows = build_student_identity_candidates(source, grapro)
+
+    assert [row["target_student_id"] for row in rows] == ["GP1"]
+    expected = name_similarity("Abraham Harrmon", "Abraham Harmon")
+    assert rows[0]["score"] == f"{expected:.3f}"
+
+
+def test_candidates_keep_score_order_and_limit():
+    """Best scores come first, ties keep GraPro order, and limit applies."""
+    source = [_row("SS1", "John Kollie", "smartschool")]
+    grapro = [
+        _row("GP1", "Jon Kolie", "grapro"),
+        _row("GP2", "John Kollie", "grapro"),
+        _row("GP3", "John Kolie", "grapro"),
+        _row("GP4", "John Kollie", "grapro"),
+    ]
+
+    rows = build_student_identity_candidates(source, grapro, limit=3)
+
+    assert [row["target_student_id"] for row in rows] == ["GP2", "GP4", "GP3"]
+    assert rows[0]["recommendation"] == "strong_name_match"
+
+
+@pytest.mark.parametrize("name", ["", "Anthony Doe"])
+def test_unmatched_rows_yield_no_candidates(name):
+    """Empty or unrelated names produce no fuzzy candidates."""
+    source = [_row("SS1", name, "smartschool")]
+    grapro = [_row("GP1", "Virginia Blyee", "grapro")]
+
+    assert build_student_identity_candidates(source, grapro) == []
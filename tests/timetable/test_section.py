@@ -1,8 +1,12 @@
 """Tests for timetable section model."""
 
+from io import StringIO
+
 import pytest
+from django.core.management import call_command
 from django.db import IntegrityError, transaction
 
+from app.academics.models.curriculum_course import CurriCrs
 from app.timetable.models.section import Section
 
 pytestmark = pytest.mark.django_db
@@ -20,3 +24,66 @@ def test_sec_unique_per_curriculum_course(curriculum_course, semester):
             Section.objects.create(
                 semester=semester, curriculum_course=curriculum_course, number=1
             )
+
+
+# ~~~~~~~~~~~~~~~~ Sort code ~~~~~~~~~~~~~~~~
+
+
+def test_sec_sort_code_follows_number_and_course_rename(sec_factory):
+    section = sec_factory("321", "CURRI_SORT", 2)
+    course = section.curriculum_course.course
+    assert section.sort_code == f"{course.short_code}:s2"
+
+    section.number = 3
+    section.save(update_fields=["number"])
+    course.short_code = "RENAMED321"
+    course.save()
+
+    section.refresh_from_db()
+    assert section.sort_code == "RENAMED321:s3"
+
+
+def test_course_save_refreshes_sort_codes_only_on_code_changes(sec_factory):
+    section = sec_factory("323", "CURRI_SORT", 1)
+    course = section.curriculum_course.course
+    Section.objects.filter(pk=section.pk).update(sort_code="")
+
+    course.title = "Retitled"
+    course.save()
+    section.refresh_from_db()
+    assert section.sort_code == ""
+
+    course.short_code = "RENAMED323"
+    course.save()
+    section.refresh_from_db()
+    assert section.sort_code == "RENAMED323:s1"
+
+
+def test_sort_code_follows_curriculum_course_moves(sec_factory, crs_factory):
+    section = sec_factory("324", "CURRI_SORT", 1)
+    other = sec_factory("325", "CURRI_SORT", 2)
+    curriculum_course = section.curriculum_course
+
+    curriculum_course.course = crs_factory("326")
+    curriculum_course.save()
+    section.refresh_from_db()
+    assert section.sort_code == f"{curriculum_course.course.short_code}:s1"
+
+    Section.objects.filter(pk=other.pk).update(curriculum_course=curriculum_course)
+    other.refresh_from_db()
+    assert other.sort_code == f"{curriculum_course.course.short_code}:s2"
+
+    moved_to = crs_factory("327")
+    CurriCrs.objects.filter(pk=curriculum_course.pk).update(course=moved_to)
+    other.refresh_from_db()
+    assert other.sort_code == f"{moved_to.short_code}:s2"
+
+
+def test_rebuild_section_sort_codes_backfills_stale_rows(sec_factory):
+    section = sec_factory("322", "CURRI_SORT", 1)
+    Section.objects.filter(pk=section.pk).update(sort_code="")
+
+    call_command("rebuild_section_sort_codes", stdout=StringIO())
+
+    section.refresh_from_db()
+    assert section.sort_code == section.short_code
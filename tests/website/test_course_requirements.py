@@ -23,7 +23,10 @@ from app.registry.models.registration import Registration, RegistrationStatus
 from app.timetable.models.section import Section
 from app.timetable.models.semester import Semester, SemesterStatus
 from app.website.views.course_requirements import (
+    ReqContextT,
     eval_curri_crs_reqs,
+    eval_req_table,
+    load_req_table,
 )
 
 pytestmark = pytest.mark.django_db
@@ -346,3 +349,63 @@ def test_dashboard_keeps_no_sec_crss_in_locked_information_list(
         for line in target_payload["reason_lines"]
     )
     assert target_payload["level_hint"] == "Level 3"
+
+
+def test_req_table_matches_single_course_eval_in_two_queries(
+    curriculum_course_factory,
+    sem_factory,
+    user_factory,
+    django_assert_num_queries,
+) -> None:
+    """The batched rule table should reproduce the per-course evaluator."""
+    semester = _open_regio_sem(sem_factory)
+    target = curriculum_course_factory("950", "CURRI_REQ_TABLE")
+    target.min_validated_credits = 12
+    target.save(update_fields=["min_validated_credits"])
+    other = curriculum_course_factory("951", "CURRI_REQ_TABLE")
+    members = [
+        curriculum_course_factory(number, "CURRI_REQ_TABLE")
+        for number in ("952", "953", "954")
+    ]
+    _add_req_member_gp(target=target, kind=ReqKind.PREREQ_ALL, required_courses=members)
+    _add_req_member_gp(target=other, kind=ReqKind.PREREQ_ANY, required_courses=members)
+    _add_req_member_gp(target=other, kind=ReqKind.COREQ_ALL, required_courses=[target])
+    student = _std_for_curri(
+        user_factory=user_factory,
+        curriculum=target.curriculum,
+        semester=semester,
+        username="req_table_student",
+    )
+    context: ReqContextT = {
+        "passed_course_ids": {members[1].course_id},
+        "validated_credits": 3,
+    }
+    selected = {target.course_id, other.course_id}
+    curriculum_courses = [target, other, *members]
+
+    with django_assert_num_queries(2):
+        table = load_req_table(curriculum_courses)
+    results = eval_req_table(table, context=context, selected_course_ids=selected)
+
+    for curriculum_course in curriculum_courses:
+        expected = eval_curri_crs_reqs(
+            student=student,
+            curriculum_course=curriculum_course,
+            selected_course_ids=selected,
+            context=context,
+        )
+        assert results[curriculum_course.id] == expected
+        # A preloaded table makes per-course evaluation in a loop query-free.
+        with django_assert_num_queries(0):
+            assert (
+                eval_curri_crs_reqs(
+                    student=student,
+                    curriculum_course=curriculum_course,
+                    selected_course_ids=selected,
+                    context=context,
+                    table=table,
+                )
+                == expected
+            )
+    assert not results[target.id]["ok"]
+    assert results[other.id]["ok"]
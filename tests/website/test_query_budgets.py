@@ -0,0 +1,84 @@
+"""Query budgets for the key portal pages (see ``app.shared.perf``)."""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.urls import reverse
+
+from app.finance.fee_quotes import rebuild_sem_fee_quotes
+
+pytestmark = pytest.mark.django_db
+
+# Page name -> maximum queries for one render. Budgets must not grow with
+# the number of rows shown; raise them only with a reason in the commit.
+QUERY_BUDGETS = {
+    "reg_grades_dashboard": 12,
+    "finance_officer_invoices": 24,
+    "staff_role_dashboard": 50,
+}
+
+
+def _finance_user() -> User:
+    """Create a user with finance officer portal access."""
+    user = User.objects.create_user("finance_budget", is_staff=True)
+    group, _ = Group.objects.get_or_create(name="Finance Officer")
+    user.groups.add(group)
+    return user
+
+
+def _assert_budget(response, page: str) -> int:
+    assert response.status_code == 200
+    queries = response.perf.queries
+    assert queries <= QUERY_BUDGETS[page], (page, queries, response.perf.as_log_dict())
+    return queries
+
+
+def test_registrar_grades_page_stays_within_budget(
+    client,
+    reg_user_factory,
+    reg_sem_pair_factory,
+    reg_sec_factory,
+    reg_std_factory,
+    reg_grade_factory,
+) -> None:
+    """Rendering more students does not add queries."""
+    _year, previous, current = reg_sem_pair_factory()
+    client.force_login(reg_user_factory("registrar_budget"))
+
+    def add_students(offset: int, count: int) -> None:
+        for index in range(offset, offset + count):
+            section, curriculum = reg_sec_factory(
+                previous, course_number=f"4{index:02d}", curriculum_short_name="CURRI_QB"
+            )
+            student = reg_std_factory(f"budget_std_{index}", curriculum, current)
+            reg_grade_factory(student, section)
+
+    add_students(0, 2)
+    response = client.get(reverse("reg_grades_dashboard"))
+    small = _assert_budget(response, "reg_grades_dashboard")
+    add_students(2, 4)
+    response = client.get(reverse("reg_grades_dashboard"))
+    assert len(response.context["student_groups"]) == 6
+    assert _assert_budget(response, "reg_grades_dashboard") == small
+    assert response.perf.blocks["registrar_grades"].calls == 1
+
+
+def test_finance_invoices_page_stays_within_budget(client, regio_factory) -> None:
+    """The finance invoices console renders within its budget."""
+    registration = regio_factory("finance_budget_std", "CURRI_FIN_QB", "806", 1)
+    client.force_login(_finance_user())
+    url = reverse("finance_officer_invoices")
+    params = {"student_id": str(registration.student.id)}
+    rebuild_sem_fee_quotes(registration.section.semester)  # as registration opens
+    response = client.get(url, params)
+    _assert_budget(response, "finance_officer_invoices")
+    assert "Server-Timing" in response
+
+
+def test_staff_dashboard_stays_within_budget(client) -> None:
+    """The finance role dashboard renders within its budget."""
+    client.force_login(_finance_user())
+    response = client.get(reverse("staff_role_dashboard", args=["finance"]))
+    _assert_budget(response, "staff_role_dashboard")
+    assert "staff.finance" in response.perf.blocks
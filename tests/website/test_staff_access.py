@@ -0,0 +1,102 @@
+"""Tests for the per-request user access snapshot behind staff roles."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from app.academics.models.college import College
+from app.people.models.role_assignment import RoleAssignment
+from app.website.services.staff_access import user_access
+from app.website.services.staff_roles import (
+    build_staff_role_switcher,
+    resolve_staff_role,
+    user_can_access_role,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def _user(username: str, *groups: str) -> User:
+    user = User.objects.create_user(username, is_staff=True)
+    for name in groups:
+        user.groups.add(Group.objects.get_or_create(name=name)[0])
+    return user
+
+
+def test_role_helpers_share_one_snapshot(django_assert_num_queries) -> None:
+    """Resolution, checks and the switcher reuse the same snapshot."""
+    user = User.objects.get(pk=_user("chair_access", "Chair").pk)
+    with django_assert_num_queries(3):  # groups, profile ids, role scopes
+        assert resolve_staff_role(user) == "chair"
+        assert user_can_access_role(user, "faculty")
+        assert not user_can_access_role(user, "dean")
+        assert build_staff_role_switcher(user, "chair")
+    assert user_access(user).accessible_roles == {"chair", "faculty"}
+
+
+def test_snapshot_follows_group_changes_on_the_same_user() -> None:
+    """Adding a group through the user drops the memoized snapshot."""
+    user = _user("grow_access")
+    assert resolve_staff_role(user) == "general"
+    user.groups.add(Group.objects.get_or_create(name="Dean")[0])
+    assert resolve_staff_role(user) == "dean"
+
+
+def test_snapshot_holds_active_role_scopes() -> None:
+    """Only current role assignments contribute college scopes."""
+    user = _user("scoped_access", "Dean")
+    group = Group.objects.get(name="Dean")
+    college = College.objects.create(code="ACS", long_name="Access College")
+    old = College.objects.create(code="ACO", long_name="Old Access College")
+    RoleAssignment.objects.create(
+        user=user, group=group, college=college, start_date=date(2020, 1, 1)
+    )
+    RoleAssignment.objects.create(
+        user=user,
+        group=group,
+        college=old,
+        start_date=date(2010, 1, 1),
+        end_date=date(2011, 1, 1),
+    )
+    access = user_access(User.objects.get(pk=user.pk))
+    assert access.college_ids == {college.id}
+    assert access.scopes_for("Dean") == {("Dean", college.id, None)}
+
+
+def test_cached_snapshot_is_versioned(settings) -> None:
+    """Cached snapshots are reused across requests until roles change."""
+    settings.USER_ACCESS_CACHE_SECONDS = 60
+    cache.clear()
+    user = _user("cached_access", "Finance")
+    assert user_access(User.objects.get(pk=user.pk)).primary_role == "finance"
+
+    group = Group.objects.get_or_create(name="Finance Officer")[0]
+    group.user_set.add(user)  # reverse side: only the version bump applies
+    assert user_access(User.objects.get(pk=user.pk)).primary_role == "finance_officer"
+
+    RoleAssignment.objects.create(user=user, group=group, start_date=date(2020, 1, 1))
+    assert user_access(User.objects.get(pk=user.pk)).role_scopes == {
+        ("Finance Officer", None, None)
+    }
+    cache.clear()
+
+
+def test_dashboard_resolves_roles_once_per_request(client) -> None:
+    """A staff page reads the user's group names once for all role helpers."""
+    client.force_login(_user("page_access", "Registrar Officer"))
+    with CaptureQueriesContext(connection) as captured:
+        response = client.get(reverse("staff_role_dashboard", args=["reg_officer"]))
+    assert response.status_code == 200
+    group_name_reads = [
+        query["sql"]
+        for query in captured.captured_queries
+        if 'FROM "auth_group" INNER JOIN "auth_user_groups"' in query["sql"]
+    ]
+    assert len(group_name_reads) == 1